@@ -1,13 +1,567 @@
 """Birdeye Tool - Comprehensive Solana token analytics and wallet data."""
 
 import logging
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from solana_agent import AutoTool, ToolRegistry
 
+from sakit.utils.birdeye import (
+    BIRDEYE_API,
+    COMPACT_MAX_ITEMS,
+    JsonArrayStream,
+    get_rate_limiter,
+    project,
+)
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of cached responses kept per tool instance
+CACHE_MAX_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class BirdeyeAction:
+    """
+    Declarative description of a Birdeye action.
+
+    Attributes:
+        name: Action name exposed to the agent
+        category: Group used for the schema's action list
+        endpoint: Birdeye endpoint path
+        method: HTTP method
+        required: Parameters that must be non-empty
+        optional: Parameters forwarded when non-empty
+        defaults: Query parameters sent unless overridden
+        body: Parameters sent in the JSON body instead of the query string
+        cache_ttl: Seconds to cache successful responses (0 disables caching)
+        compact_fields: Keys kept on each record in compact mode (empty keeps all)
+        stream_path: Keys leading to a large list decoded incrementally ("*" = any)
+        error: Error message when a required parameter is missing
+    """
+
+    name: str
+    category: str
+    endpoint: str
+    method: str = "GET"
+    required: Tuple[str, ...] = ()
+    optional: Tuple[str, ...] = ()
+    defaults: Dict[str, Any] = field(default_factory=dict)
+    body: Tuple[str, ...] = ()
+    cache_ttl: float = 0.0
+    compact_fields: Tuple[str, ...] = ()
+    stream_path: Tuple[str, ...] = ()
+    error: str = ""
+
+    def __post_init__(self):
+        if self.required and not self.error:
+            verb = "is" if len(self.required) == 1 else "are"
+            message = f"{' and '.join(self.required)} {verb} required"
+            object.__setattr__(self, "error", message)
+
+    def validate(self, values: Dict[str, Any]) -> Optional[str]:
+        """Return an error message if a required parameter is missing."""
+        for name in self.required:
+            if not values.get(name):
+                return self.error
+        return None
+
+    def build(
+        self, values: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Build the query parameters and JSON body for a request."""
+        params = dict(self.defaults)
+        json_data = {}
+        for name in self.required + self.optional:
+            value = values.get(name)
+            if not value:
+                continue
+            if name in self.body:
+                json_data[name] = value
+            elif isinstance(value, list):
+                params[name] = ",".join(value)
+            else:
+                params[name] = value
+        return params or None, json_data or None
+
+    def projection(
+        self, fields: str = "", compact: bool = False
+    ) -> Tuple[Optional[frozenset], Optional[int]]:
+        """Resolve the record keys and list limit for a response."""
+        keys = frozenset(f.strip() for f in fields.split(",") if f.strip())
+        if not keys and compact and self.compact_fields:
+            keys = frozenset(self.compact_fields)
+        max_items = COMPACT_MAX_ITEMS if compact else None
+        return keys or None, max_items
+
+
+_OHLCV = {
+    "optional": ("type", "time_from", "time_to"),
+    "defaults": {"type": "1H"},
+}
+_SEEK = ("tx_type", "before_time", "after_time", "limit")
+# Trade records use camelCase in v1 endpoints and snake_case in v3 endpoints
+_TRADE_FIELDS = (
+    "txHash",
+    "tx_hash",
+    "blockUnixTime",
+    "block_unix_time",
+    "txType",
+    "tx_type",
+    "side",
+    "owner",
+    "source",
+    "volumeUSD",
+    "volume_usd",
+)
+_TOKEN_LIST_FIELDS = (
+    "address",
+    "symbol",
+    "name",
+    "price",
+    "liquidity",
+    "mc",
+    "market_cap",
+    "v24hUSD",
+    "volume_24h_usd",
+    "v24hChangePercent",
+    "price_change_24h_percent",
+)
+_PAGE = ("offset", "limit")
+_ITEMS = ("data", "items")
+
+BIRDEYE_ACTIONS: Tuple[BirdeyeAction, ...] = (
+    # ==================== PRICE ====================
+    BirdeyeAction("price", "PRICE", "/defi/price", required=("address",)),
+    BirdeyeAction(
+        "multi_price", "PRICE", "/defi/multi_price", required=("list_address",)
+    ),
+    BirdeyeAction(
+        "multi_price_post",
+        "PRICE",
+        "/defi/multi_price",
+        method="POST",
+        required=("list_address",),
+        body=("list_address",),
+    ),
+    BirdeyeAction(
+        "history_price",
+        "PRICE",
+        "/defi/history_price",
+        required=("address",),
+        optional=("type", "time_from", "time_to"),
+        defaults={"address_type": "token", "type": "1H"},
+    ),
+    BirdeyeAction(
+        "historical_price_unix",
+        "PRICE",
+        "/defi/historical_price_unix",
+        required=("address", "unixtime"),
+    ),
+    BirdeyeAction(
+        "price_volume_single",
+        "PRICE",
+        "/defi/price_volume/single",
+        required=("address",),
+        optional=("type",),
+    ),
+    BirdeyeAction(
+        "price_volume_multi",
+        "PRICE",
+        "/defi/price_volume/multi",
+        method="POST",
+        required=("list_address",),
+        optional=("type",),
+        body=("list_address",),
+    ),
+    # ==================== OHLCV ====================
+    BirdeyeAction("ohlcv", "OHLCV", "/defi/ohlcv", required=("address",), **_OHLCV),
+    BirdeyeAction(
+        "ohlcv_pair", "OHLCV", "/defi/ohlcv/pair", required=("address",), **_OHLCV
+    ),
+    BirdeyeAction(
+        "ohlcv_base_quote",
+        "OHLCV",
+        "/defi/ohlcv/base_quote",
+        required=("base_address", "quote_address"),
+        **_OHLCV,
+    ),
+    BirdeyeAction(
+        "ohlcv_v3", "OHLCV", "/defi/v3/ohlcv", required=("address",), **_OHLCV
+    ),
+    BirdeyeAction(
+        "ohlcv_pair_v3",
+        "OHLCV",
+        "/defi/v3/ohlcv/pair",
+        required=("address",),
+        **_OHLCV,
+    ),
+    # ==================== TRADES ====================
+    BirdeyeAction(
+        "trades_token",
+        "TRADES",
+        "/defi/txs/token",
+        required=("address",),
+        optional=("tx_type",) + _PAGE,
+        compact_fields=_TRADE_FIELDS,
+        stream_path=_ITEMS,
+    ),
+    BirdeyeAction(
+        "trades_pair",
+        "TRADES",
+        "/defi/txs/pair",
+        required=("address",),
+        optional=("tx_type",) + _PAGE,
+        compact_fields=_TRADE_FIELDS,
+        stream_path=_ITEMS,
+    ),
+    BirdeyeAction(
+        "trades_token_seek",
+        "TRADES",
+        "/defi/txs/token/seek_by_time",
+        required=("address",),
+        optional=_SEEK,
+        compact_fields=_TRADE_FIELDS,
+        stream_path=_ITEMS,
+    ),
+    BirdeyeAction(
+        "trades_pair_seek",
+        "TRADES",
+        "/defi/txs/pair/seek_by_time",
+        required=("address",),
+        optional=_SEEK,
+        compact_fields=_TRADE_FIELDS,
+        stream_path=_ITEMS,
+    ),
+    BirdeyeAction(
+        "trades_v3",
+        "TRADES",
+        "/defi/v3/txs",
+        optional=("address", "owner") + _SEEK,
+        compact_fields=_TRADE_FIELDS,
+        stream_path=_ITEMS,
+    ),
+    BirdeyeAction(
+        "trades_token_v3",
+        "TRADES",
+        "/defi/v3/token/txs",
+        required=("address",),
+        optional=_SEEK,
+        compact_fields=_TRADE_FIELDS,
+        stream_path=_ITEMS,
+    ),
+    # ==================== TOKEN ====================
+    BirdeyeAction(
+        "token_list",
+        "TOKEN",
+        "/defi/tokenlist",
+        optional=_PAGE + ("min_liquidity",),
+        compact_fields=_TOKEN_LIST_FIELDS,
+        stream_path=("data", "tokens"),
+    ),
+    BirdeyeAction(
+        "token_list_v3",
+        "TOKEN",
+        "/defi/v3/token/list",
+        optional=_PAGE + ("min_liquidity",),
+        compact_fields=_TOKEN_LIST_FIELDS,
+        stream_path=_ITEMS,
+    ),
+    BirdeyeAction(
+        "token_list_scroll",
+        "TOKEN",
+        "/defi/v3/token/list/scroll",
+        optional=("limit", "min_liquidity"),
+        compact_fields=_TOKEN_LIST_FIELDS,
+        stream_path=_ITEMS,
+    ),
+    BirdeyeAction(
+        "token_overview",
+        "TOKEN",
+        "/defi/token_overview",
+        required=("address",),
+        compact_fields=(
+            "address",
+            "symbol",
+            "name",
+            "decimals",
+            "price",
+            "priceChange24hPercent",
+            "liquidity",
+            "marketCap",
+            "fdv",
+            "v24hUSD",
+            "holder",
+        ),
+    ),
+    BirdeyeAction(
+        "token_metadata_single",
+        "TOKEN",
+        "/defi/v3/token/meta-data/single",
+        required=("address",),
+        cache_ttl=600.0,
+    ),
+    BirdeyeAction(
+        "token_metadata_multiple",
+        "TOKEN",
+        "/defi/v3/token/meta-data/multiple",
+        required=("list_address",),
+        cache_ttl=600.0,
+    ),
+    BirdeyeAction(
+        "token_market_data",
+        "TOKEN",
+        "/defi/v3/token/market-data",
+        required=("address",),
+    ),
+    BirdeyeAction(
+        "token_market_data_multiple",
+        "TOKEN",
+        "/defi/v3/token/market-data/multiple",
+        required=("list_address",),
+    ),
+    BirdeyeAction(
+        "token_trade_data_single",
+        "TOKEN",
+        "/defi/v3/token/trade-data/single",
+        required=("address",),
+    ),
+    BirdeyeAction(
+        "token_trade_data_multiple",
+        "TOKEN",
+        "/defi/v3/token/trade-data/multiple",
+        required=("list_address",),
+    ),
+    BirdeyeAction(
+        "token_holder",
+        "TOKEN",
+        "/defi/v3/token/holder",
+        required=("address",),
+        optional=_PAGE,
+        compact_fields=("owner", "ui_amount"),
+        stream_path=_ITEMS,
+    ),
+    BirdeyeAction(
+        "token_trending",
+        "TOKEN",
+        "/defi/token_trending",
+        optional=_PAGE,
+        compact_fields=(
+            "address",
+            "symbol",
+            "name",
+            "rank",
+            "price",
+            "liquidity",
+            "volume24hUSD",
+            "price24hChangePercent",
+        ),
+    ),
+    BirdeyeAction(
+        "token_new_listing",
+        "TOKEN",
+        "/defi/v2/tokens/new_listing",
+        optional=("time_to", "time_from", "limit"),
+    ),
+    BirdeyeAction(
+        "token_top_traders",
+        "TOKEN",
+        "/defi/v2/tokens/top_traders",
+        required=("address",),
+        optional=("time_frame",) + _PAGE,
+    ),
+    BirdeyeAction(
+        "token_markets",
+        "TOKEN",
+        "/defi/v2/markets",
+        required=("address",),
+        optional=_PAGE,
+    ),
+    BirdeyeAction(
+        "token_security",
+        "TOKEN",
+        "/defi/token_security",
+        required=("address",),
+        cache_ttl=300.0,
+    ),
+    BirdeyeAction(
+        "token_creation_info",
+        "TOKEN",
+        "/defi/token_creation_info",
+        required=("address",),
+        cache_ttl=3600.0,
+    ),
+    BirdeyeAction(
+        "token_mint_burn",
+        "TOKEN",
+        "/defi/v3/token/mint-burn-txs",
+        required=("address",),
+        optional=("tx_type",) + _PAGE,
+    ),
+    BirdeyeAction(
+        "token_all_time_trades_single",
+        "TOKEN",
+        "/defi/v3/all-time-trades/single",
+        required=("address",),
+    ),
+    BirdeyeAction(
+        "token_all_time_trades_multiple",
+        "TOKEN",
+        "/defi/v3/all-time-trades/multiple",
+        required=("list_address",),
+    ),
+    BirdeyeAction(
+        "token_exit_liquidity",
+        "TOKEN",
+        "/defi/v3/token/exit-liquidity",
+        required=("address",),
+    ),
+    BirdeyeAction(
+        "token_exit_liquidity_multiple",
+        "TOKEN",
+        "/defi/v3/token/exit-liquidity/multiple",
+        required=("list_address",),
+    ),
+    # ==================== PAIR ====================
+    BirdeyeAction(
+        "pair_overview_single",
+        "PAIR",
+        "/defi/v3/pair/overview/single",
+        required=("address",),
+    ),
+    BirdeyeAction(
+        "pair_overview_multiple",
+        "PAIR",
+        "/defi/v3/pair/overview/multiple",
+        required=("list_address",),
+    ),
+    # ==================== TRADER ====================
+    BirdeyeAction(
+        "trader_gainers_losers",
+        "TRADER",
+        "/trader/gainers-losers",
+        optional=("type",) + _PAGE,
+    ),
+    BirdeyeAction(
+        "trader_txs_seek",
+        "TRADER",
+        "/trader/txs/seek_by_time",
+        required=("address",),
+        optional=_SEEK,
+    ),
+    # ==================== WALLET ====================
+    BirdeyeAction(
+        "wallet_token_list",
+        "WALLET",
+        "/v1/wallet/token_list",
+        required=("wallet",),
+        compact_fields=(
+            "wallet",
+            "totalUsd",
+            "address",
+            "symbol",
+            "uiAmount",
+            "priceUsd",
+            "valueUsd",
+        ),
+    ),
+    BirdeyeAction(
+        "wallet_token_balance",
+        "WALLET",
+        "/v1/wallet/token_balance",
+        required=("wallet", "token_address"),
+    ),
+    BirdeyeAction(
+        "wallet_tx_list",
+        "WALLET",
+        "/v1/wallet/tx_list",
+        required=("wallet",),
+        optional=("limit", "before_time"),
+        compact_fields=("txHash", "blockTime", "status", "mainAction", "fee"),
+        stream_path=("data", "*"),
+    ),
+    BirdeyeAction(
+        "wallet_balance_change",
+        "WALLET",
+        "/wallet/v2/balance-change",
+        required=("wallet",),
+        optional=("token_address", "time_from", "time_to") + _PAGE,
+    ),
+    BirdeyeAction(
+        "wallet_pnl_summary",
+        "WALLET",
+        "/wallet/v2/pnl/summary",
+        required=("wallet",),
+        optional=("tx_type",),
+    ),
+    BirdeyeAction(
+        "wallet_pnl_details",
+        "WALLET",
+        "/wallet/v2/pnl/details",
+        method="POST",
+        required=("wallet",),
+        optional=("tokens",),
+        body=("wallet", "tokens"),
+    ),
+    BirdeyeAction(
+        "wallet_pnl_multiple",
+        "WALLET",
+        "/wallet/v2/pnl/multiple",
+        required=("wallets",),
+        error="wallets list is required",
+    ),
+    BirdeyeAction(
+        "wallet_current_net_worth",
+        "WALLET",
+        "/wallet/v2/current-net-worth",
+        required=("wallet",),
+    ),
+    BirdeyeAction(
+        "wallet_net_worth",
+        "WALLET",
+        "/wallet/v2/net-worth",
+        required=("wallet",),
+        optional=("time", "type", "count", "direction"),
+    ),
+    BirdeyeAction(
+        "wallet_net_worth_details",
+        "WALLET",
+        "/wallet/v2/net-worth-details",
+        required=("wallet",),
+        optional=("time", "type"),
+    ),
+    # ==================== SEARCH ====================
+    BirdeyeAction(
+        "search", "SEARCH", "/defi/v3/search", required=("keyword",), optional=_PAGE
+    ),
+    # ==================== UTILS ====================
+    BirdeyeAction("latest_block", "UTILS", "/defi/v3/txs/latest_block"),
+    BirdeyeAction("networks", "UTILS", "/defi/networks", cache_ttl=3600.0),
+    BirdeyeAction(
+        "supported_chains",
+        "UTILS",
+        "/v1/wallet/list_supported_chain",
+        cache_ttl=3600.0,
+    ),
+)
+
+# Dispatch map compiled once at import
+ACTIONS: Dict[str, BirdeyeAction] = {spec.name: spec for spec in BIRDEYE_ACTIONS}
+
+
+def _action_description(actions: Tuple[BirdeyeAction, ...]) -> str:
+    """Build the schema's action list grouped by category."""
+    groups: Dict[str, List[str]] = {}
+    for spec in actions:
+        groups.setdefault(spec.category, []).append(spec.name)
+    listed = " ".join(f"{cat}: {', '.join(names)}." for cat, names in groups.items())
+    return f"The action to perform. Available actions: {listed}"
+
+
+ACTION_DESCRIPTION = _action_description(BIRDEYE_ACTIONS)
+
 
 class BirdeyeTool(AutoTool):
     """
@@ -35,9 +589,10 @@ class BirdeyeTool(AutoTool):
             ),
             registry=registry,
         )
-        self.base_url = "https://public-api.birdeye.so"
+        self.base_url = BIRDEYE_API
         self.api_key = ""
         self.default_chain = "solana"
+        self._cache: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
 
     def get_schema(self) -> Dict[str, Any]:
         """Return the JSON schema for the tool parameters."""
@@ -46,24 +601,7 @@ class BirdeyeTool(AutoTool):
             "properties": {
                 "action": {
                     "type": "string",
-                    "description": (
-                        "The action to perform. Available actions: "
-                        "PRICE: price, multi_price, history_price, historical_price_unix, price_volume_single, price_volume_multi. "
-                        "OHLCV: ohlcv, ohlcv_pair, ohlcv_base_quote, ohlcv_v3, ohlcv_pair_v3. "
-                        "TRADES: trades_token, trades_pair, trades_token_seek, trades_pair_seek, trades_v3, trades_token_v3. "
-                        "TOKEN: token_list, token_list_v3, token_list_scroll, token_overview, token_metadata_single, "
-                        "token_metadata_multiple, token_market_data, token_market_data_multiple, token_trade_data_single, "
-                        "token_trade_data_multiple, token_holder, token_trending, token_new_listing, token_top_traders, "
-                        "token_markets, token_security, token_creation_info, token_mint_burn, token_all_time_trades_single, "
-                        "token_all_time_trades_multiple, token_exit_liquidity, token_exit_liquidity_multiple. "
-                        "PAIR: pair_overview_single, pair_overview_multiple. "
-                        "TRADER: trader_gainers_losers, trader_txs_seek. "
-                        "WALLET: wallet_token_list, wallet_token_balance, wallet_tx_list, wallet_balance_change, "
-                        "wallet_pnl_summary, wallet_pnl_details, wallet_pnl_multiple, wallet_current_net_worth, "
-                        "wallet_net_worth, wallet_net_worth_details. "
-                        "SEARCH: search. "
-                        "UTILS: latest_block, networks, supported_chains."
-                    ),
+                    "description": ACTION_DESCRIPTION,
                 },
                 "address": {
                     "type": "string",
@@ -190,6 +728,23 @@ class BirdeyeTool(AutoTool):
                     "description": "Direction for wallet_net_worth (back, forward). Pass empty string if not needed.",
                     "default": "",
                 },
+                "fields": {
+                    "type": "string",
+                    "description": (
+                        "Comma-separated response keys to keep on each record "
+                        "(e.g. 'symbol,price,liquidity'). Pass empty string to keep all keys."
+                    ),
+                    "default": "",
+                },
+                "compact": {
+                    "type": "boolean",
+                    "description": (
+                        "Return a compact response: keep only the most useful keys for the "
+                        f"action and truncate lists to {COMPACT_MAX_ITEMS} items with a count. "
+                        "Recommended unless full details are needed."
+                    ),
+                    "default": False,
+                },
             },
             "required": [
                 "action",
@@ -218,6 +773,8 @@ class BirdeyeTool(AutoTool):
                 "time",
                 "count",
                 "direction",
+                "fields",
+                "compact",
             ],
             "additionalProperties": False,
         }
@@ -232,6 +789,17 @@ class BirdeyeTool(AutoTool):
             self.api_key = birdeye_config.get("api_key", "")
             if birdeye_config.get("chain"):
                 self.default_chain = birdeye_config.get("chain")
+            if self.api_key:
+                get_rate_limiter(
+                    self.api_key,
+                    rate_limits=birdeye_config.get("rate_limits"),
+                    credit_costs=birdeye_config.get("credit_costs"),
+                    max_retries=birdeye_config.get("max_retries"),
+                )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return rate limit and credit usage metrics for the configured API key."""
+        return get_rate_limiter(self.api_key).get_metrics()
 
     async def _request(
         self,
@@ -240,8 +808,18 @@ class BirdeyeTool(AutoTool):
         params: dict = None,
         json_data: dict = None,
         chain: str = "solana",
+        fields: Optional[frozenset] = None,
+        max_items: Optional[int] = None,
+        stream_path: Tuple[str, ...] = (),
     ) -> dict:
-        """Make authenticated request to Birdeye API."""
+        """
+        Make authenticated request to Birdeye API.
+
+        The decoded `data` is projected to `fields` and lists truncated to
+        `max_items` before it is returned, so the full payload is dropped early.
+        When `stream_path` is set, the list at that path is decoded item by item
+        from the body stream instead of loading the whole body into memory.
+        """
         if not self.api_key:
             return {
                 "success": False,
@@ -255,28 +833,73 @@ class BirdeyeTool(AutoTool):
         }
 
         url = f"{self.base_url}{endpoint}"
+        limiter = get_rate_limiter(self.api_key)
 
         async with httpx.AsyncClient(timeout=30.0) as client:
             try:
-                if method.upper() == "GET":
-                    response = await client.get(url, headers=headers, params=params)
-                else:
-                    response = await client.post(
-                        url, headers=headers, params=params, json=json_data
-                    )
-
-                if response.status_code != 200:
-                    return {
-                        "success": False,
-                        "error": f"API error: {response.status_code}",
-                        "details": response.text,
-                    }
-
-                data = response.json()
-                return {"success": True, "data": data.get("data", data)}
+                response = await limiter.request(
+                    client,
+                    method.upper(),
+                    url,
+                    endpoint,
+                    headers=headers,
+                    params=params,
+                    json=json_data,
+                    stream=bool(stream_path),
+                )
+
+                try:
+                    if response.status_code != 200:
+                        await response.aread()
+                    if response.status_code == 429:
+                        return {
+                            "success": False,
+                            "error": "API error: 429 (rate limited, retries exhausted)",
+                            "details": response.text,
+                        }
+                    if response.status_code != 200:
+                        return {
+                            "success": False,
+                            "error": f"API error: {response.status_code}",
+                            "details": response.text,
+                        }
+
+                    if stream_path:
+                        data = await self._decode_stream(
+                            response, stream_path, fields, max_items
+                        )
+                        return {"success": True, "data": data}
+
+                    data = response.json()
+                    data = data.get("data", data)
+                    if fields is not None or max_items is not None:
+                        data = project(data, fields, max_items)
+                    return {"success": True, "data": data}
+                finally:
+                    await response.aclose()
             except Exception as e:  # pragma: no cover
                 return {"success": False, "error": str(e)}
 
+    @staticmethod
+    async def _decode_stream(
+        response: httpx.Response,
+        stream_path: Tuple[str, ...],
+        fields: Optional[frozenset],
+        max_items: Optional[int],
+    ) -> Dict[str, Any]:
+        """Decode a streamed list response, projecting each item as it arrives."""
+        stream = JsonArrayStream(stream_path, max_items=max_items)
+        items = [
+            project(item, fields, max_items)
+            async for item in stream.items(response.aiter_bytes())
+        ]
+        data = project(stream.siblings, fields, max_items)
+        if stream.found:
+            data[stream.key] = items
+            if max_items is not None and stream.count > max_items:
+                data[f"{stream.key}_count"] = stream.count
+        return data
+
     async def execute(  # pragma: no cover
         self,
         action: str,
@@ -305,894 +928,80 @@ class BirdeyeTool(AutoTool):
         time: str = "",
         count: int = 0,
         direction: str = "",
+        fields: str = "",
+        compact: bool = False,
     ) -> Dict[str, Any]:
         """Execute a Birdeye action."""
-        # Use default chain if not specified
-        chain = chain or self.default_chain
-
-        # Build kwargs from the schema parameters for the internal action handlers
-        kwargs: Dict[str, Any] = {}
-        if address:
-            kwargs["address"] = address
-        if wallet:
-            kwargs["wallet"] = wallet
-        if keyword:
-            kwargs["keyword"] = keyword
-        if list_address:
-            kwargs["list_address"] = list_address
-        if type:
-            kwargs["type"] = type
-        if time_from:
-            kwargs["time_from"] = time_from
-        if time_to:
-            kwargs["time_to"] = time_to
-        if offset:
-            kwargs["offset"] = offset
-        if limit:
-            kwargs["limit"] = limit
-        if token_address:
-            kwargs["token_address"] = token_address
-        if base_address:
-            kwargs["base_address"] = base_address
-        if quote_address:
-            kwargs["quote_address"] = quote_address
-        if unixtime:
-            kwargs["unixtime"] = unixtime
-        if before_time:
-            kwargs["before_time"] = before_time
-        if after_time:
-            kwargs["after_time"] = after_time
-        if tx_type:
-            kwargs["tx_type"] = tx_type
-        if time_frame:
-            kwargs["time_frame"] = time_frame
-        if owner:
-            kwargs["owner"] = owner
-        if min_liquidity:
-            kwargs["min_liquidity"] = min_liquidity
-        if wallets:
-            kwargs["wallets"] = wallets
-        if tokens:
-            kwargs["tokens"] = tokens
-        if time:
-            kwargs["time"] = time
-        if count:
-            kwargs["count"] = count
-        if direction:
-            kwargs["direction"] = direction
-
-        # ==================== PRICE ====================
-        if action == "price":
-            # Get current price of a token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("check_liquidity"):
-                params["check_liquidity"] = kwargs["check_liquidity"]
-            if kwargs.get("include_liquidity"):
-                params["include_liquidity"] = kwargs["include_liquidity"]
-            return await self._request("GET", "/defi/price", params=params, chain=chain)
-
-        elif action == "multi_price":
-            # Get prices for multiple tokens (GET method)
-            addresses = kwargs.get("list_address")
-            if not addresses:
-                return {"success": False, "error": "list_address is required"}
-            params = {"list_address": addresses}
-            if kwargs.get("check_liquidity"):
-                params["check_liquidity"] = kwargs["check_liquidity"]
-            if kwargs.get("include_liquidity"):
-                params["include_liquidity"] = kwargs["include_liquidity"]
-            return await self._request(
-                "GET", "/defi/multi_price", params=params, chain=chain
-            )
-
-        elif action == "multi_price_post":
-            # Get prices for multiple tokens (POST method)
-            addresses = kwargs.get("list_address")
-            if not addresses:
-                return {"success": False, "error": "list_address is required"}
-            json_data = {"list_address": addresses}
-            params = {}
-            if kwargs.get("check_liquidity"):
-                params["check_liquidity"] = kwargs["check_liquidity"]
-            if kwargs.get("include_liquidity"):
-                params["include_liquidity"] = kwargs["include_liquidity"]
-            return await self._request(
-                "POST",
-                "/defi/multi_price",
-                params=params,
-                json_data=json_data,
-                chain=chain,
-            )
-
-        elif action == "history_price":
-            # Get historical price data
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {
-                "address": address,
-                "address_type": kwargs.get("address_type", "token"),
-                "type": kwargs.get("type", "1H"),
-            }
-            if kwargs.get("time_from"):
-                params["time_from"] = kwargs["time_from"]
-            if kwargs.get("time_to"):
-                params["time_to"] = kwargs["time_to"]
-            return await self._request(
-                "GET", "/defi/history_price", params=params, chain=chain
-            )
-
-        elif action == "historical_price_unix":
-            # Get historical price at specific unix timestamp
-            address = kwargs.get("address")
-            unixtime = kwargs.get("unixtime")
-            if not address or not unixtime:
-                return {"success": False, "error": "address and unixtime are required"}
-            params = {"address": address, "unixtime": unixtime}
-            return await self._request(
-                "GET", "/defi/historical_price_unix", params=params, chain=chain
-            )
-
-        elif action == "price_volume_single":
-            # Get price and volume for single token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("type"):
-                params["type"] = kwargs["type"]
-            return await self._request(
-                "GET", "/defi/price_volume/single", params=params, chain=chain
-            )
-
-        elif action == "price_volume_multi":
-            # Get price and volume for multiple tokens (POST)
-            addresses = kwargs.get("list_address")
-            if not addresses:
-                return {"success": False, "error": "list_address is required"}
-            json_data = {"list_address": addresses}
-            params = {}
-            if kwargs.get("type"):
-                params["type"] = kwargs["type"]
-            return await self._request(
-                "POST",
-                "/defi/price_volume/multi",
-                params=params,
-                json_data=json_data,
-                chain=chain,
-            )
-
-        # ==================== OHLCV ====================
-        elif action == "ohlcv":
-            # Get OHLCV candlestick data for a token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {
-                "address": address,
-                "type": kwargs.get("type", "1H"),
-            }
-            if kwargs.get("time_from"):
-                params["time_from"] = kwargs["time_from"]
-            if kwargs.get("time_to"):
-                params["time_to"] = kwargs["time_to"]
-            return await self._request("GET", "/defi/ohlcv", params=params, chain=chain)
-
-        elif action == "ohlcv_pair":
-            # Get OHLCV data for a trading pair
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {
-                "address": address,
-                "type": kwargs.get("type", "1H"),
-            }
-            if kwargs.get("time_from"):
-                params["time_from"] = kwargs["time_from"]
-            if kwargs.get("time_to"):
-                params["time_to"] = kwargs["time_to"]
-            return await self._request(
-                "GET", "/defi/ohlcv/pair", params=params, chain=chain
-            )
-
-        elif action == "ohlcv_base_quote":
-            # Get OHLCV for base/quote pair
-            base_address = kwargs.get("base_address")
-            quote_address = kwargs.get("quote_address")
-            if not base_address or not quote_address:
-                return {
-                    "success": False,
-                    "error": "base_address and quote_address are required",
-                }
-            params = {
-                "base_address": base_address,
-                "quote_address": quote_address,
-                "type": kwargs.get("type", "1H"),
-            }
-            if kwargs.get("time_from"):
-                params["time_from"] = kwargs["time_from"]
-            if kwargs.get("time_to"):
-                params["time_to"] = kwargs["time_to"]
-            return await self._request(
-                "GET", "/defi/ohlcv/base_quote", params=params, chain=chain
-            )
-
-        elif action == "ohlcv_v3":
-            # Get OHLCV v3 for token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {
-                "address": address,
-                "type": kwargs.get("type", "1H"),
-            }
-            if kwargs.get("time_from"):
-                params["time_from"] = kwargs["time_from"]
-            if kwargs.get("time_to"):
-                params["time_to"] = kwargs["time_to"]
-            if kwargs.get("currency"):
-                params["currency"] = kwargs["currency"]
-            return await self._request(
-                "GET", "/defi/v3/ohlcv", params=params, chain=chain
-            )
-
-        elif action == "ohlcv_pair_v3":
-            # Get OHLCV v3 for pair
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {
-                "address": address,
-                "type": kwargs.get("type", "1H"),
-            }
-            if kwargs.get("time_from"):
-                params["time_from"] = kwargs["time_from"]
-            if kwargs.get("time_to"):
-                params["time_to"] = kwargs["time_to"]
-            return await self._request(
-                "GET", "/defi/v3/ohlcv/pair", params=params, chain=chain
-            )
-
-        # ==================== TRADES ====================
-        elif action == "trades_token":
-            # Get recent trades for a token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("tx_type"):
-                params["tx_type"] = kwargs["tx_type"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/defi/txs/token", params=params, chain=chain
-            )
-
-        elif action == "trades_pair":
-            # Get recent trades for a pair
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("tx_type"):
-                params["tx_type"] = kwargs["tx_type"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/defi/txs/pair", params=params, chain=chain
-            )
-
-        elif action == "trades_token_seek":
-            # Get trades for token with time bounds
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("tx_type"):
-                params["tx_type"] = kwargs["tx_type"]
-            if kwargs.get("before_time"):
-                params["before_time"] = kwargs["before_time"]
-            if kwargs.get("after_time"):
-                params["after_time"] = kwargs["after_time"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/defi/txs/token/seek_by_time", params=params, chain=chain
-            )
-
-        elif action == "trades_pair_seek":
-            # Get trades for pair with time bounds
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("tx_type"):
-                params["tx_type"] = kwargs["tx_type"]
-            if kwargs.get("before_time"):
-                params["before_time"] = kwargs["before_time"]
-            if kwargs.get("after_time"):
-                params["after_time"] = kwargs["after_time"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/defi/txs/pair/seek_by_time", params=params, chain=chain
-            )
-
-        elif action == "trades_v3":
-            # Get trades v3 with filters
-            params = {}
-            if kwargs.get("address"):
-                params["address"] = kwargs["address"]
-            if kwargs.get("owner"):
-                params["owner"] = kwargs["owner"]
-            if kwargs.get("tx_type"):
-                params["tx_type"] = kwargs["tx_type"]
-            if kwargs.get("before_time"):
-                params["before_time"] = kwargs["before_time"]
-            if kwargs.get("after_time"):
-                params["after_time"] = kwargs["after_time"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/defi/v3/txs", params=params, chain=chain
-            )
-
-        elif action == "trades_token_v3":
-            # Get token trades v3
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("tx_type"):
-                params["tx_type"] = kwargs["tx_type"]
-            if kwargs.get("before_time"):
-                params["before_time"] = kwargs["before_time"]
-            if kwargs.get("after_time"):
-                params["after_time"] = kwargs["after_time"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            if kwargs.get("cursor"):
-                params["cursor"] = kwargs["cursor"]
-            return await self._request(
-                "GET", "/defi/v3/token/txs", params=params, chain=chain
-            )
-
-        # ==================== TOKEN ====================
-        elif action == "token_list":
-            # Get list of tokens
-            params = {}
-            if kwargs.get("sort_by"):
-                params["sort_by"] = kwargs["sort_by"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            if kwargs.get("min_liquidity"):
-                params["min_liquidity"] = kwargs["min_liquidity"]
-            return await self._request(
-                "GET", "/defi/tokenlist", params=params, chain=chain
-            )
-
-        elif action == "token_list_v3":
-            # Get token list v3
-            params = {}
-            if kwargs.get("sort_by"):
-                params["sort_by"] = kwargs["sort_by"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            if kwargs.get("min_liquidity"):
-                params["min_liquidity"] = kwargs["min_liquidity"]
-            if kwargs.get("min_volume_24h_usd"):
-                params["min_volume_24h_usd"] = kwargs["min_volume_24h_usd"]
-            if kwargs.get("min_market_cap"):
-                params["min_market_cap"] = kwargs["min_market_cap"]
-            return await self._request(
-                "GET", "/defi/v3/token/list", params=params, chain=chain
-            )
-
-        elif action == "token_list_scroll":
-            # Get token list with scroll pagination
-            params = {}
-            if kwargs.get("sort_by"):
-                params["sort_by"] = kwargs["sort_by"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            if kwargs.get("min_liquidity"):
-                params["min_liquidity"] = kwargs["min_liquidity"]
-            if kwargs.get("scroll_id"):
-                params["scroll_id"] = kwargs["scroll_id"]
-            return await self._request(
-                "GET", "/defi/v3/token/list/scroll", params=params, chain=chain
-            )
-
-        elif action == "token_overview":
-            # Get detailed token overview
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            return await self._request(
-                "GET", "/defi/token_overview", params=params, chain=chain
-            )
-
-        elif action == "token_metadata_single":
-            # Get metadata for single token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            return await self._request(
-                "GET", "/defi/v3/token/meta-data/single", params=params, chain=chain
-            )
-
-        elif action == "token_metadata_multiple":
-            # Get metadata for multiple tokens
-            addresses = kwargs.get("list_address")
-            if not addresses:
-                return {"success": False, "error": "list_address is required"}
-            params = {"list_address": addresses}
-            return await self._request(
-                "GET", "/defi/v3/token/meta-data/multiple", params=params, chain=chain
-            )
-
-        elif action == "token_market_data":
-            # Get market data for single token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            return await self._request(
-                "GET", "/defi/v3/token/market-data", params=params, chain=chain
-            )
-
-        elif action == "token_market_data_multiple":
-            # Get market data for multiple tokens
-            addresses = kwargs.get("list_address")
-            if not addresses:
-                return {"success": False, "error": "list_address is required"}
-            params = {"list_address": addresses}
-            return await self._request(
-                "GET", "/defi/v3/token/market-data/multiple", params=params, chain=chain
-            )
-
-        elif action == "token_trade_data_single":
-            # Get trade data for single token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            return await self._request(
-                "GET", "/defi/v3/token/trade-data/single", params=params, chain=chain
-            )
-
-        elif action == "token_trade_data_multiple":
-            # Get trade data for multiple tokens
-            addresses = kwargs.get("list_address")
-            if not addresses:
-                return {"success": False, "error": "list_address is required"}
-            params = {"list_address": addresses}
-            return await self._request(
-                "GET", "/defi/v3/token/trade-data/multiple", params=params, chain=chain
-            )
-
-        elif action == "token_holder":
-            # Get token holders
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/defi/v3/token/holder", params=params, chain=chain
-            )
-
-        elif action == "token_trending":
-            # Get trending tokens
-            params = {}
-            if kwargs.get("sort_by"):
-                params["sort_by"] = kwargs["sort_by"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/defi/token_trending", params=params, chain=chain
-            )
-
-        elif action == "token_new_listing":
-            # Get newly listed tokens
-            params = {}
-            if kwargs.get("time_to"):
-                params["time_to"] = kwargs["time_to"]
-            if kwargs.get("time_from"):
-                params["time_from"] = kwargs["time_from"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            if kwargs.get("meme_platform_enabled"):
-                params["meme_platform_enabled"] = kwargs["meme_platform_enabled"]
-            return await self._request(
-                "GET", "/defi/v2/tokens/new_listing", params=params, chain=chain
-            )
-
-        elif action == "token_top_traders":
-            # Get top traders for a token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("time_frame"):
-                params["time_frame"] = kwargs["time_frame"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("sort_by"):
-                params["sort_by"] = kwargs["sort_by"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/defi/v2/tokens/top_traders", params=params, chain=chain
-            )
-
-        elif action == "token_markets":
-            # Get markets for a token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("sort_by"):
-                params["sort_by"] = kwargs["sort_by"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/defi/v2/markets", params=params, chain=chain
-            )
-
-        elif action == "token_security":
-            # Get token security analysis
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            return await self._request(
-                "GET", "/defi/token_security", params=params, chain=chain
-            )
-
-        elif action == "token_creation_info":
-            # Get token creation information
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            return await self._request(
-                "GET", "/defi/token_creation_info", params=params, chain=chain
-            )
-
-        elif action == "token_mint_burn":
-            # Get mint/burn transactions
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("tx_type"):
-                params["tx_type"] = kwargs["tx_type"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/defi/v3/token/mint-burn-txs", params=params, chain=chain
-            )
-
-        elif action == "token_all_time_trades_single":
-            # Get all-time trade stats for single token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            return await self._request(
-                "GET", "/defi/v3/all-time-trades/single", params=params, chain=chain
-            )
-
-        elif action == "token_all_time_trades_multiple":
-            # Get all-time trade stats for multiple tokens
-            addresses = kwargs.get("list_address")
-            if not addresses:
-                return {"success": False, "error": "list_address is required"}
-            params = {"list_address": addresses}
-            return await self._request(
-                "GET", "/defi/v3/all-time-trades/multiple", params=params, chain=chain
-            )
-
-        elif action == "token_exit_liquidity":
-            # Get exit liquidity for a token
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            return await self._request(
-                "GET", "/defi/v3/token/exit-liquidity", params=params, chain=chain
-            )
-
-        elif action == "token_exit_liquidity_multiple":
-            # Get exit liquidity for multiple tokens (max 50)
-            addresses = kwargs.get("list_address")
-            if not addresses:
-                return {"success": False, "error": "list_address is required"}
-            params = {"list_address": addresses}
-            return await self._request(
-                "GET",
-                "/defi/v3/token/exit-liquidity/multiple",
-                params=params,
-                chain=chain,
-            )
-
-        # ==================== PAIR ====================
-        elif action == "pair_overview_single":
-            # Get overview for single pair
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            return await self._request(
-                "GET", "/defi/v3/pair/overview/single", params=params, chain=chain
-            )
-
-        elif action == "pair_overview_multiple":
-            # Get overview for multiple pairs
-            addresses = kwargs.get("list_address")
-            if not addresses:
-                return {"success": False, "error": "list_address is required"}
-            params = {"list_address": addresses}
-            return await self._request(
-                "GET", "/defi/v3/pair/overview/multiple", params=params, chain=chain
-            )
-
-        # ==================== TRADER ====================
-        elif action == "trader_gainers_losers":
-            # Get top gainers and losers
-            params = {}
-            if kwargs.get("type"):
-                params["type"] = kwargs["type"]
-            if kwargs.get("sort_by"):
-                params["sort_by"] = kwargs["sort_by"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/trader/gainers-losers", params=params, chain=chain
-            )
-
-        elif action == "trader_txs_seek":
-            # Get trader transactions with time bounds
-            address = kwargs.get("address")
-            if not address:
-                return {"success": False, "error": "address is required"}
-            params = {"address": address}
-            if kwargs.get("tx_type"):
-                params["tx_type"] = kwargs["tx_type"]
-            if kwargs.get("before_time"):
-                params["before_time"] = kwargs["before_time"]
-            if kwargs.get("after_time"):
-                params["after_time"] = kwargs["after_time"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            return await self._request(
-                "GET", "/trader/txs/seek_by_time", params=params, chain=chain
-            )
-
-        # ==================== WALLET ====================
-        elif action == "wallet_token_list":
-            # Get wallet token holdings
-            wallet = kwargs.get("wallet")
-            if not wallet:
-                return {"success": False, "error": "wallet is required"}
-            params = {"wallet": wallet}
-            return await self._request(
-                "GET", "/v1/wallet/token_list", params=params, chain=chain
-            )
-
-        elif action == "wallet_token_balance":
-            # Get specific token balance in wallet
-            wallet = kwargs.get("wallet")
-            token_address = kwargs.get("token_address")
-            if not wallet or not token_address:
-                return {
-                    "success": False,
-                    "error": "wallet and token_address are required",
-                }
-            params = {"wallet": wallet, "token_address": token_address}
-            return await self._request(
-                "GET", "/v1/wallet/token_balance", params=params, chain=chain
-            )
-
-        elif action == "wallet_tx_list":
-            # Get wallet transaction history
-            wallet = kwargs.get("wallet")
-            if not wallet:
-                return {"success": False, "error": "wallet is required"}
-            params = {"wallet": wallet}
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            if kwargs.get("before_time"):
-                params["before_time"] = kwargs["before_time"]
-            return await self._request(
-                "GET", "/v1/wallet/tx_list", params=params, chain=chain
-            )
-
-        elif action == "wallet_balance_change":
-            # Get wallet balance changes
-            wallet = kwargs.get("wallet")
-            if not wallet:
-                return {"success": False, "error": "wallet is required"}
-            params = {"wallet": wallet}
-            if kwargs.get("token_address"):
-                params["token_address"] = kwargs["token_address"]
-            if kwargs.get("time_from"):
-                params["time_from"] = kwargs["time_from"]
-            if kwargs.get("time_to"):
-                params["time_to"] = kwargs["time_to"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            return await self._request(
-                "GET", "/wallet/v2/balance-change", params=params, chain=chain
-            )
-
-        elif action == "wallet_pnl_summary":
-            # Get PNL summary for a wallet
-            wallet = kwargs.get("wallet")
-            if not wallet:
-                return {"success": False, "error": "wallet is required"}
-            params = {"wallet": wallet}
-            if kwargs.get("tx_type"):
-                params["tx_type"] = kwargs["tx_type"]
-            return await self._request(
-                "GET", "/wallet/v2/pnl/summary", params=params, chain=chain
-            )
-
-        elif action == "wallet_pnl_details":
-            # Get PNL details broken down by token (POST, max 100 tokens)
-            wallet = kwargs.get("wallet")
-            if not wallet:
-                return {"success": False, "error": "wallet is required"}
-            json_data = {"wallet": wallet}
-            if kwargs.get("tokens"):
-                json_data["tokens"] = kwargs["tokens"]
-            return await self._request(
-                "POST", "/wallet/v2/pnl/details", json_data=json_data, chain=chain
-            )
-
-        elif action == "wallet_pnl_multiple":
-            # Get PNL for multiple wallets (max 50)
-            wallets = kwargs.get("wallets")
-            if not wallets:
-                return {"success": False, "error": "wallets list is required"}
-            params = {
-                "wallets": ",".join(wallets) if isinstance(wallets, list) else wallets
-            }
-            return await self._request(
-                "GET", "/wallet/v2/pnl/multiple", params=params, chain=chain
-            )
-
-        elif action == "wallet_current_net_worth":
-            # Get current net worth and portfolio
-            wallet = kwargs.get("wallet")
-            if not wallet:
-                return {"success": False, "error": "wallet is required"}
-            params = {"wallet": wallet}
-            return await self._request(
-                "GET", "/wallet/v2/current-net-worth", params=params, chain=chain
-            )
-
-        elif action == "wallet_net_worth":
-            # Get historical net worth by dates
-            wallet = kwargs.get("wallet")
-            if not wallet:
-                return {"success": False, "error": "wallet is required"}
-            params = {"wallet": wallet}
-            if kwargs.get("time"):
-                params["time"] = kwargs["time"]  # ISO 8601 UTC format
-            if kwargs.get("type"):
-                params["type"] = kwargs["type"]  # 1h or 1d
-            if kwargs.get("count"):
-                params["count"] = kwargs["count"]
-            if kwargs.get("direction"):
-                params["direction"] = kwargs["direction"]  # back or forward
-            return await self._request(
-                "GET", "/wallet/v2/net-worth", params=params, chain=chain
-            )
-
-        elif action == "wallet_net_worth_details":
-            # Get asset details on a specific date
-            wallet = kwargs.get("wallet")
-            if not wallet:
-                return {"success": False, "error": "wallet is required"}
-            params = {"wallet": wallet}
-            if kwargs.get("time"):
-                params["time"] = kwargs["time"]  # ISO 8601 UTC format
-            if kwargs.get("type"):
-                params["type"] = kwargs["type"]  # 1h or 1d
-            return await self._request(
-                "GET", "/wallet/v2/net-worth-details", params=params, chain=chain
-            )
-
-        # ==================== SEARCH ====================
-        elif action == "search":
-            # Search for tokens/pairs
-            keyword = kwargs.get("keyword")
-            if not keyword:
-                return {"success": False, "error": "keyword is required"}
-            params = {"keyword": keyword}
-            if kwargs.get("target"):
-                params["target"] = kwargs["target"]
-            if kwargs.get("sort_by"):
-                params["sort_by"] = kwargs["sort_by"]
-            if kwargs.get("sort_type"):
-                params["sort_type"] = kwargs["sort_type"]
-            if kwargs.get("offset"):
-                params["offset"] = kwargs["offset"]
-            if kwargs.get("limit"):
-                params["limit"] = kwargs["limit"]
-            if kwargs.get("verify_token"):
-                params["verify_token"] = kwargs["verify_token"]
-            if kwargs.get("markets"):
-                params["markets"] = kwargs["markets"]
-            return await self._request(
-                "GET", "/defi/v3/search", params=params, chain=chain
-            )
+        spec = ACTIONS.get(action)
+        if spec is None:
+            return {"success": False, "error": f"Unknown action: {action}"}
 
-        # ==================== UTILS ====================
-        elif action == "latest_block":
-            # Get latest block info
-            return await self._request("GET", "/defi/v3/txs/latest_block", chain=chain)
+        values = {
+            "address": address,
+            "wallet": wallet,
+            "keyword": keyword,
+            "list_address": list_address,
+            "type": type,
+            "time_from": time_from,
+            "time_to": time_to,
+            "offset": offset,
+            "limit": limit,
+            "token_address": token_address,
+            "base_address": base_address,
+            "quote_address": quote_address,
+            "unixtime": unixtime,
+            "before_time": before_time,
+            "after_time": after_time,
+            "tx_type": tx_type,
+            "time_frame": time_frame,
+            "owner": owner,
+            "min_liquidity": min_liquidity,
+            "wallets": wallets,
+            "tokens": tokens,
+            "time": time,
+            "count": count,
+            "direction": direction,
+        }
+        error = spec.validate(values)
+        if error:
+            return {"success": False, "error": error}
 
-        elif action == "networks":
-            # Get supported networks
-            return await self._request("GET", "/defi/networks", chain=chain)
+        params, json_data = spec.build(values)
+        # Use default chain if not specified
+        chain = chain or self.default_chain
 
-        elif action == "supported_chains":
-            # Get supported chains for wallet API
-            return await self._request(
-                "GET", "/v1/wallet/list_supported_chain", chain=chain
+        projection, max_items = spec.projection(fields, compact)
+
+        cache_key = None
+        if spec.cache_ttl:
+            cache_key = (
+                spec.name,
+                chain,
+                repr(params),
+                repr(json_data),
+                fields,
+                compact,
             )
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] > monotonic():
+                return dict(cached[1])
+
+        result = await self._request(
+            spec.method,
+            spec.endpoint,
+            params=params,
+            json_data=json_data,
+            chain=chain,
+            fields=projection,
+            max_items=max_items,
+            stream_path=spec.stream_path,
+        )
 
-        else:
-            return {"success": False, "error": f"Unknown action: {action}"}
+        if cache_key and result.get("success"):
+            if len(self._cache) >= CACHE_MAX_ENTRIES:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[cache_key] = (monotonic() + spec.cache_ttl, result)
+        return result
 
 
 class BirdeyePlugin:
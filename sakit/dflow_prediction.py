@@ -27,8 +27,10 @@ from solders.transaction import VersionedTransaction
 from solders.message import to_bytes_versioned
 
 from sakit.utils.dflow import DFlowPredictionClient
+from sakit.utils.jobs import get_job_manager, job_submitted
 from sakit.utils.trigger import replace_blockhash_in_transaction, get_fresh_blockhash
 from sakit.utils.wallet import send_raw_transaction_with_priority
+from sakit.utils.keyring import get_keyring, load_address, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +86,7 @@ class DFlowPredictionTool(AutoTool):
                         "buy",
                         "sell",
                         "positions",
+                        "job_status",
                     ],
                     "description": (
                         "Action to perform: "
@@ -94,7 +97,8 @@ class DFlowPredictionTool(AutoTool):
                         "'get_market' - Get specific market details. "
                         "'buy' - Buy outcome tokens (YES/NO). "
                         "'sell' - Sell outcome tokens. "
-                        "'positions' - Get user's prediction market positions."
+                        "'positions' - Get user's prediction market positions. "
+                        "'job_status' - Get the result of a background buy/sell by job_id."
                     ),
                 },
                 "query": {
@@ -140,6 +144,14 @@ class DFlowPredictionTool(AutoTool):
                     "type": ["boolean", "null"],
                     "description": "Include low-quality markets (with warnings). Default false. Pass null to use default.",
                 },
+                "background": {
+                    "type": ["boolean", "null"],
+                    "description": "Run 'buy'/'sell' as a background job and return a job_id immediately instead of waiting for the order to fill. Default false. Pass null to use default.",
+                },
+                "job_id": {
+                    "type": ["string", "null"],
+                    "description": "Job ID returned by a background 'buy'/'sell' (for 'job_status' action). Pass null if not needed.",
+                },
             },
             "required": [
                 "action",
@@ -153,6 +165,8 @@ class DFlowPredictionTool(AutoTool):
                 "status",
                 "sort",
                 "include_risky",
+                "background",
+                "job_id",
             ],
             "additionalProperties": False,
         }
@@ -169,6 +183,11 @@ class DFlowPredictionTool(AutoTool):
         self._min_liquidity_usd = tool_cfg.get("min_liquidity_usd", 500)
         self._include_risky = tool_cfg.get("include_risky", False)
         self._payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self._private_key, self._payer_private_key)
+        get_job_manager().configure(
+            store_path=tool_cfg.get("job_store_path"),
+            max_concurrent=tool_cfg.get("max_background_jobs"),
+        )
 
     def _get_client(
         self, include_risky: Optional[bool] = None
@@ -186,7 +205,7 @@ class DFlowPredictionTool(AutoTool):
         """Get the keypair from private key config."""
         if not self._private_key:
             raise ValueError("private_key not configured")
-        return Keypair.from_base58_string(self._private_key)
+        return load_keypair(self._private_key)
 
     async def _sign_and_send(
         self,
@@ -226,7 +245,7 @@ class DFlowPredictionTool(AutoTool):
 
         # Sign with payer if configured
         if self._payer_private_key:
-            payer_keypair = Keypair.from_base58_string(self._payer_private_key)
+            payer_keypair = load_keypair(self._payer_private_key)
             payer_pubkey = payer_keypair.pubkey()
             payer_signature = payer_keypair.sign_message(message_bytes)
 
@@ -305,12 +324,51 @@ class DFlowPredictionTool(AutoTool):
         status: str = "active",
         sort: str = "volume",
         include_risky: Optional[bool] = None,
+        background: Optional[bool] = None,
+        job_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Execute a prediction market action."""
 
         client = self._get_client(include_risky)
 
         try:
+            # =====================================================================
+            # BACKGROUND JOBS
+            # =====================================================================
+
+            if action == "job_status":
+                return get_job_manager().status(
+                    job_id,
+                    owner=load_address(self._private_key)
+                    if self._private_key
+                    else None,
+                )
+
+            if background and action in ("buy", "sell"):
+                params = {
+                    "market_id": market_id,
+                    "mint_address": mint_address,
+                    "side": side,
+                    "amount": amount,
+                    "include_risky": include_risky,
+                }
+
+                async def run_in_background() -> Dict[str, Any]:
+                    return await self.execute(
+                        action=action,
+                        **params,
+                    )
+
+                job = get_job_manager().submit(
+                    f"dflow_prediction.{action}",
+                    run_in_background,
+                    owner=load_address(self._private_key)
+                    if self._private_key
+                    else None,
+                    params=params,
+                )
+                return job_submitted(job, action)
+
             # =====================================================================
             # DISCOVERY ACTIONS
             # =====================================================================
@@ -383,8 +441,8 @@ class DFlowPredictionTool(AutoTool):
                 if not amount:
                     return {"status": "error", "message": "amount required for buy"}
 
-                keypair = Keypair.from_base58_string(self._private_key)
-                user_pubkey = str(keypair.pubkey())
+                keypair = load_keypair(self._private_key)
+                user_pubkey = load_address(self._private_key)
 
                 # Get market to find the outcome mint
                 market = await self._get_market_with_mints(
@@ -473,8 +531,8 @@ class DFlowPredictionTool(AutoTool):
                 if not amount:
                     return {"status": "error", "message": "amount required for sell"}
 
-                keypair = Keypair.from_base58_string(self._private_key)
-                user_pubkey = str(keypair.pubkey())
+                keypair = load_keypair(self._private_key)
+                user_pubkey = load_address(self._private_key)
 
                 # Get market to find the outcome mint
                 market = await self._get_market_with_mints(
@@ -546,8 +604,8 @@ class DFlowPredictionTool(AutoTool):
                         "message": "rpc_url must be configured to query positions",
                     }
 
-                keypair = Keypair.from_base58_string(self._private_key)
-                user_pubkey = str(keypair.pubkey())
+                keypair = load_keypair(self._private_key)
+                user_pubkey = load_address(self._private_key)
 
                 # Query positions via RPC + DFlow outcome mints
                 positions_result = await client.get_positions(
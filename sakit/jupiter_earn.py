@@ -11,14 +11,15 @@ from typing import Any, Dict, List, Optional
 
 from solana_agent import AutoTool, ToolRegistry
 from solders.instruction import Instruction, AccountMeta
-from solders.keypair import Keypair
 from solders.message import Message
 from solders.pubkey import Pubkey
 from solders.transaction import Transaction
 
 from sakit.utils.earn import JupiterEarn
+from sakit.utils.holdings import invalidate_holdings
 from sakit.utils.trigger import get_fresh_blockhash
 from sakit.utils.wallet import send_raw_transaction_with_priority
+from sakit.utils.keyring import get_keyring, load_address, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -145,6 +146,7 @@ class JupiterEarnTool(AutoTool):
         super().configure(config)
         tool_cfg = config.get("tools", {}).get("jupiter_earn", {})
         self._private_key = tool_cfg.get("private_key")
+        get_keyring().preload(self._private_key)
         self._jupiter_api_key = tool_cfg.get("jupiter_api_key")
         self._rpc_url = tool_cfg.get("rpc_url")
 
@@ -178,8 +180,8 @@ class JupiterEarnTool(AutoTool):
                     "message": "Only SOL and USDC are supported for earn transactions.",
                 }
 
-            keypair = Keypair.from_base58_string(self._private_key)
-            signer = str(keypair.pubkey())
+            keypair = load_keypair(self._private_key)
+            signer = load_address(self._private_key)
 
             if action in {"deposit", "withdraw"}:
                 if not amount:
@@ -255,6 +257,7 @@ class JupiterEarnTool(AutoTool):
                     "message": send_result.get("error", "Failed to send transaction"),
                 }
 
+            invalidate_holdings(signer)
             return {
                 "status": "success",
                 "action": action,
@@ -288,7 +291,7 @@ class JupiterEarnTool(AutoTool):
                         "status": "error",
                         "message": "Private key not configured for default positions lookup.",
                     }
-                keypair = Keypair.from_base58_string(self._private_key)
+                keypair = load_keypair(self._private_key)
                 users_list = [str(keypair.pubkey())]
 
             positions_result = await earn.get_positions(users_list)
@@ -310,8 +313,8 @@ class JupiterEarnTool(AutoTool):
                         "status": "error",
                         "message": "user is required for earnings when private key is not configured.",
                     }
-                keypair = Keypair.from_base58_string(self._private_key)
-                user = str(keypair.pubkey())
+                keypair = load_keypair(self._private_key)
+                user = load_address(self._private_key)
 
             if not positions:
                 return {
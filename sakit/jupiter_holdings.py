@@ -1,7 +1,8 @@
 """
 Jupiter Holdings tool.
 
-Gets token holdings for a wallet using Jupiter Ultra API.
+Gets token holdings for a wallet using Jupiter Ultra API. Responses are
+served from a short-TTL per-wallet cache that transacting tools invalidate.
 """
 
 import logging
@@ -9,6 +10,7 @@ from typing import Dict, Any, List, Optional
 
 from solana_agent import AutoTool, ToolRegistry
 
+from sakit.utils.holdings import HOLDINGS_CACHE_TTL, get_holdings_cache
 from sakit.utils.ultra import JupiterUltra
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,7 @@ class JupiterHoldingsTool(AutoTool):
             registry=registry,
         )
         self._jupiter_api_key: Optional[str] = None
+        self._cache_ttl: float = HOLDINGS_CACHE_TTL
 
     def get_schema(self) -> Dict[str, Any]:
         return {
@@ -47,6 +50,7 @@ class JupiterHoldingsTool(AutoTool):
         super().configure(config)
         tool_cfg = config.get("tools", {}).get("jupiter_holdings", {})
         self._jupiter_api_key = tool_cfg.get("jupiter_api_key")
+        self._cache_ttl = float(tool_cfg.get("holdings_cache_ttl", HOLDINGS_CACHE_TTL))
 
     async def execute(
         self,
@@ -56,14 +60,14 @@ class JupiterHoldingsTool(AutoTool):
         try:
             ultra = JupiterUltra(api_key=self._jupiter_api_key)
 
-            if native_only:
-                holdings = await ultra.get_native_holdings(wallet_address)
-            else:
-                holdings = await ultra.get_holdings(wallet_address)
+            holdings, age = await get_holdings_cache().get(
+                ultra, wallet_address, native_only=native_only, ttl=self._cache_ttl
+            )
 
             return {
                 "status": "success",
                 "holdings": holdings,
+                "holdings_age_seconds": round(age, 2),
             }
 
         except Exception as e:
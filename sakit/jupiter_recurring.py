@@ -8,9 +8,10 @@ import logging
 from typing import Dict, Any, List, Optional
 
 from solana_agent import AutoTool, ToolRegistry
-from solders.keypair import Keypair  # type: ignore
 
+from sakit.utils.jobs import get_job_manager, job_submitted
 from sakit.utils.recurring import JupiterRecurring, sign_recurring_transaction
+from sakit.utils.keyring import get_keyring, load_address, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +39,12 @@ class JupiterRecurringTool(AutoTool):
             "properties": {
                 "action": {
                     "type": "string",
-                    "enum": ["create", "cancel", "list"],
+                    "enum": ["create", "cancel", "list", "job_status"],
                     "description": (
                         "Action to perform: 'create' (new DCA order), "
                         "'cancel' (cancel specific order by pubkey), "
-                        "'list' (view active orders)"
+                        "'list' (view active orders), "
+                        "'job_status' (result of a background 'create'/'cancel' by job_id)"
                     ),
                 },
                 "input_mint": {
@@ -95,6 +97,16 @@ class JupiterRecurringTool(AutoTool):
                     "description": "Wallet address to query orders for (optional for 'list', defaults to configured wallet). Pass empty string if not needed.",
                     "default": "",
                 },
+                "background": {
+                    "type": "boolean",
+                    "description": "Run 'create'/'cancel' as a background job and return a job_id immediately instead of waiting for the transaction. Pass false if not needed.",
+                    "default": False,
+                },
+                "job_id": {
+                    "type": "string",
+                    "description": "Job ID returned by a background action (required for 'job_status'). Pass empty string if not needed.",
+                    "default": "",
+                },
             },
             "required": [
                 "action",
@@ -108,6 +120,8 @@ class JupiterRecurringTool(AutoTool):
                 "start_at",
                 "order_pubkey",
                 "wallet_address",
+                "background",
+                "job_id",
             ],
             "additionalProperties": False,
         }
@@ -118,6 +132,11 @@ class JupiterRecurringTool(AutoTool):
         self._private_key = tool_cfg.get("private_key")
         self._jupiter_api_key = tool_cfg.get("jupiter_api_key")
         self._payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self._private_key, self._payer_private_key)
+        get_job_manager().configure(
+            store_path=tool_cfg.get("job_store_path"),
+            max_concurrent=tool_cfg.get("max_background_jobs"),
+        )
 
     async def execute(
         self,
@@ -132,10 +151,45 @@ class JupiterRecurringTool(AutoTool):
         start_at: Optional[str] = None,
         order_pubkey: Optional[str] = None,
         wallet_address: Optional[str] = None,
+        background: bool = False,
+        job_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         action = action.lower().strip()
         recurring = JupiterRecurring(api_key=self._jupiter_api_key)
 
+        if action == "job_status":
+            return get_job_manager().status(
+                job_id,
+                owner=load_address(self._private_key) if self._private_key else None,
+            )
+
+        if background and action in ("create", "cancel"):
+            params = {
+                "input_mint": input_mint,
+                "output_mint": output_mint,
+                "in_amount": in_amount,
+                "order_count": order_count,
+                "frequency": frequency,
+                "min_out_amount": min_out_amount,
+                "max_out_amount": max_out_amount,
+                "start_at": start_at,
+                "order_pubkey": order_pubkey,
+            }
+
+            async def run_in_background() -> Dict[str, Any]:
+                return await self.execute(
+                    action=action,
+                    **params,
+                )
+
+            job = get_job_manager().submit(
+                f"jupiter_recurring.{action}",
+                run_in_background,
+                owner=load_address(self._private_key) if self._private_key else None,
+                params=params,
+            )
+            return job_submitted(job, action)
+
         if action == "create":
             return await self._create_order(
                 recurring,
@@ -155,7 +209,7 @@ class JupiterRecurringTool(AutoTool):
         else:
             return {
                 "status": "error",
-                "message": f"Unknown action: {action}. Valid actions: create, cancel, list",
+                "message": f"Unknown action: {action}. Valid actions: create, cancel, list, job_status",
             }
 
     async def _create_order(  # pragma: no cover
@@ -180,15 +234,15 @@ class JupiterRecurringTool(AutoTool):
             return {"status": "error", "message": "Private key not configured."}
 
         try:
-            keypair = Keypair.from_base58_string(self._private_key)
-            user = str(keypair.pubkey())
+            keypair = load_keypair(self._private_key)
+            user = load_address(self._private_key)
 
             # Check if integrator payer is configured for gasless transactions
             payer_keypair = None
             payer_pubkey = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_keypair = load_keypair(self._payer_private_key)
+                payer_pubkey = load_address(self._payer_private_key)
 
             # Create order
             result = await recurring.create_order(
@@ -253,8 +307,8 @@ class JupiterRecurringTool(AutoTool):
             return {"status": "error", "message": "Private key not configured."}
 
         try:
-            keypair = Keypair.from_base58_string(self._private_key)
-            user = str(keypair.pubkey())
+            keypair = load_keypair(self._private_key)
+            user = load_address(self._private_key)
 
             # Verify the order belongs to this user before attempting to cancel
             orders_result = await recurring.get_orders(user=user, order_status="active")
@@ -272,8 +326,8 @@ class JupiterRecurringTool(AutoTool):
             payer_keypair = None
             payer_pubkey = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_keypair = load_keypair(self._payer_private_key)
+                payer_pubkey = load_address(self._payer_private_key)
 
             result = await recurring.cancel_order(
                 user=user,
@@ -322,8 +376,7 @@ class JupiterRecurringTool(AutoTool):
             if wallet_address:
                 wallet = wallet_address
             elif self._private_key:
-                keypair = Keypair.from_base58_string(self._private_key)
-                wallet = str(keypair.pubkey())
+                wallet = load_address(self._private_key)
             else:
                 return {
                     "status": "error",
@@ -1,7 +1,8 @@
 """
 Jupiter Shield tool.
 
-Gets security warnings for token mints using Jupiter Ultra API.
+Gets security warnings for token mints using Jupiter Ultra API. Verdicts are
+cached per mint and concurrent lookups are merged into batched requests.
 """
 
 import logging
@@ -9,6 +10,7 @@ from typing import Dict, Any, List, Optional
 
 from solana_agent import AutoTool, ToolRegistry
 
+from sakit.utils.shield import get_shield_cache
 from sakit.utils.ultra import JupiterUltra
 
 logger = logging.getLogger(__name__)
@@ -53,11 +55,13 @@ class JupiterShieldTool(AutoTool):
 
         try:
             ultra = JupiterUltra(api_key=self._jupiter_api_key)
-            shield_data = await ultra.get_shield(mints)
+            raw_warnings = await get_shield_cache(self._jupiter_api_key).get_warnings(
+                ultra, mints
+            )
 
             # Process warnings into a more readable format
             warnings_summary = {}
-            for mint, warnings in shield_data.get("warnings", {}).items():
+            for mint, warnings in raw_warnings.items():
                 if warnings:
                     warnings_summary[mint] = {
                         "has_warnings": True,
@@ -81,7 +85,9 @@ class JupiterShieldTool(AutoTool):
             return {
                 "status": "success",
                 "shield": warnings_summary,
-                "raw_response": shield_data,
+                # Unprocessed warning records per mint; cached entries mean
+                # this is not always a single upstream response
+                "raw_warnings": raw_warnings,
             }
 
         except Exception as e:
@@ -2,17 +2,74 @@
 Jupiter Token Search tool.
 
 Searches for tokens by symbol, name, or mint address using Jupiter Ultra API.
+With `local_index` enabled, exact mint and symbol lookups are answered from
+an in-memory index of Jupiter's verified token list; everything else goes to
+the network, with the index's prefix and fuzzy search as the fallback when
+the network search fails or comes back empty. Local answers carry the index's age, since their price and
+market fields are only as fresh as the last token list refresh.
+Comma-separated queries are split, deduplicated and searched concurrently,
+with results keyed by query.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from solana_agent import AutoTool, ToolRegistry
 
+from sakit.utils.token_index import TOKEN_INDEX_REFRESH_INTERVAL, get_token_index
 from sakit.utils.ultra import JupiterUltra
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent searches for one multi-query call
+DEFAULT_MAX_CONCURRENT_SEARCHES = 4
+
+
+def _format_token(token: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a Jupiter token record for tool output."""
+    formatted = {
+        "mint": token.get("id"),
+        "name": token.get("name"),
+        "symbol": token.get("symbol"),
+        "decimals": token.get("decimals"),
+        "icon": token.get("icon"),
+        "is_verified": token.get("isVerified", False),
+        "price_usd": token.get("usdPrice"),
+        "market_cap": token.get("mcap"),
+        "fdv": token.get("fdv"),
+        "liquidity": token.get("liquidity"),
+        "holder_count": token.get("holderCount"),
+        "organic_score": token.get("organicScore"),
+        "organic_score_label": token.get("organicScoreLabel"),
+        "tags": token.get("tags", []),
+        "cexes": token.get("cexes", []),
+    }
+
+    # Add audit info if available
+    audit = token.get("audit", {})
+    if audit:
+        formatted["audit"] = {
+            "mint_authority_disabled": audit.get("mintAuthorityDisabled"),
+            "freeze_authority_disabled": audit.get("freezeAuthorityDisabled"),
+            "top_holders_percentage": audit.get("topHoldersPercentage"),
+        }
+
+    # Add 24h stats if available
+    stats_24h = token.get("stats24h", {})
+    if stats_24h:
+        formatted["stats_24h"] = {
+            "price_change": stats_24h.get("priceChange"),
+            "volume_change": stats_24h.get("volumeChange"),
+            "buy_volume": stats_24h.get("buyVolume"),
+            "sell_volume": stats_24h.get("sellVolume"),
+            "num_buys": stats_24h.get("numBuys"),
+            "num_sells": stats_24h.get("numSells"),
+            "num_traders": stats_24h.get("numTraders"),
+        }
+
+    return formatted
+
 
 class JupiterTokenSearchTool(AutoTool):
     """Search for tokens using Jupiter Ultra API."""
@@ -24,6 +81,9 @@ class JupiterTokenSearchTool(AutoTool):
             registry=registry,
         )
         self._jupiter_api_key: Optional[str] = None
+        self._local_index: bool = False
+        self._index_refresh_interval: float = TOKEN_INDEX_REFRESH_INTERVAL
+        self._max_concurrent_searches: int = DEFAULT_MAX_CONCURRENT_SEARCHES
 
     def get_schema(self) -> Dict[str, Any]:
         return {
@@ -42,6 +102,78 @@ class JupiterTokenSearchTool(AutoTool):
         super().configure(config)
         tool_cfg = config.get("tools", {}).get("jupiter_token_search", {})
         self._jupiter_api_key = tool_cfg.get("jupiter_api_key")
+        self._local_index = bool(tool_cfg.get("local_index", False))
+        self._index_refresh_interval = float(
+            tool_cfg.get("index_refresh_interval", TOKEN_INDEX_REFRESH_INTERVAL)
+        )
+        self._max_concurrent_searches = max(
+            1,
+            int(
+                tool_cfg.get("max_concurrent_searches", DEFAULT_MAX_CONCURRENT_SEARCHES)
+            ),
+        )
+
+    async def _search_one(
+        self, ultra: JupiterUltra, query: str
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Search one query, trying the local index first when enabled.
+
+        Only exact mint or symbol matches are answered locally up front: a
+        prefix or fuzzy hit on the verified list could hide an exact match
+        the network search would find. When the network search fails or
+        finds nothing, the index's prefix and fuzzy search is the fallback.
+
+        Returns:
+            Tuple of (tokens, source fields for the response)
+        """
+        if not self._local_index:
+            return await ultra.search_tokens(query), {"source": "network"}
+
+        index = get_token_index(self._jupiter_api_key, self._index_refresh_interval)
+        tokens = await index.lookup(query, exact=True)
+        if tokens:
+            return tokens, {"source": "local", "data_age_seconds": int(index.age or 0)}
+
+        try:
+            tokens = await ultra.search_tokens(query)
+        except Exception as e:
+            fallback = index.search(query)
+            if not fallback:
+                raise
+            logger.warning(f"Token search for '{query}' failed, using local index: {e}")
+            tokens = fallback
+        else:
+            if tokens:
+                return tokens, {"source": "network"}
+            tokens = index.search(query)
+            if not tokens:
+                return [], {"source": "network"}
+        return tokens, {"source": "local", "data_age_seconds": int(index.age or 0)}
+
+    async def _search_many(
+        self, ultra: JupiterUltra, queries: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Search queries concurrently, returning results keyed by query."""
+        semaphore = asyncio.Semaphore(self._max_concurrent_searches)
+
+        async def run(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    tokens, source = await self._search_one(ultra, query)
+                except Exception as e:
+                    logger.warning(f"Token search for '{query}' failed: {e}")
+                    return {"status": "error", "message": str(e)}
+            formatted = [_format_token(token) for token in tokens]
+            return {
+                "status": "success",
+                "count": len(formatted),
+                "tokens": formatted,
+                **source,
+            }
+
+        results = await asyncio.gather(*(run(query) for query in queries))
+        return dict(zip(queries, results))
 
     async def execute(
         self,
@@ -50,61 +182,37 @@ class JupiterTokenSearchTool(AutoTool):
         if not query:
             return {"status": "error", "message": "No query provided."}
 
+        # Split multi-queries and drop empty and duplicate entries
+        queries = list(dict.fromkeys(q.strip() for q in query.split(",") if q.strip()))
+        if not queries:
+            return {"status": "error", "message": "No query provided."}
+
         try:
             ultra = JupiterUltra(api_key=self._jupiter_api_key)
-            tokens = await ultra.search_tokens(query)
-
-            # Format results for better readability
-            formatted_tokens = []
-            for token in tokens:
-                formatted_token = {
-                    "mint": token.get("id"),
-                    "name": token.get("name"),
-                    "symbol": token.get("symbol"),
-                    "decimals": token.get("decimals"),
-                    "icon": token.get("icon"),
-                    "is_verified": token.get("isVerified", False),
-                    "price_usd": token.get("usdPrice"),
-                    "market_cap": token.get("mcap"),
-                    "fdv": token.get("fdv"),
-                    "liquidity": token.get("liquidity"),
-                    "holder_count": token.get("holderCount"),
-                    "organic_score": token.get("organicScore"),
-                    "organic_score_label": token.get("organicScoreLabel"),
-                    "tags": token.get("tags", []),
-                    "cexes": token.get("cexes", []),
-                }
 
-                # Add audit info if available
-                audit = token.get("audit", {})
-                if audit:
-                    formatted_token["audit"] = {
-                        "mint_authority_disabled": audit.get("mintAuthorityDisabled"),
-                        "freeze_authority_disabled": audit.get(
-                            "freezeAuthorityDisabled"
+            if len(queries) > 1:
+                results = await self._search_many(ultra, queries)
+                if all(r["status"] == "error" for r in results.values()):
+                    return {
+                        "status": "error",
+                        "message": "; ".join(
+                            f"{q}: {r['message']}" for q, r in results.items()
                         ),
-                        "top_holders_percentage": audit.get("topHoldersPercentage"),
-                    }
-
-                # Add 24h stats if available
-                stats_24h = token.get("stats24h", {})
-                if stats_24h:
-                    formatted_token["stats_24h"] = {
-                        "price_change": stats_24h.get("priceChange"),
-                        "volume_change": stats_24h.get("volumeChange"),
-                        "buy_volume": stats_24h.get("buyVolume"),
-                        "sell_volume": stats_24h.get("sellVolume"),
-                        "num_buys": stats_24h.get("numBuys"),
-                        "num_sells": stats_24h.get("numSells"),
-                        "num_traders": stats_24h.get("numTraders"),
                     }
+                return {
+                    "status": "success",
+                    "count": sum(r.get("count", 0) for r in results.values()),
+                    "results": results,
+                }
 
-                formatted_tokens.append(formatted_token)
+            tokens, source = await self._search_one(ultra, queries[0])
+            formatted_tokens = [_format_token(token) for token in tokens]
 
             return {
                 "status": "success",
                 "count": len(formatted_tokens),
                 "tokens": formatted_tokens,
+                **source,
             }
 
         except Exception as e:
@@ -18,12 +18,20 @@ from solders.pubkey import Pubkey  # type: ignore
 from solders.transaction import VersionedTransaction  # type: ignore
 from solders.message import to_bytes_versioned  # type: ignore
 
+from sakit.utils.jobs import get_job_manager, job_submitted
+from sakit.utils.holdings import invalidate_holdings
 from sakit.utils.trigger import (
     JupiterTrigger,
     replace_blockhash_in_transaction,
     get_fresh_blockhash,
 )
+from sakit.utils.trigger_orders import (
+    created_order,
+    get_trigger_order_mirror,
+    order_key,
+)
 from sakit.utils.wallet import send_raw_transaction_with_priority
+from sakit.utils.keyring import get_keyring, load_address, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -88,12 +96,13 @@ class JupiterTriggerTool(AutoTool):
             "properties": {
                 "action": {
                     "type": "string",
-                    "enum": ["create", "cancel", "cancel_all", "list"],
+                    "enum": ["create", "cancel", "cancel_all", "list", "job_status"],
                     "description": (
                         "Action to perform: 'create' (new limit order), "
                         "'cancel' (cancel specific order by pubkey), "
                         "'cancel_all' (cancel all open orders), "
-                        "'list' (view active orders)"
+                        "'list' (view active orders), "
+                        "'job_status' (result of a background 'create'/'cancel'/'cancel_all' by job_id)"
                     ),
                 },
                 "input_mint": {
@@ -131,6 +140,16 @@ class JupiterTriggerTool(AutoTool):
                     "description": "Wallet address to query orders for (optional for 'list', defaults to configured wallet). Pass empty string if not needed.",
                     "default": "",
                 },
+                "background": {
+                    "type": "boolean",
+                    "description": "Run 'create'/'cancel'/'cancel_all' as a background job and return a job_id immediately instead of waiting for the transaction. Pass false if not needed.",
+                    "default": False,
+                },
+                "job_id": {
+                    "type": "string",
+                    "description": "Job ID returned by a background action (required for 'job_status'). Pass empty string if not needed.",
+                    "default": "",
+                },
             },
             "required": [
                 "action",
@@ -141,6 +160,8 @@ class JupiterTriggerTool(AutoTool):
                 "expired_at",
                 "order_pubkey",
                 "wallet_address",
+                "background",
+                "job_id",
             ],
             "additionalProperties": False,
         }
@@ -153,6 +174,11 @@ class JupiterTriggerTool(AutoTool):
         self._referral_account = tool_cfg.get("referral_account")
         self._referral_fee = tool_cfg.get("referral_fee")
         self._payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self._private_key, self._payer_private_key)
+        get_job_manager().configure(
+            store_path=tool_cfg.get("job_store_path"),
+            max_concurrent=tool_cfg.get("max_background_jobs"),
+        )
         self._rpc_url = tool_cfg.get("rpc_url")
 
     async def _sign_and_execute(
@@ -211,6 +237,7 @@ class JupiterTriggerTool(AutoTool):
                 serialized_tx=tx_base64,
             )
 
+            invalidate_holdings(str(keypair.pubkey()))
             return {"success": True, "signature": sig}
 
         except Exception as e:
@@ -227,10 +254,42 @@ class JupiterTriggerTool(AutoTool):
         expired_at: Optional[str] = None,
         order_pubkey: Optional[str] = None,
         wallet_address: Optional[str] = None,
+        background: bool = False,
+        job_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         action = action.lower().strip()
         trigger = JupiterTrigger(api_key=self._jupiter_api_key)
 
+        if action == "job_status":
+            return get_job_manager().status(
+                job_id,
+                owner=load_address(self._private_key) if self._private_key else None,
+            )
+
+        if background and action in ("create", "cancel", "cancel_all"):
+            params = {
+                "input_mint": input_mint,
+                "output_mint": output_mint,
+                "making_amount": making_amount,
+                "taking_amount": taking_amount,
+                "expired_at": expired_at,
+                "order_pubkey": order_pubkey,
+            }
+
+            async def run_in_background() -> Dict[str, Any]:
+                return await self.execute(
+                    action=action,
+                    **params,
+                )
+
+            job = get_job_manager().submit(
+                f"jupiter_trigger.{action}",
+                run_in_background,
+                owner=load_address(self._private_key) if self._private_key else None,
+                params=params,
+            )
+            return job_submitted(job, action)
+
         if action == "create":
             return await self._create_order(
                 trigger,
@@ -249,7 +308,7 @@ class JupiterTriggerTool(AutoTool):
         else:  # pragma: no cover
             return {
                 "status": "error",
-                "message": f"Unknown action: {action}. Valid actions: create, cancel, cancel_all, list",
+                "message": f"Unknown action: {action}. Valid actions: create, cancel, cancel_all, list, job_status",
             }
 
     async def _create_order(  # pragma: no cover
@@ -271,15 +330,15 @@ class JupiterTriggerTool(AutoTool):
             return {"status": "error", "message": "Private key not configured."}
 
         try:
-            keypair = Keypair.from_base58_string(self._private_key)
-            maker = str(keypair.pubkey())
+            keypair = load_keypair(self._private_key)
+            maker = load_address(self._private_key)
 
             # Check if integrator payer is configured for gasless transactions
             payer_keypair = None
             payer_pubkey = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_keypair = load_keypair(self._payer_private_key)
+                payer_pubkey = load_address(self._payer_private_key)
 
             # Create order
             result = await trigger.create_order(
@@ -316,6 +375,20 @@ class JupiterTriggerTool(AutoTool):
                     "message": exec_result.get("error", "Unknown error"),
                 }
 
+            get_trigger_order_mirror().add(
+                maker,
+                result.order,
+                created_order(
+                    result.order,
+                    maker,
+                    input_mint,
+                    output_mint,
+                    making_amount,
+                    taking_amount,
+                    expired_at,
+                ),
+            )
+
             return {
                 "status": "success",
                 "action": "create",
@@ -343,27 +416,24 @@ class JupiterTriggerTool(AutoTool):
             return {"status": "error", "message": "Private key not configured."}
 
         try:
-            keypair = Keypair.from_base58_string(self._private_key)
-            maker = str(keypair.pubkey())
+            keypair = load_keypair(self._private_key)
+            maker = load_address(self._private_key)
 
             # Verify the order belongs to this user before attempting to cancel
-            orders_result = await trigger.get_orders(user=maker, order_status="active")
-            if orders_result.get("success", False):
-                user_orders = [
-                    o.get("orderKey") or o.get("order") or o.get("orderPubkey")
-                    for o in orders_result.get("orders", [])
-                ]
-                if order_pubkey not in user_orders:
-                    return {
-                        "status": "error",
-                        "message": f"Order {order_pubkey} does not belong to this wallet or is not active.",
-                    }
+            owned = await get_trigger_order_mirror().has_order(
+                trigger, maker, order_pubkey
+            )
+            if owned is False:
+                return {
+                    "status": "error",
+                    "message": f"Order {order_pubkey} does not belong to this wallet or is not active.",
+                }
 
             payer_keypair = None
             payer_pubkey = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_keypair = load_keypair(self._payer_private_key)
+                payer_pubkey = load_address(self._payer_private_key)
 
             result = await trigger.cancel_order(
                 maker=maker,
@@ -393,6 +463,8 @@ class JupiterTriggerTool(AutoTool):
                     "message": exec_result.get("error", "Unknown error"),
                 }
 
+            get_trigger_order_mirror().remove(maker, order_pubkey)
+
             return {
                 "status": "success",
                 "action": "cancel",
@@ -412,17 +484,19 @@ class JupiterTriggerTool(AutoTool):
             return {"status": "error", "message": "Private key not configured."}
 
         try:
-            keypair = Keypair.from_base58_string(self._private_key)
-            maker = str(keypair.pubkey())
+            keypair = load_keypair(self._private_key)
+            maker = load_address(self._private_key)
 
             payer_keypair = None
             payer_pubkey = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_keypair = load_keypair(self._payer_private_key)
+                payer_pubkey = load_address(self._payer_private_key)
 
-            # Get all active orders first
-            orders_result = await trigger.get_orders(user=maker, order_status="active")
+            # Get all active orders first, fresh so none made elsewhere are missed
+            orders_result = await get_trigger_order_mirror().get_orders(
+                trigger, maker, refresh=True
+            )
 
             if not orders_result.get("success", False):
                 return {
@@ -466,6 +540,11 @@ class JupiterTriggerTool(AutoTool):
                 if exec_result.get("success") and exec_result.get("signature"):
                     signatures.append(exec_result.get("signature"))
 
+            if len(signatures) == len(result.transactions):
+                get_trigger_order_mirror().remove_all(maker)
+            else:
+                get_trigger_order_mirror().invalidate(maker)
+
             return {
                 "status": "success",
                 "action": "cancel_all",
@@ -487,15 +566,14 @@ class JupiterTriggerTool(AutoTool):
             if wallet_address:
                 wallet = wallet_address
             elif self._private_key:
-                keypair = Keypair.from_base58_string(self._private_key)
-                wallet = str(keypair.pubkey())
+                wallet = load_address(self._private_key)
             else:
                 return {
                     "status": "error",
                     "message": "Either wallet_address parameter or private_key config required.",
                 }
 
-            result = await trigger.get_orders(user=wallet, order_status="active")
+            result = await get_trigger_order_mirror().get_orders(trigger, wallet)
 
             if not result.get("success", False):
                 return {
@@ -510,9 +588,7 @@ class JupiterTriggerTool(AutoTool):
             for order in orders:
                 formatted_orders.append(
                     {
-                        "order_pubkey": order.get("orderKey")
-                        or order.get("order")
-                        or order.get("orderPubkey"),
+                        "order_pubkey": order_key(order),
                         "input_mint": order.get("inputMint"),
                         "output_mint": order.get("outputMint"),
                         "making_amount": order.get("makingAmount"),
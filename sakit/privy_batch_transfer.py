@@ -0,0 +1,216 @@
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional
+from solana_agent import AutoTool, ToolRegistry
+from privy import AsyncPrivyAPI
+from solders.hash import Hash
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+from sakit.privy_transfer import privy_sign_and_send
+from sakit.utils.batch_transfer import (
+    MAX_BATCH_ROWS,
+    TRANSFER_ROW_SCHEMA,
+    PackedTransaction,
+    compile_transaction,
+    fetch_lookup_tables,
+    landed_recipients,
+    pack_transfers,
+    parse_rows,
+    plan_batch,
+    send_packed,
+    summarize_batch,
+)
+from sakit.utils.holdings import invalidate_holdings
+from sakit.utils.transaction import TransactionEditor
+from sakit.utils.trigger import get_fresh_blockhash
+from sakit.utils.wallet import get_rpc_client
+from sakit.utils.keyring import get_keyring, load_keypair
+
+logger = logging.getLogger(__name__)
+
+# Privy signs each transaction with a separate API call; stay well under its rate limit
+DEFAULT_MAX_CONCURRENT_SENDS = 4
+
+
+class PrivyBatchTransferTool(AutoTool):
+    def __init__(self, registry: Optional[ToolRegistry] = None):
+        super().__init__(
+            name="privy_batch_transfer",
+            description=(
+                "Transfer SOL or SPL tokens to many recipients at once (payouts, "
+                "airdrops) using Privy delegated wallet. Transfers are packed into "
+                "as few transactions as possible."
+            ),
+            registry=registry,
+        )
+        self.app_id = None
+        self.app_secret = None
+        self.signing_key = None
+        self.rpc_url = None
+        self.fee_payer = None
+        self.fee_percentage = None
+        self.max_concurrent_sends = DEFAULT_MAX_CONCURRENT_SENDS
+        self.lookup_table_addresses: List[str] = []
+
+    def get_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "wallet_id": {
+                    "type": "string",
+                    "description": "Privy wallet ID. REQUIRED.",
+                },
+                "wallet_public_key": {
+                    "type": "string",
+                    "description": "Solana public key of the wallet. REQUIRED.",
+                },
+                "transfers": {
+                    "type": "array",
+                    "description": f"Transfers to make (up to {MAX_BATCH_ROWS})",
+                    "items": TRANSFER_ROW_SCHEMA,
+                },
+            },
+            "required": ["wallet_id", "wallet_public_key", "transfers"],
+            "additionalProperties": False,
+        }
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        tool_cfg = config.get("tools", {}).get("privy_batch_transfer", {})
+        self.app_id = tool_cfg.get("app_id")
+        self.app_secret = tool_cfg.get("app_secret")
+        self.signing_key = tool_cfg.get("signing_key")
+        self.rpc_url = tool_cfg.get("rpc_url")
+        self.fee_payer = tool_cfg.get("fee_payer")
+        get_keyring().preload(self.fee_payer)
+        self.fee_percentage = tool_cfg.get("fee_percentage", 0.0)  # Default: no fees
+        self.max_concurrent_sends = int(
+            tool_cfg.get("max_concurrent_sends", DEFAULT_MAX_CONCURRENT_SENDS)
+        )
+        self.lookup_table_addresses = list(tool_cfg.get("lookup_table_addresses") or [])
+
+    async def execute(
+        self,
+        wallet_id: str,
+        wallet_public_key: str,
+        transfers: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        if not wallet_id or not wallet_public_key:
+            return {
+                "status": "error",
+                "message": "wallet_id and wallet_public_key are required.",
+            }
+
+        if not all(
+            [
+                self.app_id,
+                self.app_secret,
+                self.signing_key,
+                self.rpc_url,
+                self.fee_payer,
+            ]
+        ):
+            return {"status": "error", "message": "Privy config missing."}
+
+        if not transfers:
+            return {"status": "error", "message": "No transfers provided."}
+        if len(transfers) > MAX_BATCH_ROWS:
+            return {
+                "status": "error",
+                "message": f"Too many transfers: {len(transfers)} (max {MAX_BATCH_ROWS}).",
+            }
+
+        privy_client = AsyncPrivyAPI(
+            app_id=self.app_id,
+            app_secret=self.app_secret,
+        )
+
+        try:
+            owner = Pubkey.from_string(wallet_public_key)
+            fee_payer = load_keypair(self.fee_payer)
+            payer = fee_payer.pubkey()
+            client = get_rpc_client(self.rpc_url)
+            rows = parse_rows(transfers)
+
+            # Blockhash, account prefetch and lookup tables load concurrently
+            blockhash_task = asyncio.ensure_future(get_fresh_blockhash(self.rpc_url))
+            try:
+                plan, lookup_tables = await asyncio.gather(
+                    plan_batch(
+                        client,
+                        owner,
+                        payer,
+                        rows,
+                        fee_recipient=payer,
+                        fee_percentage=self.fee_percentage or 0.0,
+                    ),
+                    fetch_lookup_tables(client, self.lookup_table_addresses),
+                )
+                packed = pack_transfers(payer, plan, lookup_tables=lookup_tables)
+
+                blockhash_result = await blockhash_task
+            finally:
+                # No-op once awaited; stops the prefetch if planning failed
+                blockhash_task.cancel()
+            if "error" in blockhash_result:
+                return {
+                    "status": "error",
+                    "message": f"Failed to get blockhash: {blockhash_result['error']}",
+                }
+            blockhash = Hash.from_string(blockhash_result["blockhash"])
+
+            async def send(tx: PackedTransaction) -> Dict[str, Any]:
+                message = compile_transaction(
+                    payer, tx.instructions, blockhash, lookup_tables
+                )
+                unsigned = VersionedTransaction.populate(
+                    message,
+                    [Signature.default()] * message.header.num_required_signatures,
+                )
+                editor = TransactionEditor(bytes(unsigned))
+                editor.sign(fee_payer)
+                result = await privy_sign_and_send(
+                    wallet_id, editor.to_base64(), privy_client, self.signing_key
+                )
+                return {
+                    "success": True,
+                    "signature": (result.get("data") or {}).get("hash"),
+                }
+
+            results = await send_packed(packed, send, self.max_concurrent_sends)
+            summary = summarize_batch(rows, plan, packed, results)
+            landed = landed_recipients(summary)
+            if landed:
+                invalidate_holdings(wallet_public_key, *landed)
+            return summary
+        except Exception as e:
+            logger.exception(f"Privy batch transfer failed: {str(e)}")
+            return {"status": "error", "message": str(e)}
+
+
+class PrivyBatchTransferPlugin:
+    def __init__(self):
+        self.name = "privy_batch_transfer"
+        self.config = None
+        self.tool_registry = None
+        self._tool = None
+
+    @property
+    def description(self):
+        return "Plugin for transferring SOL or SPL tokens to many recipients using Privy delegated wallet."
+
+    def initialize(self, tool_registry: ToolRegistry) -> None:  # pragma: no cover
+        self.tool_registry = tool_registry
+        self._tool = PrivyBatchTransferTool(registry=tool_registry)
+
+    def configure(self, config: Dict[str, Any]) -> None:  # pragma: no cover
+        self.config = config
+        if self._tool:
+            self._tool.configure(self.config)
+
+    def get_tools(self) -> List[AutoTool]:  # pragma: no cover
+        return [self._tool] if self._tool else []
+
+
+def get_plugin():  # pragma: no cover
+    return PrivyBatchTransferPlugin()
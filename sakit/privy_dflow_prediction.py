@@ -25,14 +25,15 @@ from cryptography.hazmat.primitives import serialization
 from privy import AsyncPrivyAPI
 from privy.lib.authorization_signatures import get_authorization_signature
 from solana_agent import AutoTool, ToolRegistry
-from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.transaction import VersionedTransaction
 from solders.message import to_bytes_versioned
 
 from sakit.utils.dflow import DFlowPredictionClient
+from sakit.utils.jobs import get_job_manager, job_submitted
 from sakit.utils.trigger import replace_blockhash_in_transaction, get_fresh_blockhash
 from sakit.utils.wallet import send_raw_transaction_with_priority
+from sakit.utils.keyring import get_keyring, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -210,6 +211,7 @@ class PrivyDFlowPredictionTool(AutoTool):
                         "buy",
                         "sell",
                         "positions",
+                        "job_status",
                     ],
                     "description": (
                         "Action to perform: "
@@ -220,12 +222,13 @@ class PrivyDFlowPredictionTool(AutoTool):
                         "'get_market' - Get specific market details. "
                         "'buy' - Buy outcome tokens (YES/NO). "
                         "'sell' - Sell outcome tokens. "
-                        "'positions' - Get user's prediction market positions."
+                        "'positions' - Get user's prediction market positions. "
+                        "'job_status' - Get the result of a background buy/sell by job_id."
                     ),
                 },
                 "wallet_id": {
                     "type": ["string", "null"],
-                    "description": "Privy wallet ID. Required for trading actions. Pass null for discovery actions.",
+                    "description": "Privy wallet ID. Required for trading actions and 'job_status'. Pass null for discovery actions.",
                 },
                 "wallet_public_key": {
                     "type": ["string", "null"],
@@ -274,6 +277,14 @@ class PrivyDFlowPredictionTool(AutoTool):
                     "type": ["boolean", "null"],
                     "description": "Include low-quality markets (with warnings). Default false. Pass null to use default.",
                 },
+                "background": {
+                    "type": ["boolean", "null"],
+                    "description": "Run 'buy'/'sell' as a background job and return a job_id immediately instead of waiting for the order to fill. Default false. Pass null to use default.",
+                },
+                "job_id": {
+                    "type": ["string", "null"],
+                    "description": "Job ID returned by a background 'buy'/'sell' (for 'job_status' action). Pass null if not needed.",
+                },
             },
             "required": [
                 "action",
@@ -289,6 +300,8 @@ class PrivyDFlowPredictionTool(AutoTool):
                 "status",
                 "sort",
                 "include_risky",
+                "background",
+                "job_id",
             ],
             "additionalProperties": False,
         }
@@ -317,6 +330,11 @@ class PrivyDFlowPredictionTool(AutoTool):
 
         # Gasless/sponsor
         self._payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self._payer_private_key)
+        get_job_manager().configure(
+            store_path=tool_cfg.get("job_store_path"),
+            max_concurrent=tool_cfg.get("max_background_jobs"),
+        )
 
     def _get_client(
         self, include_risky: Optional[bool] = None
@@ -386,7 +404,7 @@ class PrivyDFlowPredictionTool(AutoTool):
 
         # Sign with payer if configured (for gasless)
         if self._payer_private_key:
-            payer_keypair = Keypair.from_base58_string(self._payer_private_key)
+            payer_keypair = load_keypair(self._payer_private_key)
             payer_pubkey = payer_keypair.pubkey()
             payer_signature = payer_keypair.sign_message(message_bytes)
 
@@ -489,12 +507,46 @@ class PrivyDFlowPredictionTool(AutoTool):
         status: str = "active",
         sort: str = "volume",
         include_risky: Optional[bool] = None,
+        background: Optional[bool] = None,
+        job_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Execute a prediction market action using Privy embedded wallet."""
 
         client = self._get_client(include_risky)
 
         try:
+            # =====================================================================
+            # BACKGROUND JOBS
+            # =====================================================================
+
+            if action == "job_status":
+                return get_job_manager().status(job_id, owner=wallet_id)
+
+            if background and action in ("buy", "sell"):
+                params = {
+                    "market_id": market_id,
+                    "mint_address": mint_address,
+                    "side": side,
+                    "amount": amount,
+                    "include_risky": include_risky,
+                }
+
+                async def run_in_background() -> Dict[str, Any]:
+                    return await self.execute(
+                        action=action,
+                        wallet_id=wallet_id,
+                        wallet_public_key=wallet_public_key,
+                        **params,
+                    )
+
+                job = get_job_manager().submit(
+                    f"privy_dflow_prediction.{action}",
+                    run_in_background,
+                    owner=wallet_id,
+                    params=params,
+                )
+                return job_submitted(job, action)
+
             # =====================================================================
             # DISCOVERY ACTIONS (no signing required)
             # =====================================================================
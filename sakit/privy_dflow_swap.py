@@ -21,12 +21,14 @@ from solana_agent import AutoTool, ToolRegistry
 from privy import AsyncPrivyAPI
 from privy.lib.authorization_signatures import get_authorization_signature
 from cryptography.hazmat.primitives import serialization
-from solders.keypair import Keypair  # type: ignore
 from solders.transaction import VersionedTransaction  # type: ignore
 from solders.message import to_bytes_versioned  # type: ignore
 
 from sakit.utils.dflow import DFlowSwap
+from sakit.utils.holdings import invalidate_holdings
+from sakit.utils.retry import BLOCKHASH_RETRY_POLICY
 from sakit.utils.wallet import send_raw_transaction_with_priority
+from sakit.utils.keyring import get_keyring, load_address, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -211,6 +213,7 @@ class PrivyDFlowSwapTool(AutoTool):
         self._app_secret = tool_cfg.get("app_secret")
         self._signing_key = tool_cfg.get("signing_key")
         self._payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self._payer_private_key)
         # RPC URL for sending transactions (Helius recommended for priority fees)
         self._rpc_url = tool_cfg.get("rpc_url")
 
@@ -247,14 +250,14 @@ class PrivyDFlowSwapTool(AutoTool):
             # Get sponsor pubkey if gasless is configured
             sponsor = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                sponsor = str(payer_keypair.pubkey())
+                sponsor = load_address(self._payer_private_key)
 
-            # Retry logic for blockhash expiration
-            max_retries = 3
+            # Retry with a fresh order when the blockhash expires
             last_error = None
+            attempt = 0
 
-            for attempt in range(max_retries):
+            async for _ in BLOCKHASH_RETRY_POLICY.attempts():
+                attempt += 1
                 # Get fresh order from DFlow (includes fresh blockhash)
                 order_result = await dflow.get_order(
                     input_mint=input_mint,
@@ -279,7 +282,7 @@ class PrivyDFlowSwapTool(AutoTool):
 
                 # If gasless, sign with payer first
                 if self._payer_private_key:
-                    payer_keypair = Keypair.from_base58_string(self._payer_private_key)
+                    payer_keypair = load_keypair(self._payer_private_key)
                     tx_bytes = base64.b64decode(order_result.transaction)
                     transaction = VersionedTransaction.from_bytes(tx_bytes)
                     message_bytes = to_bytes_versioned(transaction.message)
@@ -329,6 +332,8 @@ class PrivyDFlowSwapTool(AutoTool):
                             "message": "No transaction signature returned.",
                         }
 
+                    invalidate_holdings(public_key)
+
                     return {
                         "status": "success",
                         "signature": signature,
@@ -350,7 +355,7 @@ class PrivyDFlowSwapTool(AutoTool):
                 ):
                     last_error = error_msg
                     logger.warning(
-                        f"Blockhash expired on attempt {attempt + 1}/{max_retries}, retrying with fresh transaction..."
+                        f"Blockhash expired on attempt {attempt}/{BLOCKHASH_RETRY_POLICY.max_attempts}, retrying with fresh transaction..."
                     )
                     continue
                 else:
@@ -365,7 +370,7 @@ class PrivyDFlowSwapTool(AutoTool):
             # All retries exhausted
             return {
                 "status": "error",
-                "message": f"Transaction failed after {max_retries} attempts. Last error: {last_error}",
+                "message": f"Transaction failed after {attempt} attempts. Last error: {last_error}",
             }
 
         except Exception as e:
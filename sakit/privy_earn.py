@@ -20,6 +20,7 @@ from solders.null_signer import NullSigner
 from solders.transaction import VersionedTransaction
 
 from sakit.utils.earn import JupiterEarn
+from sakit.utils.holdings import invalidate_holdings
 from sakit.utils.trigger import get_fresh_blockhash
 from sakit.utils.wallet import send_raw_transaction_with_priority
 
@@ -402,6 +403,7 @@ class PrivyEarnTool(AutoTool):
                         ),
                     }
 
+                invalidate_holdings(wallet_public_key)
                 return {
                     "status": "success",
                     "action": action,
@@ -13,11 +13,12 @@ from solana_agent import AutoTool, ToolRegistry
 from privy import AsyncPrivyAPI
 from privy.lib.authorization_signatures import get_authorization_signature
 from cryptography.hazmat.primitives import serialization
-from solders.keypair import Keypair  # type: ignore
 from solders.transaction import VersionedTransaction  # type: ignore
 from solders.message import to_bytes_versioned  # type: ignore
 
+from sakit.utils.jobs import get_job_manager, job_submitted
 from sakit.utils.recurring import JupiterRecurring
+from sakit.utils.keyring import get_keyring, load_address, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -151,11 +152,12 @@ class PrivyRecurringTool(AutoTool):
                 },
                 "action": {
                     "type": "string",
-                    "enum": ["create", "cancel", "list"],
+                    "enum": ["create", "cancel", "list", "job_status"],
                     "description": (
                         "Action to perform: 'create' (new DCA order), "
                         "'cancel' (cancel specific order by pubkey), "
-                        "'list' (view active orders)"
+                        "'list' (view active orders), "
+                        "'job_status' (result of a background 'create'/'cancel' by job_id)"
                     ),
                 },
                 "input_mint": {
@@ -203,6 +205,16 @@ class PrivyRecurringTool(AutoTool):
                     "description": "Order public key to cancel (required for 'cancel'). Get this from 'list' action. Pass empty string if not needed.",
                     "default": "",
                 },
+                "background": {
+                    "type": "boolean",
+                    "description": "Run 'create'/'cancel' as a background job and return a job_id immediately instead of waiting for the transaction. Pass false if not needed.",
+                    "default": False,
+                },
+                "job_id": {
+                    "type": "string",
+                    "description": "Job ID returned by a background action (required for 'job_status'). Pass empty string if not needed.",
+                    "default": "",
+                },
             },
             "required": [
                 "wallet_id",
@@ -217,6 +229,8 @@ class PrivyRecurringTool(AutoTool):
                 "max_out_amount",
                 "start_at",
                 "order_pubkey",
+                "background",
+                "job_id",
             ],
             "additionalProperties": False,
         }
@@ -229,6 +243,11 @@ class PrivyRecurringTool(AutoTool):
         self._signing_key = tool_cfg.get("signing_key")
         self._jupiter_api_key = tool_cfg.get("jupiter_api_key")
         self._payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self._payer_private_key)
+        get_job_manager().configure(
+            store_path=tool_cfg.get("job_store_path"),
+            max_concurrent=tool_cfg.get("max_background_jobs"),
+        )
 
     async def execute(
         self,
@@ -244,6 +263,8 @@ class PrivyRecurringTool(AutoTool):
         max_out_amount: Optional[str] = None,
         start_at: Optional[str] = None,
         order_pubkey: Optional[str] = None,
+        background: bool = False,
+        job_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         if not wallet_id or not wallet_public_key:
             return {
@@ -259,6 +280,38 @@ class PrivyRecurringTool(AutoTool):
         action = action.lower().strip()
         recurring = JupiterRecurring(api_key=self._jupiter_api_key)
 
+        if action == "job_status":
+            return get_job_manager().status(job_id, owner=wallet_id)
+
+        if background and action in ("create", "cancel"):
+            params = {
+                "input_mint": input_mint,
+                "output_mint": output_mint,
+                "in_amount": in_amount,
+                "order_count": order_count,
+                "frequency": frequency,
+                "min_out_amount": min_out_amount,
+                "max_out_amount": max_out_amount,
+                "start_at": start_at,
+                "order_pubkey": order_pubkey,
+            }
+
+            async def run_in_background() -> Dict[str, Any]:
+                return await self.execute(
+                    action=action,
+                    wallet_id=wallet_id,
+                    wallet_public_key=wallet_public_key,
+                    **params,
+                )
+
+            job = get_job_manager().submit(
+                f"privy_recurring.{action}",
+                run_in_background,
+                owner=wallet_id,
+                params=params,
+            )
+            return job_submitted(job, action)
+
         if action == "create":
             return await self._create_order(
                 recurring,
@@ -282,7 +335,7 @@ class PrivyRecurringTool(AutoTool):
         else:
             return {
                 "status": "error",
-                "message": f"Unknown action: {action}. Valid actions: create, cancel, list",
+                "message": f"Unknown action: {action}. Valid actions: create, cancel, list, job_status",
             }
 
     async def _sign_and_execute(  # pragma: no cover
@@ -298,7 +351,7 @@ class PrivyRecurringTool(AutoTool):
 
             # If payer is configured, sign with payer first
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
+                payer_keypair = load_keypair(self._payer_private_key)
                 tx_bytes = base64.b64decode(transaction_base64)
                 transaction = VersionedTransaction.from_bytes(tx_bytes)
                 message_bytes = to_bytes_versioned(transaction.message)
@@ -361,8 +414,7 @@ class PrivyRecurringTool(AutoTool):
         try:
             payer_pubkey = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_pubkey = load_address(self._payer_private_key)
 
             result = await recurring.create_order(
                 input_mint=input_mint,
@@ -436,8 +488,7 @@ class PrivyRecurringTool(AutoTool):
 
             payer_pubkey = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_pubkey = load_address(self._payer_private_key)
 
             result = await recurring.cancel_order(
                 user=public_key,
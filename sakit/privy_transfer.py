@@ -5,6 +5,9 @@ from solana_agent import AutoTool, ToolRegistry
 from privy import AsyncPrivyAPI
 from privy.lib.authorization_signatures import get_authorization_signature
 from cryptography.hazmat.primitives import serialization
+from sakit.utils.holdings import invalidate_holdings
+from sakit.utils.keyring import get_keyring
+from sakit.utils.nonce import get_nonce_pool
 from sakit.utils.wallet import SolanaWalletClient
 from sakit.utils.transfer import TokenTransferManager
 
@@ -125,6 +128,7 @@ class PrivyTransferTool(AutoTool):
         self.rpc_url = None
         self.fee_payer = None
         self.fee_percentage = None
+        self.nonce_accounts: List[str] = []
 
     def get_schema(self) -> Dict[str, Any]:
         return {
@@ -174,7 +178,9 @@ class PrivyTransferTool(AutoTool):
         self.signing_key = tool_cfg.get("signing_key")
         self.rpc_url = tool_cfg.get("rpc_url")
         self.fee_payer = tool_cfg.get("fee_payer")
+        get_keyring().preload(self.fee_payer)
         self.fee_percentage = tool_cfg.get("fee_percentage", 0.0)  # Default: no fees
+        self.nonce_accounts = list(tool_cfg.get("nonce_accounts") or [])
 
     async def execute(
         self,
@@ -208,6 +214,9 @@ class PrivyTransferTool(AutoTool):
             app_secret=self.app_secret,
         )
 
+        nonce_pool = None
+        nonce = None
+        sent = False
         try:
             wallet = SolanaWalletClient(
                 self.rpc_url, None, wallet_public_key, self.fee_payer
@@ -215,6 +224,12 @@ class PrivyTransferTool(AutoTool):
             provider = None
             if "helius" in self.rpc_url:  # pragma: no cover
                 provider = "helius"
+            if self.nonce_accounts:
+                # The fee payer signs locally, so it is the nonce authority
+                nonce_pool = get_nonce_pool(
+                    str(wallet.fee_payer.pubkey()), self.nonce_accounts
+                )
+                nonce = await nonce_pool.acquire(wallet.client)
             transaction = await TokenTransferManager.transfer(
                 wallet,
                 to_address,
@@ -224,6 +239,7 @@ class PrivyTransferTool(AutoTool):
                 True,
                 self.fee_percentage,
                 memo,
+                nonce=nonce,
             )
             encoded_transaction = base64.b64encode(bytes(transaction)).decode("utf-8")
             result = await privy_sign_and_send(
@@ -232,10 +248,16 @@ class PrivyTransferTool(AutoTool):
                 privy_client,
                 self.signing_key,
             )
+            # Only an accepted transaction can advance the nonce
+            sent = True
+            invalidate_holdings(wallet_public_key, to_address)
             return {"status": "success", "result": result}
         except Exception as e:
             logger.exception(f"Privy transfer failed: {str(e)}")
             return {"status": "error", "message": str(e)}
+        finally:
+            if nonce is not None:
+                nonce_pool.release(nonce, consumed=sent)
 
 
 class PrivyTransferPlugin:
@@ -5,6 +5,7 @@ Enables creating, canceling, and managing limit orders using Jupiter Trigger API
 with Privy embedded wallets. Uses the official Privy Python SDK.
 """
 
+import asyncio
 import base64
 import logging
 import time
@@ -14,17 +15,24 @@ from solana_agent import AutoTool, ToolRegistry
 from privy import AsyncPrivyAPI
 from privy.lib.authorization_signatures import get_authorization_signature
 from cryptography.hazmat.primitives import serialization
-from solders.keypair import Keypair  # type: ignore
 from solders.pubkey import Pubkey  # type: ignore
 from solders.transaction import VersionedTransaction  # type: ignore
 from solders.message import to_bytes_versioned  # type: ignore
 
+from sakit.utils.jobs import get_job_manager, job_submitted
+from sakit.utils.holdings import invalidate_holdings
 from sakit.utils.trigger import (
     JupiterTrigger,
     replace_blockhash_in_transaction,
     get_fresh_blockhash,
 )
-from sakit.utils.wallet import send_raw_transaction_with_priority
+from sakit.utils.trigger_orders import (
+    created_order,
+    get_trigger_order_mirror,
+    order_key,
+)
+from sakit.utils.wallet import confirm_signatures, send_raw_transaction_with_priority
+from sakit.utils.keyring import get_keyring, load_address, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -157,6 +165,10 @@ async def _privy_sign_transaction(  # pragma: no cover
         return None
 
 
+# Concurrent Privy signing requests during cancel_all, to stay under Privy's rate limit
+PRIVY_SIGN_CONCURRENCY = 4
+
+
 class PrivyTriggerTool(AutoTool):
     """Create and manage limit orders using Jupiter Trigger API with Privy wallets."""
 
@@ -194,12 +206,13 @@ class PrivyTriggerTool(AutoTool):
                 },
                 "action": {
                     "type": "string",
-                    "enum": ["create", "cancel", "cancel_all", "list"],
+                    "enum": ["create", "cancel", "cancel_all", "list", "job_status"],
                     "description": (
                         "Action to perform: 'create' (new limit order), "
                         "'cancel' (cancel specific order by pubkey), "
                         "'cancel_all' (cancel all open orders), "
-                        "'list' (view active orders)"
+                        "'list' (view active orders), "
+                        "'job_status' (result of a background 'create'/'cancel'/'cancel_all' by job_id)"
                     ),
                 },
                 "input_mint": {
@@ -232,6 +245,16 @@ class PrivyTriggerTool(AutoTool):
                     "description": "Order public key to cancel (required for 'cancel'). Get this from 'list' action. Pass empty string if not needed.",
                     "default": "",
                 },
+                "background": {
+                    "type": "boolean",
+                    "description": "Run 'create'/'cancel'/'cancel_all' as a background job and return a job_id immediately instead of waiting for the transaction. Pass false if not needed.",
+                    "default": False,
+                },
+                "job_id": {
+                    "type": "string",
+                    "description": "Job ID returned by a background action (required for 'job_status'). Pass empty string if not needed.",
+                    "default": "",
+                },
             },
             "required": [
                 "wallet_id",
@@ -243,6 +266,8 @@ class PrivyTriggerTool(AutoTool):
                 "taking_amount",
                 "expired_at",
                 "order_pubkey",
+                "background",
+                "job_id",
             ],
             "additionalProperties": False,
         }
@@ -257,6 +282,11 @@ class PrivyTriggerTool(AutoTool):
         self._referral_account = tool_cfg.get("referral_account")
         self._referral_fee = tool_cfg.get("referral_fee")
         self._payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self._payer_private_key)
+        get_job_manager().configure(
+            store_path=tool_cfg.get("job_store_path"),
+            max_concurrent=tool_cfg.get("max_background_jobs"),
+        )
         self._rpc_url = tool_cfg.get("rpc_url")
 
     async def execute(
@@ -270,6 +300,8 @@ class PrivyTriggerTool(AutoTool):
         taking_amount: Optional[str] = None,
         expired_at: Optional[str] = None,
         order_pubkey: Optional[str] = None,
+        background: bool = False,
+        job_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         if not wallet_id or not wallet_public_key:
             return {
@@ -292,8 +324,37 @@ class PrivyTriggerTool(AutoTool):
             action = action.lower().strip()
             trigger = JupiterTrigger(api_key=self._jupiter_api_key)
 
+            if action == "job_status":
+                return get_job_manager().status(job_id, owner=wallet_id)
+
+            if background and action in ("create", "cancel", "cancel_all"):
+                params = {
+                    "input_mint": input_mint,
+                    "output_mint": output_mint,
+                    "making_amount": making_amount,
+                    "taking_amount": taking_amount,
+                    "expired_at": expired_at,
+                    "order_pubkey": order_pubkey,
+                }
+
+                async def run_in_background() -> Dict[str, Any]:
+                    return await self.execute(
+                        action=action,
+                        wallet_id=wallet_id,
+                        wallet_public_key=wallet_public_key,
+                        **params,
+                    )
+
+                job = get_job_manager().submit(
+                    f"privy_trigger.{action}",
+                    run_in_background,
+                    owner=wallet_id,
+                    params=params,
+                )
+                return job_submitted(job, action)
+
             if action == "create":
-                return await self._create_order(
+                result = await self._create_order(
                     privy_client,
                     trigger,
                     wallet_id,
@@ -305,11 +366,11 @@ class PrivyTriggerTool(AutoTool):
                     expired_at,
                 )
             elif action == "cancel":
-                return await self._cancel_order(
+                result = await self._cancel_order(
                     privy_client, trigger, wallet_id, public_key, order_pubkey
                 )
             elif action == "cancel_all":
-                return await self._cancel_all_orders(
+                result = await self._cancel_all_orders(
                     privy_client, trigger, wallet_id, public_key
                 )
             elif action == "list":
@@ -317,11 +378,59 @@ class PrivyTriggerTool(AutoTool):
             else:
                 return {
                     "status": "error",
-                    "message": f"Unknown action: {action}. Valid actions: create, cancel, cancel_all, list",
+                    "message": f"Unknown action: {action}. Valid actions: create, cancel, cancel_all, list, job_status",
                 }
+
+            # Creating escrows the input tokens; cancelling returns them
+            if result.get("status") == "success":
+                invalidate_holdings(public_key)
+            return result
         finally:
             await privy_client.close()
 
+    def _payer_sign(self, transaction_base64: str) -> str:
+        """Add the payer signature if a payer is configured and is a signer."""
+        tx_to_sign = transaction_base64
+        if self._payer_private_key:
+            payer_keypair = load_keypair(self._payer_private_key)
+            tx_bytes = base64.b64decode(transaction_base64)
+            transaction = VersionedTransaction.from_bytes(tx_bytes)
+            message_bytes = to_bytes_versioned(transaction.message)
+            payer_signature = payer_keypair.sign_message(message_bytes)
+
+            # Find the payer's position in the account keys
+            # The first N accounts (where N = num_required_signatures) are signers
+            payer_pubkey = payer_keypair.pubkey()
+            num_signers = transaction.message.header.num_required_signatures
+            account_keys = transaction.message.account_keys
+
+            payer_index = None
+            for i in range(num_signers):
+                if account_keys[i] == payer_pubkey:
+                    payer_index = i
+                    break
+
+            if payer_index is None:
+                logger.warning(
+                    f"Payer pubkey {payer_pubkey} not found in signers. "
+                    f"Signers: {[str(account_keys[i]) for i in range(num_signers)]}"
+                )
+                # Payer not in transaction - this might be a non-gasless transaction
+                # Just pass through to Privy signing
+            else:
+                # Create signature list with payer signature in correct position
+                new_signatures = list(transaction.signatures)
+                new_signatures[payer_index] = payer_signature
+                logger.info(f"Payer signed at index {payer_index}")
+
+                partially_signed = VersionedTransaction.populate(
+                    transaction.message,
+                    new_signatures,
+                )
+                tx_to_sign = base64.b64encode(bytes(partially_signed)).decode("utf-8")
+
+        return tx_to_sign
+
     async def _sign_and_execute(  # pragma: no cover
         self,
         privy_client: AsyncPrivyAPI,
@@ -363,48 +472,8 @@ class PrivyTriggerTool(AutoTool):
                 transaction_base64, fresh_blockhash
             )
 
-            tx_to_sign = tx_with_new_blockhash
-
             # Step 3: If payer is configured, sign with payer first
-            if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                tx_bytes = base64.b64decode(tx_with_new_blockhash)
-                transaction = VersionedTransaction.from_bytes(tx_bytes)
-                message_bytes = to_bytes_versioned(transaction.message)
-                payer_signature = payer_keypair.sign_message(message_bytes)
-
-                # Find the payer's position in the account keys
-                # The first N accounts (where N = num_required_signatures) are signers
-                payer_pubkey = payer_keypair.pubkey()
-                num_signers = transaction.message.header.num_required_signatures
-                account_keys = transaction.message.account_keys
-
-                payer_index = None
-                for i in range(num_signers):
-                    if account_keys[i] == payer_pubkey:
-                        payer_index = i
-                        break
-
-                if payer_index is None:
-                    logger.warning(
-                        f"Payer pubkey {payer_pubkey} not found in signers. "
-                        f"Signers: {[str(account_keys[i]) for i in range(num_signers)]}"
-                    )
-                    # Payer not in transaction - this might be a non-gasless transaction
-                    # Just pass through to Privy signing
-                else:
-                    # Create signature list with payer signature in correct position
-                    new_signatures = list(transaction.signatures)
-                    new_signatures[payer_index] = payer_signature
-                    logger.info(f"Payer signed at index {payer_index}")
-
-                    partially_signed = VersionedTransaction.populate(
-                        transaction.message,
-                        new_signatures,
-                    )
-                    tx_to_sign = base64.b64encode(bytes(partially_signed)).decode(
-                        "utf-8"
-                    )
+            tx_to_sign = self._payer_sign(tx_with_new_blockhash)
 
             # Step 4: Sign with Privy using the official SDK
             signed_tx = await _privy_sign_transaction(
@@ -445,6 +514,95 @@ class PrivyTriggerTool(AutoTool):
             logger.exception(f"Failed to sign and execute: {str(e)}")
             return {"status": "error", "message": str(e)}
 
+    async def _sign_and_execute_all(  # pragma: no cover
+        self,
+        privy_client: AsyncPrivyAPI,
+        wallet_id: str,
+        transactions: List[str],
+        order_count: int,
+    ) -> Dict[str, Any]:
+        """
+        Sign and send every cancel transaction at once.
+
+        All transactions share one blockhash, are signed through Privy
+        concurrently (at most PRIVY_SIGN_CONCURRENCY at a time), sent in
+        parallel and confirmed together through the shared tracker.
+        """
+        if not self._rpc_url:
+            return {
+                "status": "error",
+                "message": "rpc_url must be configured for trigger orders. Jupiter's execute endpoint is broken.",
+            }
+
+        blockhash_result = await get_fresh_blockhash(self._rpc_url)
+        if "error" in blockhash_result:
+            return {
+                "status": "error",
+                "message": f"Failed to get blockhash: {blockhash_result['error']}",
+            }
+        fresh_blockhash = blockhash_result["blockhash"]
+        last_valid_block_height = blockhash_result.get("lastValidBlockHeight")
+
+        prepared = [
+            self._payer_sign(replace_blockhash_in_transaction(tx, fresh_blockhash))
+            for tx in transactions
+        ]
+
+        semaphore = asyncio.Semaphore(PRIVY_SIGN_CONCURRENCY)
+
+        async def sign_and_send(tx_to_sign: str) -> Dict[str, Any]:
+            async with semaphore:
+                signed_tx = await _privy_sign_transaction(
+                    privy_client, wallet_id, tx_to_sign, self._signing_key
+                )
+            if not signed_tx:
+                return {
+                    "success": False,
+                    "error": "Failed to sign transaction via Privy.",
+                }
+            return await send_raw_transaction_with_priority(
+                rpc_url=self._rpc_url,
+                tx_bytes=base64.b64decode(signed_tx),
+                skip_preflight=True,
+                skip_confirmation=True,
+            )
+
+        sends = await asyncio.gather(*(sign_and_send(tx) for tx in prepared))
+        sent = [r["signature"] for r in sends if r.get("success")]
+        errors = [
+            r.get("error", "Failed to send transaction")
+            for r in sends
+            if not r.get("success")
+        ]
+
+        confirmations = await confirm_signatures(
+            self._rpc_url, sent, last_valid_block_height
+        )
+        signatures = [sig for sig, error in zip(sent, confirmations) if error is None]
+        errors.extend(error for error in confirmations if error is not None)
+
+        if not signatures:
+            return {"status": "error", "message": "; ".join(errors)}
+
+        response = {
+            "status": "success",
+            "action": "cancel_all",
+            "cancelled_count": order_count,
+            "signatures": signatures,
+            "message": f"Cancelled {order_count} orders.",
+        }
+        if errors:
+            # Jupiter batches several orders per transaction without saying
+            # which, so the cancelled count is unknown when some failed
+            del response["cancelled_count"]
+            response["failed_transactions"] = len(errors)
+            response["errors"] = errors
+            response["message"] = (
+                f"Cancel transactions: {len(signatures)} landed, "
+                f"{len(errors)} failed. Run cancel_all again for the rest."
+            )
+        return response
+
     async def _create_order(  # pragma: no cover
         self,
         privy_client: AsyncPrivyAPI,
@@ -482,8 +640,7 @@ class PrivyTriggerTool(AutoTool):
         try:
             payer_pubkey = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_pubkey = load_address(self._payer_private_key)
 
             # Derive the referral token account for the output mint if referral is configured
             fee_account = None
@@ -523,6 +680,20 @@ class PrivyTriggerTool(AutoTool):
             if exec_result["status"] != "success":
                 return exec_result
 
+            get_trigger_order_mirror().add(
+                public_key,
+                result.order,
+                created_order(
+                    result.order,
+                    public_key,
+                    input_mint,
+                    output_mint,
+                    making_amount,
+                    taking_amount,
+                    expired_at,
+                ),
+            )
+
             return {
                 "status": "success",
                 "action": "create",
@@ -551,24 +722,18 @@ class PrivyTriggerTool(AutoTool):
 
         try:
             # Verify the order belongs to this user before attempting to cancel
-            orders_result = await trigger.get_orders(
-                user=public_key, order_status="active"
+            owned = await get_trigger_order_mirror().has_order(
+                trigger, public_key, order_pubkey
             )
-            if orders_result.get("success", False):
-                user_orders = [
-                    o.get("orderKey") or o.get("order") or o.get("orderPubkey")
-                    for o in orders_result.get("orders", [])
-                ]
-                if order_pubkey not in user_orders:
-                    return {
-                        "status": "error",
-                        "message": f"Order {order_pubkey} does not belong to this user or is not active.",
-                    }
+            if owned is False:
+                return {
+                    "status": "error",
+                    "message": f"Order {order_pubkey} does not belong to this user or is not active.",
+                }
 
             payer_pubkey = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_pubkey = load_address(self._payer_private_key)
 
             result = await trigger.cancel_order(
                 maker=public_key,
@@ -592,6 +757,8 @@ class PrivyTriggerTool(AutoTool):
             if exec_result["status"] != "success":
                 return exec_result
 
+            get_trigger_order_mirror().remove(public_key, order_pubkey)
+
             return {
                 "status": "success",
                 "action": "cancel",
@@ -614,12 +781,11 @@ class PrivyTriggerTool(AutoTool):
         try:
             payer_pubkey = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_pubkey = load_address(self._payer_private_key)
 
-            # Get active orders first
-            orders_result = await trigger.get_orders(
-                user=public_key, order_status="active"
+            # Get active orders first, fresh so none made elsewhere are missed
+            orders_result = await get_trigger_order_mirror().get_orders(
+                trigger, public_key, refresh=True
             )
 
             if not orders_result.get("success", False):
@@ -652,21 +818,14 @@ class PrivyTriggerTool(AutoTool):
                     "message": "No transactions returned from Jupiter.",
                 }
 
-            signatures = []
-            for tx_base64 in result.transactions:
-                exec_result = await self._sign_and_execute(
-                    privy_client, trigger, wallet_id, tx_base64, result.request_id
-                )
-                if exec_result["status"] == "success":
-                    signatures.append(exec_result["signature"])
-
-            return {
-                "status": "success",
-                "action": "cancel_all",
-                "cancelled_count": len(orders),
-                "signatures": signatures,
-                "message": f"Cancelled {len(orders)} orders.",
-            }
+            response = await self._sign_and_execute_all(
+                privy_client, wallet_id, result.transactions, len(orders)
+            )
+            if response["status"] == "success" and "errors" not in response:
+                get_trigger_order_mirror().remove_all(public_key)
+            else:
+                get_trigger_order_mirror().invalidate(public_key)
+            return response
 
         except Exception as e:
             logger.exception(f"Failed to cancel all trigger orders: {str(e)}")
@@ -678,7 +837,7 @@ class PrivyTriggerTool(AutoTool):
         public_key: str,
     ) -> Dict[str, Any]:
         try:
-            result = await trigger.get_orders(user=public_key, order_status="active")
+            result = await get_trigger_order_mirror().get_orders(trigger, public_key)
 
             if not result.get("success", False):
                 return {
@@ -692,9 +851,7 @@ class PrivyTriggerTool(AutoTool):
             for order in orders:
                 formatted_orders.append(
                     {
-                        "order_pubkey": order.get("orderKey")
-                        or order.get("order")
-                        or order.get("orderPubkey"),
+                        "order_pubkey": order_key(order),
                         "input_mint": order.get("inputMint"),
                         "output_mint": order.get("outputMint"),
                         "making_amount": order.get("makingAmount"),
@@ -17,13 +17,19 @@ from solana_agent import AutoTool, ToolRegistry
 from privy import AsyncPrivyAPI
 from privy.lib.authorization_signatures import get_authorization_signature
 from cryptography.hazmat.primitives import serialization
-from solders.keypair import Keypair
-from solders.transaction import VersionedTransaction
-from solders.message import to_bytes_versioned
 
+from sakit.utils.holdings import invalidate_holdings
+from sakit.utils.pipeline import StagePipeline
+from sakit.utils.shield import (
+    SHIELD_BLOCK_SEVERITIES,
+    get_shield_cache,
+    pre_trade_check,
+)
 from sakit.utils.ultra import JupiterUltra
-from sakit.utils.trigger import replace_blockhash_in_transaction, get_fresh_blockhash
+from sakit.utils.transaction import TransactionEditor
+from sakit.utils.trigger import get_fresh_blockhash
 from sakit.utils.wallet import send_raw_transaction_with_priority
+from sakit.utils.keyring import get_keyring, load_address, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -261,13 +267,64 @@ class PrivyUltraTool(AutoTool):
         self.referral_fee = tool_cfg.get("referral_fee")
         self.payer_private_key = tool_cfg.get("payer_private_key")
         self._payer_private_key = self.payer_private_key  # For _sign_and_execute
+        get_keyring().preload(self.payer_private_key)
         self._rpc_url = tool_cfg.get("rpc_url")
+        self.shield_check = bool(tool_cfg.get("shield_check", False))
+        self.shield_block_severities = list(
+            tool_cfg.get("shield_block_severities", SHIELD_BLOCK_SEVERITIES)
+        )
+        self.broadcast_rpc_urls = list(tool_cfg.get("broadcast_rpc_urls") or [])
+
+    def _apply_blockhash_and_payer(  # pragma: no cover
+        self, transaction_base64: str, blockhash: str
+    ) -> str:
+        """Replace the blockhash and add the payer signature if configured.
+
+        The transaction is decoded once and patched in place; it is only
+        re-encoded for the Privy signing request.
+        """
+        editor = TransactionEditor.from_base64(transaction_base64)
+        editor.set_blockhash(blockhash)
+
+        if self._payer_private_key:
+            payer_keypair = load_keypair(self._payer_private_key)
+            payer_index = editor.sign(payer_keypair)
+            if payer_index is None:
+                signers = [
+                    str(editor.signer(i)) for i in range(editor.num_required_signatures)
+                ]
+                logger.warning(
+                    f"Payer pubkey {payer_keypair.pubkey()} not found in signers. "
+                    f"Signers: {signers}"
+                )
+                # Payer not in transaction - this might be a non-gasless transaction
+                # Just pass through to Privy signing
+            else:
+                logger.info(f"Payer signed at index {payer_index}")
+
+        return editor.to_base64()
+
+    def _payer_pubkey(self) -> Optional[str]:
+        """Public key of the integrator payer, if configured."""
+        if not self.payer_private_key:
+            return None
+        return load_address(self.payer_private_key)
+
+    def _start_prefetch(self, pipeline: StagePipeline) -> None:
+        """Start the stages that do not depend on the order."""
+        if self._rpc_url and "blockhash" not in pipeline:
+            pipeline.add("blockhash", lambda: get_fresh_blockhash(self._rpc_url))
+        if "signing_key" not in pipeline:
+            pipeline.add(
+                "signing_key", lambda: convert_key_to_pkcs8_pem(self._signing_key)
+            )
 
     async def _sign_and_execute(  # pragma: no cover
         self,
         privy_client: AsyncPrivyAPI,
         wallet_id: str,
         transaction_base64: str,
+        pipeline: Optional[StagePipeline] = None,
     ) -> Dict[str, Any]:
         """
         Replace blockhash, sign with payer (if configured) and Privy, then send.
@@ -278,8 +335,14 @@ class PrivyUltraTool(AutoTool):
         3. Sign with our keys
         4. Send directly via our RPC
 
+        When `pipeline` is given, the blockhash and signing key stages started
+        alongside the order fetch are reused instead of being run again.
+
         This matches the pattern used in privy_trigger.py.
         """
+        owns_pipeline = pipeline is None
+        if owns_pipeline:
+            pipeline = StagePipeline()
         try:
             # RPC URL is required - Jupiter's execute has reliability issues
             if not self._rpc_url:
@@ -288,8 +351,10 @@ class PrivyUltraTool(AutoTool):
                     "message": "rpc_url must be configured for Ultra swaps. Jupiter's execute endpoint has reliability issues.",
                 }
 
-            # Step 1: Get fresh blockhash from our RPC
-            blockhash_result = await get_fresh_blockhash(self._rpc_url)
+            self._start_prefetch(pipeline)
+
+            # Step 1: Fresh blockhash from our RPC (usually already fetched)
+            blockhash_result = await pipeline.result("blockhash")
             if "error" in blockhash_result:
                 return {
                     "status": "error",
@@ -299,60 +364,21 @@ class PrivyUltraTool(AutoTool):
             fresh_blockhash = blockhash_result["blockhash"]
             logger.info(f"Got fresh blockhash: {fresh_blockhash}")
 
-            # Step 2: Replace blockhash in the transaction
-            tx_with_new_blockhash = replace_blockhash_in_transaction(
-                transaction_base64, fresh_blockhash
+            # Steps 2-3: Replace blockhash and sign with payer if configured
+            tx_to_sign = await pipeline.add(
+                "transaction",
+                lambda: self._apply_blockhash_and_payer(
+                    transaction_base64, fresh_blockhash
+                ),
             )
 
-            tx_to_sign = tx_with_new_blockhash
-
-            # Step 3: If payer is configured, sign with payer first
-            if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                tx_bytes = base64.b64decode(tx_with_new_blockhash)
-                transaction = VersionedTransaction.from_bytes(tx_bytes)
-                message_bytes = to_bytes_versioned(transaction.message)
-                payer_signature = payer_keypair.sign_message(message_bytes)
-
-                # Find the payer's position in the account keys
-                # The first N accounts (where N = num_required_signatures) are signers
-                payer_pubkey = payer_keypair.pubkey()
-                num_signers = transaction.message.header.num_required_signatures
-                account_keys = transaction.message.account_keys
-
-                payer_index = None
-                for i in range(num_signers):
-                    if account_keys[i] == payer_pubkey:
-                        payer_index = i
-                        break
-
-                if payer_index is None:
-                    logger.warning(
-                        f"Payer pubkey {payer_pubkey} not found in signers. "
-                        f"Signers: {[str(account_keys[i]) for i in range(num_signers)]}"
-                    )
-                    # Payer not in transaction - this might be a non-gasless transaction
-                    # Just pass through to Privy signing
-                else:
-                    # Create signature list with payer signature in correct position
-                    new_signatures = list(transaction.signatures)
-                    new_signatures[payer_index] = payer_signature
-                    logger.info(f"Payer signed at index {payer_index}")
-
-                    partially_signed = VersionedTransaction.populate(
-                        transaction.message,
-                        new_signatures,
-                    )
-                    tx_to_sign = base64.b64encode(bytes(partially_signed)).decode(
-                        "utf-8"
-                    )
-
             # Step 4: Sign with Privy using the official SDK
-            signed_tx = await _privy_sign_transaction(
-                privy_client,
-                wallet_id,
-                tx_to_sign,
-                self._signing_key,
+            signing_key = await pipeline.result("signing_key")
+            signed_tx = await pipeline.add(
+                "privy_sign",
+                lambda: _privy_sign_transaction(
+                    privy_client, wallet_id, tx_to_sign, signing_key
+                ),
             )
 
             if not signed_tx:
@@ -363,12 +389,19 @@ class PrivyUltraTool(AutoTool):
 
             # Step 5: Send via our RPC
             tx_bytes = base64.b64decode(signed_tx)
-            send_result = await send_raw_transaction_with_priority(
-                rpc_url=self._rpc_url,
-                tx_bytes=tx_bytes,
-                skip_preflight=True,  # Some RPCs don't support preflight simulation
-                skip_confirmation=False,  # Wait for confirmation - blockhash is from our RPC
-                confirm_timeout=30.0,
+            send_result = await pipeline.add(
+                "send",
+                lambda: send_raw_transaction_with_priority(
+                    rpc_url=self._rpc_url,
+                    tx_bytes=tx_bytes,
+                    skip_preflight=True,  # Some RPCs don't support preflight simulation
+                    skip_confirmation=False,  # Wait for confirmation - blockhash is from our RPC
+                    confirm_timeout=30.0,
+                    broadcast_urls=self.broadcast_rpc_urls,
+                    last_valid_block_height=blockhash_result.get(
+                        "lastValidBlockHeight"
+                    ),
+                ),
             )
 
             if not send_result.get("success"):
@@ -377,14 +410,21 @@ class PrivyUltraTool(AutoTool):
                     "message": send_result.get("error", "Failed to send transaction"),
                 }
 
-            return {
+            result = {
                 "status": "success",
                 "signature": send_result.get("signature"),
             }
+            if send_result.get("landed_on"):
+                result["landed_on"] = send_result["landed_on"]
+            return result
 
         except Exception as e:
             logger.exception(f"Failed to sign and execute: {str(e)}")
             return {"status": "error", "message": str(e)}
+        finally:
+            # A caller's pipeline is closed by the caller
+            if owns_pipeline:
+                await pipeline.aclose()
 
     async def execute(  # pragma: no cover
         self,
@@ -409,29 +449,46 @@ class PrivyUltraTool(AutoTool):
             app_secret=self.app_secret,
         )
 
+        # Independent stages (payer key, blockhash, signing key) run
+        # concurrently with the order fetch instead of after it
+        pipeline = StagePipeline()
+
         try:
             public_key = wallet_public_key
 
-            # Check if integrator payer is configured for gasless transactions
-            payer_pubkey = None
-            if self.payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self.payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
-
             # Initialize Jupiter Ultra client
             ultra = JupiterUltra(api_key=self.jupiter_api_key)
 
+            # Integrator payer for gasless transactions, if configured
+            pipeline.add("payer", self._payer_pubkey)
+            self._start_prefetch(pipeline)
+            if self.shield_check:
+                pipeline.add(
+                    "shield",
+                    lambda: pre_trade_check(
+                        get_shield_cache(self.jupiter_api_key),
+                        ultra,
+                        [input_mint, output_mint],
+                        self.shield_block_severities,
+                    ),
+                )
+
             # Get swap order
-            order = await ultra.get_order(
-                input_mint=input_mint,
-                output_mint=output_mint,
-                amount=amount,
-                taker=public_key,
-                referral_account=self.referral_account,
-                referral_fee=self.referral_fee,
-                payer=payer_pubkey,
-                close_authority=public_key if payer_pubkey else None,
+            pipeline.add(
+                "order",
+                lambda payer_pubkey: ultra.get_order(
+                    input_mint=input_mint,
+                    output_mint=output_mint,
+                    amount=amount,
+                    taker=public_key,
+                    referral_account=self.referral_account,
+                    referral_fee=self.referral_fee,
+                    payer=payer_pubkey,
+                    close_authority=public_key if payer_pubkey else None,
+                ),
+                "payer",
             )
+            order = await pipeline.result("order")
 
             if not order.transaction:
                 return {
@@ -439,14 +496,26 @@ class PrivyUltraTool(AutoTool):
                     "message": "No transaction returned from Jupiter Ultra.",
                 }
 
+            verdict = None
+            if "shield" in pipeline:
+                verdict = await pipeline.result("shield")
+                if verdict.blocked:
+                    return {
+                        "status": "error",
+                        "message": f"Swap blocked by Jupiter Shield warnings for: {', '.join(verdict.blocked)}",
+                        "shield": verdict.summary(),
+                    }
+
             # Sign and execute via RPC (bypasses Jupiter's /execute endpoint)
             exec_result = await self._sign_and_execute(
                 privy_client=privy_client,
                 wallet_id=wallet_id,
                 transaction_base64=order.transaction,
+                pipeline=pipeline,
             )
 
             if exec_result.get("status") == "success":
+                invalidate_holdings(public_key)
                 # Format price impact as percentage with sign
                 price_impact_str = ""
                 if order.price_impact is not None:
@@ -463,6 +532,13 @@ class PrivyUltraTool(AutoTool):
                     "out_usd_value": order.out_usd_value,
                     "slippage_bps": order.slippage_bps,
                     "price_impact_pct": price_impact_str,
+                    "timings": pipeline.timings(),
+                    **({"shield": verdict.summary()} if verdict else {}),
+                    **(
+                        {"landed_on": exec_result["landed_on"]}
+                        if exec_result.get("landed_on")
+                        else {}
+                    ),
                 }
             else:
                 return exec_result
@@ -471,6 +547,7 @@ class PrivyUltraTool(AutoTool):
             logger.exception(f"Privy Ultra swap failed: {str(e)}")
             return {"status": "error", "message": str(e)}
         finally:
+            await pipeline.aclose()
             await privy_client.close()
 
 
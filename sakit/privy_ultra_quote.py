@@ -8,9 +8,9 @@ import logging
 from typing import Dict, Any, List, Optional
 
 from solana_agent import AutoTool, ToolRegistry
-from solders.keypair import Keypair
 
-from sakit.utils.ultra import JupiterUltra
+from sakit.utils.ultra import QUOTE_CACHE_TTL, JupiterUltra, UltraQuoteCache
+from sakit.utils.keyring import get_keyring, load_address
 
 
 logger = logging.getLogger(__name__)
@@ -29,6 +29,7 @@ class PrivyUltraQuoteTool(AutoTool):
         self.referral_account = None
         self.referral_fee = None
         self.payer_private_key = None
+        self.quote_cache = UltraQuoteCache()
 
     def get_schema(self) -> Dict[str, Any]:
         return {
@@ -71,6 +72,11 @@ class PrivyUltraQuoteTool(AutoTool):
         self.referral_account = tool_cfg.get("referral_account")
         self.referral_fee = tool_cfg.get("referral_fee")
         self.payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self.payer_private_key)
+        self.quote_cache = UltraQuoteCache(
+            ttl=tool_cfg.get("quote_cache_ttl", QUOTE_CACHE_TTL),
+            amount_precision=tool_cfg.get("quote_amount_precision", 0),
+        )
 
     async def execute(  # pragma: no cover
         self,
@@ -91,15 +97,16 @@ class PrivyUltraQuoteTool(AutoTool):
         # Check if integrator payer is configured for gasless transactions
         payer_pubkey = None
         if self.payer_private_key:
-            payer_keypair = Keypair.from_base58_string(self.payer_private_key)
-            payer_pubkey = str(payer_keypair.pubkey())
+            payer_pubkey = load_address(self.payer_private_key)
 
         # Initialize Jupiter Ultra client
         ultra = JupiterUltra(api_key=self.jupiter_api_key)
 
         try:
-            # Get swap quote (doesn't execute, just shows details)
-            order = await ultra.get_order(
+            # Get swap quote (doesn't execute, just shows details); repeated
+            # quotes within the cache TTL are served without an API call
+            order, age = await self.quote_cache.get_quote(
+                ultra,
                 input_mint=input_mint,
                 output_mint=output_mint,
                 amount=amount,
@@ -107,7 +114,6 @@ class PrivyUltraQuoteTool(AutoTool):
                 referral_account=self.referral_account,
                 referral_fee=self.referral_fee,
                 payer=payer_pubkey,
-                close_authority=public_key if payer_pubkey else None,
             )
 
             # Format price impact as percentage with sign
@@ -132,6 +138,7 @@ class PrivyUltraQuoteTool(AutoTool):
                 "price_impact_pct": price_impact_str,
                 "swap_type": order.swap_type,
                 "gasless": order.gasless,
+                "quote_age_seconds": round(age, 2),
                 "message": "Preview only - no transaction executed. Call privy_ultra to execute the swap.",
             }
 
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional
+from solana_agent import AutoTool, ToolRegistry
+from solders.hash import Hash
+from solders.transaction import VersionedTransaction
+from sakit.utils.batch_transfer import (
+    MAX_BATCH_ROWS,
+    TRANSFER_ROW_SCHEMA,
+    PackedTransaction,
+    compile_transaction,
+    fetch_lookup_tables,
+    landed_recipients,
+    pack_transfers,
+    parse_rows,
+    plan_batch,
+    send_packed,
+    summarize_batch,
+)
+from sakit.utils.holdings import invalidate_holdings
+from sakit.utils.priority_fees import (
+    DEFAULT_FEE_STRATEGY,
+    DEFAULT_PRIORITY_FEE_CAP,
+    get_fee_oracle,
+)
+from sakit.utils.trigger import get_fresh_blockhash
+from sakit.utils.wallet import get_rpc_client, send_raw_transaction_with_priority
+from sakit.utils.keyring import get_keyring, load_keypair
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_SENDS = 8
+
+
+class SolanaBatchTransferTool(AutoTool):
+    def __init__(self, registry: Optional[ToolRegistry] = None):
+        super().__init__(
+            name="solana_batch_transfer",
+            description=(
+                "Transfer SOL or SPL tokens to many recipients at once (payouts, "
+                "airdrops). Transfers are packed into as few transactions as possible."
+            ),
+            registry=registry,
+        )
+        self._rpc_url: Optional[str] = None
+        self._private_key: Optional[str] = None
+        self._max_concurrent_sends = DEFAULT_MAX_CONCURRENT_SENDS
+        self._lookup_table_addresses: List[str] = []
+        self._priority_fee_strategy: str = DEFAULT_FEE_STRATEGY
+        self._priority_fee_cap: Optional[int] = DEFAULT_PRIORITY_FEE_CAP
+
+    def get_schema(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "transfers": {
+                    "type": "array",
+                    "description": f"transfers to make (up to {MAX_BATCH_ROWS})",
+                    "items": TRANSFER_ROW_SCHEMA,
+                },
+            },
+            "required": ["transfers"],
+            "additionalProperties": False,
+        }
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        super().configure(config)
+        tool_cfg = config.get("tools", {}).get("solana_batch_transfer", {})
+        self._rpc_url = tool_cfg.get("rpc_url")
+        self._private_key = tool_cfg.get("private_key")
+        get_keyring().preload(self._private_key)
+        self._max_concurrent_sends = int(
+            tool_cfg.get("max_concurrent_sends", DEFAULT_MAX_CONCURRENT_SENDS)
+        )
+        self._lookup_table_addresses = list(
+            tool_cfg.get("lookup_table_addresses") or []
+        )
+        self._priority_fee_strategy = tool_cfg.get(
+            "priority_fee_strategy", DEFAULT_FEE_STRATEGY
+        )
+        self._priority_fee_cap = tool_cfg.get(
+            "priority_fee_cap", DEFAULT_PRIORITY_FEE_CAP
+        )
+
+    async def execute(self, transfers: List[Dict[str, Any]]) -> Dict[str, Any]:
+        if not self._rpc_url:
+            return {"status": "error", "message": "RPC URL not configured."}
+        if not self._private_key:
+            return {"status": "error", "message": "Private key not configured."}
+        if not transfers:
+            return {"status": "error", "message": "No transfers provided."}
+        if len(transfers) > MAX_BATCH_ROWS:
+            return {
+                "status": "error",
+                "message": f"Too many transfers: {len(transfers)} (max {MAX_BATCH_ROWS}).",
+            }
+
+        try:
+            keypair = load_keypair(self._private_key)
+            owner = keypair.pubkey()
+            client = get_rpc_client(self._rpc_url)
+            rows = parse_rows(transfers)
+
+            # Blockhash, account prefetch and lookup tables load concurrently
+            blockhash_task = asyncio.ensure_future(get_fresh_blockhash(self._rpc_url))
+            try:
+                plan, lookup_tables = await asyncio.gather(
+                    plan_batch(client, owner, owner, rows),
+                    fetch_lookup_tables(client, self._lookup_table_addresses),
+                )
+                compute_unit_price = None
+                if "helius" in self._rpc_url:  # pragma: no cover
+                    compute_unit_price = await get_fee_oracle(self._rpc_url).get_fee(
+                        plan.sender_writable,
+                        self._priority_fee_strategy,
+                        self._priority_fee_cap,
+                    )
+                packed = pack_transfers(owner, plan, compute_unit_price, lookup_tables)
+
+                blockhash_result = await blockhash_task
+            finally:
+                # No-op once awaited; stops the prefetch if planning failed
+                blockhash_task.cancel()
+            if "error" in blockhash_result:
+                return {
+                    "status": "error",
+                    "message": f"Failed to get blockhash: {blockhash_result['error']}",
+                }
+            blockhash = Hash.from_string(blockhash_result["blockhash"])
+
+            async def send(tx: PackedTransaction) -> Dict[str, Any]:
+                message = compile_transaction(
+                    owner, tx.instructions, blockhash, lookup_tables
+                )
+                signed = VersionedTransaction(message, [keypair])
+                return await send_raw_transaction_with_priority(
+                    rpc_url=self._rpc_url,
+                    tx_bytes=bytes(signed),
+                    skip_preflight=True,
+                    confirm_timeout=30.0,
+                )
+
+            results = await send_packed(packed, send, self._max_concurrent_sends)
+            summary = summarize_batch(rows, plan, packed, results)
+            landed = landed_recipients(summary)
+            if landed:
+                invalidate_holdings(str(owner), *landed)
+            return summary
+        except Exception as e:
+            logger.exception(f"Batch transfer failed: {str(e)}")
+            return {"status": "error", "message": str(e)}
+
+
+class SolanaBatchTransferPlugin:
+    def __init__(self):
+        self.name = "solana_batch_transfer"
+        self.config = None
+        self.tool_registry = None
+        self._tool = None
+
+    @property
+    def description(self):
+        return "Plugin for transferring SOL or SPL tokens to many recipients."
+
+    def initialize(self, tool_registry: ToolRegistry) -> None:  # pragma: no cover
+        self.tool_registry = tool_registry
+        self._tool = SolanaBatchTransferTool(registry=tool_registry)
+
+    def configure(self, config: Dict[str, Any]) -> None:  # pragma: no cover
+        self.config = config
+        if self._tool:
+            self._tool.configure(self.config)
+
+    def get_tools(self) -> List[AutoTool]:  # pragma: no cover
+        return [self._tool] if self._tool else []
+
+
+def get_plugin():  # pragma: no cover
+    return SolanaBatchTransferPlugin()
@@ -13,13 +13,14 @@ import logging
 from typing import Dict, Any, List, Optional
 
 from solana_agent import AutoTool, ToolRegistry
-from solders.keypair import Keypair  # type: ignore
 from solders.transaction import VersionedTransaction  # type: ignore
 from solders.message import to_bytes_versioned  # type: ignore
 from solana.rpc.async_api import AsyncClient  # type: ignore
 from solana.rpc.commitment import Confirmed  # type: ignore
 
 from sakit.utils.dflow import DFlowSwap
+from sakit.utils.holdings import invalidate_holdings
+from sakit.utils.keyring import get_keyring, load_address, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +114,7 @@ class SolanaDFlowSwapTool(AutoTool):
         tool_cfg = config.get("tools", {}).get("solana_dflow_swap", {})
         self._private_key = tool_cfg.get("private_key")
         self._payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self._private_key, self._payer_private_key)
         self._rpc_url = tool_cfg.get("rpc_url") or DEFAULT_RPC_URL
 
     async def execute(
@@ -126,15 +128,15 @@ class SolanaDFlowSwapTool(AutoTool):
             return {"status": "error", "message": "Private key not configured."}
 
         try:
-            keypair = Keypair.from_base58_string(self._private_key)
-            user_pubkey = str(keypair.pubkey())
+            keypair = load_keypair(self._private_key)
+            user_pubkey = load_address(self._private_key)
 
             # Check if payer is configured for gasless transactions
             payer_keypair = None
             sponsor = None
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                sponsor = str(payer_keypair.pubkey())
+                payer_keypair = load_keypair(self._payer_private_key)
+                sponsor = load_address(self._payer_private_key)
 
             # Initialize DFlow client
             dflow = DFlowSwap()
@@ -174,6 +176,7 @@ class SolanaDFlowSwapTool(AutoTool):
                     "message": "Failed to send transaction to Solana.",
                 }
 
+            invalidate_holdings(user_pubkey)
             return {
                 "status": "success",
                 "signature": signature,
@@ -1,8 +1,11 @@
 from typing import Dict, Any, List, Optional
 from solana_agent import AutoTool, ToolRegistry
-from solders.keypair import Keypair
+from sakit.utils.holdings import invalidate_holdings
+from sakit.utils.nonce import get_nonce_pool
+from sakit.utils.priority_fees import DEFAULT_FEE_STRATEGY, DEFAULT_PRIORITY_FEE_CAP
 from sakit.utils.wallet import SolanaWalletClient
 from sakit.utils.transfer import TokenTransferManager
+from sakit.utils.keyring import get_keyring, load_keypair
 
 LAMPORTS_PER_SOL = 10**9
 
@@ -16,6 +19,9 @@ class SolanaTransferTool(AutoTool):
         )
         self._rpc_url: Optional[str] = None
         self._private_key: Optional[str] = None
+        self._priority_fee_strategy: str = DEFAULT_FEE_STRATEGY
+        self._priority_fee_cap: Optional[int] = DEFAULT_PRIORITY_FEE_CAP
+        self._nonce_accounts: List[str] = []
 
     def get_schema(self) -> Dict[str, Any]:
         return {
@@ -46,6 +52,15 @@ class SolanaTransferTool(AutoTool):
         self._private_key = (
             config.get("tools", {}).get("solana_transfer", {}).get("private_key")
         )
+        get_keyring().preload(self._private_key)
+        tool_cfg = config.get("tools", {}).get("solana_transfer", {})
+        self._priority_fee_strategy = tool_cfg.get(
+            "priority_fee_strategy", DEFAULT_FEE_STRATEGY
+        )
+        self._priority_fee_cap = tool_cfg.get(
+            "priority_fee_cap", DEFAULT_PRIORITY_FEE_CAP
+        )
+        self._nonce_accounts = list(tool_cfg.get("nonce_accounts") or [])
 
     async def execute(
         self, to_address: str, amount: float, mint: Optional[str] = None
@@ -54,20 +69,39 @@ class SolanaTransferTool(AutoTool):
             return {"status": "error", "message": "RPC URL not configured."}
         if not self._private_key:
             return {"status": "error", "message": "Private key not configured."}
-        keypair = Keypair.from_base58_string(self._private_key)
+        keypair = load_keypair(self._private_key)
         wallet = SolanaWalletClient(self._rpc_url, keypair)
         provider = None
         if "helius" in self._rpc_url:  # pragma: no cover
             provider = "helius"
+        nonce_pool = None
+        nonce = None
+        sent = False
         try:
+            if self._nonce_accounts:
+                nonce_pool = get_nonce_pool(str(keypair.pubkey()), self._nonce_accounts)
+                nonce = await nonce_pool.acquire(wallet.client)
             transaction = await TokenTransferManager.transfer(
-                wallet, to_address, amount, mint, provider
+                wallet,
+                to_address,
+                amount,
+                mint,
+                provider,
+                priority_fee_strategy=self._priority_fee_strategy,
+                priority_fee_cap=self._priority_fee_cap,
+                nonce=nonce,
             )
             signature = await wallet.client.send_transaction(transaction)
+            # Only an accepted transaction can advance the nonce
+            sent = True
             sig = signature.value
+            invalidate_holdings(str(keypair.pubkey()), to_address)
             return {"status": "success", "result": sig}
         except Exception as e:
             return {"status": "error", "message": str(e)}
+        finally:
+            if nonce is not None:
+                nonce_pool.release(nonce, consumed=sent)
 
 
 class SolanaTransferPlugin:
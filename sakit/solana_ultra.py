@@ -8,18 +8,27 @@ our RPC (Helius). This is because Jupiter's execute can have reliability issues.
 This matches the pattern used in privy_ultra.py and privy_trigger.py.
 """
 
-import base64
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 
 from solana_agent import AutoTool, ToolRegistry
 from solders.keypair import Keypair
-from solders.transaction import VersionedTransaction
-from solders.message import to_bytes_versioned
 
+from sakit.utils.dflow import DFlowSwap
+from sakit.utils.holdings import invalidate_holdings
+from sakit.utils.routing import ROUTE_DEADLINE, race_routes
+from sakit.utils.shield import (
+    SHIELD_BLOCK_SEVERITIES,
+    ShieldVerdict,
+    get_shield_cache,
+    pre_trade_check,
+)
 from sakit.utils.ultra import JupiterUltra
-from sakit.utils.trigger import replace_blockhash_in_transaction, get_fresh_blockhash
+from sakit.utils.transaction import TransactionEditor
+from sakit.utils.trigger import get_fresh_blockhash
 from sakit.utils.wallet import send_raw_transaction_with_priority
+from sakit.utils.keyring import get_keyring, load_address, load_keypair
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +48,11 @@ class SolanaUltraTool(AutoTool):
         self._referral_fee: Optional[int] = None
         self._payer_private_key: Optional[str] = None
         self._rpc_url: Optional[str] = None
+        self._broadcast_rpc_urls: List[str] = []
+        self._route_racing: bool = False
+        self._route_deadline: float = ROUTE_DEADLINE
+        self._shield_check: bool = False
+        self._shield_block_severities: List[str] = list(SHIELD_BLOCK_SEVERITIES)
 
     def get_schema(self) -> Dict[str, Any]:
         return {
@@ -69,7 +83,38 @@ class SolanaUltraTool(AutoTool):
         self._referral_account = tool_cfg.get("referral_account")
         self._referral_fee = tool_cfg.get("referral_fee")
         self._payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self._private_key, self._payer_private_key)
         self._rpc_url = tool_cfg.get("rpc_url")
+        self._route_racing = bool(tool_cfg.get("route_racing", False))
+        self._route_deadline = float(tool_cfg.get("route_deadline", ROUTE_DEADLINE))
+        self._shield_check = bool(tool_cfg.get("shield_check", False))
+        self._shield_block_severities = list(
+            tool_cfg.get("shield_block_severities", SHIELD_BLOCK_SEVERITIES)
+        )
+        self._broadcast_rpc_urls = list(tool_cfg.get("broadcast_rpc_urls") or [])
+
+    def _start_shield_check(
+        self, ultra: JupiterUltra, input_mint: str, output_mint: str
+    ) -> Optional[asyncio.Future]:
+        """Start the optional Shield check so it overlaps the order fetch."""
+        if not self._shield_check:
+            return None
+        return asyncio.ensure_future(
+            pre_trade_check(
+                get_shield_cache(self._jupiter_api_key),
+                ultra,
+                [input_mint, output_mint],
+                self._shield_block_severities,
+            )
+        )
+
+    @staticmethod
+    def _shield_blocked(verdict: ShieldVerdict) -> Dict[str, Any]:
+        return {
+            "status": "error",
+            "message": f"Swap blocked by Jupiter Shield warnings for: {', '.join(verdict.blocked)}",
+            "shield": verdict.summary(),
+        }
 
     async def _sign_and_execute(  # pragma: no cover
         self,
@@ -106,64 +151,26 @@ class SolanaUltraTool(AutoTool):
             fresh_blockhash = blockhash_result["blockhash"]
             logger.info(f"Got fresh blockhash: {fresh_blockhash}")
 
-            # Step 2: Replace blockhash in the transaction
-            tx_with_new_blockhash = replace_blockhash_in_transaction(
-                transaction_base64, fresh_blockhash
-            )
-
-            # Step 3: Sign with keypair (and payer if configured)
-            tx_bytes = base64.b64decode(tx_with_new_blockhash)
-            transaction = VersionedTransaction.from_bytes(tx_bytes)
-            message_bytes = to_bytes_versioned(transaction.message)
-
-            # Get the number of required signatures
-            num_signers = transaction.message.header.num_required_signatures
-            account_keys = transaction.message.account_keys
-            new_signatures = list(transaction.signatures)
+            # Step 2: Replace blockhash in place (single decode, no re-serialize)
+            editor = TransactionEditor.from_base64(transaction_base64)
+            editor.set_blockhash(fresh_blockhash)
 
-            # If payer is configured, sign with payer first
+            # Step 3: Sign with payer first (if configured), then the taker
             if self._payer_private_key:
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = payer_keypair.pubkey()
-                payer_signature = payer_keypair.sign_message(message_bytes)
-
-                # Find payer's position in signers
-                payer_index = None
-                for i in range(num_signers):
-                    if account_keys[i] == payer_pubkey:
-                        payer_index = i
-                        break
-
+                payer_keypair = load_keypair(self._payer_private_key)
+                payer_index = editor.sign(payer_keypair)
                 if payer_index is not None:
-                    new_signatures[payer_index] = payer_signature
                     logger.info(f"Payer signed at index {payer_index}")
 
-            # Sign with main keypair (taker)
-            taker_pubkey = keypair.pubkey()
-            taker_signature = keypair.sign_message(message_bytes)
-
-            # Find taker's position in signers
-            taker_index = None
-            for i in range(num_signers):
-                if account_keys[i] == taker_pubkey:
-                    taker_index = i
-                    break
-
+            taker_index = editor.sign(keypair)
             if taker_index is None:
                 return {
                     "status": "error",
-                    "message": f"Taker pubkey {taker_pubkey} not found in transaction signers.",
+                    "message": f"Taker pubkey {keypair.pubkey()} not found in transaction signers.",
                 }
-
-            new_signatures[taker_index] = taker_signature
             logger.info(f"Taker signed at index {taker_index}")
 
-            # Create signed transaction
-            signed_transaction = VersionedTransaction.populate(
-                transaction.message,
-                new_signatures,
-            )
-            signed_tx_bytes = bytes(signed_transaction)
+            signed_tx_bytes = bytes(editor)
 
             # Step 4: Send via our RPC
             send_result = await send_raw_transaction_with_priority(
@@ -172,6 +179,8 @@ class SolanaUltraTool(AutoTool):
                 skip_preflight=True,  # Some RPCs don't support preflight simulation
                 skip_confirmation=False,  # Wait for confirmation - blockhash is from our RPC
                 confirm_timeout=30.0,
+                broadcast_urls=self._broadcast_rpc_urls,
+                last_valid_block_height=blockhash_result.get("lastValidBlockHeight"),
             )
 
             if not send_result.get("success"):
@@ -180,10 +189,14 @@ class SolanaUltraTool(AutoTool):
                     "message": send_result.get("error", "Failed to send transaction"),
                 }
 
-            return {
+            invalidate_holdings(str(keypair.pubkey()))
+            result = {
                 "status": "success",
                 "signature": send_result.get("signature"),
             }
+            if send_result.get("landed_on"):
+                result["landed_on"] = send_result["landed_on"]
+            return result
 
         except Exception as e:
             logger.exception(f"Failed to sign and execute: {str(e)}")
@@ -198,18 +211,30 @@ class SolanaUltraTool(AutoTool):
         if not self._private_key:
             return {"status": "error", "message": "Private key not configured."}
 
+        shield_task = None
         try:
-            keypair = Keypair.from_base58_string(self._private_key)
-            taker = str(keypair.pubkey())
+            keypair = load_keypair(self._private_key)
+            taker = load_address(self._private_key)
 
             # Check if integrator payer is configured for gasless transactions
             payer_pubkey = None
             if self._payer_private_key:  # pragma: no cover
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_pubkey = load_address(self._payer_private_key)
 
             # Initialize Jupiter Ultra client
             ultra = JupiterUltra(api_key=self._jupiter_api_key)
+            shield_task = self._start_shield_check(ultra, input_mint, output_mint)
+
+            if self._route_racing:
+                return await self._execute_best_route(
+                    keypair,
+                    ultra,
+                    input_mint,
+                    output_mint,
+                    amount,
+                    payer_pubkey,
+                    shield_task=shield_task,
+                )
 
             # Get swap order
             order = await ultra.get_order(
@@ -229,6 +254,10 @@ class SolanaUltraTool(AutoTool):
                     "message": "No transaction returned from Jupiter Ultra.",
                 }
 
+            verdict = await shield_task if shield_task else None
+            if verdict and verdict.blocked:
+                return self._shield_blocked(verdict)
+
             # Sign and execute via RPC (bypasses Jupiter's /execute endpoint)
             exec_result = await self._sign_and_execute(
                 keypair=keypair,
@@ -252,6 +281,12 @@ class SolanaUltraTool(AutoTool):
                     "out_usd_value": order.out_usd_value,
                     "slippage_bps": order.slippage_bps,
                     "price_impact_pct": price_impact_str,
+                    **({"shield": verdict.summary()} if verdict else {}),
+                    **(
+                        {"landed_on": exec_result["landed_on"]}
+                        if exec_result.get("landed_on")
+                        else {}
+                    ),
                 }
             else:
                 return exec_result
@@ -259,6 +294,70 @@ class SolanaUltraTool(AutoTool):
         except Exception as e:
             logger.exception(f"Solana Ultra swap failed: {str(e)}")
             return {"status": "error", "message": str(e)}
+        finally:
+            # Stop a Shield check nobody awaited (no order, or it failed)
+            if shield_task:
+                shield_task.cancel()
+
+    async def _execute_best_route(
+        self,
+        keypair: Keypair,
+        ultra: JupiterUltra,
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        payer_pubkey: Optional[str],
+        shield_task: Optional[asyncio.Future] = None,
+    ) -> Dict[str, Any]:
+        """Race Ultra against DFlow and execute whichever route pays out more."""
+        decision = await race_routes(
+            input_mint=input_mint,
+            output_mint=output_mint,
+            amount=amount,
+            taker=str(keypair.pubkey()),
+            ultra=ultra,
+            dflow=DFlowSwap(),
+            deadline=self._route_deadline,
+            referral_account=self._referral_account,
+            referral_fee=self._referral_fee,
+            payer=payer_pubkey,
+            rpc_url=self._rpc_url,
+        )
+        route = decision.best
+        if route is None:
+            return {
+                "status": "error",
+                "message": "No route returned from Jupiter Ultra or DFlow.",
+                "routes": decision.summary(),
+            }
+
+        verdict = await shield_task if shield_task else None
+        if verdict and verdict.blocked:
+            return self._shield_blocked(verdict)
+
+        exec_result = await self._sign_and_execute(
+            keypair=keypair,
+            transaction_base64=route.transaction,
+        )
+        if exec_result.get("status") != "success":
+            return exec_result
+
+        return {
+            "status": "success",
+            "signature": exec_result.get("signature"),
+            "route": route.provider,
+            "routes": decision.summary(),
+            "in_amount": route.in_amount,
+            "out_amount": str(route.out_amount),
+            "slippage_bps": route.slippage_bps,
+            "price_impact_pct": route.price_impact_pct,
+            **({"shield": verdict.summary()} if verdict else {}),
+            **(
+                {"landed_on": exec_result["landed_on"]}
+                if exec_result.get("landed_on")
+                else {}
+            ),
+        }
 
 
 class SolanaUltraPlugin:
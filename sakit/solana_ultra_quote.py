@@ -8,9 +8,9 @@ import logging
 from typing import Dict, Any, List, Optional
 
 from solana_agent import AutoTool, ToolRegistry
-from solders.keypair import Keypair
 
-from sakit.utils.ultra import JupiterUltra
+from sakit.utils.ultra import QUOTE_CACHE_TTL, JupiterUltra, UltraQuoteCache
+from sakit.utils.keyring import get_keyring, load_address
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,7 @@ class SolanaUltraQuoteTool(AutoTool):
         self._referral_account: Optional[str] = None
         self._referral_fee: Optional[int] = None
         self._payer_private_key: Optional[str] = None
+        self._quote_cache = UltraQuoteCache()
 
     def get_schema(self) -> Dict[str, Any]:
         return {
@@ -59,6 +60,11 @@ class SolanaUltraQuoteTool(AutoTool):
         self._referral_account = tool_cfg.get("referral_account")
         self._referral_fee = tool_cfg.get("referral_fee")
         self._payer_private_key = tool_cfg.get("payer_private_key")
+        get_keyring().preload(self._private_key, self._payer_private_key)
+        self._quote_cache = UltraQuoteCache(
+            ttl=tool_cfg.get("quote_cache_ttl", QUOTE_CACHE_TTL),
+            amount_precision=tool_cfg.get("quote_amount_precision", 0),
+        )
 
     async def execute(
         self,
@@ -70,20 +76,20 @@ class SolanaUltraQuoteTool(AutoTool):
             return {"status": "error", "message": "Private key not configured."}
 
         try:
-            keypair = Keypair.from_base58_string(self._private_key)
-            taker = str(keypair.pubkey())
+            taker = load_address(self._private_key)
 
             # Check if integrator payer is configured for gasless transactions
             payer_pubkey = None
             if self._payer_private_key:  # pragma: no cover
-                payer_keypair = Keypair.from_base58_string(self._payer_private_key)
-                payer_pubkey = str(payer_keypair.pubkey())
+                payer_pubkey = load_address(self._payer_private_key)
 
             # Initialize Jupiter Ultra client
             ultra = JupiterUltra(api_key=self._jupiter_api_key)
 
-            # Get swap quote (doesn't execute, just shows details)
-            order = await ultra.get_order(
+            # Get swap quote (doesn't execute, just shows details); repeated
+            # quotes within the cache TTL are served without an API call
+            order, age = await self._quote_cache.get_quote(
+                ultra,
                 input_mint=input_mint,
                 output_mint=output_mint,
                 amount=amount,
@@ -91,7 +97,6 @@ class SolanaUltraQuoteTool(AutoTool):
                 referral_account=self._referral_account,
                 referral_fee=self._referral_fee,
                 payer=payer_pubkey,
-                close_authority=taker if payer_pubkey else None,
             )
 
             # Format price impact as percentage with sign
@@ -116,6 +121,7 @@ class SolanaUltraQuoteTool(AutoTool):
                 "price_impact_pct": price_impact_str,
                 "swap_type": order.swap_type,
                 "gasless": order.gasless,
+                "quote_age_seconds": round(age, 2),
                 "message": "Preview only - no transaction executed. Call solana_ultra to execute the swap.",
             }
 
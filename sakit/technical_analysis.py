@@ -18,6 +18,8 @@ import pandas as pd
 import pandas_ta as ta
 from solana_agent import AutoTool, ToolRegistry
 
+from sakit.utils.birdeye import BIRDEYE_API, get_rate_limiter
+
 logger = logging.getLogger(__name__)
 
 # Minimum candles required for reliable TA calculation
@@ -412,7 +414,7 @@ class TechnicalAnalysisTool(AutoTool):
             ),
             registry=registry,
         )
-        self.birdeye_base_url = "https://public-api.birdeye.so"
+        self.birdeye_base_url = BIRDEYE_API
         self.api_key = ""
         self.default_chain = "solana"
 
@@ -448,6 +450,13 @@ class TechnicalAnalysisTool(AutoTool):
             self.api_key = ta_config.get("api_key", "")
             if ta_config.get("chain"):
                 self.default_chain = ta_config.get("chain")
+            if self.api_key:
+                get_rate_limiter(
+                    self.api_key,
+                    rate_limits=ta_config.get("rate_limits"),
+                    credit_costs=ta_config.get("credit_costs"),
+                    max_retries=ta_config.get("max_retries"),
+                )
 
     async def _get_ohlcv_data(
         self, address: str, timeframe: str, chain: str
@@ -475,7 +484,8 @@ class TechnicalAnalysisTool(AutoTool):
         # Request 500 candles worth of data
         time_from = now - (500 * interval_seconds)
 
-        url = f"{self.birdeye_base_url}/defi/v3/ohlcv"
+        endpoint = "/defi/v3/ohlcv"
+        url = f"{self.birdeye_base_url}{endpoint}"
         params = {
             "address": address,
             "type": birdeye_type,
@@ -490,13 +500,16 @@ class TechnicalAnalysisTool(AutoTool):
         }
 
         async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params, headers=headers)
+            response = await get_rate_limiter(self.api_key).request(
+                client, "GET", url, endpoint, params=params, headers=headers
+            )
             response.raise_for_status()
             return response.json()
 
     async def _get_token_overview(self, address: str, chain: str) -> Dict[str, Any]:
         """Fetch token overview from Birdeye API."""
-        url = f"{self.birdeye_base_url}/defi/token_overview"
+        endpoint = "/defi/token_overview"
+        url = f"{self.birdeye_base_url}{endpoint}"
         params = {"address": address}
         headers = {
             "accept": "application/json",
@@ -505,7 +518,9 @@ class TechnicalAnalysisTool(AutoTool):
         }
 
         async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params, headers=headers)
+            response = await get_rate_limiter(self.api_key).request(
+                client, "GET", url, endpoint, params=params, headers=headers
+            )
             response.raise_for_status()
             return response.json()
 
@@ -659,6 +674,12 @@ class TechnicalAnalysisTool(AutoTool):
                     "address": address,
                     "message": "Token not found",
                 }
+            elif e.response.status_code == 429:
+                return {
+                    "status": "error",
+                    "error": "rate_limited",
+                    "message": "Birdeye rate limit exceeded, retries exhausted",
+                }
             return {
                 "status": "error",
                 "error": "api_error",
@@ -0,0 +1,607 @@
+"""
+Multi-recipient batch transfers.
+
+Payouts and airdrops send the same kind of transfer to many recipients.
+Instead of one transaction per recipient, a batch is planned and packed:
+
+1. Mint accounts, then all source, destination and fee token accounts are
+   fetched with bulk `getMultipleAccounts` calls (two round trips in total).
+2. Each row becomes a small instruction group (an idempotent ATA creation
+   when the recipient has no token account, then the transfer).
+3. Groups are packed greedily into v0 transactions while the serialized
+   size stays under the packet limit and the estimated compute units under
+   the budget. Address lookup tables are used when configured.
+4. Transactions are signed and sent concurrently with a bounded pool.
+
+Rows stay atomic: a row's instructions never span two transactions.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from solana.rpc.async_api import AsyncClient
+from solders.address_lookup_table_account import (
+    AddressLookupTable,
+    AddressLookupTableAccount,
+)
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.message import MessageV0
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.system_program import TransferParams, transfer
+from solders.transaction import VersionedTransaction
+from spl.token.instructions import (
+    TransferCheckedParams,
+    create_idempotent_associated_token_account,
+    get_associated_token_address,
+    transfer_checked,
+)
+
+from sakit.utils.compute_units import MAX_COMPUTE_UNITS
+
+logger = logging.getLogger(__name__)
+
+LAMPORTS_PER_SOL = 10**9
+SOL_MINT = "So11111111111111111111111111111111111111112"
+SYSTEM_PROGRAM_ID = "11111111111111111111111111111111"
+SPL_TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_2022_PROGRAM_ID = "TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb"
+ASSOCIATED_TOKEN_PROGRAM_ID = "ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL"
+
+# Maximum serialized transaction size (packet data limit)
+MAX_TRANSACTION_SIZE = 1232
+
+# Conservative compute units per instruction, used to pack and to set the limit
+INSTRUCTION_COMPUTE_UNITS = {
+    SYSTEM_PROGRAM_ID: 1_000,
+    SPL_TOKEN_PROGRAM_ID: 10_000,
+    TOKEN_2022_PROGRAM_ID: 25_000,
+    ASSOCIATED_TOKEN_PROGRAM_ID: 60_000,
+}
+DEFAULT_INSTRUCTION_COMPUTE_UNITS = 60_000
+BASE_COMPUTE_UNITS = 10_000
+
+# Rows accepted per batch call
+MAX_BATCH_ROWS = 1000
+
+# getMultipleAccounts accepts at most 100 accounts
+MULTIPLE_ACCOUNTS_CHUNK = 100
+
+# Mint account layout: decimals byte offset
+MINT_DECIMALS_OFFSET = 44
+
+# JSON schema of one row in a batch transfer tool call
+TRANSFER_ROW_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "to_address": {
+            "type": "string",
+            "description": "recipient wallet address",
+        },
+        "amount": {
+            "type": "number",
+            "description": "amount to transfer (in SOL or token units)",
+        },
+        "mint": {
+            "type": "string",
+            "description": "token mint address",
+        },
+    },
+    "required": ["to_address", "amount", "mint"],
+    "additionalProperties": False,
+}
+
+
+@dataclass
+class TransferRow:
+    """One payout in a batch."""
+
+    to_address: str
+    amount: float
+    mint: str
+
+
+@dataclass
+class MintInfo:
+    """Token program and decimals of a mint."""
+
+    program_id: Pubkey
+    decimals: int
+
+
+@dataclass
+class BatchPlan:
+    """Instruction groups per row, plus the rows that could not be planned."""
+
+    owner: Pubkey
+    groups: Dict[int, List[Instruction]] = field(default_factory=dict)
+    errors: Dict[int, str] = field(default_factory=dict)
+    mints: Dict[str, MintInfo] = field(default_factory=dict)
+    fees: Dict[int, Tuple[str, int]] = field(default_factory=dict)
+    fee_recipient: Optional[Pubkey] = None
+    fee_atas_missing: Set[str] = field(default_factory=set)
+
+    @property
+    def sender_writable(self) -> List[str]:
+        """Sender-side writable accounts shared by every transaction."""
+        accounts = [str(self.owner)]
+        for mint, info in self.mints.items():
+            accounts.append(
+                str(
+                    get_associated_token_address(
+                        self.owner, Pubkey.from_string(mint), info.program_id
+                    )
+                )
+            )
+        return accounts
+
+    def fee_instructions(self, payer: Pubkey, rows: Sequence[int]) -> List[Instruction]:
+        """Fee transfers for rows, aggregated into one transfer per mint."""
+        if self.fee_recipient is None:
+            return []
+        totals: Dict[str, int] = {}
+        for row in rows:
+            if row in self.fees:
+                mint, amount = self.fees[row]
+                totals[mint] = totals.get(mint, 0) + amount
+        ixs: List[Instruction] = []
+        for mint, amount in totals.items():
+            if mint == SOL_MINT:
+                ixs.append(
+                    transfer(
+                        TransferParams(
+                            from_pubkey=self.owner,
+                            to_pubkey=self.fee_recipient,
+                            lamports=amount,
+                        )
+                    )
+                )
+                continue
+            info = self.mints[mint]
+            mint_pubkey = Pubkey.from_string(mint)
+            fee_ata = get_associated_token_address(
+                self.fee_recipient, mint_pubkey, info.program_id
+            )
+            if mint in self.fee_atas_missing:
+                ixs.append(
+                    create_idempotent_associated_token_account(
+                        payer, self.fee_recipient, mint_pubkey, info.program_id
+                    )
+                )
+            ixs.append(
+                transfer_checked(
+                    TransferCheckedParams(
+                        program_id=info.program_id,
+                        source=get_associated_token_address(
+                            self.owner, mint_pubkey, info.program_id
+                        ),
+                        mint=mint_pubkey,
+                        dest=fee_ata,
+                        owner=self.owner,
+                        amount=amount,
+                        decimals=info.decimals,
+                    )
+                )
+            )
+        return ixs
+
+
+@dataclass
+class PackedTransaction:
+    """Instructions for one transaction and the rows they pay out."""
+
+    rows: List[int]
+    instructions: List[Instruction]
+    compute_units: int
+
+
+def parse_rows(transfers: Sequence[Dict[str, Any]]) -> List[TransferRow]:
+    """Convert tool input rows to TransferRow objects."""
+    return [
+        TransferRow(
+            to_address=str(t.get("to_address", "")).strip(),
+            amount=float(t.get("amount") or 0),
+            mint=str(t.get("mint") or SOL_MINT).strip(),
+        )
+        for t in transfers
+    ]
+
+
+async def fetch_accounts(
+    client: AsyncClient, pubkeys: Sequence[Pubkey]
+) -> Dict[Pubkey, Any]:
+    """
+    Fetch many accounts with concurrent, chunked getMultipleAccounts calls.
+
+    Args:
+        client: Solana RPC client
+        pubkeys: Accounts to fetch (duplicates are fetched once)
+
+    Returns:
+        Dict of pubkey -> account (None for accounts that do not exist)
+    """
+    unique = list(dict.fromkeys(pubkeys))
+    chunks = [
+        unique[i : i + MULTIPLE_ACCOUNTS_CHUNK]
+        for i in range(0, len(unique), MULTIPLE_ACCOUNTS_CHUNK)
+    ]
+    responses = await asyncio.gather(
+        *(client.get_multiple_accounts(chunk) for chunk in chunks)
+    )
+    accounts: Dict[Pubkey, Any] = {}
+    for chunk, response in zip(chunks, responses):
+        accounts.update(zip(chunk, response.value))
+    return accounts
+
+
+async def fetch_lookup_tables(
+    client: AsyncClient, addresses: Sequence[str]
+) -> List[AddressLookupTableAccount]:
+    """Load address lookup tables so transactions can reference their keys."""
+    if not addresses:
+        return []
+    keys = [Pubkey.from_string(a) for a in addresses]
+    accounts = await fetch_accounts(client, keys)
+    tables = []
+    for key in keys:
+        account = accounts.get(key)
+        if account is None:
+            logger.warning(f"Address lookup table {key} not found; skipping")
+            continue
+        table = AddressLookupTable.deserialize(bytes(account.data))
+        tables.append(AddressLookupTableAccount(key, list(table.addresses)))
+    return tables
+
+
+def _is_valid_ata_owner(pubkey: Pubkey, account: Any) -> bool:
+    if not pubkey.is_on_curve():
+        return False
+    return account is None or str(account.owner) == SYSTEM_PROGRAM_ID
+
+
+async def plan_batch(
+    client: AsyncClient,
+    owner: Pubkey,
+    payer: Pubkey,
+    rows: Sequence[TransferRow],
+    fee_recipient: Optional[Pubkey] = None,
+    fee_percentage: float = 0.0,
+) -> BatchPlan:
+    """
+    Prefetch accounts in bulk and build each row's instructions.
+
+    Args:
+        client: Solana RPC client
+        owner: Wallet sending the tokens
+        payer: Account paying fees and rent for new token accounts
+        rows: Payout rows
+        fee_recipient: Account collecting the integrator fee, if any
+        fee_percentage: Fee as a percentage of each row's amount
+
+    Returns:
+        BatchPlan with an instruction group per valid row and errors for the rest
+    """
+    plan = BatchPlan(owner=owner)
+    recipients: Dict[int, Pubkey] = {}
+    for i, row in enumerate(rows):
+        try:
+            recipients[i] = Pubkey.from_string(row.to_address)
+        except Exception:
+            plan.errors[i] = f"Invalid recipient address: {row.to_address}"
+            continue
+        if row.amount <= 0:
+            plan.errors[i] = "Amount must be positive"
+
+    # Round 1: mints (and the fee recipient, to validate it as an ATA owner)
+    mint_keys = {}
+    for i, row in enumerate(rows):
+        if i in plan.errors or row.mint == SOL_MINT:
+            continue
+        try:
+            mint_keys[row.mint] = Pubkey.from_string(row.mint)
+        except Exception:
+            plan.errors[i] = f"Invalid mint address: {row.mint}"
+    first_round = list(mint_keys.values())
+    if fee_recipient is not None:
+        first_round.append(fee_recipient)
+    accounts = await fetch_accounts(client, first_round) if first_round else {}
+
+    for mint, key in mint_keys.items():
+        account = accounts.get(key)
+        owner_program = str(account.owner) if account is not None else None
+        if owner_program in (SPL_TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID):
+            plan.mints[mint] = MintInfo(
+                program_id=Pubkey.from_string(owner_program),
+                decimals=bytes(account.data)[MINT_DECIMALS_OFFSET],
+            )
+
+    collect_fees = fee_recipient is not None and fee_percentage > 0
+    token_fees = collect_fees and _is_valid_ata_owner(
+        fee_recipient, accounts.get(fee_recipient)
+    )
+    if collect_fees and not token_fees and mint_keys:
+        logger.warning(
+            "Skipping token fee collection: fee_payer is not a valid ATA owner"
+        )
+
+    # Round 2: every source, destination and fee token account
+    token_accounts: List[Pubkey] = []
+    for mint, info in plan.mints.items():
+        mint_key = mint_keys[mint]
+        token_accounts.append(
+            get_associated_token_address(owner, mint_key, info.program_id)
+        )
+        if token_fees:
+            token_accounts.append(
+                get_associated_token_address(fee_recipient, mint_key, info.program_id)
+            )
+    for i, row in enumerate(rows):
+        if i not in plan.errors and row.mint in plan.mints:
+            info = plan.mints[row.mint]
+            token_accounts.append(
+                get_associated_token_address(
+                    recipients[i], mint_keys[row.mint], info.program_id
+                )
+            )
+    token_infos = await fetch_accounts(client, token_accounts) if token_accounts else {}
+
+    if token_fees:
+        for mint, info in plan.mints.items():
+            fee_ata = get_associated_token_address(
+                fee_recipient, mint_keys[mint], info.program_id
+            )
+            if token_infos.get(fee_ata) is None:
+                plan.fee_atas_missing.add(mint)
+    if collect_fees:
+        plan.fee_recipient = fee_recipient
+
+    for i, row in enumerate(rows):
+        if i in plan.errors:
+            continue
+        to_pubkey = recipients[i]
+        if row.mint == SOL_MINT:
+            lamports = int(row.amount * LAMPORTS_PER_SOL)
+            plan.groups[i] = [
+                transfer(
+                    TransferParams(
+                        from_pubkey=owner, to_pubkey=to_pubkey, lamports=lamports
+                    )
+                )
+            ]
+            fee = int(lamports * (fee_percentage / 100)) if collect_fees else 0
+            if fee > 0:
+                plan.fees[i] = (SOL_MINT, fee)
+            continue
+
+        info = plan.mints.get(row.mint)
+        if info is None:
+            plan.errors[i] = (
+                f"Unsupported token mint: {row.mint}. "
+                "Supported programs are SPL Token and Token 2022."
+            )
+            continue
+        mint_key = mint_keys[row.mint]
+        source = get_associated_token_address(owner, mint_key, info.program_id)
+        if token_infos.get(source) is None:
+            plan.errors[i] = f"Sender has no token account for mint {row.mint}"
+            continue
+        dest = get_associated_token_address(to_pubkey, mint_key, info.program_id)
+        units = int(row.amount * (10**info.decimals))
+        group = []
+        if token_infos.get(dest) is None:
+            group.append(
+                create_idempotent_associated_token_account(
+                    payer, to_pubkey, mint_key, info.program_id
+                )
+            )
+        group.append(
+            transfer_checked(
+                TransferCheckedParams(
+                    program_id=info.program_id,
+                    source=source,
+                    mint=mint_key,
+                    dest=dest,
+                    owner=owner,
+                    amount=units,
+                    decimals=info.decimals,
+                )
+            )
+        )
+        plan.groups[i] = group
+        fee = int(units * (fee_percentage / 100)) if token_fees else 0
+        if fee > 0:
+            plan.fees[i] = (row.mint, fee)
+
+    return plan
+
+
+def _compute_units(instructions: Sequence[Instruction]) -> int:
+    return BASE_COMPUTE_UNITS + sum(
+        INSTRUCTION_COMPUTE_UNITS.get(
+            str(ix.program_id), DEFAULT_INSTRUCTION_COMPUTE_UNITS
+        )
+        for ix in instructions
+    )
+
+
+def _budget_instructions(
+    compute_units: int, compute_unit_price: Optional[int]
+) -> List[Instruction]:
+    ixs = [set_compute_unit_limit(compute_units)]
+    if compute_unit_price:
+        ixs.append(set_compute_unit_price(compute_unit_price))
+    return ixs
+
+
+def compile_transaction(
+    payer: Pubkey,
+    instructions: Sequence[Instruction],
+    blockhash: Hash,
+    lookup_tables: Sequence[AddressLookupTableAccount] = (),
+) -> MessageV0:
+    """Compile instructions into a v0 message."""
+    return MessageV0.try_compile(
+        payer, list(instructions), list(lookup_tables), blockhash
+    )
+
+
+def transaction_size(
+    payer: Pubkey,
+    instructions: Sequence[Instruction],
+    lookup_tables: Sequence[AddressLookupTableAccount] = (),
+) -> int:
+    """Serialized size in bytes of a transaction with these instructions."""
+    message = compile_transaction(payer, instructions, Hash.default(), lookup_tables)
+    signatures = [Signature.default()] * message.header.num_required_signatures
+    return len(bytes(VersionedTransaction.populate(message, signatures)))
+
+
+def pack_transfers(
+    payer: Pubkey,
+    plan: BatchPlan,
+    compute_unit_price: Optional[int] = None,
+    lookup_tables: Sequence[AddressLookupTableAccount] = (),
+    max_size: int = MAX_TRANSACTION_SIZE,
+    max_compute_units: int = MAX_COMPUTE_UNITS,
+) -> List[PackedTransaction]:
+    """
+    Greedily pack planned rows into as few transactions as fit.
+
+    Args:
+        payer: Fee payer of every transaction
+        plan: Planned instruction groups
+        compute_unit_price: Priority fee in micro-lamports per compute unit
+        lookup_tables: Address lookup tables available to the transactions
+        max_size: Maximum serialized transaction size
+        max_compute_units: Maximum compute units per transaction
+
+    Returns:
+        Packed transactions, each with its compute budget instructions first
+    """
+
+    def build(rows: List[int]) -> Optional[PackedTransaction]:
+        body = [ix for row in rows for ix in plan.groups[row]]
+        body.extend(plan.fee_instructions(payer, rows))
+        units = _compute_units(body)
+        if units > max_compute_units:
+            return None
+        instructions = [*_budget_instructions(units, compute_unit_price), *body]
+        if transaction_size(payer, instructions, lookup_tables) > max_size:
+            return None
+        return PackedTransaction(
+            rows=rows, instructions=instructions, compute_units=units
+        )
+
+    packed: List[PackedTransaction] = []
+    current: Optional[PackedTransaction] = None
+    for row in sorted(plan.groups):
+        candidate = build((current.rows if current else []) + [row])
+        if candidate is not None:
+            current = candidate
+            continue
+        if current is not None:
+            packed.append(current)
+        current = build([row])
+        if current is None:
+            plan.errors[row] = "Transfer does not fit in a single transaction"
+    if current is not None:
+        packed.append(current)
+    return packed
+
+
+SendFn = Callable[[PackedTransaction], Awaitable[Dict[str, Any]]]
+
+
+async def send_packed(
+    packed: Sequence[PackedTransaction], send: SendFn, max_concurrent: int
+) -> List[Dict[str, Any]]:
+    """
+    Sign and send packed transactions concurrently.
+
+    Args:
+        packed: Packed transactions
+        send: Coroutine function that signs and sends one transaction and
+            returns a dict with 'success' and 'signature' or 'error'
+        max_concurrent: Maximum transactions in flight
+
+    Returns:
+        Send results in the order of `packed`
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+    async def run(tx: PackedTransaction) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await send(tx)
+            except Exception as e:
+                logger.warning(f"Batch transaction failed: {e}")
+                return {"success": False, "error": str(e)}
+
+    return await asyncio.gather(*(run(tx) for tx in packed))
+
+
+def summarize_batch(
+    rows: Sequence[TransferRow],
+    plan: BatchPlan,
+    packed: Sequence[PackedTransaction],
+    results: Sequence[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Tool response for a batch: per-transaction results and failed rows."""
+    transactions = []
+    transferred = 0
+    errors = [
+        {"index": i, "to_address": rows[i].to_address, "message": message}
+        for i, message in sorted(plan.errors.items())
+    ]
+    for tx, result in zip(packed, results):
+        recipients = [rows[i].to_address for i in tx.rows]
+        entry: Dict[str, Any] = {
+            "status": "success" if result.get("success") else "error",
+            "signature": result.get("signature"),
+            "recipients": recipients,
+        }
+        if result.get("success"):
+            transferred += len(tx.rows)
+        else:
+            entry["message"] = result.get("error", "Failed to send transaction")
+            errors.extend(
+                {
+                    "index": i,
+                    "to_address": rows[i].to_address,
+                    "message": entry["message"],
+                }
+                for i in tx.rows
+            )
+        transactions.append(entry)
+
+    if transferred == len(rows):
+        status = "success"
+    elif transferred:
+        status = "partial"
+    else:
+        status = "error"
+    response: Dict[str, Any] = {
+        "status": status,
+        "transferred": transferred,
+        "failed": len(rows) - transferred,
+        "transactions": transactions,
+    }
+    if errors:
+        response["errors"] = sorted(errors, key=lambda e: e["index"])
+    if status == "error":
+        response["message"] = "No transfers in the batch succeeded"
+    return response
+
+
+def landed_recipients(summary: Dict[str, Any]) -> List[str]:
+    """Recipients of the transactions in a batch summary that landed."""
+    return [
+        recipient
+        for entry in summary["transactions"]
+        if entry["status"] == "success"
+        for recipient in entry["recipients"]
+    ]
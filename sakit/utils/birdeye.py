@@ -0,0 +1,512 @@
+"""
+Birdeye API utility functions.
+
+Provides a per-API-key rate limiter with credit accounting that is shared by
+the Birdeye-backed tools (birdeye, technical_analysis), and response
+projection helpers that slim payloads before they reach the agent, and an
+incremental decoder for large list responses.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Birdeye public API base URL
+BIRDEYE_API = "https://public-api.birdeye.so"
+
+# Default request rates (requests per second) per endpoint class.
+# Override with the `rate_limits` config key to match your Birdeye plan.
+DEFAULT_RATE_LIMITS: Dict[str, float] = {
+    "default": 15.0,
+    "wallet": 0.5,  # v1 wallet endpoints are limited to 30 rpm
+}
+
+# Endpoint prefixes mapped to their endpoint class (first match wins)
+ENDPOINT_CLASSES = (("/v1/wallet/", "wallet"),)
+
+# Credits charged per successful call unless overridden via `credit_costs`
+DEFAULT_CREDIT_COST = 1
+
+# Retry settings for 429 responses
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 30.0
+
+
+class TokenBucket:
+    """
+    Token bucket that adapts its rate to upstream throttling.
+
+    Callers reserve a token and sleep for the returned wait time. Reservations
+    may drive the balance negative, which queues later callers behind earlier
+    ones without needing a lock (and so without binding to an event loop).
+    """
+
+    def __init__(self, rate: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        now = time.monotonic()
+        if now > self._updated:
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+        self._tokens -= 1
+        wait = self._updated - now
+        if self._tokens < 0:
+            wait += -self._tokens / self.rate
+        return max(0.0, wait)
+
+    def backoff(self, delay: float) -> None:
+        """Pause the bucket for `delay` seconds and halve the rate."""
+        self.rate = max(self.max_rate / 16, self.rate / 2)
+        self._tokens = min(self._tokens, 0.0)
+        self._updated = max(self._updated, time.monotonic() + delay)
+
+    def recover(self) -> None:
+        """Step the rate back towards its configured maximum."""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class BirdeyeRateLimiter:
+    """Rate limiter and credit meter for a single Birdeye API key."""
+
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[str, float]] = None,
+        credit_costs: Optional[Dict[str, int]] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate_limits: Requests per second per endpoint class (default, wallet)
+            credit_costs: Credits charged per call, keyed by endpoint path
+            max_retries: Number of retries on 429 responses
+            base_delay: Base backoff delay when no Retry-After header is sent
+            max_delay: Upper bound for any single backoff delay
+        """
+        self.rate_limits = {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}
+        self.credit_costs = dict(credit_costs or {})
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._metrics: Dict[str, Dict[str, Any]] = {}
+
+    def configure(
+        self,
+        rate_limits: Optional[Dict[str, float]] = None,
+        credit_costs: Optional[Dict[str, int]] = None,
+        max_retries: Optional[int] = None,
+    ) -> None:
+        """Update limits in place; buckets are rebuilt on next use."""
+        if rate_limits:
+            self.rate_limits.update(rate_limits)
+            self._buckets.clear()
+        if credit_costs:
+            self.credit_costs.update(credit_costs)
+        if max_retries is not None:
+            self.max_retries = max_retries
+
+    def endpoint_class(self, endpoint: str) -> str:
+        """Return the endpoint class used to select a token bucket."""
+        for prefix, name in ENDPOINT_CLASSES:
+            if endpoint.startswith(prefix) and name in self.rate_limits:
+                return name
+        return "default"
+
+    def credit_cost(self, endpoint: str) -> int:
+        """Return the credits charged for a successful call to `endpoint`."""
+        return self.credit_costs.get(endpoint, DEFAULT_CREDIT_COST)
+
+    def _bucket(self, name: str) -> TokenBucket:
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            bucket = TokenBucket(float(self.rate_limits[name]))
+            self._buckets[name] = bucket
+        return bucket
+
+    def _endpoint_metrics(self, endpoint: str) -> Dict[str, Any]:
+        metrics = self._metrics.get(endpoint)
+        if metrics is None:
+            metrics = {
+                "calls": 0,
+                "credits": 0,
+                "rate_limited": 0,
+                "retries": 0,
+                "wait_seconds": 0.0,
+            }
+            self._metrics[endpoint] = metrics
+        return metrics
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Compute the backoff delay for a 429 response, honouring Retry-After."""
+        delay = self.base_delay * (2**attempt)
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = retry_at.timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+        delay = min(self.max_delay, max(0.0, delay))
+        return delay + random.uniform(0, self.base_delay)
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        endpoint: str,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request through the rate limiter.
+
+        Waits for a token from the endpoint's bucket, retries 429 responses
+        with jittered backoff, and records calls and credits for `endpoint`.
+
+        Args:
+            client: httpx client used to send the request
+            method: HTTP method
+            url: Full request URL
+            endpoint: Birdeye endpoint path used for classification and metrics
+            stream: Return without reading the body (caller must close it)
+            **kwargs: Passed through to `client.build_request`
+
+        Returns:
+            The final httpx.Response (a 429 if retries were exhausted)
+        """
+        bucket = self._bucket(self.endpoint_class(endpoint))
+        metrics = self._endpoint_metrics(endpoint)
+
+        attempt = 0
+        while True:
+            wait = bucket.reserve()
+            if wait > 0:
+                metrics["wait_seconds"] += wait
+                await asyncio.sleep(wait)
+
+            request = client.build_request(method, url, **kwargs)
+            response = await client.send(request, stream=stream)
+            metrics["calls"] += 1
+
+            if response.status_code != 429:
+                if response.status_code == 200:
+                    metrics["credits"] += self.credit_cost(endpoint)
+                    bucket.recover()
+                return response
+
+            metrics["rate_limited"] += 1
+            if attempt >= self.max_retries:
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            await response.aclose()
+            logger.warning(
+                f"Birdeye rate limited on {endpoint}, retrying in {delay:.2f}s "
+                f"(attempt {attempt + 1}/{self.max_retries})"
+            )
+            bucket.backoff(delay)
+            metrics["retries"] += 1
+            attempt += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Export call and credit counters.
+
+        Returns:
+            Dict with per-endpoint counters, totals and current bucket rates
+        """
+        endpoints = {name: dict(values) for name, values in self._metrics.items()}
+        totals = {
+            key: sum(values[key] for values in endpoints.values())
+            for key in ("calls", "credits", "rate_limited", "retries")
+        }
+        rates = {name: bucket.rate for name, bucket in self._buckets.items()}
+        return {"endpoints": endpoints, "totals": totals, "rates": rates}
+
+    def reset_metrics(self) -> None:
+        """Clear all recorded counters."""
+        self._metrics.clear()
+
+
+_RATE_LIMITERS: Dict[str, BirdeyeRateLimiter] = {}
+
+
+def get_rate_limiter(
+    api_key: str,
+    rate_limits: Optional[Dict[str, float]] = None,
+    credit_costs: Optional[Dict[str, int]] = None,
+    max_retries: Optional[int] = None,
+) -> BirdeyeRateLimiter:
+    """
+    Get the shared rate limiter for a Birdeye API key.
+
+    All tools using the same key share one limiter so their combined traffic
+    stays within the key's limits. Passing settings updates the shared limiter.
+
+    Args:
+        api_key: Birdeye API key
+        rate_limits: Optional requests per second per endpoint class
+        credit_costs: Optional credits per call keyed by endpoint path
+        max_retries: Optional number of retries on 429 responses
+
+    Returns:
+        BirdeyeRateLimiter for the key
+    """
+    limiter = _RATE_LIMITERS.get(api_key)
+    if limiter is None:
+        limiter = BirdeyeRateLimiter()
+        _RATE_LIMITERS[api_key] = limiter
+    limiter.configure(
+        rate_limits=rate_limits, credit_costs=credit_costs, max_retries=max_retries
+    )
+    return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Drop all shared rate limiters (mainly for tests)."""
+    _RATE_LIMITERS.clear()
+
+
+# Default array length kept per list in compact mode
+COMPACT_MAX_ITEMS = 20
+
+
+def project(
+    value: Any,
+    fields: Optional[frozenset] = None,
+    max_items: Optional[int] = None,
+) -> Any:
+    """
+    Slim a decoded Birdeye payload.
+
+    Dicts containing any of `fields` are treated as records and reduced to
+    those keys; other dicts are containers whose values are projected
+    recursively. Lists are always kept and projected element by element,
+    and lists longer than `max_items` are truncated with a sibling
+    `<key>_count` holding the original length.
+
+    Args:
+        value: Decoded JSON value
+        fields: Keys to keep on records (None keeps every key)
+        max_items: Maximum list length to keep (None keeps every item)
+
+    Returns:
+        Projected copy of `value`
+    """
+    if isinstance(value, list):
+        if max_items is not None:
+            value = value[:max_items]
+        return [project(item, fields, max_items) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    is_record = fields is not None and not fields.isdisjoint(value)
+    projected = {}
+    for key, item in value.items():
+        if isinstance(item, list):
+            projected[key] = project(item, fields, max_items)
+            if max_items is not None and len(item) > max_items:
+                projected[f"{key}_count"] = len(item)
+        elif is_record:
+            if key in fields:
+                projected[key] = item
+        else:
+            projected[key] = project(item, fields, max_items)
+    return projected
+
+
+# Upper bound on bytes buffered while streaming a single list item or member
+STREAM_MAX_BUFFER_BYTES = 1024 * 1024
+
+# Consumed bytes are dropped from the stream buffer once this many accumulate
+_STREAM_TRIM_BYTES = 64 * 1024
+
+_STRUCTURAL = re.compile(rb'[\[\]{}",:]')
+_STRING_END = re.compile(rb'["\\]')
+_QUOTE, _BACKSLASH, _COMMA, _COLON = b'"'[0], b"\\"[0], b","[0], b":"[0]
+_OPEN_OBJECT, _OPEN_ARRAY = b"{"[0], b"["[0]
+
+
+class JsonArrayStream:
+    """
+    Incrementally decode the items of one JSON array from a byte stream.
+
+    Only the array at `path` is decoded item by item; members next to it in
+    the same object are collected into `siblings`, and everything else is
+    skipped. At most one item (or sibling) is buffered at a time, so memory
+    stays bounded by `max_buffer_bytes` regardless of the body size.
+
+    Example:
+        stream = JsonArrayStream(("data", "items"))
+        async for item in stream.items(response.aiter_bytes()):
+            ...
+        stream.siblings  # e.g. {"hasNext": True}
+        stream.count  # total items in the array
+    """
+
+    def __init__(
+        self,
+        path: Tuple[str, ...],
+        max_items: Optional[int] = None,
+        max_buffer_bytes: int = STREAM_MAX_BUFFER_BYTES,
+    ):
+        """
+        Initialize the stream decoder.
+
+        Args:
+            path: Object keys leading to the array ("*" matches any key)
+            max_items: Stop decoding after this many items (the rest are counted)
+            max_buffer_bytes: Maximum size of a single buffered item or sibling
+        """
+        self.path = tuple(path)
+        self.max_items = max_items
+        self.max_buffer_bytes = max_buffer_bytes
+        self.found = False
+        self.key: Optional[str] = None
+        self.count = 0
+        self.siblings: Dict[str, Any] = {}
+
+    @staticmethod
+    def _matches(frames: List[list], path: Tuple[str, ...]) -> bool:
+        if len(frames) != len(path):
+            return False
+        for frame, key in zip(frames, path):
+            if not frame[0] or (key != "*" and frame[1] != key):
+                return False
+        return True
+
+    async def items(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+        """
+        Yield decoded items of the target array as bytes arrive.
+
+        Args:
+            chunks: Async iterator of body bytes (e.g. `response.aiter_bytes()`)
+
+        Raises:
+            ValueError: If a single item or sibling exceeds `max_buffer_bytes`
+        """
+        depth = len(self.path)
+        buf = bytearray()
+        pos = 0
+        # Frames are [is_object, current_key, expecting_key]
+        stack: List[list] = []
+        in_string = False
+        string_start = 0
+        item_start: Optional[int] = None
+        member_start: Optional[int] = None
+        member_key: Optional[str] = None
+
+        async for chunk in chunks:
+            buf += chunk
+            while True:
+                if in_string:
+                    match = _STRING_END.search(buf, pos)
+                    if match is None:
+                        pos = len(buf)
+                        break
+                    if buf[match.start()] == _BACKSLASH:
+                        if match.end() >= len(buf):
+                            pos = match.start()
+                            break
+                        pos = match.end() + 1
+                        continue
+                    in_string = False
+                    pos = match.end()
+                    frame = stack[-1] if stack else None
+                    if frame and frame[0] and frame[2] and len(stack) <= depth:
+                        frame[1] = json.loads(bytes(buf[string_start:pos]))
+                        frame[2] = False
+                    continue
+
+                match = _STRUCTURAL.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                char = buf[match.start()]
+                pos = match.end()
+
+                if char == _QUOTE:
+                    in_string = True
+                    string_start = match.start()
+                elif char == _OPEN_OBJECT or char == _OPEN_ARRAY:
+                    if (
+                        char == _OPEN_ARRAY
+                        and not self.found
+                        and self._matches(stack, self.path)
+                    ):
+                        self.found = True
+                        self.key = stack[-1][1] if stack else None
+                        item_start = pos
+                        member_start = None
+                    stack.append([char == _OPEN_OBJECT, None, char == _OPEN_OBJECT])
+                elif char == _COLON:
+                    if len(stack) == depth and self._matches(
+                        stack[:-1], self.path[:-1]
+                    ):
+                        member_start = pos
+                        member_key = stack[-1][1]
+                else:
+                    # Comma or closing bracket
+                    if item_start is not None and len(stack) == depth + 1:
+                        raw = bytes(buf[item_start : match.start()]).strip()
+                        item_start = pos if char == _COMMA else None
+                        if raw:
+                            self.count += 1
+                            if self.max_items is None or self.count <= self.max_items:
+                                yield json.loads(raw)
+                    elif member_start is not None and len(stack) == depth:
+                        raw = bytes(buf[member_start : match.start()]).strip()
+                        self.siblings[member_key] = json.loads(raw)
+                        member_start = None
+                    if char == _COMMA:
+                        if stack and stack[-1][0]:
+                            stack[-1][2] = True
+                    elif stack:
+                        stack.pop()
+
+            starts = [pos]
+            for start in (item_start, member_start):
+                if start is not None:
+                    starts.append(start)
+            if in_string:
+                starts.append(string_start)
+            keep_from = min(starts)
+            if len(buf) - keep_from > self.max_buffer_bytes:
+                raise ValueError(
+                    f"Streamed JSON value exceeds {self.max_buffer_bytes} bytes"
+                )
+            if keep_from > _STREAM_TRIM_BYTES:
+                del buf[:keep_from]
+                pos -= keep_from
+                string_start -= keep_from
+                if item_start is not None:
+                    item_start -= keep_from
+                if member_start is not None:
+                    member_start -= keep_from
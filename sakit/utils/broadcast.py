@@ -0,0 +1,251 @@
+"""
+Multi-RPC transaction broadcaster.
+
+During congestion a transaction sent to a single RPC often never reaches
+the leader. `TransactionBroadcaster` sends the same signed bytes to several
+RPC endpoints at once and keeps rebroadcasting on an interval until any
+endpoint reports the signature confirmed, the blockhash expires, or a
+timeout passes. It records which endpoint saw the transaction land first.
+
+Only plain JSON-RPC (`sendTransaction`, `getSignatureStatuses`,
+`getBlockHeight`) is used, so any Solana RPC, or a local stand-in, works.
+"""
+
+import asyncio
+import base64
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from sakit.utils.transaction import TransactionEditor
+
+logger = logging.getLogger(__name__)
+
+# Seconds between rebroadcasts and between status polls
+BROADCAST_INTERVAL = 2.0
+STATUS_POLL_INTERVAL = 0.4
+
+# Upper bound on a broadcast (a blockhash is valid for ~150 blocks,
+# roughly 60-90 seconds)
+BROADCAST_TIMEOUT = 90.0
+
+LANDED_STATUSES = ("confirmed", "finalized")
+
+
+@dataclass
+class BroadcastResult:
+    """Outcome of a multi-RPC broadcast."""
+
+    success: bool
+    signature: str
+    landed_on: Optional[str] = None
+    accepted_by: List[str] = field(default_factory=list)
+    rounds: int = 0
+    error: Optional[str] = None
+    # Accepted but not seen confirmed before the timeout; it may still land
+    timed_out: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Result dict in the shape returned by `send_raw_transaction_with_priority`."""
+        result: Dict[str, Any] = {
+            "success": self.success,
+            "signature": self.signature,
+            "landed_on": self.landed_on,
+            "broadcast_rounds": self.rounds,
+        }
+        if self.error:
+            result["error"] = self.error
+        return result
+
+
+class TransactionBroadcaster:
+    """
+    Send a signed transaction to several RPC endpoints until it lands.
+
+    Example:
+        broadcaster = TransactionBroadcaster([helius_url, triton_url, public_url])
+        result = await broadcaster.broadcast(tx_bytes, last_valid_block_height)
+        result.landed_on  # first endpoint that reported the tx confirmed
+    """
+
+    def __init__(
+        self,
+        rpc_urls: Sequence[str],
+        interval: float = BROADCAST_INTERVAL,
+        poll_interval: float = STATUS_POLL_INTERVAL,
+        timeout: float = BROADCAST_TIMEOUT,
+        request_timeout: float = 10.0,
+    ):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            rpc_urls: RPC endpoints to send to (duplicates are ignored)
+            interval: Seconds between rebroadcasts
+            poll_interval: Seconds between signature status polls
+            timeout: Seconds before giving up on confirmation
+            request_timeout: Timeout for each individual RPC request
+        """
+        self.rpc_urls = list(dict.fromkeys(url for url in rpc_urls if url))
+        if not self.rpc_urls:
+            raise ValueError("At least one RPC URL is required")
+        self.interval = interval
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.request_timeout = request_timeout
+
+    async def _rpc(
+        self, client: httpx.AsyncClient, url: str, method: str, params: List[Any]
+    ) -> Any:
+        response = await client.post(
+            url,
+            json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params},
+        )
+        if response.status_code != 200:
+            raise Exception(f"RPC error: {response.status_code}")
+        data = response.json()
+        if "error" in data:
+            raise Exception(f"RPC error: {data['error']}")
+        return data.get("result")
+
+    async def _send_all(
+        self, client: httpx.AsyncClient, tx_base64: str
+    ) -> Dict[str, Optional[str]]:
+        """Send to every endpoint; returns url -> error (None if accepted)."""
+
+        async def send(url: str) -> Optional[str]:
+            try:
+                await self._rpc(
+                    client,
+                    url,
+                    "sendTransaction",
+                    [
+                        tx_base64,
+                        {"encoding": "base64", "skipPreflight": True, "maxRetries": 0},
+                    ],
+                )
+                return None
+            except Exception as e:
+                logger.debug(f"Broadcast to {url} failed: {e}")
+                return str(e)
+
+        errors = await asyncio.gather(*(send(url) for url in self.rpc_urls))
+        return dict(zip(self.rpc_urls, errors))
+
+    async def _first_status(
+        self, client: httpx.AsyncClient, signature: str
+    ) -> Optional[tuple]:
+        """Poll every endpoint; return (url, status) from the first to see the tx land."""
+
+        async def status(url: str) -> Optional[tuple]:
+            try:
+                result = await self._rpc(
+                    client, url, "getSignatureStatuses", [[signature]]
+                )
+            except Exception as e:
+                logger.debug(f"Status poll on {url} failed: {e}")
+                return None
+            value = (result or {}).get("value") or [None]
+            entry = value[0]
+            if entry and (
+                entry.get("err") or entry.get("confirmationStatus") in LANDED_STATUSES
+            ):
+                return url, entry
+            return None
+
+        tasks = [asyncio.ensure_future(status(url)) for url in self.rpc_urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                found = await next_done
+                if found:
+                    return found
+        finally:
+            for task in tasks:
+                task.cancel()
+        return None
+
+    async def _expired(
+        self, client: httpx.AsyncClient, last_valid_block_height: int
+    ) -> bool:
+        for url in self.rpc_urls:
+            try:
+                height = await self._rpc(
+                    client, url, "getBlockHeight", [{"commitment": "confirmed"}]
+                )
+                return int(height) > last_valid_block_height
+            except Exception as e:
+                logger.debug(f"Block height from {url} failed: {e}")
+        return False
+
+    async def broadcast(
+        self,
+        tx_bytes: bytes,
+        last_valid_block_height: Optional[int] = None,
+        confirm: bool = True,
+    ) -> BroadcastResult:
+        """
+        Broadcast a signed transaction until it lands or can no longer land.
+
+        Args:
+            tx_bytes: Serialized signed transaction
+            last_valid_block_height: Block height after which the blockhash
+                expires (the broadcast stops early once it passes); `timeout`
+                always bounds the broadcast
+            confirm: Wait for the transaction to land. When False, return
+                right after the first round once any endpoint accepted it
+
+        Returns:
+            BroadcastResult with the landing endpoint on success
+        """
+        signature = str(TransactionEditor(tx_bytes).signature(0))
+        tx_base64 = base64.b64encode(tx_bytes).decode("utf-8")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        result = BroadcastResult(success=False, signature=signature)
+
+        async with httpx.AsyncClient(timeout=self.request_timeout) as client:
+            while True:
+                result.rounds += 1
+                errors = await self._send_all(client, tx_base64)
+                for url, error in errors.items():
+                    if error is None and url not in result.accepted_by:
+                        result.accepted_by.append(url)
+                if not result.accepted_by:
+                    result.error = "; ".join(
+                        f"{url}: {error}" for url, error in errors.items()
+                    )
+                    return result
+                if not confirm:
+                    result.success = True
+                    return result
+
+                next_send = loop.time() + self.interval
+                while True:
+                    found = await self._first_status(client, signature)
+                    if found:
+                        url, status = found
+                        result.landed_on = url
+                        if status.get("err"):
+                            result.error = f"Transaction failed: {status['err']}"
+                        else:
+                            result.success = True
+                            logger.info(
+                                f"Transaction {signature} landed via {url} "
+                                f"after {result.rounds} broadcast round(s)"
+                            )
+                        return result
+                    if loop.time() >= next_send:
+                        break
+                    await asyncio.sleep(self.poll_interval)
+
+                if last_valid_block_height is not None and await self._expired(
+                    client, last_valid_block_height
+                ):
+                    result.error = "Blockhash expired before confirmation"
+                    return result
+                if loop.time() >= deadline:
+                    result.error = f"Not confirmed after {self.timeout}s"
+                    result.timed_out = True
+                    return result
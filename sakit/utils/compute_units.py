@@ -0,0 +1,124 @@
+"""
+Compute unit estimate cache.
+
+Transfers are sized by simulating them, but transactions with the same
+instruction shape (same programs, account counts and instruction types)
+consume nearly the same compute units. `ComputeUnitCache` remembers the
+units used per shape and only simulates on a miss or when an entry is due
+for recalibration.
+"""
+
+import logging
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from solders.instruction import Instruction
+
+logger = logging.getLogger(__name__)
+
+# Headroom added to simulated units before setting the compute unit limit
+CU_MARGIN = 100_000
+
+# Maximum compute units a transaction may request
+MAX_COMPUTE_UNITS = 1_400_000
+
+# Re-simulate a cached shape after this long to follow program upgrades
+CU_RECALIBRATE_INTERVAL = 600.0
+
+MEMO_PROGRAM_ID = "MemoSq4gqABAXKb96qnH8TysNcWxMyWCqXgDLGmfcHr"
+
+Shape = Tuple[Hashable, ...]
+
+
+def instruction_shape(instructions: Iterable[Instruction]) -> Shape:
+    """
+    Key describing what a list of instructions does, ignoring amounts and addresses.
+
+    Each instruction contributes its program, account count and instruction
+    discriminator (first data byte). Memo text is ignored.
+    """
+    shape = []
+    for ix in instructions:
+        program = str(ix.program_id)
+        discriminator = None if program == MEMO_PROGRAM_ID else bytes(ix.data[:1])
+        shape.append((program, len(ix.accounts), discriminator))
+    return tuple(shape)
+
+
+class ComputeUnitCache:
+    """
+    Simulated compute units per instruction shape.
+
+    Example:
+        cache = get_compute_unit_cache()
+        limit = await cache.limit(ixs, simulate)  # simulate() only on a miss
+    """
+
+    def __init__(
+        self,
+        margin: int = CU_MARGIN,
+        recalibrate_interval: float = CU_RECALIBRATE_INTERVAL,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            margin: Compute units added to the estimate
+            recalibrate_interval: Seconds before a shape is simulated again
+        """
+        self.margin = margin
+        self.recalibrate_interval = recalibrate_interval
+        self._entries: Dict[Shape, Tuple[float, int]] = {}
+
+    def clear(self) -> None:
+        """Drop all cached estimates."""
+        self._entries.clear()
+
+    def cached(self, shape: Shape) -> Optional[int]:
+        """Cached units for a shape, or None if missing or due for recalibration."""
+        entry = self._entries.get(shape)
+        if entry is None or monotonic() - entry[0] >= self.recalibrate_interval:
+            return None
+        return entry[1]
+
+    def store(self, shape: Shape, units: int) -> None:
+        """Record simulated units for a shape."""
+        self._entries[shape] = (monotonic(), int(units))
+
+    async def limit(
+        self,
+        instructions: Iterable[Instruction],
+        simulate: Callable[[], Awaitable[Optional[int]]],
+    ) -> int:
+        """
+        Compute unit limit for instructions, simulating only on a miss.
+
+        Args:
+            instructions: Instructions of the transaction (without compute budget)
+            simulate: Coroutine function returning the simulated units consumed
+
+        Returns:
+            Estimated units plus the margin, capped at MAX_COMPUTE_UNITS
+        """
+        shape = instruction_shape(instructions)
+        units = self.cached(shape)
+        if units is None:
+            units = await simulate()
+            if not units:
+                raise ValueError("Simulation did not report compute units consumed")
+            self.store(shape, units)
+            logger.debug(f"Simulated {units} compute units for a new shape")
+        return min(int(units) + self.margin, MAX_COMPUTE_UNITS)
+
+
+_CU_CACHE = ComputeUnitCache()
+
+
+def get_compute_unit_cache() -> ComputeUnitCache:
+    """Get the process-wide compute unit cache."""
+    return _CU_CACHE
+
+
+def reset_compute_unit_cache() -> None:
+    """Drop all cached compute unit estimates (mainly for tests)."""
+    _CU_CACHE.clear()
@@ -0,0 +1,314 @@
+"""
+Shared blockhash cache and confirmation tracker for the send path.
+
+Sending a transaction the naive way costs three sequential round trips per
+caller: fetch a blockhash, send, then poll the signature until it confirms.
+With many transactions in flight that is one blockhash fetch and one polling
+loop per transaction, and callers queue behind each other's polls.
+
+`BlockhashCache` keeps one recent blockhash per RPC client and refreshes it
+at most once per TTL, however many callers ask at the same time.
+`ConfirmationTracker` collects the signatures of every in-flight transaction
+on an RPC client and resolves them all from one background poll of
+`getSignatureStatuses` (plus one `getBlockHeight` for expiry), so callers
+only wait on a future.
+
+Both are kept per pooled `AsyncClient` (see `get_rpc_client`), which already
+binds them to one RPC URL and one event loop.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from solders.hash import Hash
+from solders.signature import Signature
+from solders.transaction_status import TransactionConfirmationStatus
+
+logger = logging.getLogger(__name__)
+
+# A blockhash stays valid for ~150 blocks (60-90 seconds); refreshing every
+# 20 seconds leaves every send at least ~40 seconds to land
+BLOCKHASH_TTL = 20.0
+
+# Seconds between status polls while transactions are in flight
+CONFIRM_POLL_INTERVAL = 0.5
+
+# Default seconds a caller waits for its transaction to confirm
+CONFIRM_TIMEOUT = 30.0
+
+# Seconds a sent signature is remembered. Identical instructions signed on
+# the same cached blockhash produce the same signature, and the RPC drops the
+# second copy, so senders re-sign on a new blockhash instead. A blockhash
+# expires within ~90 seconds, so older signatures cannot repeat.
+SENT_SIGNATURE_TTL = 90.0
+
+# getSignatureStatuses accepts at most this many signatures per call
+MAX_SIGNATURE_STATUSES = 256
+
+LANDED_STATUSES = (
+    TransactionConfirmationStatus.Confirmed,
+    TransactionConfirmationStatus.Finalized,
+)
+
+
+class BlockhashCache:
+    """
+    Recent blockhash shared by every sender on one RPC client.
+
+    Example:
+        cache = get_blockhash_cache(client)
+        blockhash, last_valid_block_height = await cache.get()
+    """
+
+    def __init__(self, client: AsyncClient, ttl: float = BLOCKHASH_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            client: RPC client to fetch blockhashes from
+            ttl: Seconds a fetched blockhash is reused
+        """
+        self._client = client
+        self.ttl = ttl
+        self._value: Optional[Tuple[Hash, int]] = None
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return (
+            self._value is not None and time.monotonic() - self._fetched_at < self.ttl
+        )
+
+    async def get(self) -> Tuple[Hash, int]:
+        """
+        Get a recent blockhash, fetching one only when the cached one is stale.
+
+        Concurrent callers share a single fetch.
+
+        Returns:
+            Tuple of (blockhash, last valid block height)
+        """
+        if self._fresh():
+            return self._value
+        async with self._lock:
+            if not self._fresh():
+                response = await self._client.get_latest_blockhash(commitment=Confirmed)
+                self._value = (
+                    response.value.blockhash,
+                    response.value.last_valid_block_height,
+                )
+                self._fetched_at = time.monotonic()
+            return self._value
+
+    def invalidate(self) -> None:
+        """Drop the cached blockhash so the next caller fetches a new one."""
+        self._value = None
+
+
+class ConfirmationTracker:
+    """
+    Confirm many in-flight transactions from one polling loop.
+
+    Example:
+        tracker = get_confirmation_tracker(client)
+        await tracker.wait(signature, last_valid_block_height, timeout=30)
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        poll_interval: float = CONFIRM_POLL_INTERVAL,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            client: RPC client to poll statuses and block height from
+            poll_interval: Seconds between polls while anything is pending
+        """
+        self._client = client
+        self.poll_interval = poll_interval
+        self._pending: Dict[Signature, Tuple[Optional[int], asyncio.Future]] = {}
+        self._sent: Dict[Signature, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of signatures waiting for confirmation."""
+        return len(self._pending)
+
+    def claim(self, signature: Signature) -> bool:
+        """
+        Reserve a signature for a transaction about to be sent.
+
+        Returns:
+            False if the same signature is pending or was claimed within
+            `SENT_SIGNATURE_TTL` (the transaction would be a duplicate)
+        """
+        now = time.monotonic()
+        for sent, at in list(self._sent.items()):
+            if now - at >= SENT_SIGNATURE_TTL:
+                del self._sent[sent]
+        if signature in self._pending or signature in self._sent:
+            return False
+        self._sent[signature] = now
+        return True
+
+    def track(
+        self,
+        signature: Signature,
+        last_valid_block_height: Optional[int] = None,
+    ) -> asyncio.Future:
+        """
+        Start tracking a signature.
+
+        Args:
+            signature: Signature of a sent transaction
+            last_valid_block_height: Blockhash expiry; past it the transaction
+                can no longer land and its future fails
+
+        Returns:
+            Future resolving to the confirmation status once the transaction
+            lands, or failing if it errors on chain or expires
+        """
+        entry = self._pending.get(signature)
+        if entry is not None:
+            return entry[1]
+        future = asyncio.get_running_loop().create_future()
+        self._pending[signature] = (last_valid_block_height, future)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    async def wait(
+        self,
+        signature: Signature,
+        last_valid_block_height: Optional[int] = None,
+        timeout: float = CONFIRM_TIMEOUT,
+    ) -> TransactionConfirmationStatus:
+        """
+        Track a signature and wait for it to confirm.
+
+        Args:
+            signature: Signature of a sent transaction
+            last_valid_block_height: Blockhash expiry
+            timeout: Max seconds to wait
+
+        Returns:
+            The confirmation status the transaction reached
+
+        Raises:
+            RuntimeError: If the transaction failed on chain or expired
+            asyncio.TimeoutError: If it did not confirm within `timeout`
+        """
+        future = self.track(signature, last_valid_block_height)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self._discard(signature)
+            raise
+
+    def _discard(self, signature: Signature) -> None:
+        entry = self._pending.pop(signature, None)
+        if entry is not None and not entry[1].done():
+            entry[1].cancel()
+
+    async def poll(self) -> None:
+        """Poll statuses for every pending signature once and resolve them."""
+        signatures: List[Signature] = list(self._pending)
+        for start in range(0, len(signatures), MAX_SIGNATURE_STATUSES):
+            chunk = signatures[start : start + MAX_SIGNATURE_STATUSES]
+            response = await self._client.get_signature_statuses(chunk)
+            for signature, status in zip(chunk, response.value):
+                if status is None:
+                    continue
+                if status.err is not None:
+                    self._resolve(
+                        signature,
+                        error=RuntimeError(f"Transaction failed: {status.err}"),
+                    )
+                elif status.confirmation_status in LANDED_STATUSES:
+                    self._resolve(signature, result=status.confirmation_status)
+
+        expiring = [
+            (signature, entry[0])
+            for signature, entry in self._pending.items()
+            if entry[0] is not None
+        ]
+        if expiring:
+            height = (await self._client.get_block_height(Confirmed)).value
+            for signature, last_valid in expiring:
+                if height > last_valid:
+                    self._resolve(
+                        signature,
+                        error=RuntimeError(
+                            f"Transaction expired before confirming: {signature}"
+                        ),
+                    )
+
+    def _resolve(self, signature, result=None, error: Optional[Exception] = None):
+        entry = self._pending.pop(signature, None)
+        if entry is None or entry[1].done():
+            return
+        if error is not None:
+            entry[1].set_exception(error)
+        else:
+            entry[1].set_result(result)
+
+    async def _run(self) -> None:
+        try:
+            while self._pending:
+                try:
+                    await self.poll()
+                except Exception as e:
+                    logger.debug(f"Confirmation poll failed: {e}")
+                if self._pending:
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            self._task = None
+
+    async def stop(self) -> None:
+        """Stop polling and cancel every pending wait."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for signature in list(self._pending):
+            self._discard(signature)
+
+
+_BLOCKHASH_CACHES: "weakref.WeakKeyDictionary[AsyncClient, BlockhashCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_TRACKERS: "weakref.WeakKeyDictionary[AsyncClient, ConfirmationTracker]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_blockhash_cache(client: AsyncClient) -> BlockhashCache:
+    """Get the shared blockhash cache for an RPC client."""
+    cache = _BLOCKHASH_CACHES.get(client)
+    if cache is None:
+        cache = _BLOCKHASH_CACHES[client] = BlockhashCache(client)
+    return cache
+
+
+def get_confirmation_tracker(client: AsyncClient) -> ConfirmationTracker:
+    """Get the shared confirmation tracker for an RPC client."""
+    tracker = _TRACKERS.get(client)
+    if tracker is None:
+        tracker = _TRACKERS[client] = ConfirmationTracker(client)
+    return tracker
+
+
+def reset_confirmation_state() -> None:
+    """Drop all shared blockhash caches and trackers (mainly for tests)."""
+    _BLOCKHASH_CACHES.clear()
+    _TRACKERS.clear()
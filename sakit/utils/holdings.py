@@ -0,0 +1,167 @@
+"""
+Shared wallet holdings cache.
+
+Agents read holdings before and after nearly every swap, transfer and earn
+action. `HoldingsCache` keeps the last Jupiter Ultra holdings response per
+wallet for a short TTL and coalesces concurrent reads into one request.
+Tools that land a transaction touching a wallet call `invalidate_holdings`
+so the next read goes back to the network.
+"""
+
+import asyncio
+import copy
+import logging
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+
+from sakit.utils.ultra import JupiterUltra
+
+logger = logging.getLogger(__name__)
+
+# Holdings go stale as soon as the wallet transacts; tools invalidate on
+# confirmed transactions, so the TTL only bounds drift from outside activity.
+HOLDINGS_CACHE_TTL = 15.0
+
+# Maximum cached responses (expired entries are pruned first, then the oldest)
+HOLDINGS_CACHE_MAX_ENTRIES = 1024
+
+
+class HoldingsCache:
+    """
+    Per-wallet TTL cache of Jupiter Ultra holdings responses.
+
+    Entries are keyed by (wallet, native_only). A wallet with a fetch in
+    flight has a generation counter bumped on invalidation, so a fetch that
+    started before an invalidation never repopulates the cache with
+    pre-trade balances. Reads return a copy of the cached response.
+
+    Example:
+        cache = get_holdings_cache()
+        holdings, age = await cache.get(ultra, wallet)
+        invalidate_holdings(wallet)  # after a confirmed swap
+    """
+
+    def __init__(
+        self,
+        ttl: float = HOLDINGS_CACHE_TTL,
+        max_entries: int = HOLDINGS_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize the holdings cache.
+
+        Args:
+            ttl: Default seconds a response is served from cache (0 disables)
+            max_entries: Maximum cached responses (oldest evicted first)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, bool], Tuple[float, Dict[str, Any]]] = {}
+        self._inflight: Dict[Tuple[str, bool, int], asyncio.Future] = {}
+        self._generations: Dict[str, int] = {}
+
+    def clear(self) -> None:
+        """Drop all cached holdings."""
+        self._entries.clear()
+        self._generations.clear()
+
+    def _fetching(self, wallet: str) -> bool:
+        return any(key[0] == wallet for key in self._inflight)
+
+    def invalidate(self, wallet: str) -> None:
+        """Forget cached holdings for a wallet."""
+        if self._fetching(wallet):
+            self._generations[wallet] = self._generations.get(wallet, 0) + 1
+        self._entries.pop((wallet, False), None)
+        self._entries.pop((wallet, True), None)
+
+    def _store(
+        self, key: Tuple[str, bool], holdings: Dict[str, Any], ttl: float
+    ) -> None:
+        now = monotonic()
+        max_age = max(self.ttl, ttl)
+        expired = [k for k, (at, _) in self._entries.items() if now - at >= max_age]
+        for k in expired:
+            del self._entries[k]
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (now, holdings)
+
+    async def _fetch(
+        self, ultra: JupiterUltra, wallet: str, native_only: bool
+    ) -> Dict[str, Any]:
+        if native_only:
+            return await ultra.get_native_holdings(wallet)
+        return await ultra.get_holdings(wallet)
+
+    async def get(
+        self,
+        ultra: JupiterUltra,
+        wallet: str,
+        native_only: bool = False,
+        ttl: Optional[float] = None,
+    ) -> Tuple[Dict[str, Any], float]:
+        """
+        Get holdings, serving a fresh cached entry when one exists.
+
+        Args:
+            ultra: Jupiter Ultra client used on a cache miss
+            wallet: Wallet address
+            native_only: Fetch only the native SOL balance
+            ttl: Override of the cache TTL for this read
+
+        Returns:
+            Tuple of (copy of the holdings, age in seconds of the response)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        key = (wallet, native_only)
+        if ttl > 0:
+            cached = self._entries.get(key)
+            if cached is not None:
+                age = monotonic() - cached[0]
+                if age < ttl:
+                    return copy.deepcopy(cached[1]), age
+
+        generation = self._generations.get(wallet, 0)
+        flight_key = (wallet, native_only, generation)
+        future = self._inflight.get(flight_key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(ultra, wallet, native_only))
+            self._inflight[flight_key] = future
+            try:
+                holdings = await asyncio.shield(future)
+            finally:
+                self._inflight.pop(flight_key, None)
+                current = self._generations.get(wallet, 0) == generation
+                if not self._fetching(wallet):
+                    self._generations.pop(wallet, None)
+            if ttl > 0 and current:
+                self._store(key, holdings, ttl)
+            return copy.deepcopy(holdings), 0.0
+
+        return copy.deepcopy(await asyncio.shield(future)), 0.0
+
+
+_HOLDINGS_CACHE = HoldingsCache()
+
+
+def get_holdings_cache() -> HoldingsCache:
+    """Get the process-wide holdings cache shared by all tools."""
+    return _HOLDINGS_CACHE
+
+
+def invalidate_holdings(*wallets: Optional[str]) -> None:
+    """
+    Invalidate cached holdings for wallets touched by a confirmed transaction.
+
+    Empty values are ignored so callers can pass optional addresses directly.
+    """
+    for wallet in wallets:
+        if wallet:
+            logger.debug(f"Invalidating cached holdings for {wallet}")
+            _HOLDINGS_CACHE.invalidate(str(wallet))
+
+
+def reset_holdings_cache() -> None:
+    """Drop all cached holdings (mainly for tests)."""
+    _HOLDINGS_CACHE.clear()
@@ -0,0 +1,313 @@
+"""
+Background jobs for long-running tool actions.
+
+Some actions hold the tool call open until a transaction lands: DFlow async
+prediction orders poll for up to 90s, and Jupiter's execute endpoints wait
+for confirmation. With `background=True` these tools submit the work to the
+shared `JobManager` and return a job id right away; the agent polls the
+result later with the tool's `job_status` action.
+
+Jobs run as asyncio tasks, at most `max_concurrent` at a time. When a store
+path is configured, every job is written to a JSON file on each state
+change. Jobs still pending or running when the process stopped cannot be
+resumed (the signed transaction may or may not have landed), so on load
+they are marked `interrupted` for the agent to check on-chain.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Jobs running at once across all tools; the rest wait in the pool
+JOB_CONCURRENCY = 8
+
+# Seconds a finished job's result is kept for status polling
+JOB_RETENTION = 3600.0
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_INTERRUPTED = "interrupted"
+
+FINISHED_STATES = frozenset({JOB_SUCCEEDED, JOB_FAILED, JOB_INTERRUPTED})
+
+
+@dataclass
+class Job:
+    """A background tool action and its outcome."""
+
+    id: str
+    kind: str
+    owner: Optional[str] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    status: str = JOB_PENDING
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has reached a final state."""
+        return self.status in FINISHED_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Job as a tool response payload (without the owner)."""
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "job_status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": int(self.created_at),
+            "updated_at": int(self.updated_at),
+        }
+
+
+class JobManager:
+    """
+    Runs background jobs in a bounded task pool and tracks their state.
+
+    Example:
+        jobs = get_job_manager()
+        job = jobs.submit("dflow_prediction.buy", lambda: do_buy(...), owner=wallet)
+        return job_submitted(job, "buy")
+        ...
+        return jobs.status(job_id, owner=wallet)  # in the job_status action
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = JOB_CONCURRENCY,
+        store_path: Optional[str] = None,
+        retention: float = JOB_RETENTION,
+    ):
+        """
+        Initialize the job manager.
+
+        Args:
+            max_concurrent: Jobs allowed to run at once
+            store_path: Optional JSON file that jobs are persisted to
+            retention: Seconds finished jobs are kept
+        """
+        self.max_concurrent = max_concurrent
+        self.retention = retention
+        self.store_path: Optional[str] = None
+        self._jobs: Dict[str, Job] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        if store_path:
+            self.configure(store_path=store_path)
+
+    def configure(
+        self,
+        store_path: Optional[str] = None,
+        max_concurrent: Optional[int] = None,
+    ) -> None:
+        """
+        Apply tool configuration; unset values keep their current setting.
+
+        Setting a new store path loads the jobs persisted there. The
+        concurrency limit only applies before the first job has run: a new
+        pool would let jobs already holding the old one exceed the limit.
+        """
+        if max_concurrent and int(max_concurrent) != self.max_concurrent:
+            if self._semaphore is None:
+                self.max_concurrent = int(max_concurrent)
+            else:
+                logger.warning(
+                    f"Job pool already started with {self.max_concurrent} slots; "
+                    f"ignoring max_concurrent={max_concurrent}"
+                )
+        if store_path and store_path != self.store_path:
+            self.store_path = store_path
+            self._load()
+
+    def _pool(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished and job.updated_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _load(self) -> None:
+        if not self.store_path or not os.path.exists(self.store_path):
+            return
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load jobs from {self.store_path}: {e}")
+            return
+
+        for record in records:
+            try:
+                job = Job(**record)
+            except TypeError:
+                logger.warning(f"Skipping unreadable job record: {record}")
+                continue
+            if not job.finished:
+                job.status = JOB_INTERRUPTED
+                job.error = (
+                    "The process stopped before this job finished. Its transaction "
+                    "may or may not have landed; check the wallet before retrying."
+                )
+                job.updated_at = time.time()
+            self._jobs.setdefault(job.id, job)
+        self._prune()
+        self._save()
+
+    def _save(self) -> None:
+        if not self.store_path:
+            return
+        records = [asdict(job) for job in self._jobs.values()]
+        tmp_path = f"{self.store_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(records, f, default=str)
+            os.replace(tmp_path, self.store_path)
+        except OSError as e:
+            logger.warning(f"Could not persist jobs to {self.store_path}: {e}")
+
+    def _update(self, job: Job, status: str, **changes: Any) -> None:
+        job.status = status
+        for name, value in changes.items():
+            setattr(job, name, value)
+        job.updated_at = time.time()
+        self._save()
+
+    def submit(
+        self,
+        kind: str,
+        work: Callable[[], Awaitable[Dict[str, Any]]],
+        owner: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Job:
+        """
+        Start a job in the background.
+
+        Args:
+            kind: Job type, e.g. "dflow_prediction.buy"
+            work: Zero-argument coroutine function returning a tool response
+            owner: Wallet the job acts for; status lookups must match it
+            params: Action arguments, kept with the job for reference
+
+        Returns:
+            The pending Job
+        """
+        self._prune()
+        job = Job(id=uuid.uuid4().hex, kind=kind, owner=owner, params=params or {})
+        self._jobs[job.id] = job
+        self._save()
+        task = asyncio.ensure_future(self._run(job, work))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        return job
+
+    async def _run(
+        self, job: Job, work: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> None:
+        try:
+            async with self._pool():
+                self._update(job, JOB_RUNNING)
+                result = await work()
+        except asyncio.CancelledError:
+            self._update(job, JOB_INTERRUPTED, error="Job was cancelled.")
+            raise
+        except Exception as e:
+            logger.exception(f"Background job {job.id} ({job.kind}) failed")
+            self._update(job, JOB_FAILED, error=str(e))
+            return
+
+        if isinstance(result, dict) and result.get("status") == "error":
+            self._update(job, JOB_FAILED, result=result, error=result.get("message"))
+        else:
+            self._update(job, JOB_SUCCEEDED, result=result)
+
+    def get(self, job_id: str, owner: Optional[str] = None) -> Optional[Job]:
+        """Get a job by id, or None if unknown or owned by another wallet."""
+        job = self._jobs.get(job_id)
+        if job is None or (job.owner is not None and job.owner != owner):
+            return None
+        return job
+
+    def status(
+        self, job_id: Optional[str], owner: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Tool response for a `job_status` action.
+
+        Args:
+            job_id: Id returned when the job was submitted
+            owner: Wallet making the request
+
+        Returns:
+            Success dict with the job's state and result, or an error dict
+        """
+        if not job_id:
+            return {"status": "error", "message": "job_id is required for job_status."}
+        job = self.get(job_id, owner)
+        if job is None:
+            return {
+                "status": "error",
+                "message": f"Unknown job_id {job_id}. Finished jobs are kept for {int(self.retention)}s.",
+            }
+        return {"status": "success", "action": "job_status", **job.to_dict()}
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Job:
+        """Wait for a job to finish (mainly for tests and shutdown)."""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        return self._jobs[job_id]
+
+    async def shutdown(self) -> None:
+        """Cancel running jobs; they are persisted as interrupted."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+_JOB_MANAGER = JobManager()
+
+
+def get_job_manager() -> JobManager:
+    """Get the process-wide job manager shared by all tools."""
+    return _JOB_MANAGER
+
+
+def reset_job_manager() -> None:
+    """Replace the job manager with an empty one (mainly for tests)."""
+    global _JOB_MANAGER
+    _JOB_MANAGER = JobManager()
+
+
+def job_submitted(job: Job, action: str) -> Dict[str, Any]:
+    """Tool response for an action that was submitted as a background job."""
+    return {
+        "status": "success",
+        "action": action,
+        "job_id": job.id,
+        "job_status": job.status,
+        "message": (
+            f"'{action}' is running in the background. Call this tool with "
+            f"action 'job_status' and job_id {job.id} to get the result."
+        ),
+    }
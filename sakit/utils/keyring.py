@@ -0,0 +1,122 @@
+"""
+Parsed keypair cache for configured private keys.
+
+Tools are configured with base58 private keys and used to parse them with
+`Keypair.from_base58_string` on every execution (several times per retry in
+some swap flows), then derive the public key and its string form again.
+`Keyring` parses each configured key once, at `configure()`, and keeps the
+keypair with its precomputed pubkey and address. All tools share one
+keyring, so a key configured for several tools is parsed once.
+
+Entries are looked up by a SHA-256 digest of the private key, so the keyring
+holds no second copy of the key string.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class KeyringEntry:
+    """A parsed keypair with its precomputed public key forms."""
+
+    keypair: Keypair
+    pubkey: Pubkey
+    address: str
+
+    def sign_message(self, message: bytes) -> Signature:
+        """Sign message bytes with the keypair's expanded key."""
+        return self.keypair.sign_message(message)
+
+
+class Keyring:
+    """
+    Keypairs parsed once per private key.
+
+    Example:
+        keyring = get_keyring()
+        keyring.preload(private_key, payer_private_key)  # in configure()
+        entry = keyring.load(private_key)  # in execute(), no parsing
+        entry.address, entry.sign_message(message_bytes)
+    """
+
+    def __init__(self):
+        """Initialize an empty keyring."""
+        self._entries: Dict[bytes, KeyringEntry] = {}
+
+    @staticmethod
+    def _digest(private_key: str) -> bytes:
+        return hashlib.sha256(private_key.encode("utf-8")).digest()
+
+    def load(self, private_key: str) -> KeyringEntry:
+        """
+        Get the parsed entry for a private key, parsing it on first use.
+
+        Args:
+            private_key: Base58 private key
+
+        Returns:
+            KeyringEntry for the key
+
+        Raises:
+            ValueError: If the key is not a valid base58 keypair
+        """
+        digest = self._digest(private_key)
+        entry = self._entries.get(digest)
+        if entry is None:
+            keypair = Keypair.from_base58_string(private_key)
+            pubkey = keypair.pubkey()
+            entry = KeyringEntry(keypair=keypair, pubkey=pubkey, address=str(pubkey))
+            self._entries[digest] = entry
+        return entry
+
+    def preload(self, *private_keys: Optional[str]) -> None:
+        """
+        Parse configured keys ahead of use.
+
+        Empty keys are skipped. Invalid keys are skipped too and only logged,
+        so a bad key surfaces as an error from the tool that uses it rather
+        than failing configuration of every tool.
+        """
+        for private_key in private_keys:
+            if not private_key:
+                continue
+            try:
+                self.load(private_key)
+            except Exception as e:
+                logger.warning(f"Could not parse configured private key: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_KEYRING = Keyring()
+
+
+def get_keyring() -> Keyring:
+    """Get the keyring shared by all tools."""
+    return _KEYRING
+
+
+def reset_keyring() -> None:
+    """Drop all parsed keypairs (mainly for tests)."""
+    global _KEYRING
+    _KEYRING = Keyring()
+
+
+def load_keypair(private_key: str) -> Keypair:
+    """Parsed keypair for a private key from the shared keyring."""
+    return _KEYRING.load(private_key).keypair
+
+
+def load_address(private_key: str) -> str:
+    """Base58 public key for a private key from the shared keyring."""
+    return _KEYRING.load(private_key).address
@@ -0,0 +1,235 @@
+"""
+Durable nonce pool.
+
+A transaction built on a recent blockhash must land within ~150 blocks,
+so it has to be built right before it is sent and rebuilt when it expires.
+A transaction built on a durable nonce instead stays valid until the nonce
+is advanced, so it can be built and signed ahead of time.
+
+`NoncePool` manages the nonce accounts configured for one authority
+(wallet). It leases out one account at a time together with its current
+nonce value, and tracks consumption: a released account that was used in a
+sent transaction is marked stale, and stale accounts are re-read from chain
+in one `getMultipleAccounts` call before they are leased again. A stale
+account stays out of the pool until the chain shows a nonce other than the
+one it was leased with, since the transaction may not have landed yet.
+
+Nonce accounts are created once, outside the pool, with
+`solders.system_program.create_nonce_account`.
+"""
+
+import logging
+import struct
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from solana.rpc.async_api import AsyncClient
+from solders.hash import Hash
+from solders.instruction import Instruction
+from solders.pubkey import Pubkey
+from solders.system_program import AdvanceNonceAccountParams, advance_nonce_account
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROGRAM_ID = "11111111111111111111111111111111"
+
+# Nonce account layout: version u32, state u32, authority, nonce, fee u64
+NONCE_ACCOUNT_LENGTH = 80
+NONCE_STATE_INITIALIZED = 1
+NONCE_AUTHORITY_OFFSET = 8
+NONCE_VALUE_OFFSET = 40
+
+
+@dataclass
+class NonceLease:
+    """A nonce account leased for one transaction."""
+
+    address: Pubkey
+    authority: Pubkey
+    nonce: Hash
+
+    def advance_instruction(self) -> Instruction:
+        """`AdvanceNonceAccount` instruction; must be the first in the transaction."""
+        return advance_nonce_account(
+            AdvanceNonceAccountParams(
+                nonce_pubkey=self.address,
+                authorized_pubkey=self.authority,
+            )
+        )
+
+
+def parse_nonce_account(data: bytes) -> Optional[Tuple[Pubkey, Hash]]:
+    """
+    Parse nonce account data.
+
+    Args:
+        data: Raw account data
+
+    Returns:
+        Tuple of (authority, nonce) or None if the account is not an
+        initialized nonce account
+    """
+    data = bytes(data)
+    if len(data) < NONCE_ACCOUNT_LENGTH:
+        return None
+    _, state = struct.unpack_from("<II", data)
+    if state != NONCE_STATE_INITIALIZED:
+        return None
+    authority = Pubkey.from_bytes(
+        data[NONCE_AUTHORITY_OFFSET : NONCE_AUTHORITY_OFFSET + 32]
+    )
+    nonce = Hash.from_bytes(data[NONCE_VALUE_OFFSET : NONCE_VALUE_OFFSET + 32])
+    return authority, nonce
+
+
+class NoncePool:
+    """
+    Nonce accounts for one authority, leased one transaction at a time.
+
+    Example:
+        pool = get_nonce_pool(str(keypair.pubkey()), nonce_accounts)
+        lease = await pool.acquire(client)  # None when no account is free
+        ...build with lease.nonce and lease.advance_instruction(), send...
+        pool.release(lease)
+    """
+
+    def __init__(self, authority: Pubkey, addresses: Iterable[str]):
+        """
+        Initialize the pool.
+
+        Args:
+            authority: Nonce authority; signs every advance instruction
+            addresses: Nonce account addresses owned by `authority`
+        """
+        self.authority = authority
+        self._nonces: Dict[Pubkey, Optional[Hash]] = {}
+        self._leased: set = set()
+        self._dropped: set = set()
+        # Bumped on every consumption so a slow refresh never restores an old nonce
+        self._versions: Dict[Pubkey, int] = {}
+        # Nonce each stale account was consumed with, until the chain advances it
+        self._consumed: Dict[Pubkey, Hash] = {}
+        self.add(addresses)
+
+    def add(self, addresses: Iterable[str]) -> None:
+        """Add nonce accounts to the pool; their nonces are read on first use."""
+        for address in addresses:
+            pubkey = Pubkey.from_string(address)
+            if pubkey not in self._dropped:
+                self._nonces.setdefault(pubkey, None)
+
+    @property
+    def available(self) -> int:
+        """Number of accounts not currently leased."""
+        return len(self._nonces) - len(self._leased)
+
+    async def refresh(self, client: AsyncClient) -> None:
+        """
+        Read the current nonce of every idle stale account in one call.
+
+        Accounts that are missing, not initialized, or have a different
+        authority are dropped from the pool. Accounts whose nonce still
+        equals the consumed one stay stale until their transaction lands.
+        """
+        stale = [
+            address
+            for address, nonce in self._nonces.items()
+            if nonce is None and address not in self._leased
+        ]
+        if not stale:
+            return
+        versions = [self._versions.get(address, 0) for address in stale]
+        response = await client.get_multiple_accounts(stale)
+        for address, version, account in zip(stale, versions, response.value):
+            if address not in self._nonces or self._versions.get(address, 0) != version:
+                continue
+            parsed = None
+            if account is not None and str(account.owner) == SYSTEM_PROGRAM_ID:
+                parsed = parse_nonce_account(account.data)
+            if parsed is None or parsed[0] != self.authority:
+                logger.warning(f"Dropping unusable nonce account {address}")
+                del self._nonces[address]
+                self._consumed.pop(address, None)
+                self._dropped.add(address)
+                continue
+            if parsed[1] == self._consumed.get(address):
+                continue
+            self._consumed.pop(address, None)
+            self._nonces[address] = parsed[1]
+
+    async def acquire(self, client: AsyncClient) -> Optional[NonceLease]:
+        """
+        Lease an idle nonce account with its current nonce.
+
+        Args:
+            client: RPC client used to refresh stale nonces
+
+        Returns:
+            NonceLease, or None when every account is leased or unusable
+        """
+        if not any(
+            nonce is None and address not in self._leased
+            for address, nonce in self._nonces.items()
+        ):
+            return self._lease()
+        await self.refresh(client)
+        return self._lease()
+
+    def _lease(self) -> Optional[NonceLease]:
+        for address, nonce in self._nonces.items():
+            if nonce is not None and address not in self._leased:
+                self._leased.add(address)
+                return NonceLease(address, self.authority, nonce)
+        return None
+
+    def release(self, lease: NonceLease, consumed: bool = True) -> None:
+        """
+        Return a leased account to the pool.
+
+        Args:
+            lease: The lease from `acquire`
+            consumed: Whether a transaction using the lease was sent. Sent
+                transactions advance the nonce once they land, so the
+                account is not leased again until the chain shows a new
+                nonce. Pass False only when the transaction was never sent.
+        """
+        self._leased.discard(lease.address)
+        if consumed and lease.address in self._nonces:
+            self._nonces[lease.address] = None
+            self._consumed[lease.address] = lease.nonce
+            self._versions[lease.address] = self._versions.get(lease.address, 0) + 1
+
+
+_POOLS: Dict[str, NoncePool] = {}
+
+
+def get_nonce_pool(authority: str, addresses: Iterable[str]) -> NoncePool:
+    """
+    Get the shared nonce pool for an authority.
+
+    Args:
+        authority: Base58 nonce authority (wallet) address
+        addresses: Nonce account addresses; new ones are added to the pool
+
+    Returns:
+        The authority's NoncePool
+    """
+    pool = _POOLS.get(authority)
+    if pool is None:
+        pool = _POOLS[authority] = NoncePool(Pubkey.from_string(authority), [])
+    pool.add(addresses)
+    return pool
+
+
+def reset_nonce_pools() -> None:
+    """Drop all nonce pools (mainly for tests)."""
+    _POOLS.clear()
+
+
+def nonce_instructions(
+    lease: Optional[NonceLease], ixs: List[Instruction]
+) -> List[Instruction]:
+    """Prepend the lease's advance instruction to `ixs` when a lease is given."""
+    if lease is None:
+        return list(ixs)
+    return [lease.advance_instruction(), *ixs]
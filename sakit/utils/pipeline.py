@@ -0,0 +1,100 @@
+"""
+Async stage pipeline utility.
+
+Runs the stages of a transaction flow (order fetch, blockhash fetch, key
+preparation, signing, sending) as a small dependency graph: every stage is
+started as a task as soon as it is added and waits only for the stages it
+depends on, so independent network round trips overlap. Each stage's start
+offset and duration are recorded for latency breakdowns.
+"""
+
+import asyncio
+import inspect
+import logging
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class StagePipeline:
+    """
+    Dependency-ordered async stages with per-stage timing.
+
+    Example:
+        pipeline = StagePipeline()
+        pipeline.add("blockhash", lambda: get_fresh_blockhash(rpc_url))
+        pipeline.add("order", lambda: ultra.get_order(...))
+        pipeline.add("tx", lambda order, bh: patch(order, bh), "order", "blockhash")
+        tx = await pipeline.result("tx")
+        pipeline.timings()  # {"blockhash": {"start_ms": 0.1, "duration_ms": 80.2}, ...}
+        await pipeline.aclose()
+    """
+
+    def __init__(self):
+        """Initialize an empty pipeline; timings are relative to creation."""
+        self._started = perf_counter()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._timings: Dict[str, Dict[str, float]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tasks
+
+    def add(self, name: str, func: Callable[..., Any], *deps: str) -> asyncio.Task:
+        """
+        Start a stage.
+
+        Args:
+            name: Stage name (must be unique within the pipeline)
+            func: Called with the results of `deps` in order; may return an
+                awaitable, which is awaited
+            *deps: Names of stages whose results this stage needs
+
+        Returns:
+            The stage task (await it or `result(name)` for the stage output)
+
+        Raises:
+            ValueError: If the name is taken or a dependency is unknown
+        """
+        if name in self._tasks:
+            raise ValueError(f"Stage '{name}' already exists")
+        missing = [dep for dep in deps if dep not in self._tasks]
+        if missing:
+            raise ValueError(f"Unknown stage dependencies: {', '.join(missing)}")
+        dep_tasks = [self._tasks[dep] for dep in deps]
+
+        async def run() -> Any:
+            inputs = [await task for task in dep_tasks]
+            start = perf_counter()
+            try:
+                result = func(*inputs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            finally:
+                self._timings[name] = {
+                    "start_ms": round((start - self._started) * 1000, 1),
+                    "duration_ms": round((perf_counter() - start) * 1000, 1),
+                }
+
+        task = asyncio.ensure_future(run())
+        self._tasks[name] = task
+        return task
+
+    async def result(self, name: str) -> Any:
+        """Wait for a stage and return its result (re-raising its exception)."""
+        return await self._tasks[name]
+
+    def timings(self) -> Dict[str, Dict[str, float]]:
+        """Start offset and duration (ms) of every stage that has run."""
+        return dict(self._timings)
+
+    async def aclose(self) -> None:
+        """Cancel unfinished stages and collect outstanding results."""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+        results = await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        for name, result in zip(self._tasks, results):
+            if isinstance(result, Exception):
+                logger.debug(f"Stage '{name}' failed: {result}")
@@ -0,0 +1,281 @@
+"""
+Priority fee oracle.
+
+Estimating a priority fee per transaction costs an RPC round trip on the
+send path. `PriorityFeeOracle` instead samples `getRecentPrioritizationFees`
+in the background for each set of writable accounts that callers ask about,
+keeps rolling percentiles over the recent slots, and answers fee queries
+synchronously from memory.
+
+Fees are in micro-lamports per compute unit, ready for
+`set_compute_unit_price`.
+"""
+
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Seconds between background samples of each tracked account set
+FEE_SAMPLE_INTERVAL = 10.0
+
+# Recent slots kept per account set (the RPC reports up to 150)
+FEE_SAMPLE_SLOTS = 150
+
+# Stop sampling account sets nobody has asked about for this long
+FEE_ORACLE_IDLE_TIMEOUT = 300.0
+FEE_ORACLE_MAX_ACCOUNT_SETS = 64
+
+# getRecentPrioritizationFees accepts at most 128 accounts
+MAX_FEE_ACCOUNTS = 128
+
+FEE_STRATEGIES = {"p50": 50, "p75": 75, "p90": 90}
+DEFAULT_FEE_STRATEGY = "p75"
+
+# Upper bound on the fee paid, in micro-lamports per compute unit
+DEFAULT_PRIORITY_FEE_CAP = 1_000_000
+
+FeeFetcher = Callable[[List[str]], Awaitable[List[Dict[str, Any]]]]
+AccountSet = FrozenSet[str]
+
+
+async def fetch_recent_prioritization_fees(  # pragma: no cover
+    rpc_url: str, accounts: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Fetch recent prioritization fees for writable accounts.
+
+    Args:
+        rpc_url: The RPC endpoint URL
+        accounts: Writable account addresses (empty for the global fee market)
+
+    Returns:
+        List of {"slot", "prioritizationFee"} entries
+    """
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        response = await client.post(
+            rpc_url,
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getRecentPrioritizationFees",
+                "params": [accounts] if accounts else [],
+            },
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"RPC error: {response.status_code}")
+
+        data = response.json()
+        if "error" in data:
+            raise Exception(f"RPC error: {data['error']}")
+
+        return data.get("result") or []
+
+
+def _percentile(sorted_fees: List[int], percent: int) -> int:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(0, -(-len(sorted_fees) * percent // 100) - 1)
+    return sorted_fees[rank]
+
+
+class _FeeWindow:
+    __slots__ = ("fees", "percentiles", "used_at")
+
+    def __init__(self):
+        self.fees: Dict[int, int] = {}
+        self.percentiles: Dict[int, int] = {}
+        self.used_at = monotonic()
+
+
+class PriorityFeeOracle:
+    """
+    Rolling priority fee percentiles per writable-account set.
+
+    Example:
+        oracle = get_fee_oracle(rpc_url)
+        fee = await oracle.get_fee(writable_accounts, strategy="p75")
+        fee = oracle.estimate(writable_accounts)  # sync, None until sampled
+    """
+
+    def __init__(
+        self,
+        fetch: FeeFetcher,
+        sample_interval: float = FEE_SAMPLE_INTERVAL,
+        idle_timeout: float = FEE_ORACLE_IDLE_TIMEOUT,
+        max_account_sets: int = FEE_ORACLE_MAX_ACCOUNT_SETS,
+    ):
+        """
+        Initialize the oracle.
+
+        Args:
+            fetch: Coroutine function returning recent fees for accounts
+            sample_interval: Seconds between background samples
+            idle_timeout: Seconds an unused account set keeps being sampled
+            max_account_sets: Maximum account sets tracked (least recently used dropped)
+        """
+        self.fetch = fetch
+        self.sample_interval = sample_interval
+        self.idle_timeout = idle_timeout
+        self.max_account_sets = max_account_sets
+        self._windows: Dict[AccountSet, _FeeWindow] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def account_set(accounts: Iterable[str]) -> AccountSet:
+        """Normalize accounts to the key used for tracking."""
+        return frozenset(sorted({str(a) for a in accounts})[:MAX_FEE_ACCOUNTS])
+
+    def _track(self, key: AccountSet) -> _FeeWindow:
+        window = self._windows.pop(key, None) or _FeeWindow()
+        window.used_at = monotonic()
+        self._windows[key] = window
+        while len(self._windows) > self.max_account_sets:
+            del self._windows[next(iter(self._windows))]
+        return window
+
+    def record(self, accounts: Iterable[str], samples: List[Dict[str, Any]]) -> None:
+        """Merge fee samples for an account set and recompute its percentiles."""
+        key = self.account_set(accounts)
+        window = self._windows.get(key) or self._track(key)
+        for sample in samples:
+            window.fees[int(sample["slot"])] = int(sample["prioritizationFee"])
+        for slot in sorted(window.fees)[:-FEE_SAMPLE_SLOTS]:
+            del window.fees[slot]
+        fees = sorted(window.fees.values())
+        window.percentiles = (
+            {p: _percentile(fees, p) for p in FEE_STRATEGIES.values()} if fees else {}
+        )
+
+    def estimate(
+        self,
+        accounts: Iterable[str] = (),
+        strategy: str = DEFAULT_FEE_STRATEGY,
+        cap: Optional[int] = DEFAULT_PRIORITY_FEE_CAP,
+    ) -> Optional[int]:
+        """
+        Answer a fee query from memory.
+
+        The account set is tracked for background sampling. Until it has
+        samples the global fee market is used.
+
+        Args:
+            accounts: Writable accounts of the transaction
+            strategy: One of FEE_STRATEGIES ("p50", "p75", "p90")
+            cap: Maximum fee returned (None for no cap)
+
+        Returns:
+            Fee in micro-lamports per compute unit, or None if nothing is sampled yet
+        """
+        if strategy not in FEE_STRATEGIES:
+            raise ValueError(
+                f"Unknown priority fee strategy: {strategy}. "
+                f"Expected one of {', '.join(FEE_STRATEGIES)}."
+            )
+        percent = FEE_STRATEGIES[strategy]
+        fee = self._track(self.account_set(accounts)).percentiles.get(percent)
+        if fee is None:
+            fee = self._track(frozenset()).percentiles.get(percent)
+        self._ensure_sampling()
+        if fee is None:
+            return None
+        return min(fee, cap) if cap is not None else fee
+
+    async def sample(self, accounts: Iterable[str] = ()) -> None:
+        """Fetch and record fees for one account set."""
+        key = self.account_set(accounts)
+        self.record(key, await self.fetch(sorted(key)))
+
+    async def get_fee(
+        self,
+        accounts: Iterable[str] = (),
+        strategy: str = DEFAULT_FEE_STRATEGY,
+        cap: Optional[int] = DEFAULT_PRIORITY_FEE_CAP,
+        default: int = 0,
+    ) -> int:
+        """
+        Get a fee, sampling once only if nothing is known yet.
+
+        Sampling failures are logged and yield `default` so a fee lookup
+        never blocks a transaction.
+
+        Args:
+            accounts: Writable accounts of the transaction
+            strategy: One of FEE_STRATEGIES ("p50", "p75", "p90")
+            cap: Maximum fee returned (None for no cap)
+            default: Fee used when no samples are available
+
+        Returns:
+            Fee in micro-lamports per compute unit
+        """
+        accounts = list(accounts)
+        fee = self.estimate(accounts, strategy, cap)
+        if fee is None:
+            try:
+                await self.sample(accounts)
+            except Exception as e:
+                logger.warning(f"Priority fee sample failed: {e}")
+            fee = self.estimate(accounts, strategy, cap)
+        return default if fee is None else fee
+
+    def _ensure_sampling(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sample_interval)
+            now = monotonic()
+            for key, window in list(self._windows.items()):
+                if key and now - window.used_at >= self.idle_timeout:
+                    del self._windows[key]
+            if not any(
+                now - w.used_at < self.idle_timeout for w in self._windows.values()
+            ):
+                return
+            keys = list(self._windows)
+            results = await asyncio.gather(
+                *(self.fetch(sorted(key)) for key in keys),
+                return_exceptions=True,
+            )
+            for key, samples in zip(keys, results):
+                if isinstance(samples, Exception):
+                    logger.debug(f"Priority fee sample failed: {samples}")
+                    continue
+                self.record(key, samples)
+
+    def stop(self) -> None:
+        """Cancel background sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+_FEE_ORACLES: Dict[str, PriorityFeeOracle] = {}
+
+
+def get_fee_oracle(rpc_url: str) -> PriorityFeeOracle:
+    """Get the priority fee oracle shared by all tools using an RPC URL."""
+    oracle = _FEE_ORACLES.get(rpc_url)
+    if oracle is None:
+        oracle = PriorityFeeOracle(
+            fetch=lambda accounts: fetch_recent_prioritization_fees(rpc_url, accounts)
+        )
+        _FEE_ORACLES[rpc_url] = oracle
+    return oracle
+
+
+def reset_fee_oracles() -> None:
+    """Stop and drop all shared fee oracles (mainly for tests)."""
+    for oracle in _FEE_ORACLES.values():
+        oracle.stop()
+    _FEE_ORACLES.clear()
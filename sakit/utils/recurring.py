@@ -14,6 +14,8 @@ import httpx
 from solders.transaction import VersionedTransaction  # type: ignore
 from solders.message import to_bytes_versioned  # type: ignore
 
+from sakit.utils.retry import EXECUTE_RETRY_POLICY, request_with_retry
+
 logger = logging.getLogger(__name__)
 
 # Jupiter Recurring API base URL (API key required, free tier available at portal.jup.ag)
@@ -239,31 +241,32 @@ class JupiterRecurring:
         }
 
         try:
-            # Use longer timeout for execute - Jupiter waits for tx confirmation
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/execute",
-                    json=payload,
-                    headers=self._headers,
-                )
-
-                if response.status_code != 200:
-                    return RecurringExecuteResponse(
-                        success=False,
-                        error=f"Failed to execute recurring order: {response.status_code} - {response.text}",
-                    )
-
-                data = response.json()
-                status = data.get("status", "")
-
+            # Jupiter waits for tx confirmation; bounded by the execute deadline
+            response = await request_with_retry(
+                "POST",
+                f"{self.base_url}/execute",
+                policy=EXECUTE_RETRY_POLICY,
+                json=payload,
+                headers=self._headers,
+            )
+
+            if response.status_code != 200:
                 return RecurringExecuteResponse(
-                    success=status.lower() == "success",
-                    status=status,
-                    signature=data.get("signature"),
-                    error=data.get("error"),
-                    code=data.get("code", 0),
-                    raw_response=data,
+                    success=False,
+                    error=f"Failed to execute recurring order: {response.status_code} - {response.text}",
                 )
+
+            data = response.json()
+            status = data.get("status", "")
+
+            return RecurringExecuteResponse(
+                success=status.lower() == "success",
+                status=status,
+                signature=data.get("signature"),
+                error=data.get("error"),
+                code=data.get("code", 0),
+                raw_response=data,
+            )
         except Exception as e:
             logger.exception("Failed to execute recurring order")
             return RecurringExecuteResponse(success=False, error=str(e))
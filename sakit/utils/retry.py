@@ -0,0 +1,183 @@
+"""
+Shared retry policy for upstream API calls.
+
+Execute endpoints (Jupiter Trigger, Recurring and Ultra) hold the request
+open until the transaction lands, and each client used to handle slowness
+on its own: one retried 504s with `2**attempt` sleeps, others waited up to
+120s in a single shot. `RetryPolicy` gives them one behaviour: attempts are
+spaced with decorrelated jitter, each attempt's timeout is cut to what is
+left of a total deadline, and only failures that are safe to repeat are
+retried.
+
+A request is retried when the failure is transient. For requests that are
+not idempotent, only failures where the server cannot have acted on the
+request (connection never established, rate limited) are retried.
+"""
+
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, AsyncIterator, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying. 500 is left out: upstreams use it for
+# deterministic failures (bad transaction, simulation error).
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 502, 503, 504})
+
+# Status codes returned before the request was processed
+UNPROCESSED_STATUS_CODES = frozenset({429})
+
+# Exceptions raised before the request reached the server
+UNSENT_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Exceptions after which the server may or may not have processed the request
+TRANSIENT_EXCEPTIONS = (
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+    asyncio.TimeoutError,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry schedule bounded by attempts and a total deadline.
+
+    Example:
+        async for timeout in EXECUTE_RETRY_POLICY.attempts():
+            ...one attempt, finishing within `timeout` seconds...
+            if not retryable:
+                break
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    deadline: float = 60.0
+    attempt_timeout: float = 30.0
+
+    def backoff(self, previous: float) -> float:
+        """
+        Next delay using decorrelated jitter.
+
+        Args:
+            previous: The previous delay (base_delay before the first retry)
+
+        Returns:
+            Seconds to sleep, between base_delay and max_delay
+        """
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def should_retry_status(self, status_code: int, idempotent: bool = True) -> bool:
+        """Whether a response status is worth retrying."""
+        if idempotent:
+            return status_code in RETRYABLE_STATUS_CODES
+        return status_code in UNPROCESSED_STATUS_CODES
+
+    def should_retry_exception(
+        self, exc: BaseException, idempotent: bool = True
+    ) -> bool:
+        """Whether a request exception is worth retrying."""
+        if isinstance(exc, UNSENT_EXCEPTIONS):
+            return True
+        return idempotent and isinstance(exc, TRANSIENT_EXCEPTIONS)
+
+    async def attempts(self) -> AsyncIterator[float]:
+        """
+        Yield once per attempt, sleeping with jitter between attempts.
+
+        Stops after max_attempts, or earlier when the remaining deadline
+        would not cover the next delay.
+
+        Yields:
+            Timeout in seconds for the attempt (never past the deadline)
+        """
+        start = monotonic()
+        delay = self.base_delay
+        for attempt in range(self.max_attempts):
+            if attempt:
+                delay = self.backoff(delay)
+                if self.deadline - (monotonic() - start) <= delay:
+                    return
+                await asyncio.sleep(delay)
+            remaining = self.deadline - (monotonic() - start)
+            if remaining <= 0:
+                return
+            yield min(self.attempt_timeout, remaining)
+
+
+# Execute endpoints wait for the transaction to land. A signed transaction's
+# blockhash expires after 60-90s, so retrying past that only adds latency.
+EXECUTE_RETRY_POLICY = RetryPolicy(
+    max_attempts=4, base_delay=1.0, max_delay=8.0, deadline=90.0, attempt_timeout=60.0
+)
+
+# Rebuilding a transaction after its blockhash expired
+BLOCKHASH_RETRY_POLICY = RetryPolicy(
+    max_attempts=3, base_delay=0.2, max_delay=2.0, deadline=60.0, attempt_timeout=30.0
+)
+
+
+async def request_with_retry(
+    method: str,
+    url: str,
+    policy: RetryPolicy = EXECUTE_RETRY_POLICY,
+    idempotent: bool = True,
+    **kwargs: Any,
+) -> httpx.Response:
+    """
+    Send an HTTP request under a retry policy.
+
+    Args:
+        method: HTTP method ("GET" or "POST")
+        url: Full request URL
+        policy: Retry schedule and deadline
+        idempotent: Whether repeating the request is safe once the server
+            may have received it (e.g. resubmitting the same signed transaction)
+        **kwargs: Passed through to the httpx request (json, params, headers)
+
+    Returns:
+        The final httpx.Response (a retryable status if attempts ran out)
+
+    Raises:
+        Exception: The last request exception if no attempt got a response
+    """
+    response: Optional[httpx.Response] = None
+    error: Optional[BaseException] = None
+    attempt = 0
+    async for timeout in policy.attempts():
+        attempt += 1
+        try:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                send = getattr(client, method.lower())
+                response = await asyncio.wait_for(send(url, **kwargs), timeout)
+                error = None
+        except Exception as e:
+            if not policy.should_retry_exception(e, idempotent):
+                raise
+            response, error = None, e
+            logger.warning(
+                f"{method} {url} failed on attempt {attempt}/{policy.max_attempts}: "
+                f"{type(e).__name__}: {e}"
+            )
+            continue
+
+        if not policy.should_retry_status(response.status_code, idempotent):
+            return response
+        logger.warning(
+            f"{method} {url} returned {response.status_code} on attempt "
+            f"{attempt}/{policy.max_attempts}"
+        )
+
+    if response is not None:
+        return response
+    raise error or asyncio.TimeoutError(f"{method} {url}: retry deadline exceeded")
@@ -0,0 +1,366 @@
+"""
+Swap route racing utility functions.
+
+Requests a Jupiter Ultra order and a DFlow order concurrently, waits up to a
+deadline, and picks the route that leaves the user with the most output
+tokens after fees. If only one aggregator answers in time, its route is used;
+if neither has answered by the deadline, the first successful answer wins.
+
+The integrator's Ultra referral fee is also charged on DFlow routes, as a
+DFlow platform fee paid to the referral token account of the output mint,
+so the fee is collected whichever aggregator wins. DFlow orders fail when
+that account does not exist (Ultra just skips its fee), so the account is
+looked up first; without it, DFlow does not take part in the race.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from time import monotonic, perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from solders.pubkey import Pubkey
+
+from sakit.utils.dflow import DFlowOrderResponse, DFlowSwap
+from sakit.utils.ultra import JupiterUltra, UltraOrderResponse
+from sakit.utils.wallet import get_rpc_client
+
+logger = logging.getLogger(__name__)
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+
+# Jupiter Referral Program ID
+JUPITER_REFERRAL_PROGRAM_ID = Pubkey.from_string(
+    "REFER4ZgmyYx9c6He5XfaTMiGfdLwRnkV4RPp9t9iF3"
+)
+
+# Seconds to wait for both aggregators before settling for what answered
+ROUTE_DEADLINE = 1.5
+
+ULTRA = "ultra"
+DFLOW = "dflow"
+
+# Seconds before a missing referral token account is looked up again
+# (existing accounts are remembered for the life of the process)
+FEE_ACCOUNT_MISS_TTL = 300.0
+
+# (referral_account, mint) -> (account exists, checked at)
+_FEE_ACCOUNTS: Dict[Tuple[str, str], Tuple[bool, float]] = {}
+
+
+@dataclass
+class RouteQuote:
+    """A normalized swap order from one aggregator."""
+
+    provider: str
+    success: bool
+    transaction: Optional[str] = None  # Base64 encoded transaction
+    in_amount: Optional[str] = None
+    out_amount: int = 0
+    network_fee_lamports: int = 0
+    net_out_amount: int = 0
+    slippage_bps: Optional[int] = None
+    price_impact_pct: Optional[str] = None
+    latency: float = 0.0
+    order: Any = None  # UltraOrderResponse or DFlowOrderResponse
+    error: Optional[str] = None
+
+
+@dataclass
+class RouteDecision:
+    """Outcome of a route race."""
+
+    best: Optional[RouteQuote]
+    quotes: Dict[str, RouteQuote] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact per-provider view for tool responses."""
+        routes: Dict[str, Any] = {}
+        for provider, quote in self.quotes.items():
+            if quote.success:
+                routes[provider] = {
+                    "out_amount": str(quote.out_amount),
+                    "net_out_amount": str(quote.net_out_amount),
+                    "latency_ms": round(quote.latency * 1000),
+                }
+            else:
+                routes[provider] = {"error": quote.error}
+        for provider in self.timed_out:
+            routes[provider] = {"error": "timed out"}
+        return routes
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _referral_token_account(referral_account: str, token_mint: str) -> str:
+    """Jupiter referral token account PDA of `referral_account` for a mint."""
+    referral_token_account, _ = Pubkey.find_program_address(
+        [
+            b"referral_ata",
+            bytes(Pubkey.from_string(referral_account)),
+            bytes(Pubkey.from_string(token_mint)),
+        ],
+        JUPITER_REFERRAL_PROGRAM_ID,
+    )
+    return str(referral_token_account)
+
+
+async def dflow_fee_account(
+    rpc_url: str, referral_account: str, mint: str
+) -> Optional[str]:
+    """
+    Referral token account that can receive a DFlow platform fee in `mint`.
+
+    Args:
+        rpc_url: RPC endpoint used to look the account up
+        referral_account: Jupiter referral account
+        mint: Fee token mint
+
+    Returns:
+        The referral token account, or None if it does not exist (or the
+        lookup failed)
+    """
+    address = _referral_token_account(referral_account, mint)
+    key = (referral_account, mint)
+    cached = _FEE_ACCOUNTS.get(key)
+    if cached is not None and (
+        cached[0] or monotonic() - cached[1] < FEE_ACCOUNT_MISS_TTL
+    ):
+        return address if cached[0] else None
+
+    try:
+        response = await get_rpc_client(rpc_url).get_account_info(
+            Pubkey.from_string(address)
+        )
+    except Exception as e:
+        logger.warning(f"Could not look up referral token account {address}: {e}")
+        return None
+    exists = response.value is not None
+    _FEE_ACCOUNTS[key] = (exists, monotonic())
+    return address if exists else None
+
+
+def reset_fee_accounts() -> None:
+    """Forget looked-up referral token accounts (mainly for tests)."""
+    _FEE_ACCOUNTS.clear()
+
+
+def _net_out(output_mint: str, out_amount: int, fee_lamports: int) -> int:
+    # Network fees are paid in SOL and only comparable when SOL is the output
+    if output_mint == SOL_MINT:
+        return out_amount - fee_lamports
+    return out_amount
+
+
+def ultra_route(
+    order: UltraOrderResponse, output_mint: str, latency: float = 0.0
+) -> RouteQuote:
+    """
+    Normalize a Jupiter Ultra order into a RouteQuote.
+
+    Ultra's outAmount already has the referral fee taken out.
+    """
+    raw = order.raw_response or {}
+    fee = 0
+    if not order.gasless:
+        fee = sum(
+            _int(raw.get(key))
+            for key in (
+                "signatureFeeLamports",
+                "prioritizationFeeLamports",
+                "rentFeeLamports",
+            )
+        )
+    out_amount = _int(order.out_amount)
+    return RouteQuote(
+        provider=ULTRA,
+        success=bool(order.transaction),
+        transaction=order.transaction,
+        in_amount=order.in_amount,
+        out_amount=out_amount,
+        network_fee_lamports=fee,
+        net_out_amount=_net_out(output_mint, out_amount, fee),
+        slippage_bps=order.slippage_bps,
+        price_impact_pct=f"{order.price_impact:.2f}%"
+        if order.price_impact is not None
+        else None,
+        latency=latency,
+        order=order,
+        error=None if order.transaction else "No transaction returned",
+    )
+
+
+def dflow_route(
+    order: DFlowOrderResponse,
+    output_mint: str,
+    latency: float = 0.0,
+    platform_fee_bps: Optional[int] = None,
+) -> RouteQuote:
+    """
+    Normalize a DFlow order into a RouteQuote.
+
+    DFlow's outAmount is before the platform fee, so the fee (as reported,
+    or computed from `platform_fee_bps`) is taken out of `net_out_amount`
+    to compare it with Ultra's.
+    """
+    if not order.success or not order.transaction:
+        return RouteQuote(
+            provider=DFLOW,
+            success=False,
+            latency=latency,
+            order=order,
+            error=order.error or "No transaction returned",
+        )
+    fee = _int(order.prioritization_fee_lamports)
+    out_amount = _int(order.out_amount)
+    platform_fee = 0
+    if platform_fee_bps:
+        platform_fee = _int((order.platform_fee or {}).get("amount")) or (
+            out_amount * platform_fee_bps // 10_000
+        )
+    return RouteQuote(
+        provider=DFLOW,
+        success=True,
+        transaction=order.transaction,
+        in_amount=order.in_amount,
+        out_amount=out_amount,
+        network_fee_lamports=fee,
+        net_out_amount=_net_out(output_mint, out_amount - platform_fee, fee),
+        slippage_bps=order.slippage_bps,
+        price_impact_pct=order.price_impact_pct,
+        latency=latency,
+        order=order,
+    )
+
+
+async def race_routes(
+    input_mint: str,
+    output_mint: str,
+    amount: int,
+    taker: str,
+    ultra: Optional[JupiterUltra] = None,
+    dflow: Optional[DFlowSwap] = None,
+    deadline: float = ROUTE_DEADLINE,
+    referral_account: Optional[str] = None,
+    referral_fee: Optional[int] = None,
+    payer: Optional[str] = None,
+    slippage_bps: Optional[int] = None,
+    rpc_url: Optional[str] = None,
+) -> RouteDecision:
+    """
+    Race Jupiter Ultra and DFlow orders and pick the best route.
+
+    Both orders are requested at once. After `deadline` seconds the best
+    successful route so far wins (highest `net_out_amount`, ties go to the
+    faster answer) and slower requests are cancelled. If nothing succeeded
+    by then, the first successful answer to arrive is used.
+
+    Args:
+        input_mint: Input token mint address
+        output_mint: Output token mint address
+        amount: Amount of input token (in smallest units)
+        taker: User's wallet address
+        ultra: Jupiter Ultra client (skipped when None)
+        dflow: DFlow Swap client (skipped when None)
+        deadline: Seconds to wait for all aggregators
+        referral_account: Optional Ultra referral account (also receives
+            the DFlow platform fee)
+        referral_fee: Optional referral fee in basis points, charged on
+            either route
+        payer: Optional gas payer (Ultra payer / DFlow sponsor)
+        slippage_bps: Optional DFlow slippage (None for auto)
+        rpc_url: RPC endpoint used to check the DFlow fee account; with a
+            referral fee but no RPC (or no account), DFlow is skipped
+
+    Returns:
+        RouteDecision with the best route (None if every route failed)
+    """
+    started = perf_counter()
+    dflow_fee_bps = referral_fee if referral_account and referral_fee else None
+
+    async def fetch_ultra() -> RouteQuote:
+        try:
+            order = await ultra.get_order(
+                input_mint=input_mint,
+                output_mint=output_mint,
+                amount=amount,
+                taker=taker,
+                referral_account=referral_account,
+                referral_fee=referral_fee,
+                payer=payer,
+                close_authority=taker if payer else None,
+            )
+        except Exception as e:
+            return RouteQuote(
+                provider=ULTRA,
+                success=False,
+                latency=perf_counter() - started,
+                error=str(e),
+            )
+        return ultra_route(order, output_mint, perf_counter() - started)
+
+    async def fetch_dflow() -> RouteQuote:
+        fee_account = None
+        if dflow_fee_bps:
+            if rpc_url:
+                fee_account = await dflow_fee_account(
+                    rpc_url, referral_account, output_mint
+                )
+            if fee_account is None:
+                return RouteQuote(
+                    provider=DFLOW,
+                    success=False,
+                    latency=perf_counter() - started,
+                    error="No referral token account for the output mint",
+                )
+        order = await dflow.get_order(
+            input_mint=input_mint,
+            output_mint=output_mint,
+            amount=amount,
+            user_public_key=taker,
+            slippage_bps=slippage_bps,
+            platform_fee_bps=dflow_fee_bps,
+            platform_fee_mode="outputMint" if dflow_fee_bps else None,
+            fee_account=fee_account,
+            sponsor=payer,
+        )
+        return dflow_route(order, output_mint, perf_counter() - started, dflow_fee_bps)
+
+    tasks: Dict[asyncio.Task, str] = {}
+    if ultra is not None:
+        tasks[asyncio.ensure_future(fetch_ultra())] = ULTRA
+    if dflow is not None:
+        tasks[asyncio.ensure_future(fetch_dflow())] = DFLOW
+
+    decision = RouteDecision(best=None)
+    if not tasks:
+        return decision
+
+    done, pending = await asyncio.wait(tasks, timeout=deadline)
+    for task in done:
+        decision.quotes[tasks[task]] = task.result()
+
+    # Nothing usable by the deadline: take the first success that arrives
+    while pending and not any(q.success for q in decision.quotes.values()):
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            decision.quotes[tasks[task]] = task.result()
+
+    for task in pending:
+        task.cancel()
+        decision.timed_out.append(tasks[task])
+
+    successes = [q for q in decision.quotes.values() if q.success]
+    if successes:
+        decision.best = max(successes, key=lambda q: (q.net_out_amount, -q.latency))
+        logger.info(
+            f"Route race: {decision.best.provider} won "
+            f"({decision.best.net_out_amount} net out); timed out: {decision.timed_out}"
+        )
+    return decision
@@ -0,0 +1,249 @@
+"""
+Shared Jupiter Shield verdict cache.
+
+The same mints are checked over and over by different users and tools.
+`ShieldCache` keeps mint -> warnings for a TTL (including mints with no
+warnings, on a shorter TTL) and merges concurrent lookups that arrive within
+a small window into a single upstream `/shield` request. Swap tools use
+`pre_trade_check` alongside their order fetch so the check adds no extra
+round trip.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sakit.utils.ultra import JupiterUltra
+
+logger = logging.getLogger(__name__)
+
+# Warnings rarely disappear; clean verdicts are re-checked sooner since new
+# tokens can pick up warnings as they trade
+SHIELD_CACHE_TTL = 600.0
+SHIELD_NEGATIVE_TTL = 120.0
+SHIELD_CACHE_MAX_ENTRIES = 10_000
+
+# Micro-batching: wait this long for more mints before calling /shield
+SHIELD_BATCH_WINDOW = 0.01
+SHIELD_MAX_BATCH = 100
+
+# Severities that block a swap when the pre-trade check is enabled
+SHIELD_BLOCK_SEVERITIES = ("critical",)
+
+
+@dataclass
+class ShieldVerdict:
+    """Result of a pre-trade Shield check."""
+
+    warnings: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    blocked: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact dict for tool responses."""
+        summary: Dict[str, Any] = {
+            mint: [
+                {"type": w.get("type"), "severity": w.get("severity")} for w in warnings
+            ]
+            for mint, warnings in self.warnings.items()
+            if warnings
+        }
+        if self.blocked:
+            summary["blocked"] = self.blocked
+        if self.error:
+            summary["error"] = self.error
+        return summary
+
+
+class ShieldCache:
+    """
+    TTL cache of Shield warnings per mint with micro-batched lookups.
+
+    Lookups for uncached mints are queued; the queue is flushed as one
+    `/shield` request after `batch_window` seconds or as soon as it holds
+    `max_batch` mints. Failed requests are not cached.
+
+    Example:
+        cache = get_shield_cache(api_key)
+        warnings = await cache.get_warnings(ultra, [mint_a, mint_b])
+    """
+
+    def __init__(
+        self,
+        ttl: float = SHIELD_CACHE_TTL,
+        negative_ttl: float = SHIELD_NEGATIVE_TTL,
+        batch_window: float = SHIELD_BATCH_WINDOW,
+        max_batch: int = SHIELD_MAX_BATCH,
+        max_entries: int = SHIELD_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize the Shield cache.
+
+        Args:
+            ttl: Seconds mints with warnings are served from cache
+            negative_ttl: Seconds mints without warnings are served from cache
+            batch_window: Seconds to collect mints before calling /shield
+            max_batch: Maximum mints per /shield request
+            max_entries: Maximum cached mints (oldest evicted first)
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._pending_client: Optional[JupiterUltra] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    def clear(self) -> None:
+        """Drop all cached verdicts."""
+        self._entries.clear()
+
+    def cached(self, mint: str) -> Optional[List[Dict[str, Any]]]:
+        """Cached warnings for a mint, or None if missing or expired."""
+        entry = self._entries.get(mint)
+        if entry is None:
+            return None
+        fetched_at, warnings = entry
+        ttl = self.ttl if warnings else self.negative_ttl
+        if monotonic() - fetched_at >= ttl:
+            del self._entries[mint]
+            return None
+        return warnings
+
+    def _store(self, mint: str, warnings: List[Dict[str, Any]]) -> None:
+        self._entries.pop(mint, None)
+        self._entries[mint] = (monotonic(), warnings)
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        client, self._pending_client = self._pending_client, None
+        if batch:
+            self._inflight.update(batch)
+            task = asyncio.ensure_future(self._run_batch(client, batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(
+        self, ultra: JupiterUltra, batch: Dict[str, asyncio.Future]
+    ) -> None:
+        try:
+            data = await ultra.get_shield(list(batch))
+            warnings = data.get("warnings") or {}
+            for mint, future in batch.items():
+                mint_warnings = warnings.get(mint) or []
+                self._store(mint, mint_warnings)
+                if not future.done():
+                    future.set_result(mint_warnings)
+        except Exception as e:
+            logger.debug(f"Shield batch of {len(batch)} mints failed: {e}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for mint, future in batch.items():
+                if self._inflight.get(mint) is future:
+                    del self._inflight[mint]
+
+    async def get_warnings(
+        self, ultra: JupiterUltra, mints: Iterable[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get Shield warnings for mints, batching uncached lookups.
+
+        Args:
+            ultra: Jupiter Ultra client used if this call starts a batch
+            mints: Token mint addresses
+
+        Returns:
+            Dict of mint -> list of warnings (empty when the mint is clean)
+        """
+        loop = asyncio.get_running_loop()
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        for mint in dict.fromkeys(mints):
+            cached = self.cached(mint)
+            if cached is not None:
+                result[mint] = cached
+                continue
+            future = self._inflight.get(mint) or self._pending.get(mint)
+            if future is None:
+                future = loop.create_future()
+                self._pending[mint] = future
+                if self._pending_client is None:
+                    self._pending_client = ultra
+                if len(self._pending) >= self.max_batch:
+                    self._flush()
+                elif self._flush_handle is None:
+                    self._flush_handle = loop.call_later(self.batch_window, self._flush)
+            waiting[mint] = future
+
+        if waiting:
+            values = await asyncio.gather(
+                *(asyncio.shield(future) for future in waiting.values())
+            )
+            result.update(zip(waiting, values))
+        return result
+
+
+async def pre_trade_check(
+    cache: ShieldCache,
+    ultra: JupiterUltra,
+    mints: Iterable[str],
+    block_severities: Iterable[str] = SHIELD_BLOCK_SEVERITIES,
+) -> ShieldVerdict:
+    """
+    Check swap mints against Shield without failing the trade on errors.
+
+    Meant to run concurrently with the order fetch. Shield outages are
+    reported in `error` rather than raised so they never block a swap.
+
+    Args:
+        cache: Shield cache to read through
+        ultra: Jupiter Ultra client for cache misses
+        mints: Mints involved in the trade
+        block_severities: Warning severities that should block the trade
+
+    Returns:
+        ShieldVerdict with warnings per mint and mints that should block
+    """
+    try:
+        warnings = await cache.get_warnings(ultra, mints)
+    except Exception as e:
+        logger.warning(f"Shield pre-trade check failed: {e}")
+        return ShieldVerdict(error=str(e))
+    severities = set(block_severities)
+    blocked = [
+        mint
+        for mint, mint_warnings in warnings.items()
+        if any(w.get("severity") in severities for w in mint_warnings)
+    ]
+    return ShieldVerdict(warnings=warnings, blocked=blocked)
+
+
+_SHIELD_CACHES: Dict[str, ShieldCache] = {}
+
+
+def get_shield_cache(api_key: Optional[str]) -> ShieldCache:
+    """Get the Shield cache shared by all tools using a Jupiter API key."""
+    key = api_key or ""
+    cache = _SHIELD_CACHES.get(key)
+    if cache is None:
+        cache = ShieldCache()
+        _SHIELD_CACHES[key] = cache
+    return cache
+
+
+def reset_shield_caches() -> None:
+    """Drop all shared Shield caches (mainly for tests)."""
+    _SHIELD_CACHES.clear()
@@ -0,0 +1,289 @@
+"""
+Local token search index.
+
+Token search is the most frequent tool call, and most lookups are for the
+same few hundred well-known tokens. `TokenIndex` holds a periodically
+refreshed copy of Jupiter's verified token list and answers searches from
+memory:
+
+- exact mint lookups via a hashmap
+- symbol and name prefix lookups via a trie whose nodes keep their top
+  ranked tokens, so a lookup costs O(len(query))
+- simple fuzzy matching on symbols for typos
+
+Results are ranked by verification, then liquidity. Callers fall back to the
+network search when the index has no match.
+"""
+
+import asyncio
+import difflib
+import logging
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Jupiter Tokens API base URL (API key required, free tier available at portal.jup.ag)
+JUPITER_TOKENS_API = "https://api.jup.ag/tokens/v2"
+
+# Refresh the token list hourly; stale lists are refreshed in the background
+TOKEN_INDEX_REFRESH_INTERVAL = 3600.0
+
+# Results kept per trie node and returned per search
+TOKEN_INDEX_MAX_RESULTS = 20
+
+# Wait this long before retrying a failed load
+TOKEN_INDEX_RETRY_INTERVAL = 60.0
+
+# Minimum query length and similarity for fuzzy symbol matches
+FUZZY_MIN_LENGTH = 3
+FUZZY_CUTOFF = 0.75
+
+TokenFetcher = Callable[[], Awaitable[List[Dict[str, Any]]]]
+
+
+async def fetch_verified_tokens(  # pragma: no cover
+    api_key: Optional[str],
+) -> List[Dict[str, Any]]:
+    """
+    Fetch Jupiter's verified token list.
+
+    Args:
+        api_key: Jupiter API key
+
+    Returns:
+        List of tokens in the same shape as Ultra /search results
+    """
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        response = await client.get(
+            f"{JUPITER_TOKENS_API}/tag",
+            params={"query": "verified"},
+            headers={"x-api-key": api_key or ""},
+        )
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to fetch token list: {response.status_code} - {response.text}"
+            )
+
+        return response.json()
+
+
+def _rank(token: Dict[str, Any]) -> tuple:
+    """Sort key: verified tokens first, then by liquidity (descending)."""
+    return (
+        not token.get("isVerified", False),
+        -(token.get("liquidity") or 0),
+    )
+
+
+class _TrieNode:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.top: List[Dict[str, Any]] = []
+
+
+class TokenIndex:
+    """
+    In-memory token search index with periodic refresh.
+
+    Example:
+        index = get_token_index(api_key)
+        tokens = await index.lookup("USDC")  # [] on a miss
+    """
+
+    def __init__(
+        self,
+        fetch: TokenFetcher,
+        refresh_interval: float = TOKEN_INDEX_REFRESH_INTERVAL,
+        max_results: int = TOKEN_INDEX_MAX_RESULTS,
+    ):
+        """
+        Initialize an empty index.
+
+        Args:
+            fetch: Coroutine function returning the token list
+            refresh_interval: Seconds before the token list is refreshed
+            max_results: Maximum tokens returned per search
+        """
+        self.fetch = fetch
+        self.refresh_interval = refresh_interval
+        self.max_results = max_results
+        self.loaded_at: Optional[float] = None
+        self.failed_at: Optional[float] = None
+        self._by_mint: Dict[str, Dict[str, Any]] = {}
+        self._by_symbol: Dict[str, List[Dict[str, Any]]] = {}
+        self._root = _TrieNode()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._by_mint)
+
+    def build(self, tokens: List[Dict[str, Any]]) -> None:
+        """Replace the index contents with `tokens`."""
+        by_mint: Dict[str, Dict[str, Any]] = {}
+        by_symbol: Dict[str, List[Dict[str, Any]]] = {}
+        root = _TrieNode()
+
+        # Insert in rank order so every list below is already ranked
+        for token in sorted(tokens, key=_rank):
+            mint = token.get("id")
+            if not mint or mint in by_mint:
+                continue
+            by_mint[mint] = token
+            symbol = (token.get("symbol") or "").lower()
+            if symbol:
+                by_symbol.setdefault(symbol, []).append(token)
+            name = (token.get("name") or "").lower()
+            nodes = set()
+            for key in {symbol, name, *name.split()}:
+                node = root
+                for char in key:
+                    node = node.children.setdefault(char, _TrieNode())
+                    nodes.add(node)
+            for node in nodes:
+                if len(node.top) < self.max_results:
+                    node.top.append(token)
+
+        self._by_mint, self._by_symbol, self._root = by_mint, by_symbol, root
+        self.loaded_at = monotonic()
+
+    def match(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Exact mint or symbol matches only, without prefix or fuzzy results.
+
+        Args:
+            query: Mint address or symbol
+
+        Returns:
+            Ranked matching tokens (empty if nothing matched exactly)
+        """
+        query = query.strip()
+        token = self._by_mint.get(query)
+        if token is not None:
+            return [token]
+        return list(self._by_symbol.get(query.lower(), ()))[: self.max_results]
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Search the index without touching the network.
+
+        Args:
+            query: Mint address, symbol, or name (or a prefix of one)
+
+        Returns:
+            Ranked matching tokens (empty if nothing matched)
+        """
+        query = query.strip()
+        token = self._by_mint.get(query)
+        if token is not None:
+            return [token]
+
+        key = query.lower()
+        if not key:
+            return []
+        results = list(self._by_symbol.get(key, ()))
+
+        node: Optional[_TrieNode] = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                break
+        if node is not None:
+            seen = {id(t) for t in results}
+            results.extend(t for t in node.top if id(t) not in seen)
+
+        if not results and len(key) >= FUZZY_MIN_LENGTH:
+            for symbol in difflib.get_close_matches(
+                key, self._by_symbol, n=3, cutoff=FUZZY_CUTOFF
+            ):
+                results.extend(self._by_symbol[symbol])
+            results.sort(key=_rank)
+
+        return results[: self.max_results]
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the token list was loaded, or None before the first load."""
+        if self.loaded_at is None:
+            return None
+        return monotonic() - self.loaded_at
+
+    @property
+    def stale(self) -> bool:
+        """Whether the token list is missing or older than the refresh interval."""
+        return (
+            self.loaded_at is None
+            or monotonic() - self.loaded_at >= self.refresh_interval
+        )
+
+    async def refresh(self) -> None:
+        """Fetch the token list and rebuild the index."""
+        tokens = await self.fetch()
+        self.build(tokens)
+        logger.info(f"Token index refreshed with {len(self)} tokens")
+
+    async def _refresh_quietly(self) -> None:
+        try:
+            await self.refresh()
+            self.failed_at = None
+        except Exception as e:
+            self.failed_at = monotonic()
+            logger.warning(f"Token index refresh failed: {e}")
+
+    async def lookup(self, query: str, exact: bool = False) -> List[Dict[str, Any]]:
+        """
+        Search the index, loading or refreshing the token list as needed.
+
+        The first lookup waits for the initial load; later lookups on a
+        stale index are answered from the current list while a refresh
+        runs in the background. Load failures are logged, retried after
+        `TOKEN_INDEX_RETRY_INTERVAL`, and yield no results so callers fall
+        back to the network.
+
+        Args:
+            query: Mint address, symbol, or name (or a prefix of one)
+            exact: Only return exact mint or symbol matches (see `match`)
+
+        Returns:
+            Ranked matching tokens (empty on a miss)
+        """
+        idle = self._refresh_task is None or self._refresh_task.done()
+        backing_off = (
+            self.failed_at is not None
+            and monotonic() - self.failed_at < TOKEN_INDEX_RETRY_INTERVAL
+        )
+        if self.stale and idle and not backing_off:
+            self._refresh_task = asyncio.ensure_future(self._refresh_quietly())
+        if self.loaded_at is None and self._refresh_task is not None:
+            await asyncio.shield(self._refresh_task)
+        return self.match(query) if exact else self.search(query)
+
+
+_TOKEN_INDEXES: Dict[str, TokenIndex] = {}
+
+
+def get_token_index(
+    api_key: Optional[str],
+    refresh_interval: float = TOKEN_INDEX_REFRESH_INTERVAL,
+) -> TokenIndex:
+    """Get the token index shared by all tools using a Jupiter API key."""
+    key = api_key or ""
+    index = _TOKEN_INDEXES.get(key)
+    if index is None:
+        index = TokenIndex(
+            fetch=lambda: fetch_verified_tokens(api_key),
+            refresh_interval=refresh_interval,
+        )
+        _TOKEN_INDEXES[key] = index
+    index.refresh_interval = refresh_interval
+    return index
+
+
+def reset_token_indexes() -> None:
+    """Drop all shared token indexes (mainly for tests)."""
+    _TOKEN_INDEXES.clear()
@@ -0,0 +1,181 @@
+"""
+Byte-level Solana transaction editing.
+
+Transactions returned by Jupiter, DFlow and similar services only need a new
+blockhash and one or more signatures before they are sent. Rather than
+deserializing into `VersionedTransaction`, rebuilding the message and
+re-serializing at every step, `TransactionEditor` locates the signature,
+account key and blockhash offsets once and patches them in place in a
+`bytearray`. The editor (or its raw bytes) can be passed between stages and
+encoded to base64 only at the edge.
+
+Wire format (legacy and v0):
+    shortvec(num_signatures) || signatures[64 * n] || message
+    message = [0x80 | version] || header[3] || shortvec(num_keys) ||
+              account_keys[32 * num_keys] || recent_blockhash[32] || ...
+"""
+
+import base64
+from typing import Optional, Tuple, Union
+
+from solders.hash import Hash  # type: ignore
+from solders.keypair import Keypair  # type: ignore
+from solders.pubkey import Pubkey  # type: ignore
+from solders.signature import Signature  # type: ignore
+
+SIGNATURE_LENGTH = 64
+PUBKEY_LENGTH = 32
+BLOCKHASH_LENGTH = 32
+
+
+def _read_shortvec(
+    data: Union[bytes, bytearray, memoryview], offset: int
+) -> Tuple[int, int]:
+    """Decode a compact-u16 at `offset`, returning (value, next offset)."""
+    value = 0
+    for i in range(3):
+        if offset + i >= len(data):
+            raise ValueError("Truncated transaction: incomplete length prefix")
+        byte = data[offset + i]
+        value |= (byte & 0x7F) << (7 * i)
+        if not byte & 0x80:
+            return value, offset + i + 1
+    raise ValueError("Invalid transaction: length prefix too long")
+
+
+class TransactionEditor:
+    """
+    In-place editor for a serialized Solana transaction.
+
+    Example:
+        editor = TransactionEditor.from_base64(order.transaction)
+        editor.set_blockhash(fresh_blockhash)
+        editor.sign(payer_keypair)
+        send(bytes(editor))  # or editor.to_base64() for HTTP APIs
+    """
+
+    __slots__ = (
+        "data",
+        "num_signatures",
+        "message_offset",
+        "num_required_signatures",
+        "keys_offset",
+        "num_account_keys",
+        "blockhash_offset",
+        "versioned",
+    )
+
+    def __init__(self, data: Union[bytes, bytearray]):
+        """
+        Parse the offsets of a serialized transaction.
+
+        Args:
+            data: Serialized transaction (copied into a bytearray unless it
+                already is one, in which case it is edited in place)
+
+        Raises:
+            ValueError: If the bytes are not a well-formed transaction
+        """
+        self.data = data if isinstance(data, bytearray) else bytearray(data)
+        self.num_signatures, sig_offset = _read_shortvec(self.data, 0)
+        self.message_offset = sig_offset + SIGNATURE_LENGTH * self.num_signatures
+        if self.message_offset >= len(self.data):
+            raise ValueError("Truncated transaction: missing message")
+
+        offset = self.message_offset
+        self.versioned = bool(self.data[offset] & 0x80)
+        if self.versioned:
+            offset += 1
+        self.num_required_signatures = self.data[offset]
+        offset += 3  # header: required sigs, readonly signed, readonly unsigned
+
+        self.num_account_keys, self.keys_offset = _read_shortvec(self.data, offset)
+        self.blockhash_offset = self.keys_offset + PUBKEY_LENGTH * self.num_account_keys
+        if self.blockhash_offset + BLOCKHASH_LENGTH > len(self.data):
+            raise ValueError("Truncated transaction: missing blockhash")
+
+    @classmethod
+    def from_base64(cls, transaction_base64: str) -> "TransactionEditor":
+        """Decode a base64 transaction into an editor."""
+        return cls(bytearray(base64.b64decode(transaction_base64)))
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.data)
+
+    def to_base64(self) -> str:
+        """Encode the current transaction bytes as base64."""
+        return base64.b64encode(self.data).decode("utf-8")
+
+    @property
+    def message(self) -> memoryview:
+        """Zero-copy view of the message bytes (what signers sign)."""
+        return memoryview(self.data)[self.message_offset :]
+
+    @property
+    def blockhash(self) -> Hash:
+        """Current recent blockhash."""
+        start = self.blockhash_offset
+        return Hash.from_bytes(bytes(self.data[start : start + BLOCKHASH_LENGTH]))
+
+    def set_blockhash(self, blockhash: Union[str, bytes, Hash]) -> None:
+        """
+        Replace the recent blockhash in place.
+
+        Existing signatures become invalid, so callers should sign afterwards.
+
+        Args:
+            blockhash: Base58 string, 32 raw bytes, or a `Hash`
+        """
+        if isinstance(blockhash, str):
+            raw = bytes(Hash.from_string(blockhash))
+        else:
+            raw = bytes(blockhash)
+        if len(raw) != BLOCKHASH_LENGTH:
+            raise ValueError(f"Blockhash must be {BLOCKHASH_LENGTH} bytes")
+        start = self.blockhash_offset
+        self.data[start : start + BLOCKHASH_LENGTH] = raw
+
+    def signer_index(self, pubkey: Union[Pubkey, bytes]) -> Optional[int]:
+        """Index of `pubkey` among the required signers, or None."""
+        target = bytes(pubkey)
+        view = memoryview(self.data)
+        for i in range(min(self.num_required_signatures, self.num_signatures)):
+            start = self.keys_offset + PUBKEY_LENGTH * i
+            if view[start : start + PUBKEY_LENGTH] == target:
+                return i
+        return None
+
+    def signer(self, index: int) -> Pubkey:
+        """Public key of the signer at `index`."""
+        start = self.keys_offset + PUBKEY_LENGTH * index
+        return Pubkey.from_bytes(bytes(self.data[start : start + PUBKEY_LENGTH]))
+
+    def signature(self, index: int = 0) -> Signature:
+        """Signature in slot `index` (slot 0 is the transaction id)."""
+        if not 0 <= index < self.num_signatures:
+            raise IndexError(f"Signature index {index} out of range")
+        start = self.message_offset - SIGNATURE_LENGTH * (self.num_signatures - index)
+        return Signature.from_bytes(bytes(self.data[start : start + SIGNATURE_LENGTH]))
+
+    def set_signature(self, index: int, signature: bytes) -> None:
+        """Write a 64-byte signature into slot `index`."""
+        if not 0 <= index < self.num_signatures:
+            raise IndexError(f"Signature index {index} out of range")
+        raw = bytes(signature)
+        if len(raw) != SIGNATURE_LENGTH:
+            raise ValueError(f"Signature must be {SIGNATURE_LENGTH} bytes")
+        start = self.message_offset - SIGNATURE_LENGTH * (self.num_signatures - index)
+        self.data[start : start + SIGNATURE_LENGTH] = raw
+
+    def sign(self, keypair: Keypair) -> Optional[int]:
+        """
+        Sign the message with `keypair` and place the signature in its slot.
+
+        Returns:
+            The signer index used, or None if the keypair is not a signer
+        """
+        index = self.signer_index(keypair.pubkey())
+        if index is None:
+            return None
+        self.set_signature(index, bytes(keypair.sign_message(bytes(self.message))))
+        return index
@@ -1,10 +1,11 @@
 import logging
-import based58
+from typing import List, Optional
 from solana.rpc.commitment import Confirmed, Finalized
 from solders.transaction import Transaction, VersionedTransaction
+from solders.hash import Hash
 from solders.pubkey import Pubkey
 from solders.message import Message, to_bytes_versioned
-from solders.compute_budget import set_compute_unit_limit
+from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
 from solders.system_program import TransferParams, transfer
 from solders.null_signer import NullSigner
 from solders.instruction import Instruction
@@ -16,6 +17,13 @@ from spl.token.instructions import (
     create_associated_token_account,
     get_associated_token_address,
 )
+from sakit.utils.compute_units import get_compute_unit_cache
+from sakit.utils.nonce import NonceLease, nonce_instructions
+from sakit.utils.priority_fees import (
+    DEFAULT_FEE_STRATEGY,
+    DEFAULT_PRIORITY_FEE_CAP,
+    get_fee_oracle,
+)
 from sakit.utils.wallet import SolanaWalletClient
 
 LAMPORTS_PER_SOL = 10**9
@@ -50,6 +58,54 @@ class TokenTransferManager:
             # Never block transfers due to RPC/account lookup issues.
             return True
 
+    @staticmethod
+    async def _compute_unit_limit(
+        wallet: SolanaWalletClient, ixs: List[Instruction]
+    ) -> int:
+        """Compute unit limit for the instructions, simulating only for new shapes."""
+
+        async def simulate() -> Optional[int]:
+            blockhash_response = await wallet.client.get_latest_blockhash(
+                commitment=Finalized,
+            )
+            transaction = Transaction(
+                from_keypairs=[wallet.keypair],
+                message=Message(instructions=ixs, payer=wallet.pubkey),
+                recent_blockhash=blockhash_response.value.blockhash,
+            )
+            result = await wallet.client.simulate_transaction(
+                transaction, commitment=Confirmed
+            )
+            return result.value.units_consumed
+
+        return await get_compute_unit_cache().limit(ixs, simulate)
+
+    @staticmethod
+    async def _priority_fee_instruction(
+        wallet: SolanaWalletClient,
+        ixs: List[Instruction],
+        strategy: str = DEFAULT_FEE_STRATEGY,
+        cap: Optional[int] = DEFAULT_PRIORITY_FEE_CAP,
+    ) -> Instruction:
+        """Compute unit price from the shared fee oracle for the writable accounts."""
+        writable = [
+            str(meta.pubkey) for ix in ixs for meta in ix.accounts if meta.is_writable
+        ]
+        fee = await get_fee_oracle(wallet.rpc_url).get_fee(writable, strategy, cap)
+        return set_compute_unit_price(fee)
+
+    @staticmethod
+    async def _recent_blockhash(
+        wallet: SolanaWalletClient, nonce: Optional[NonceLease] = None
+    ) -> Hash:
+        """Durable nonce when one is leased, otherwise a fresh blockhash."""
+        if nonce is not None:
+            return nonce.nonce
+        blockhash_response = await wallet.client.get_latest_blockhash(
+            commitment=Finalized,
+        )
+        return blockhash_response.value.blockhash
+
     @staticmethod
     async def transfer(  # pragma: no cover
         wallet: SolanaWalletClient,
@@ -60,6 +116,9 @@ class TokenTransferManager:
         no_signer: bool = False,
         fee_percentage: float = 0.0,
         memo: str = "",
+        priority_fee_strategy: str = DEFAULT_FEE_STRATEGY,
+        priority_fee_cap: Optional[int] = DEFAULT_PRIORITY_FEE_CAP,
+        nonce: Optional[NonceLease] = None,
     ) -> Transaction:
         """
         Transfer SOL, SPL, or Token2022 tokens to a recipient.
@@ -72,6 +131,10 @@ class TokenTransferManager:
         :param no_signer: If True, doesn't sign the transaction with the wallet's keypair
         :param fee_percentage: Optional percentage of the transfer amount to be used as a fee (default 0.0 = no fees)
         :param memo: Optional memo for the transaction
+        :param priority_fee_strategy: Fee percentile used with the helius provider ("p50", "p75", "p90")
+        :param priority_fee_cap: Maximum priority fee in micro-lamports per compute unit
+        :param nonce: Optional durable nonce lease; the transaction is built on the
+            nonce instead of a recent blockhash and advances it first
         :return: Transaction object ready for submission
         """
         try:
@@ -117,12 +180,11 @@ class TokenTransferManager:
                         ixs.append(ix_fee)
 
                 if no_signer:
-                    blockhash_response = await wallet.client.get_latest_blockhash(
-                        commitment=Finalized,
+                    recent_blockhash = await TokenTransferManager._recent_blockhash(
+                        wallet, nonce
                     )
-                    recent_blockhash = blockhash_response.value.blockhash
                     msg = Message.new_with_blockhash(
-                        instructions=ixs,
+                        instructions=nonce_instructions(nonce, ixs),
                         payer=tx_payer_pubkey,
                         blockhash=recent_blockhash,
                     )
@@ -149,39 +211,23 @@ class TokenTransferManager:
                         signatures=signatures,
                     )
 
-                blockhash_response = await wallet.client.get_latest_blockhash(
-                    commitment=Finalized,
-                )
-                recent_blockhash = blockhash_response.value.blockhash
-
-                msg = Message(
-                    instructions=ixs,
-                    payer=wallet_pubkey,
-                )
-
-                transaction = Transaction(
-                    from_keypairs=[wallet_keypair],
-                    message=msg,
-                    recent_blockhash=recent_blockhash,
-                )
-
-                cu_units = (
-                    await wallet.client.simulate_transaction(
-                        transaction, commitment=Confirmed
+                cu_limit = await TokenTransferManager._compute_unit_limit(wallet, ixs)
+                compute_budget_ixs = [set_compute_unit_limit(cu_limit)]
+                if provider == "helius":
+                    compute_budget_ixs.append(
+                        await TokenTransferManager._priority_fee_instruction(
+                            wallet, ixs, priority_fee_strategy, priority_fee_cap
+                        )
                     )
-                ).value.units_consumed
-
-                compute_budget_ix = set_compute_unit_limit(int(cu_units + 100_000))
 
                 new_msg = Message(
-                    instructions=[*ixs, compute_budget_ix],
+                    instructions=[*nonce_instructions(nonce, ixs), *compute_budget_ixs],
                     payer=wallet_pubkey,
                 )
 
-                blockhash_response = await wallet.client.get_latest_blockhash(
-                    commitment=Finalized,
+                recent_blockhash = await TokenTransferManager._recent_blockhash(
+                    wallet, nonce
                 )
-                recent_blockhash = blockhash_response.value.blockhash
 
                 new_transaction = Transaction(
                     from_keypairs=[wallet_keypair],
@@ -189,20 +235,6 @@ class TokenTransferManager:
                     recent_blockhash=recent_blockhash,
                 )
 
-                if provider == "helius":
-                    encoded_transaction = based58.b58encode(
-                        bytes(new_transaction), based58.Alphabet.DEFAULT
-                    ).decode("utf-8")
-
-                    priority_fee = await wallet.get_priority_fee_estimate_helius(
-                        encoded_transaction
-                    )
-
-                    new_transaction.message.instructions.insert(
-                        0,
-                        set_compute_unit_limit(priority_fee),
-                    )
-
                 return new_transaction
 
             else:
@@ -317,12 +349,11 @@ class TokenTransferManager:
                     ixs.append(ix_memo)
 
                 if no_signer:
-                    blockhash_response = await wallet.client.get_latest_blockhash(
-                        commitment=Finalized,
+                    recent_blockhash = await TokenTransferManager._recent_blockhash(
+                        wallet, nonce
                     )
-                    recent_blockhash = blockhash_response.value.blockhash
                     msg = Message.new_with_blockhash(
-                        instructions=ixs,
+                        instructions=nonce_instructions(nonce, ixs),
                         payer=tx_payer_pubkey,
                         blockhash=recent_blockhash,
                     )
@@ -349,39 +380,23 @@ class TokenTransferManager:
                         signatures=signatures,
                     )
 
-                blockhash_response = await wallet.client.get_latest_blockhash(
-                    commitment=Finalized,
-                )
-                recent_blockhash = blockhash_response.value.blockhash
-
-                msg = Message(
-                    instructions=ixs,
-                    payer=wallet_pubkey,
-                )
-
-                transaction = Transaction(
-                    from_keypairs=[wallet_keypair],
-                    message=msg,
-                    recent_blockhash=recent_blockhash,
-                )
-
-                cu_units = (
-                    await wallet.client.simulate_transaction(
-                        transaction, commitment=Confirmed
+                cu_limit = await TokenTransferManager._compute_unit_limit(wallet, ixs)
+                compute_budget_ixs = [set_compute_unit_limit(cu_limit)]
+                if provider == "helius":
+                    compute_budget_ixs.append(
+                        await TokenTransferManager._priority_fee_instruction(
+                            wallet, ixs, priority_fee_strategy, priority_fee_cap
+                        )
                     )
-                ).value.units_consumed
-
-                compute_budget_ix = set_compute_unit_limit(int(cu_units + 100_000))
 
                 new_msg = Message(
-                    instructions=[*ixs, compute_budget_ix],
+                    instructions=[*nonce_instructions(nonce, ixs), *compute_budget_ixs],
                     payer=wallet_pubkey,
                 )
 
-                blockhash_response = await wallet.client.get_latest_blockhash(
-                    commitment=Finalized,
+                recent_blockhash = await TokenTransferManager._recent_blockhash(
+                    wallet, nonce
                 )
-                recent_blockhash = blockhash_response.value.blockhash
 
                 new_transaction = Transaction(
                     from_keypairs=[wallet_keypair],
@@ -389,19 +404,6 @@ class TokenTransferManager:
                     recent_blockhash=recent_blockhash,
                 )
 
-                if provider == "helius":
-                    encoded_transaction = based58.b58encode(
-                        bytes(new_transaction), based58.Alphabet.DEFAULT
-                    ).decode("utf-8")
-
-                    priority_fee = await wallet.get_priority_fee_estimate_helius(
-                        encoded_transaction
-                    )
-
-                    new_transaction.message.instructions.insert(
-                        0,
-                        set_compute_unit_limit(priority_fee),
-                    )
                 return new_transaction
 
         except Exception as e:
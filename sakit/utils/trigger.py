@@ -9,12 +9,14 @@ import logging
 import base64
 import time
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import httpx
 
 from solders.transaction import VersionedTransaction  # type: ignore
-from solders.message import to_bytes_versioned, MessageV0  # type: ignore
-from solders.hash import Hash  # type: ignore
+from solders.message import to_bytes_versioned  # type: ignore
+
+from sakit.utils.retry import EXECUTE_RETRY_POLICY, request_with_retry
+from sakit.utils.transaction import TransactionEditor
 
 logger = logging.getLogger(__name__)
 
@@ -295,77 +297,51 @@ class JupiterTrigger:
         """
         Execute a signed trigger order transaction.
 
+        Timeouts and gateway errors are retried under `EXECUTE_RETRY_POLICY`;
+        resubmitting the same signed transaction is idempotent.
+
         Args:
             signed_transaction: Base64 encoded signed transaction
             request_id: Request ID from create/cancel response
-            max_retries: Number of retries on 504 timeout (default 3)
+            max_retries: Number of retries on timeouts and gateway errors (default 3)
 
         Returns:
             TriggerExecuteResponse with execution result
         """
-        import asyncio
-
         payload = {
             "signedTransaction": signed_transaction,
             "requestId": request_id,
         }
 
-        last_error = None
-        for attempt in range(max_retries + 1):
-            try:
-                # Use longer timeout for execute - Jupiter waits for tx confirmation
-                async with httpx.AsyncClient(timeout=120.0) as client:
-                    response = await client.post(
-                        f"{self.base_url}/execute",
-                        json=payload,
-                        headers=self._headers,
-                    )
+        try:
+            response = await request_with_retry(
+                "POST",
+                f"{self.base_url}/execute",
+                policy=replace(EXECUTE_RETRY_POLICY, max_attempts=max_retries + 1),
+                json=payload,
+                headers=self._headers,
+            )
 
-                    # Retry on 504 Gateway Timeout
-                    if response.status_code == 504:
-                        last_error = f"504 Gateway Timeout (attempt {attempt + 1}/{max_retries + 1})"
-                        logger.warning(f"Jupiter execute timed out: {last_error}")
-                        if attempt < max_retries:
-                            await asyncio.sleep(2**attempt)  # Exponential backoff
-                            continue
-                        return TriggerExecuteResponse(
-                            success=False,
-                            error=f"Jupiter execute endpoint timed out after {max_retries + 1} attempts",
-                        )
-
-                    if response.status_code != 200:
-                        return TriggerExecuteResponse(
-                            success=False,
-                            error=f"Failed to execute trigger order: {response.status_code} - {response.text}",
-                        )
-
-                    data = response.json()
-                    status = data.get("status", "")
-
-                    return TriggerExecuteResponse(
-                        success=status.lower() == "success",
-                        status=status,
-                        signature=data.get("signature"),
-                        error=data.get("error"),
-                        code=data.get("code", 0),
-                        raw_response=data,
-                    )
-            except httpx.TimeoutException as e:
-                last_error = (
-                    f"Timeout: {str(e)} (attempt {attempt + 1}/{max_retries + 1})"
+            if response.status_code != 200:
+                return TriggerExecuteResponse(
+                    success=False,
+                    error=f"Failed to execute trigger order: {response.status_code} - {response.text}",
                 )
-                logger.warning(f"Jupiter execute request timed out: {last_error}")
-                if attempt < max_retries:
-                    await asyncio.sleep(2**attempt)
-                    continue
-            except Exception as e:
-                logger.exception("Failed to execute trigger order")
-                return TriggerExecuteResponse(success=False, error=str(e))
-
-        return TriggerExecuteResponse(
-            success=False,
-            error=last_error or "Failed after all retries",
-        )
+
+            data = response.json()
+            status = data.get("status", "")
+
+            return TriggerExecuteResponse(
+                success=status.lower() == "success",
+                status=status,
+                signature=data.get("signature"),
+                error=data.get("error"),
+                code=data.get("code", 0),
+                raw_response=data,
+            )
+        except Exception as e:
+            logger.exception("Failed to execute trigger order")
+            return TriggerExecuteResponse(success=False, error=str(e))
 
     async def get_orders(  # pragma: no cover
         self,
@@ -386,7 +362,7 @@ class JupiterTrigger:
             page: Page number for pagination (10 orders per page)
 
         Returns:
-            Orders data with pagination info
+            Orders data with pagination info (see `TriggerOrderMirror` for all pages)
         """
         params = {
             "user": user,
@@ -419,6 +395,7 @@ class JupiterTrigger:
                     "orders": data.get("orders", []),
                     "total": data.get("total", 0),
                     "page": data.get("page", 1),
+                    "total_pages": data.get("totalPages", 1),
                 }
         except Exception as e:
             logger.exception("Failed to get trigger orders")
@@ -442,30 +419,14 @@ def replace_blockhash_in_transaction(  # pragma: no cover
 
     Returns:
         Base64 encoded transaction with replaced blockhash (still unsigned)
-    """
-    transaction_bytes = base64.b64decode(transaction_base64)
-    transaction = VersionedTransaction.from_bytes(transaction_bytes)
 
-    # Get the message and replace blockhash
-    old_message = transaction.message
-
-    # Create new message with updated blockhash
-    new_message = MessageV0(
-        header=old_message.header,
-        account_keys=old_message.account_keys,
-        recent_blockhash=Hash.from_string(new_blockhash),
-        instructions=old_message.instructions,
-        address_table_lookups=old_message.address_table_lookups,
-    )
-
-    # Create new unsigned transaction with new message
-    # Use default signatures (all zeros) since it's unsigned
-    new_transaction = VersionedTransaction.populate(
-        new_message,
-        transaction.signatures,  # Keep placeholder signatures
-    )
-
-    return base64.b64encode(bytes(new_transaction)).decode("utf-8")
+    See `TransactionEditor` for editing raw bytes across several steps
+    without re-encoding in between.
+    """
+    # Patch the 32 blockhash bytes in place instead of rebuilding the message
+    editor = TransactionEditor.from_base64(transaction_base64)
+    editor.set_blockhash(new_blockhash)
+    return editor.to_base64()
 
 
 async def get_fresh_blockhash(rpc_url: str) -> dict:  # pragma: no cover
@@ -0,0 +1,253 @@
+"""
+Per-wallet mirror of active Jupiter trigger orders.
+
+`JupiterTrigger.get_orders` returns 10 orders per page and the trigger tools
+used to call it for every list, before every cancel (to check the order
+belongs to the wallet) and before every cancel_all. `TriggerOrderMirror`
+pages through a wallet's active orders once, fetching every page after the
+first concurrently, and keeps them indexed by order key for a short TTL so
+ownership checks are a dict lookup. Tools record their own successful
+creates and cancels in the mirror instead of refetching.
+"""
+
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sakit.utils.trigger import JupiterTrigger
+
+logger = logging.getLogger(__name__)
+
+# Orders also change outside our tools (fills, expiry, other clients), so
+# the TTL bounds how long the mirror can drift from Jupiter.
+TRIGGER_ORDERS_TTL = 15.0
+
+# Safety bound on pages fetched per refresh (10 orders per page); orders
+# past it are unknown to the mirror, so misses are not trusted then
+MAX_ORDER_PAGES = 50
+
+
+def order_key(order: Dict[str, Any]) -> Optional[str]:
+    """Order account public key of a Jupiter trigger order."""
+    return order.get("orderKey") or order.get("order") or order.get("orderPubkey")
+
+
+class TriggerOrderMirror:
+    """
+    Active trigger orders per wallet, indexed by order key.
+
+    Each wallet has a generation counter bumped whenever the mirror is
+    changed locally, so a fetch that started before a create or cancel
+    never overwrites the newer state.
+
+    Example:
+        mirror = get_trigger_order_mirror()
+        result = await mirror.get_orders(trigger, wallet)  # same shape as get_orders
+        if await mirror.has_order(trigger, wallet, order_pubkey):
+            ...cancel...
+            mirror.remove(wallet, order_pubkey)
+    """
+
+    def __init__(self, ttl: float = TRIGGER_ORDERS_TTL):
+        """
+        Initialize the mirror.
+
+        Args:
+            ttl: Seconds a wallet's orders are served without refetching (0 disables)
+        """
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._generations: Dict[str, int] = {}
+        self._truncated: Set[str] = set()
+
+    def clear(self) -> None:
+        """Drop all mirrored orders."""
+        self._entries.clear()
+        self._generations.clear()
+        self._truncated.clear()
+
+    def _bump(self, wallet: str) -> None:
+        self._generations[wallet] = self._generations.get(wallet, 0) + 1
+
+    def invalidate(self, wallet: str) -> None:
+        """Forget a wallet's orders so the next read refetches them."""
+        self._bump(wallet)
+        self._entries.pop(wallet, None)
+
+    async def _fetch(
+        self, trigger: JupiterTrigger, wallet: str
+    ) -> Dict[str, Dict[str, Any]]:
+        first = await trigger.get_orders(user=wallet, order_status="active")
+        if not first.get("success", False):
+            raise RuntimeError(first.get("error", "Failed to fetch orders"))
+
+        pages = [first]
+        reported_pages = int(first.get("total_pages") or 1)
+        total_pages = min(reported_pages, MAX_ORDER_PAGES)
+        if reported_pages > MAX_ORDER_PAGES:
+            logger.warning(
+                f"Wallet {wallet} has {reported_pages} pages of trigger orders; "
+                f"only the first {MAX_ORDER_PAGES} are mirrored"
+            )
+            self._truncated.add(wallet)
+        else:
+            self._truncated.discard(wallet)
+        if total_pages > 1:
+            pages.extend(
+                await asyncio.gather(
+                    *(
+                        trigger.get_orders(
+                            user=wallet, order_status="active", page=page
+                        )
+                        for page in range(2, total_pages + 1)
+                    )
+                )
+            )
+
+        orders: Dict[str, Dict[str, Any]] = {}
+        for page in pages:
+            if not page.get("success", False):
+                raise RuntimeError(page.get("error", "Failed to fetch orders"))
+            for order in page.get("orders", []):
+                key = order_key(order)
+                if key:
+                    orders[key] = order
+        return orders
+
+    async def _load(
+        self, trigger: JupiterTrigger, wallet: str, refresh: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        if not refresh and self.ttl > 0:
+            cached = self._entries.get(wallet)
+            if cached is not None and monotonic() - cached[0] < self.ttl:
+                return cached[1]
+
+        generation = self._generations.get(wallet, 0)
+        flight_key = (wallet, generation)
+        future = self._inflight.get(flight_key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(self._fetch(trigger, wallet))
+        self._inflight[flight_key] = future
+        try:
+            orders = await asyncio.shield(future)
+        finally:
+            self._inflight.pop(flight_key, None)
+        if self.ttl > 0 and self._generations.get(wallet, 0) == generation:
+            self._entries[wallet] = (monotonic(), orders)
+        return orders
+
+    async def get_orders(
+        self, trigger: JupiterTrigger, wallet: str, refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get a wallet's active orders, from the mirror when fresh.
+
+        Args:
+            trigger: Jupiter Trigger client used on a miss
+            wallet: Wallet address
+            refresh: Refetch even if the mirror is fresh
+
+        Returns:
+            Dict shaped like `JupiterTrigger.get_orders` with every page merged,
+            plus `truncated` when pages past `MAX_ORDER_PAGES` were skipped
+        """
+        try:
+            orders = await self._load(trigger, wallet, refresh)
+        except Exception as e:
+            return {"success": False, "error": str(e), "orders": []}
+        result = {
+            "success": True,
+            "orders": list(orders.values()),
+            "total": len(orders),
+        }
+        if wallet in self._truncated:
+            result["truncated"] = True
+        return result
+
+    async def has_order(
+        self, trigger: JupiterTrigger, wallet: str, key: str
+    ) -> Optional[bool]:
+        """
+        Check whether an order is one of the wallet's active orders.
+
+        A miss on mirrored orders is confirmed with one refetch, since the
+        order may have been created elsewhere since the mirror was filled.
+        A miss on a wallet with more than `MAX_ORDER_PAGES` pages is unknown.
+
+        Returns:
+            True or False, or None if the orders could not all be fetched
+        """
+        try:
+            cached = self._entries.get(wallet)
+            orders = await self._load(trigger, wallet)
+            if key in orders:
+                return True
+            if cached is not None and orders is cached[1]:
+                orders = await self._load(trigger, wallet, refresh=True)
+            if key not in orders and wallet in self._truncated:
+                return None
+            return key in orders
+        except Exception as e:
+            logger.warning(f"Could not fetch trigger orders for {wallet}: {e}")
+            return None
+
+    def add(self, wallet: str, key: str, order: Dict[str, Any]) -> None:
+        """Record an order created by this process."""
+        self._bump(wallet)
+        cached = self._entries.get(wallet)
+        if cached is not None:
+            cached[1][key] = order
+
+    def remove(self, wallet: str, *keys: str) -> None:
+        """Record orders cancelled by this process."""
+        self._bump(wallet)
+        cached = self._entries.get(wallet)
+        if cached is not None:
+            for key in keys:
+                cached[1].pop(key, None)
+
+    def remove_all(self, wallet: str) -> None:
+        """Record that every active order of a wallet was cancelled."""
+        self._bump(wallet)
+        self._entries[wallet] = (monotonic(), {})
+
+
+_MIRROR = TriggerOrderMirror()
+
+
+def get_trigger_order_mirror() -> TriggerOrderMirror:
+    """Get the process-wide trigger order mirror shared by all tools."""
+    return _MIRROR
+
+
+def reset_trigger_order_mirror() -> None:
+    """Drop all mirrored orders (mainly for tests)."""
+    _MIRROR.clear()
+
+
+def created_order(
+    order: str,
+    maker: str,
+    input_mint: str,
+    output_mint: str,
+    making_amount: str,
+    taking_amount: str,
+    expired_at: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Order record in `getTriggerOrders` shape for an order we just created."""
+    return {
+        "orderKey": order,
+        "userPubkey": maker,
+        "inputMint": input_mint,
+        "outputMint": output_mint,
+        "makingAmount": making_amount,
+        "takingAmount": taking_amount,
+        "remainingMakingAmount": making_amount,
+        "remainingTakingAmount": taking_amount,
+        "expiredAt": expired_at,
+        "status": "Open",
+    }
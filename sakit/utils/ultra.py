@@ -7,18 +7,25 @@ getting holdings, checking token security, and searching tokens.
 
 import logging
 import base64
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from time import monotonic
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, replace
 import httpx
 
 from solders.transaction import VersionedTransaction
 from solders.message import to_bytes_versioned
 
+from sakit.utils.retry import EXECUTE_RETRY_POLICY, request_with_retry
+
 logger = logging.getLogger(__name__)
 
 # Jupiter Ultra API base URL (API key required, free tier available at portal.jup.ag)
 JUPITER_ULTRA_API = "https://api.jup.ag/ultra/v1"
 
+# Quote cache defaults: quotes go stale within seconds on volatile pairs
+QUOTE_CACHE_TTL = 5.0
+QUOTE_CACHE_MAX_ENTRIES = 256
+
 
 @dataclass
 class UltraOrderResponse:
@@ -77,7 +84,7 @@ class JupiterUltra:
         input_mint: str,
         output_mint: str,
         amount: int,
-        taker: str,
+        taker: Optional[str],
         referral_account: Optional[str] = None,
         referral_fee: Optional[int] = None,
         payer: Optional[str] = None,
@@ -86,11 +93,14 @@ class JupiterUltra:
         """
         Get a swap order from Jupiter Ultra.
 
+        Without a taker, Ultra returns a quote only and skips building the
+        transaction (`transaction` is empty).
+
         Args:
             input_mint: Input token mint address
             output_mint: Output token mint address
             amount: Amount of input token (in smallest units)
-            taker: User's wallet address
+            taker: User's wallet address (None for a quote-only order)
             referral_account: Optional referral account for fees
             referral_fee: Optional referral fee in basis points (50-255)
             payer: Optional integrator payer public key for gasless transactions
@@ -106,9 +116,10 @@ class JupiterUltra:
             "inputMint": input_mint,
             "outputMint": output_mint,
             "amount": str(amount),
-            "taker": taker,
         }
 
+        if taker:
+            params["taker"] = taker
         if referral_account:
             params["referralAccount"] = referral_account
         if referral_fee is not None:
@@ -171,30 +182,31 @@ class JupiterUltra:
             "requestId": request_id,
         }
 
-        # Use longer timeout for execute - Jupiter waits for tx confirmation
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                f"{self.base_url}/execute",
-                json=payload,
-                headers=self._headers,
-            )
+        # Jupiter waits for tx confirmation; bounded by the execute deadline
+        response = await request_with_retry(
+            "POST",
+            f"{self.base_url}/execute",
+            policy=EXECUTE_RETRY_POLICY,
+            json=payload,
+            headers=self._headers,
+        )
 
-            if response.status_code != 200:  # pragma: no cover
-                raise Exception(
-                    f"Failed to execute order: {response.status_code} - {response.text}"
-                )
+        if response.status_code != 200:  # pragma: no cover
+            raise Exception(
+                f"Failed to execute order: {response.status_code} - {response.text}"
+            )
 
-            data = response.json()
+        data = response.json()
 
-            return UltraExecuteResponse(
-                status=data.get("status", ""),
-                signature=data.get("signature"),
-                input_amount_result=data.get("inputAmountResult"),
-                output_amount_result=data.get("outputAmountResult"),
-                error=data.get("error"),
-                code=data.get("code", 0),
-                raw_response=data,
-            )
+        return UltraExecuteResponse(
+            status=data.get("status", ""),
+            signature=data.get("signature"),
+            input_amount_result=data.get("inputAmountResult"),
+            output_amount_result=data.get("outputAmountResult"),
+            error=data.get("error"),
+            code=data.get("code", 0),
+            raw_response=data,
+        )
 
     async def get_holdings(self, wallet_address: str) -> Dict[str, Any]:
         """
@@ -294,6 +306,140 @@ class JupiterUltra:
             return response.json()
 
 
+class UltraQuoteCache:
+    """
+    Short-TTL cache of Ultra quotes shared across takers.
+
+    Entries are keyed by (input_mint, output_mint, amount bucket, referral
+    account, referral fee, payer). With `amount_precision` set, amounts are
+    bucketed to that many significant digits and a quote fetched for one
+    amount is scaled linearly for others in the same bucket.
+
+    Example:
+        cache = UltraQuoteCache(ttl=5.0)
+        order, age = await cache.get_quote(ultra, SOL, USDC, 1_000_000_000)
+    """
+
+    def __init__(
+        self,
+        ttl: float = QUOTE_CACHE_TTL,
+        amount_precision: int = 0,
+        max_entries: int = QUOTE_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize the quote cache.
+
+        Args:
+            ttl: Seconds a quote is served from cache (0 disables caching)
+            amount_precision: Significant digits of the amount bucket (0 = exact)
+            max_entries: Maximum cached quotes (oldest evicted first)
+        """
+        self.ttl = ttl
+        self.amount_precision = amount_precision
+        self.max_entries = max_entries
+        self._entries: Dict[tuple, Tuple[float, int, UltraOrderResponse]] = {}
+
+    def bucket(self, amount: int) -> int:
+        """Round an amount down to `amount_precision` significant digits."""
+        amount = int(amount)
+        if self.amount_precision <= 0 or amount <= 0:
+            return amount
+        scale = 10 ** max(len(str(amount)) - self.amount_precision, 0)
+        return amount // scale * scale
+
+    def clear(self) -> None:
+        """Drop all cached quotes."""
+        self._entries.clear()
+
+    @staticmethod
+    def _scale(
+        order: UltraOrderResponse, cached_in: int, amount: int
+    ) -> UltraOrderResponse:
+        if not cached_in or cached_in == amount:
+            return order
+        ratio = amount / cached_in
+        return replace(
+            order,
+            request_id="",
+            transaction="",
+            in_amount=str(amount),
+            out_amount=str(int(int(order.out_amount or 0) * amount // cached_in)),
+            in_usd_value=order.in_usd_value * ratio
+            if order.in_usd_value is not None
+            else None,
+            out_usd_value=order.out_usd_value * ratio
+            if order.out_usd_value is not None
+            else None,
+        )
+
+    async def get_quote(
+        self,
+        ultra: JupiterUltra,
+        input_mint: str,
+        output_mint: str,
+        amount: int,
+        taker: Optional[str] = None,
+        referral_account: Optional[str] = None,
+        referral_fee: Optional[int] = None,
+        payer: Optional[str] = None,
+    ) -> Tuple[UltraOrderResponse, float]:
+        """
+        Get a quote, serving a fresh cached entry when one exists.
+
+        Orders are requested without a taker (quote only) unless an
+        integrator payer is set, since gasless orders need the taker as
+        close authority. Such orders are specific to the taker (gasless
+        eligibility, close authority), so the taker is then part of the
+        cache key.
+
+        Args:
+            ultra: Jupiter Ultra client used on a cache miss
+            input_mint: Input token mint address
+            output_mint: Output token mint address
+            amount: Amount of input token (in smallest units)
+            taker: User's wallet address (only sent with a payer)
+            referral_account: Optional referral account for fees
+            referral_fee: Optional referral fee in basis points
+            payer: Optional integrator payer public key
+
+        Returns:
+            Tuple of (order, age in seconds of the quote)
+        """
+        taker = taker if payer else None
+        key = (
+            input_mint,
+            output_mint,
+            self.bucket(amount),
+            referral_account,
+            referral_fee,
+            payer,
+            taker,
+        )
+        now = monotonic()
+        cached = self._entries.get(key)
+        if cached and now - cached[0] < self.ttl:
+            fetched_at, cached_in, order = cached
+            return self._scale(order, cached_in, int(amount)), now - fetched_at
+
+        order = await ultra.get_order(
+            input_mint=input_mint,
+            output_mint=output_mint,
+            amount=amount,
+            taker=taker,
+            referral_account=referral_account,
+            referral_fee=referral_fee,
+            payer=payer,
+            close_authority=taker if payer else None,
+        )
+
+        if self.ttl > 0:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (monotonic(), int(amount), order)
+        return order, 0.0
+
+
 def sign_ultra_transaction(
     transaction_base64: str,
     sign_message_func,
@@ -0,0 +1,316 @@
+"""
+Portfolio valuation utility functions.
+
+Values many wallets at once by combining Jupiter Ultra holdings with Birdeye
+`multi_price`. Holdings are fetched concurrently, the unique mints across all
+wallets are priced once in chunked batch calls (with a short price cache), and
+totals are computed with Decimal precision, so the number of price lookups
+grows with the number of unique mints rather than wallets x tokens.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from time import monotonic
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from sakit.token_math import smallest_units_to_human
+from sakit.utils.birdeye import BIRDEYE_API, get_rate_limiter
+from sakit.utils.ultra import JupiterUltra
+
+logger = logging.getLogger(__name__)
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+SOL_DECIMALS = 9
+
+# Birdeye accepts up to 100 addresses per multi_price call
+PRICE_BATCH_SIZE = 100
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PRICE_TTL = 30.0
+
+
+@dataclass
+class WalletValuation:
+    """USD valuation of a single wallet."""
+
+    wallet: str
+    total_usd: Decimal = Decimal(0)
+    balances: Dict[str, Decimal] = field(default_factory=dict)  # mint -> ui amount
+    values: Dict[str, Decimal] = field(default_factory=dict)  # mint -> USD value
+    unpriced: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize with Decimals as strings."""
+        return {
+            "wallet": self.wallet,
+            "total_usd": str(self.total_usd),
+            "positions": [
+                {
+                    "mint": mint,
+                    "amount": str(amount),
+                    "value_usd": str(self.values[mint])
+                    if mint in self.values
+                    else None,
+                }
+                for mint, amount in self.balances.items()
+            ],
+            "unpriced": self.unpriced,
+            "error": self.error,
+        }
+
+
+@dataclass
+class PortfolioValuation:
+    """USD valuation of a set of wallets."""
+
+    wallets: List[WalletValuation]
+    total_usd: Decimal
+    prices: Dict[str, Decimal]
+    unpriced: List[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize with Decimals as strings."""
+        return {
+            "total_usd": str(self.total_usd),
+            "wallets": [wallet.to_dict() for wallet in self.wallets],
+            "prices": {mint: str(price) for mint, price in self.prices.items()},
+            "unique_mints": len(self.prices) + len(self.unpriced),
+            "unpriced": self.unpriced,
+        }
+
+
+def parse_holdings(holdings: Dict[str, Any]) -> Dict[str, Decimal]:
+    """
+    Extract per-mint ui balances from a Jupiter Ultra holdings response.
+
+    Native SOL (`amount` in lamports) is reported under the wrapped SOL mint
+    and added to any wSOL token accounts. Balances are summed across token
+    accounts of the same mint; zero balances are dropped.
+
+    Args:
+        holdings: Response from `JupiterUltra.get_holdings`
+
+    Returns:
+        Mapping of mint address to human-readable Decimal balance
+    """
+    balances: Dict[str, Decimal] = {}
+
+    def add(mint: str, amount: Any, decimals: Any) -> None:
+        if amount in (None, "") or decimals is None:
+            return
+        try:
+            value = Decimal(smallest_units_to_human(str(amount), int(decimals)))
+        except (ValueError, TypeError):
+            logger.warning(f"Skipping unparseable balance for {mint}: {amount}")
+            return
+        if value:
+            balances[mint] = balances.get(mint, Decimal(0)) + value
+
+    add(SOL_MINT, holdings.get("amount"), SOL_DECIMALS)
+
+    tokens = holdings.get("tokens") or {}
+    for mint, accounts in tokens.items():
+        for account in accounts or []:
+            add(mint, account.get("amount"), account.get("decimals"))
+
+    return balances
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class PortfolioValuer:
+    """
+    Batch wallet valuation with a shared price cache.
+
+    Example:
+        valuer = PortfolioValuer(jupiter_api_key="...", birdeye_api_key="...")
+        result = await valuer.value_wallets(["wallet1", "wallet2"])
+        result.total_usd
+    """
+
+    def __init__(
+        self,
+        jupiter_api_key: str,
+        birdeye_api_key: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        batch_size: int = PRICE_BATCH_SIZE,
+        price_ttl: float = DEFAULT_PRICE_TTL,
+        chain: str = "solana",
+    ):
+        """
+        Initialize the valuer.
+
+        Args:
+            jupiter_api_key: Jupiter API key used for holdings
+            birdeye_api_key: Birdeye API key used for prices
+            concurrency: Maximum in-flight holdings or price requests
+            batch_size: Mints per `multi_price` call (Birdeye max is 100)
+            price_ttl: Seconds a fetched price is reused (0 disables the cache)
+            chain: Birdeye chain for price lookups
+        """
+        self.ultra = JupiterUltra(api_key=jupiter_api_key)
+        self.birdeye_api_key = birdeye_api_key
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, min(batch_size, PRICE_BATCH_SIZE))
+        self.price_ttl = price_ttl
+        self.chain = chain
+        self._prices: Dict[str, Tuple[float, Optional[Decimal]]] = {}
+
+    def clear_cache(self) -> None:
+        """Drop all cached prices."""
+        self._prices.clear()
+
+    async def _fetch_price_batch(
+        self, client: httpx.AsyncClient, mints: List[str]
+    ) -> Dict[str, Optional[Decimal]]:
+        endpoint = "/defi/multi_price"
+        response = await get_rate_limiter(self.birdeye_api_key).request(
+            client,
+            "GET",
+            f"{BIRDEYE_API}{endpoint}",
+            endpoint,
+            params={"list_address": ",".join(mints)},
+            headers={
+                "X-API-KEY": self.birdeye_api_key,
+                "x-chain": self.chain,
+                "accept": "application/json",
+            },
+        )
+        if response.status_code != 200:
+            raise Exception(
+                f"Failed to get prices: {response.status_code} - {response.text}"
+            )
+
+        data = response.json().get("data") or {}
+        prices: Dict[str, Optional[Decimal]] = {}
+        for mint in mints:
+            entry = data.get(mint) or {}
+            value = entry.get("value")
+            try:
+                prices[mint] = Decimal(str(value)) if value is not None else None
+            except InvalidOperation:
+                prices[mint] = None
+        return prices
+
+    async def get_prices(self, mints: Iterable[str]) -> Dict[str, Decimal]:
+        """
+        Price unique mints in batched `multi_price` calls.
+
+        Cached prices younger than `price_ttl` are reused; only the remaining
+        mints are requested, `batch_size` at a time with at most `concurrency`
+        batches in flight. Mints without a price (or in a failed batch) are
+        left out of the result.
+
+        Args:
+            mints: Mint addresses (duplicates are ignored)
+
+        Returns:
+            Mapping of mint address to USD price
+        """
+        now = monotonic()
+        prices: Dict[str, Decimal] = {}
+        missing: List[str] = []
+        for mint in dict.fromkeys(mints):
+            cached = self._prices.get(mint)
+            if cached and cached[0] > now:
+                if cached[1] is not None:
+                    prices[mint] = cached[1]
+            else:
+                missing.append(mint)
+
+        if not missing:
+            return prices
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(
+            client: httpx.AsyncClient, chunk: List[str]
+        ) -> Dict[str, Optional[Decimal]]:
+            async with semaphore:
+                try:
+                    return await self._fetch_price_batch(client, chunk)
+                except Exception as e:
+                    logger.warning(f"Price batch of {len(chunk)} mints failed: {e}")
+                    return {}
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            batches = await asyncio.gather(
+                *(fetch(client, chunk) for chunk in _chunks(missing, self.batch_size))
+            )
+
+        expires = monotonic() + self.price_ttl
+        for batch in batches:
+            for mint, price in batch.items():
+                if self.price_ttl > 0:
+                    self._prices[mint] = (expires, price)
+                if price is not None:
+                    prices[mint] = price
+        return prices
+
+    async def get_balances(
+        self, wallets: Iterable[str]
+    ) -> List[Tuple[str, Dict[str, Decimal], Optional[str]]]:
+        """
+        Fetch holdings for each wallet with at most `concurrency` in flight.
+
+        Returns:
+            List of (wallet, balances, error) in input order
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(
+            wallet: str,
+        ) -> Tuple[str, Dict[str, Decimal], Optional[str]]:
+            async with semaphore:
+                try:
+                    holdings = await self.ultra.get_holdings(wallet)
+                    return wallet, parse_holdings(holdings), None
+                except Exception as e:
+                    logger.warning(f"Failed to get holdings for {wallet}: {e}")
+                    return wallet, {}, str(e)
+
+        return await asyncio.gather(*(fetch(wallet) for wallet in wallets))
+
+    async def value_wallets(self, wallets: Iterable[str]) -> PortfolioValuation:
+        """
+        Value a set of wallets in USD.
+
+        Args:
+            wallets: Wallet addresses (duplicates are valued once)
+
+        Returns:
+            PortfolioValuation with per-wallet positions and the grand total
+        """
+        results = await self.get_balances(dict.fromkeys(wallets))
+
+        mints = dict.fromkeys(mint for _, balances, _ in results for mint in balances)
+        prices = await self.get_prices(mints)
+
+        valuations: List[WalletValuation] = []
+        total = Decimal(0)
+        for wallet, balances, error in results:
+            valuation = WalletValuation(wallet=wallet, balances=balances, error=error)
+            for mint, amount in balances.items():
+                price = prices.get(mint)
+                if price is None:
+                    valuation.unpriced.append(mint)
+                    continue
+                value = amount * price
+                valuation.values[mint] = value
+                valuation.total_usd += value
+            total += valuation.total_usd
+            valuations.append(valuation)
+
+        return PortfolioValuation(
+            wallets=valuations,
+            total_usd=total,
+            prices=prices,
+            unpriced=[mint for mint in mints if mint not in prices],
+        )
@@ -1,6 +1,6 @@
-from typing import Dict, List, Optional
+import asyncio
+from typing import Dict, List, Optional, Tuple
 import httpx
-import nacl.signing
 import logging
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed
@@ -11,9 +11,21 @@ from solders.keypair import Keypair
 from solders.message import Message
 from solders.signature import Signature
 from solders.pubkey import Pubkey
+from sakit.utils.broadcast import TransactionBroadcaster
+from sakit.utils.confirmation import (
+    CONFIRM_TIMEOUT,
+    get_blockhash_cache,
+    get_confirmation_tracker,
+)
+from sakit.utils.keyring import load_keypair
 
 logger = logging.getLogger(__name__)
 
+# Re-signs on a new blockhash when a send would duplicate one in flight
+# (a new blockhash appears every slot, ~400ms)
+DUPLICATE_RESIGN_ATTEMPTS = 4
+DUPLICATE_RESIGN_DELAY = 0.4
+
 
 def sanitize_privy_user_id(user_id: Optional[str]) -> Optional[str]:
     """
@@ -72,7 +84,6 @@ class SolanaWalletClient:
         pubkey: Optional[str] = None,
         fee_payer: Optional[str] = None,
     ):
-        self.client = AsyncClient(rpc_url)
         self.rpc_url = rpc_url
         self.keypair = keypair
         self.pubkey = pubkey
@@ -82,43 +93,77 @@ class SolanaWalletClient:
         elif keypair:
             self.pubkey = keypair.pubkey()
         if fee_payer:  # pragma: no cover
-            self.fee_payer = Keypair.from_base58_string(fee_payer)
+            self.fee_payer = load_keypair(fee_payer)
 
-    def sign_message(self, message: bytes) -> Signature:  # pragma: no cover
-        signed = nacl.signing.SigningKey(self.keypair.secret()).sign(message)
-        return Signature.from_bytes(signed.signature)
+    @property
+    def client(self) -> AsyncClient:
+        """Pooled RPC client for this wallet's URL on the running event loop."""
+        return get_rpc_client(self.rpc_url)
 
-    def send_transaction(
-        self, transaction: SolanaTransaction
-    ) -> Dict[str, str]:  # pragma: no cover
-        recent_blockhash = self.client.get_latest_blockhash().value.blockhash
-        payer = self.keypair.pubkey()
+    def sign_message(self, message: bytes) -> Signature:
+        # The keypair keeps its expanded signing key; no per-call key setup
+        return self.keypair.sign_message(message)
 
-        ixs = []
-        for instruction in transaction.instructions:
-            ixs.append(instruction)
+    async def send_transaction(
+        self,
+        transaction: SolanaTransaction,
+        confirm_timeout: float = CONFIRM_TIMEOUT,
+    ) -> Dict[str, str]:
+        """
+        Sign and send a transaction, then wait for it to confirm.
+
+        The blockhash comes from the shared cache and confirmation from the
+        shared tracker of the pooled RPC client, so many transactions from
+        one or more wallets can be in flight at once without each paying its
+        own blockhash fetch or polling loop. A transaction identical to one
+        sent recently (same instructions on the same cached blockhash) is
+        re-signed on a new blockhash rather than sent as a duplicate.
+
+        Args:
+            transaction: Instructions and extra signers; the wallet keypair
+                pays and signs
+            confirm_timeout: Max seconds to wait for confirmation
+
+        Returns:
+            Dict with the transaction 'hash'
+
+        Raises:
+            RuntimeError: If the transaction failed on chain or expired
+            asyncio.TimeoutError: If it did not confirm in time
+        """
+        client = self.client
+        blockhash_cache = get_blockhash_cache(client)
+        tracker = get_confirmation_tracker(client)
 
         signers = [self.keypair]
         if transaction.accounts_to_sign:
             signers.extend(transaction.accounts_to_sign)
 
-        message = Message(
-            instructions=ixs,
-            recent_blockhash=recent_blockhash,
-            payer=payer,
-        )
-        tx = Transaction(
-            from_keypairs=signers,
-            message=message,
-            recent_blockhash=recent_blockhash,
-        )
-        result = self.client.send_transaction(
-            tx,
+        for _ in range(DUPLICATE_RESIGN_ATTEMPTS):
+            blockhash, last_valid_block_height = await blockhash_cache.get()
+            message = Message.new_with_blockhash(
+                transaction.instructions, self.keypair.pubkey(), blockhash
+            )
+            tx = Transaction(signers, message, blockhash)
+            if tracker.claim(tx.signatures[0]):
+                break
+            # An identical transaction was already sent on this blockhash;
+            # the RPC would drop this one as a duplicate, so re-sign
+            logger.info("Identical transaction already sent; re-signing")
+            blockhash_cache.invalidate()
+            await asyncio.sleep(DUPLICATE_RESIGN_DELAY)
+        else:
+            raise RuntimeError(
+                "An identical transaction was just sent; no new blockhash yet"
+            )
+
+        result = await client.send_raw_transaction(
+            bytes(tx),
             opts=TxOpts(
                 skip_preflight=False, max_retries=10, preflight_commitment=Confirmed
             ),
         )
-        self.client.confirm_transaction(result.value, commitment=Confirmed)
+        await tracker.wait(result.value, last_valid_block_height, confirm_timeout)
         return {"hash": str(result.value)}
 
     async def get_priority_fee_estimate_helius(  # pragma: no cover
@@ -151,6 +196,48 @@ class SolanaWalletClient:
             return int(result["result"]["priorityFeeEstimate"])
 
 
+_RPC_CLIENTS: Dict[Tuple[str, asyncio.AbstractEventLoop], AsyncClient] = {}
+
+
+def _drop_closed_loop_clients() -> None:
+    # A closed loop's connections cannot be closed any more; drop the clients
+    # so they are garbage collected instead of pinned by the pool
+    for key in [key for key in _RPC_CLIENTS if key[1].is_closed()]:
+        del _RPC_CLIENTS[key]
+
+
+def get_rpc_client(rpc_url: str) -> AsyncClient:
+    """
+    Get the pooled RPC client for a URL.
+
+    Clients are kept open and shared per URL so repeated sends reuse their
+    HTTP connections instead of paying a new TCP/TLS handshake each time.
+    A client is bound to the event loop that created it, so clients are
+    pooled per (URL, loop); clients of loops that have since closed are
+    dropped when a new client is created.
+
+    Args:
+        rpc_url: The RPC endpoint URL
+
+    Returns:
+        A shared AsyncClient (do not close it; see `close_rpc_clients`)
+    """
+    key = (rpc_url, asyncio.get_running_loop())
+    client = _RPC_CLIENTS.get(key)
+    if client is None:
+        _drop_closed_loop_clients()
+        client = _RPC_CLIENTS[key] = AsyncClient(rpc_url)
+    return client
+
+
+async def close_rpc_clients() -> None:
+    """Close pooled RPC clients created on the running loop and remove them."""
+    loop = asyncio.get_running_loop()
+    _drop_closed_loop_clients()
+    for key in [key for key in _RPC_CLIENTS if key[1] is loop]:
+        await _RPC_CLIENTS.pop(key).close()
+
+
 async def send_raw_transaction_with_priority(  # pragma: no cover
     rpc_url: str,
     tx_bytes: bytes,
@@ -158,109 +245,146 @@ async def send_raw_transaction_with_priority(  # pragma: no cover
     max_retries: int = 5,
     confirm_timeout: float = 30.0,
     skip_confirmation: bool = False,
+    broadcast_urls: Optional[List[str]] = None,
+    last_valid_block_height: Optional[int] = None,
 ) -> Dict[str, any]:
     """
-    Send a raw transaction to Solana RPC, with Helius priority fee logging if applicable.
+    Send a raw transaction to Solana RPC using a pooled client.
 
     This is the standard way to send pre-signed transactions (e.g., from DFlow, Jupiter)
-    through Helius or any Solana RPC endpoint.
+    through Helius or any Solana RPC endpoint. The transaction is already
+    signed with its priority fee, so it is sent immediately without a fee
+    estimate round trip.
 
     Args:
-        rpc_url: The RPC endpoint URL (Helius recommended for priority fees)
+        rpc_url: The RPC endpoint URL (Helius recommended)
         tx_bytes: The serialized signed transaction bytes
         skip_preflight: Skip preflight simulation (default True for pre-signed txs)
         max_retries: Number of retries for the RPC call
         confirm_timeout: Max seconds to wait for confirmation (default 30s)
         skip_confirmation: Skip waiting for confirmation entirely (default False)
+        broadcast_urls: Extra RPC endpoints; when set, the transaction is
+            broadcast to `rpc_url` and these concurrently until it lands or
+            `confirm_timeout` passes
+        last_valid_block_height: Blockhash expiry, used to stop rebroadcasting
 
     Returns:
         Dict with 'success' and 'signature' on success, or 'error' on failure.
+        Broadcasts also include 'landed_on', the endpoint that confirmed first.
     """
-    import asyncio
-
-    try:
-        client = AsyncClient(rpc_url)
+    if broadcast_urls:
         try:
-            # Get priority fee estimate if using Helius (for logging)
-            if "helius" in rpc_url.lower():
-                try:
-                    import base64
-
-                    tx_base64 = base64.b64encode(tx_bytes).decode("utf-8")
-                    async with httpx.AsyncClient() as http_client:
-                        payload = {
-                            "jsonrpc": "2.0",
-                            "id": "1",
-                            "method": "getPriorityFeeEstimate",
-                            "params": [
-                                {
-                                    "transaction": tx_base64,
-                                    "options": {"recommended": True},
-                                }
-                            ],
-                        }
-                        response = await http_client.post(rpc_url, json=payload)
-                        if response.status_code == 200:
-                            result = response.json()
-                            if "result" in result:
-                                priority_fee = result["result"].get(
-                                    "priorityFeeEstimate", 0
-                                )
-                                logger.info(
-                                    f"Helius priority fee estimate: {priority_fee}"
-                                )
-                except Exception as fee_error:
-                    logger.debug(f"Could not get priority fee estimate: {fee_error}")
-
-            # Send the transaction
-            logger.info(f"Sending transaction with skip_preflight={skip_preflight}")
-            result = await client.send_raw_transaction(
-                tx_bytes,
-                opts=TxOpts(
-                    skip_preflight=skip_preflight,
-                    preflight_commitment=Confirmed,
-                    max_retries=max_retries,
-                ),
+            broadcaster = TransactionBroadcaster(
+                [rpc_url, *broadcast_urls], timeout=confirm_timeout
             )
-
-            signature = str(result.value)
-            logger.info(f"Transaction sent: {signature}")
-
-            # Skip confirmation if requested (useful for pre-signed txs with external blockhashes)
-            if skip_confirmation:
-                return {"success": True, "signature": signature}
-
-            # Confirm the transaction with timeout
-            try:
-                confirmation = await asyncio.wait_for(
-                    client.confirm_transaction(
-                        result.value,
-                        commitment=Confirmed,
-                        sleep_seconds=0.5,
-                        last_valid_block_height=None,
-                    ),
-                    timeout=confirm_timeout,
-                )
-                if confirmation.value and confirmation.value[0].err:
-                    return {
-                        "success": False,
-                        "error": f"Transaction failed: {confirmation.value[0].err}",
-                    }
-            except asyncio.TimeoutError:
+            result = await broadcaster.broadcast(
+                tx_bytes, last_valid_block_height, confirm=not skip_confirmation
+            )
+            if result.timed_out:
                 logger.warning(
                     f"Transaction confirmation timed out after {confirm_timeout}s. "
-                    f"Transaction may still land. Signature: {signature}"
+                    f"Transaction may still land. Signature: {result.signature}"
                 )
-                # Return success anyway - tx was sent, just not confirmed in time
-            except Exception as confirm_error:
-                logger.debug(f"Could not confirm transaction: {confirm_error}")
-                # Still return success since transaction was sent
+                # Same as a single-RPC send: the tx was sent, just not confirmed
+                result.success, result.error = True, None
+            return result.to_dict()
+        except Exception as e:
+            logger.error(f"Error broadcasting transaction: {e}")
+            return {"success": False, "error": str(e)}
 
+    try:
+        client = get_rpc_client(rpc_url)
+
+        # Send the transaction
+        logger.info(f"Sending transaction with skip_preflight={skip_preflight}")
+        result = await client.send_raw_transaction(
+            tx_bytes,
+            opts=TxOpts(
+                skip_preflight=skip_preflight,
+                preflight_commitment=Confirmed,
+                max_retries=max_retries,
+            ),
+        )
+
+        signature = str(result.value)
+        logger.info(f"Transaction sent: {signature}")
+
+        # Skip confirmation if requested (useful for pre-signed txs with external blockhashes)
+        if skip_confirmation:
             return {"success": True, "signature": signature}
 
-        finally:
-            await client.close()
+        # Confirm the transaction with timeout
+        try:
+            confirmation = await asyncio.wait_for(
+                client.confirm_transaction(
+                    result.value,
+                    commitment=Confirmed,
+                    sleep_seconds=0.5,
+                    last_valid_block_height=None,
+                ),
+                timeout=confirm_timeout,
+            )
+            if confirmation.value and confirmation.value[0].err:
+                return {
+                    "success": False,
+                    "error": f"Transaction failed: {confirmation.value[0].err}",
+                }
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Transaction confirmation timed out after {confirm_timeout}s. "
+                f"Transaction may still land. Signature: {signature}"
+            )
+            # Return success anyway - tx was sent, just not confirmed in time
+        except Exception as confirm_error:
+            logger.debug(f"Could not confirm transaction: {confirm_error}")
+            # Still return success since transaction was sent
+
+        return {"success": True, "signature": signature}
 
     except Exception as e:
         logger.error(f"RPC error sending transaction: {e}")
         return {"success": False, "error": str(e)}
+
+
+async def confirm_signatures(
+    rpc_url: str,
+    signatures: List[str],
+    last_valid_block_height: Optional[int] = None,
+    confirm_timeout: float = CONFIRM_TIMEOUT,
+) -> List[Optional[str]]:
+    """
+    Wait for many sent transactions through the shared confirmation tracker.
+
+    All signatures are confirmed from one status poll per interval instead
+    of a polling loop each. As with `send_raw_transaction_with_priority`, a
+    transaction that does not confirm within the timeout is not treated as
+    failed, since it may still land.
+
+    Args:
+        rpc_url: The RPC endpoint URL the transactions were sent to
+        signatures: Base58 transaction signatures
+        last_valid_block_height: Blockhash expiry shared by the transactions
+        confirm_timeout: Max seconds to wait for confirmation
+
+    Returns:
+        Per signature, None if it confirmed (or timed out) or an error message
+    """
+    tracker = get_confirmation_tracker(get_rpc_client(rpc_url))
+
+    async def confirm(signature: str) -> Optional[str]:
+        try:
+            await tracker.wait(
+                Signature.from_string(signature),
+                last_valid_block_height,
+                confirm_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Transaction confirmation timed out after {confirm_timeout}s. "
+                f"Transaction may still land. Signature: {signature}"
+            )
+        except Exception as e:
+            return str(e)
+        return None
+
+    return list(await asyncio.gather(*(confirm(s) for s in signatures)))
@@ -0,0 +1,31 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from sakit.utils.jobs import reset_job_manager
+from sakit.utils.keyring import reset_keyring
+from sakit.utils.trigger_orders import reset_trigger_order_mirror
+
+
+@pytest.fixture(autouse=True)
+def _reset_keyring():
+    """Parsed keypairs are shared across tools; start every test empty."""
+    reset_keyring()
+    yield
+    reset_keyring()
+
+
+@pytest.fixture(autouse=True)
+def _reset_trigger_order_mirror():
+    """Mirrored trigger orders are shared across tools; start every test empty."""
+    reset_trigger_order_mirror()
+    yield
+    reset_trigger_order_mirror()
+
+
+@pytest.fixture(autouse=True)
+def _reset_job_manager():
+    """Background jobs are shared across tools; start every test empty."""
+    reset_job_manager()
+    yield
+    reset_job_manager()
@@ -0,0 +1,256 @@
+"""
+Tests for multi-recipient batch transfer utility.
+
+Tests bulk account prefetching, row planning, packing under size and
+compute limits, concurrent sending and the batch summary.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+from spl.token.instructions import get_associated_token_address
+
+from sakit.utils.batch_transfer import (
+    ASSOCIATED_TOKEN_PROGRAM_ID,
+    MAX_TRANSACTION_SIZE,
+    MULTIPLE_ACCOUNTS_CHUNK,
+    SOL_MINT,
+    SPL_TOKEN_PROGRAM_ID,
+    SYSTEM_PROGRAM_ID,
+    TransferRow,
+    compile_transaction,
+    fetch_accounts,
+    pack_transfers,
+    parse_rows,
+    plan_batch,
+    send_packed,
+    summarize_batch,
+    transaction_size,
+)
+
+TOKEN_PROGRAM = Pubkey.from_string(SPL_TOKEN_PROGRAM_ID)
+
+
+def _mint_account(decimals: int = 6):
+    data = bytearray(82)
+    data[44] = decimals
+    return SimpleNamespace(owner=TOKEN_PROGRAM, data=bytes(data))
+
+
+def _token_account():
+    return SimpleNamespace(owner=TOKEN_PROGRAM, data=bytes(165))
+
+
+class FakeRpc:
+    """Serves getMultipleAccounts from a dict and counts calls."""
+
+    def __init__(self, accounts=None):
+        self.accounts = accounts or {}
+        self.calls = []
+
+    async def get_multiple_accounts(self, keys):
+        self.calls.append(list(keys))
+        return MagicMock(value=[self.accounts.get(k) for k in keys])
+
+
+def _recipients(n):
+    return [str(Keypair().pubkey()) for _ in range(n)]
+
+
+class TestFetchAccounts:
+    """Test fetch_accounts."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_and_dedupes(self):
+        """Should split into getMultipleAccounts-sized chunks and skip duplicates."""
+        keys = [Keypair().pubkey() for _ in range(MULTIPLE_ACCOUNTS_CHUNK + 5)]
+        rpc = FakeRpc({keys[0]: "acct"})
+
+        accounts = await fetch_accounts(rpc, keys + keys[:3])
+
+        assert [len(c) for c in rpc.calls] == [MULTIPLE_ACCOUNTS_CHUNK, 5]
+        assert accounts[keys[0]] == "acct"
+        assert accounts[keys[1]] is None
+
+
+class TestPlanBatch:
+    """Test plan_batch."""
+
+    @pytest.mark.asyncio
+    async def test_sol_rows_and_invalid_rows(self):
+        """Should plan SOL transfers and report invalid rows without RPC calls."""
+        owner = Keypair().pubkey()
+        rows = parse_rows(
+            [
+                {"to_address": _recipients(1)[0], "amount": 0.5, "mint": SOL_MINT},
+                {"to_address": "not-an-address", "amount": 1, "mint": SOL_MINT},
+                {"to_address": _recipients(1)[0], "amount": 0, "mint": SOL_MINT},
+            ]
+        )
+        rpc = FakeRpc()
+
+        plan = await plan_batch(rpc, owner, owner, rows)
+
+        assert list(plan.groups) == [0]
+        assert set(plan.errors) == {1, 2}
+        assert rpc.calls == []
+
+    @pytest.mark.asyncio
+    async def test_token_rows_prefetch_in_two_rounds(self):
+        """Should fetch mints, then all token accounts, and create missing ATAs."""
+        owner = Keypair().pubkey()
+        mint = Keypair().pubkey()
+        has_ata, no_ata = _recipients(2)
+        rpc = FakeRpc(
+            {
+                mint: _mint_account(decimals=6),
+                get_associated_token_address(owner, mint): _token_account(),
+                get_associated_token_address(
+                    Pubkey.from_string(has_ata), mint
+                ): _token_account(),
+            }
+        )
+        rows = [
+            TransferRow(has_ata, 1.5, str(mint)),
+            TransferRow(no_ata, 2, str(mint)),
+        ]
+
+        plan = await plan_batch(rpc, owner, owner, rows)
+
+        assert len(rpc.calls) == 2
+        assert len(plan.groups[0]) == 1
+        assert [str(ix.program_id) for ix in plan.groups[1]] == [
+            ASSOCIATED_TOKEN_PROGRAM_ID,
+            SPL_TOKEN_PROGRAM_ID,
+        ]
+        # transfer_checked data: tag, u64 amount, decimals
+        assert int.from_bytes(plan.groups[0][0].data[1:9], "little") == 1_500_000
+
+    @pytest.mark.asyncio
+    async def test_token_errors(self):
+        """Should reject unknown mints and senders without a token account."""
+        owner = Keypair().pubkey()
+        mint = Keypair().pubkey()
+        rpc = FakeRpc({mint: _mint_account()})
+        rows = [
+            TransferRow(_recipients(1)[0], 1, str(mint)),
+            TransferRow(_recipients(1)[0], 1, str(Keypair().pubkey())),
+        ]
+
+        plan = await plan_batch(rpc, owner, owner, rows)
+
+        assert plan.groups == {}
+        assert "no token account" in plan.errors[0]
+        assert "Unsupported token mint" in plan.errors[1]
+
+    @pytest.mark.asyncio
+    async def test_fees_aggregate_per_transaction(self):
+        """Should charge fees with one transfer per mint per transaction."""
+        owner = Keypair().pubkey()
+        fee_payer = Keypair().pubkey()
+        rows = [TransferRow(r, 1, SOL_MINT) for r in _recipients(3)]
+
+        plan = await plan_batch(
+            FakeRpc(), owner, fee_payer, rows, fee_payer, fee_percentage=1.0
+        )
+        fee_ixs = plan.fee_instructions(fee_payer, [0, 1, 2])
+
+        assert len(fee_ixs) == 1
+        assert int.from_bytes(bytes(fee_ixs[0].data)[4:12], "little") == 3 * 10**7
+
+
+class TestPackTransfers:
+    """Test pack_transfers."""
+
+    @pytest.mark.asyncio
+    async def test_packs_under_size_limit(self):
+        """Should pack every row into transactions that fit a packet."""
+        owner = Keypair().pubkey()
+        rows = [TransferRow(r, 0.01, SOL_MINT) for r in _recipients(60)]
+        plan = await plan_batch(FakeRpc(), owner, owner, rows)
+
+        packed = pack_transfers(owner, plan, compute_unit_price=1000)
+
+        assert 1 < len(packed) < 60
+        assert sorted(r for tx in packed for r in tx.rows) == list(range(60))
+        for tx in packed:
+            size = transaction_size(owner, tx.instructions)
+            assert size <= MAX_TRANSACTION_SIZE
+            assert [str(ix.program_id) for ix in tx.instructions[:2]] == [
+                "ComputeBudget111111111111111111111111111111"
+            ] * 2
+            assert all(
+                str(ix.program_id) == SYSTEM_PROGRAM_ID for ix in tx.instructions[2:]
+            )
+
+    @pytest.mark.asyncio
+    async def test_respects_compute_budget(self):
+        """Should start a new transaction when the compute estimate is reached."""
+        owner = Keypair().pubkey()
+        rows = [TransferRow(r, 0.01, SOL_MINT) for r in _recipients(10)]
+        plan = await plan_batch(FakeRpc(), owner, owner, rows)
+
+        packed = pack_transfers(owner, plan, max_compute_units=13_000)
+
+        assert [len(tx.rows) for tx in packed] == [3, 3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_compiled_transaction_signs(self):
+        """Should compile packed instructions into a signable v0 transaction."""
+        keypair = Keypair()
+        rows = [TransferRow(r, 0.01, SOL_MINT) for r in _recipients(5)]
+        plan = await plan_batch(FakeRpc(), keypair.pubkey(), keypair.pubkey(), rows)
+        tx = pack_transfers(keypair.pubkey(), plan)[0]
+
+        message = compile_transaction(
+            keypair.pubkey(), tx.instructions, Hash.new_unique()
+        )
+        signed = VersionedTransaction(message, [keypair])
+        assert signed.verify_with_results() == [True]
+
+
+class TestSendAndSummarize:
+    """Test send_packed and summarize_batch."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_send_and_partial_summary(self):
+        """Should bound concurrency and report per-row failures."""
+        owner = Keypair().pubkey()
+        recipients = _recipients(4)
+        rows = [TransferRow(r, 0.01, SOL_MINT) for r in recipients]
+        rows.append(TransferRow("bad", 1, SOL_MINT))
+        plan = await plan_batch(FakeRpc(), owner, owner, rows)
+        packed = pack_transfers(owner, plan, max_compute_units=12_000)
+        assert len(packed) == 2
+        in_flight = 0
+        peak = 0
+
+        async def send(tx):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if 3 in tx.rows:
+                raise Exception("blockhash not found")
+            return {"success": True, "signature": f"sig{tx.rows[0]}"}
+
+        results = await send_packed(packed, send, max_concurrent=2)
+        summary = summarize_batch(rows, plan, packed, results)
+
+        assert peak <= 2
+        assert summary["status"] == "partial"
+        assert summary["transferred"] == 2
+        assert summary["failed"] == 3
+        assert [e["index"] for e in summary["errors"]] == [2, 3, 4]
+        assert summary["transactions"][0] == {
+            "status": "success",
+            "signature": "sig0",
+            "recipients": [recipients[0], recipients[1]],
+        }
@@ -4,7 +4,16 @@ import pytest
 import respx
 from httpx import Response
 
-from sakit.birdeye import BirdeyeTool
+from sakit.birdeye import ACTIONS, BIRDEYE_ACTIONS, BirdeyeAction, BirdeyeTool
+from sakit.utils.birdeye import reset_rate_limiters
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    """Give each test fresh rate limit buckets."""
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
 
 
 @pytest.fixture
@@ -922,6 +931,49 @@ class TestAPIErrors:
         assert result["success"] is False
         assert "401" in result["error"]
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_api_rate_limited_retries(self):
+        """Test 429 responses are retried and counted."""
+        t = BirdeyeTool()
+        t.configure(
+            {
+                "tools": {
+                    "birdeye": {
+                        "api_key": "test-api-key",
+                        "credit_costs": {"/defi/price": 10},
+                    }
+                }
+            }
+        )
+        respx.get("https://public-api.birdeye.so/defi/price").mock(
+            side_effect=[
+                Response(429, headers={"Retry-After": "0"}),
+                Response(200, json={"data": {"value": 150}}),
+            ]
+        )
+        result = await t.execute(action="price", address=SOL)
+        assert result["success"] is True
+        metrics = t.get_metrics()
+        assert metrics["endpoints"]["/defi/price"]["rate_limited"] == 1
+        assert metrics["totals"]["credits"] == 10
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_api_rate_limited_exhausted(self):
+        """Test 429 is reported distinctly when retries are exhausted."""
+        t = BirdeyeTool()
+        t.configure(
+            {"tools": {"birdeye": {"api_key": "test-api-key", "max_retries": 0}}}
+        )
+        respx.get("https://public-api.birdeye.so/defi/price").mock(
+            return_value=Response(429, text="Too Many Requests")
+        )
+        result = await t.execute(action="price", address=SOL)
+        assert result["success"] is False
+        assert "429" in result["error"]
+        assert "rate limited" in result["error"]
+
 
 class TestChainSupport:
     """Tests for multi-chain support."""
@@ -967,6 +1019,230 @@ class TestChainSupport:
         assert route.calls[0].request.headers["x-chain"] == "solana"
 
 
+class TestActionRegistry:
+    """Tests for the declarative action registry."""
+
+    def test_action_names_unique(self):
+        """Every action should be registered exactly once."""
+        assert len(ACTIONS) == len(BIRDEYE_ACTIONS)
+
+    def test_schema_lists_every_action(self, tool):
+        """Schema action description should be generated from the registry."""
+        description = tool.get_schema()["properties"]["action"]["description"]
+        for name in ACTIONS:
+            assert name in description
+        assert "PRICE: price, multi_price" in description
+
+    def test_required_error_messages(self):
+        """Missing required params should produce precomputed messages."""
+        assert ACTIONS["price"].validate({}) == "address is required"
+        assert (
+            ACTIONS["ohlcv_base_quote"].validate({"base_address": SOL})
+            == "base_address and quote_address are required"
+        )
+        assert ACTIONS["wallet_pnl_multiple"].validate({}) == "wallets list is required"
+        assert ACTIONS["latest_block"].validate({}) is None
+
+    def test_build_applies_defaults_and_skips_empty(self):
+        """Defaults should be sent and empty optional params dropped."""
+        params, json_data = ACTIONS["history_price"].build(
+            {"address": SOL, "time_from": 0, "time_to": 1700000000}
+        )
+        assert params == {
+            "address_type": "token",
+            "type": "1H",
+            "address": SOL,
+            "time_to": 1700000000,
+        }
+        assert json_data is None
+
+    def test_build_body_params(self):
+        """Body params should go to the JSON payload."""
+        params, json_data = ACTIONS["wallet_pnl_details"].build(
+            {"wallet": TEST_WALLET, "tokens": f"{SOL},{USDC}"}
+        )
+        assert params is None
+        assert json_data == {"wallet": TEST_WALLET, "tokens": f"{SOL},{USDC}"}
+
+    def test_build_joins_list_query_params(self):
+        """List values in the query string should be comma-joined."""
+        params, _ = ACTIONS["wallet_pnl_multiple"].build({"wallets": ["a", "b"]})
+        assert params == {"wallets": "a,b"}
+
+    def test_custom_action_error(self):
+        """Explicit error messages should be kept."""
+        spec = BirdeyeAction("x", "UTILS", "/x", required=("a",), error="need a")
+        assert spec.validate({}) == "need a"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cached_action_served_from_cache(self, tool):
+        """Actions with a cache policy should not hit the API twice."""
+        route = respx.get("https://public-api.birdeye.so/defi/networks").mock(
+            return_value=Response(200, json={"data": ["solana"]})
+        )
+        first = await tool.execute(action="networks")
+        second = await tool.execute(action="networks")
+        assert first == second
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_uncached_action_always_requests(self, tool):
+        """Actions without a cache policy should always hit the API."""
+        route = respx.get("https://public-api.birdeye.so/defi/price").mock(
+            return_value=Response(200, json={"data": {"value": 1}})
+        )
+        await tool.execute(action="price", address=SOL)
+        await tool.execute(action="price", address=SOL)
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failed_response_not_cached(self, tool):
+        """Failed responses should not be cached."""
+        route = respx.get("https://public-api.birdeye.so/defi/networks").mock(
+            side_effect=[Response(500), Response(200, json={"data": ["solana"]})]
+        )
+        first = await tool.execute(action="networks")
+        second = await tool.execute(action="networks")
+        assert first["success"] is False
+        assert second["success"] is True
+        assert route.call_count == 2
+
+
+class TestResponseProjection:
+    """Tests for fields projection and compact mode."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_fields_projection(self, tool):
+        """Should keep only requested keys."""
+        respx.get("https://public-api.birdeye.so/defi/token_overview").mock(
+            return_value=Response(
+                200,
+                json={
+                    "data": {
+                        "symbol": "SOL",
+                        "price": 150,
+                        "extensions": {"website": "https://solana.com"},
+                    }
+                },
+            )
+        )
+        result = await tool.execute(
+            action="token_overview", address=SOL, fields="symbol, price"
+        )
+        assert result["data"] == {"symbol": "SOL", "price": 150}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_compact_uses_action_fields_and_truncates(self, tool):
+        """Compact mode should apply the action's fields and truncate lists."""
+        items = [
+            {"txHash": f"tx{i}", "side": "buy", "from": {"symbol": "SOL"}}
+            for i in range(30)
+        ]
+        respx.get("https://public-api.birdeye.so/defi/txs/token").mock(
+            return_value=Response(200, json={"data": {"items": items}})
+        )
+        result = await tool.execute(action="trades_token", address=SOL, compact=True)
+        data = result["data"]
+        assert len(data["items"]) == 20
+        assert data["items_count"] == 30
+        assert data["items"][0] == {"txHash": "tx0", "side": "buy"}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_compact_without_action_fields_only_truncates(self, tool):
+        """Compact mode should keep all keys for actions without compact fields."""
+        respx.get("https://public-api.birdeye.so/defi/v3/token/meta-data/single").mock(
+            return_value=Response(200, json={"data": {"symbol": "SOL", "x": 1}})
+        )
+        result = await tool.execute(
+            action="token_metadata_single", address=SOL, compact=True
+        )
+        assert result["data"] == {"symbol": "SOL", "x": 1}
+
+    def test_projection_resolution(self):
+        """Explicit fields should take precedence over compact fields."""
+        spec = ACTIONS["token_overview"]
+        assert spec.projection() == (None, None)
+        assert spec.projection("price", False) == (frozenset({"price"}), None)
+        keys, max_items = spec.projection("", True)
+        assert "symbol" in keys
+        assert max_items == 20
+
+
+class TestStreamedResponses:
+    """Tests for incrementally decoded list responses."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_streamed_list_keeps_siblings(self, tool):
+        """Should decode the token list and keep members next to it."""
+        tokens = [{"address": f"mint{i}", "symbol": f"T{i}"} for i in range(3)]
+        respx.get("https://public-api.birdeye.so/defi/tokenlist").mock(
+            return_value=Response(
+                200,
+                json={"data": {"updateUnixTime": 1, "tokens": tokens, "total": 3}},
+            )
+        )
+        result = await tool.execute(action="token_list")
+        assert result["success"] is True
+        assert result["data"] == {"updateUnixTime": 1, "tokens": tokens, "total": 3}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_streamed_wallet_history_wildcard(self, tool):
+        """Should decode the chain-keyed wallet history list."""
+        respx.get("https://public-api.birdeye.so/v1/wallet/tx_list").mock(
+            return_value=Response(200, json={"data": {"solana": [{"txHash": "a"}]}})
+        )
+        result = await tool.execute(action="wallet_tx_list", wallet="wallet123")
+        assert result["data"] == {"solana": [{"txHash": "a"}]}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_streamed_compact_counts_skipped_items(self, tool):
+        """Should stop decoding at the compact limit and report the total."""
+        items = [{"txHash": f"tx{i}", "side": "sell", "extra": "x"} for i in range(25)]
+        respx.get("https://public-api.birdeye.so/defi/txs/token").mock(
+            return_value=Response(
+                200, json={"success": True, "data": {"items": items, "hasNext": True}}
+            )
+        )
+        result = await tool.execute(action="trades_token", address=SOL, compact=True)
+        data = result["data"]
+        assert len(data["items"]) == 20
+        assert data["items_count"] == 25
+        assert data["items"][-1] == {"txHash": "tx19", "side": "sell"}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_streamed_missing_list(self, tool):
+        """Should return the decoded siblings when the list is absent."""
+        respx.get("https://public-api.birdeye.so/defi/txs/token").mock(
+            return_value=Response(200, json={"data": {"hasNext": False}})
+        )
+        result = await tool.execute(action="trades_token", address=SOL)
+        assert result["data"] == {"hasNext": False}
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_streamed_error_response(self, tool):
+        """Should read the body of failed streamed requests."""
+        respx.get("https://public-api.birdeye.so/defi/txs/token").mock(
+            return_value=Response(500, text="boom")
+        )
+        result = await tool.execute(action="trades_token", address=SOL)
+        assert result == {
+            "success": False,
+            "error": "API error: 500",
+            "details": "boom",
+        }
+
+
 class TestBirdeyePlugin:
     """Test plugin class."""
 
@@ -0,0 +1,412 @@
+"""
+Tests for Birdeye API utility.
+
+Tests the shared BirdeyeRateLimiter: token buckets, 429 retries with
+Retry-After, endpoint classes, and credit accounting; response projection
+and the incremental JsonArrayStream decoder.
+"""
+
+import json
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+from unittest.mock import AsyncMock, patch
+
+from sakit.utils.birdeye import (
+    BIRDEYE_API,
+    DEFAULT_RATE_LIMITS,
+    BirdeyeRateLimiter,
+    JsonArrayStream,
+    TokenBucket,
+    get_rate_limiter,
+    project,
+    reset_rate_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+class TestTokenBucket:
+    """Test TokenBucket reservations and adaptation."""
+
+    def test_burst_up_to_capacity_without_wait(self):
+        """Should allow a burst of `capacity` reservations immediately."""
+        bucket = TokenBucket(rate=5.0)
+        waits = [bucket.reserve() for _ in range(5)]
+        assert all(w == 0.0 for w in waits)
+
+    def test_reservations_queue_when_empty(self):
+        """Should queue reservations beyond capacity at the bucket rate."""
+        bucket = TokenBucket(rate=2.0)
+        bucket.reserve()
+        bucket.reserve()
+        first = bucket.reserve()
+        second = bucket.reserve()
+        assert first == pytest.approx(0.5, abs=0.05)
+        assert second == pytest.approx(1.0, abs=0.05)
+
+    def test_sub_one_rate_has_capacity_of_one(self):
+        """Should always allow at least one request."""
+        bucket = TokenBucket(rate=0.5)
+        assert bucket.capacity == 1.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
+
+    def test_backoff_pauses_and_halves_rate(self):
+        """Should pause the bucket and reduce its rate."""
+        bucket = TokenBucket(rate=10.0)
+        bucket.backoff(3.0)
+        assert bucket.rate == 5.0
+        assert bucket.reserve() >= 2.9
+
+    def test_backoff_rate_floor(self):
+        """Should not reduce the rate below 1/16 of the maximum."""
+        bucket = TokenBucket(rate=16.0)
+        for _ in range(10):
+            bucket.backoff(0.0)
+        assert bucket.rate == 1.0
+
+    def test_recover_steps_back_to_max(self):
+        """Should recover the rate in steps without exceeding the maximum."""
+        bucket = TokenBucket(rate=10.0)
+        bucket.backoff(0.0)
+        bucket.recover()
+        assert bucket.rate == 6.0
+        for _ in range(10):
+            bucket.recover()
+        assert bucket.rate == 10.0
+
+
+class TestBirdeyeRateLimiterConfig:
+    """Test limiter configuration and classification."""
+
+    def test_defaults(self):
+        """Should use default rate limits and credit cost."""
+        limiter = BirdeyeRateLimiter()
+        assert limiter.rate_limits == DEFAULT_RATE_LIMITS
+        assert limiter.credit_cost("/defi/price") == 1
+
+    def test_endpoint_class(self):
+        """Should classify v1 wallet endpoints separately."""
+        limiter = BirdeyeRateLimiter()
+        assert limiter.endpoint_class("/v1/wallet/token_list") == "wallet"
+        assert limiter.endpoint_class("/defi/price") == "default"
+        assert limiter.endpoint_class("/wallet/v2/pnl/summary") == "default"
+
+    def test_endpoint_class_falls_back_when_not_configured(self):
+        """Should use the default class when a class has no configured rate."""
+        limiter = BirdeyeRateLimiter()
+        del limiter.rate_limits["wallet"]
+        assert limiter.endpoint_class("/v1/wallet/token_list") == "default"
+
+    def test_configure_overrides(self):
+        """Should merge rate limits and credit costs."""
+        limiter = BirdeyeRateLimiter()
+        limiter.configure(
+            rate_limits={"default": 50},
+            credit_costs={"/defi/token_overview": 30},
+            max_retries=1,
+        )
+        assert limiter.rate_limits["default"] == 50
+        assert limiter.rate_limits["wallet"] == DEFAULT_RATE_LIMITS["wallet"]
+        assert limiter.credit_cost("/defi/token_overview") == 30
+        assert limiter.max_retries == 1
+
+    def test_get_rate_limiter_shared_per_key(self):
+        """Should return one shared limiter per API key."""
+        a = get_rate_limiter("key-a")
+        assert get_rate_limiter("key-a") is a
+        assert get_rate_limiter("key-b") is not a
+
+    def test_get_rate_limiter_applies_settings(self):
+        """Should update the shared limiter with passed settings."""
+        limiter = get_rate_limiter("key-a")
+        get_rate_limiter("key-a", rate_limits={"default": 3})
+        assert limiter.rate_limits["default"] == 3
+
+
+class TestBirdeyeRateLimiterRequest:
+    """Test request sending, retries and metrics."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_success_records_credits(self):
+        """Should record calls and credits for successful requests."""
+        respx.get(f"{BIRDEYE_API}/defi/price").mock(
+            return_value=Response(200, json={"data": {}})
+        )
+        limiter = BirdeyeRateLimiter(credit_costs={"/defi/price": 10})
+        async with httpx.AsyncClient() as client:
+            response = await limiter.request(
+                client, "GET", f"{BIRDEYE_API}/defi/price", "/defi/price"
+            )
+        assert response.status_code == 200
+        metrics = limiter.get_metrics()
+        assert metrics["endpoints"]["/defi/price"]["calls"] == 1
+        assert metrics["endpoints"]["/defi/price"]["credits"] == 10
+        assert metrics["totals"]["credits"] == 10
+        assert metrics["rates"]["default"] == DEFAULT_RATE_LIMITS["default"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_error_not_charged(self):
+        """Should not charge credits for non-200 responses."""
+        respx.get(f"{BIRDEYE_API}/defi/price").mock(return_value=Response(500))
+        limiter = BirdeyeRateLimiter()
+        async with httpx.AsyncClient() as client:
+            response = await limiter.request(
+                client, "GET", f"{BIRDEYE_API}/defi/price", "/defi/price"
+            )
+        assert response.status_code == 500
+        assert limiter.get_metrics()["totals"] == {
+            "calls": 1,
+            "credits": 0,
+            "rate_limited": 0,
+            "retries": 0,
+        }
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retries_429_honouring_retry_after(self):
+        """Should wait for Retry-After and retry a 429."""
+        respx.get(f"{BIRDEYE_API}/defi/price").mock(
+            side_effect=[
+                Response(429, headers={"Retry-After": "2"}),
+                Response(200, json={"data": {}}),
+            ]
+        )
+        limiter = BirdeyeRateLimiter(base_delay=0.0)
+        with patch(
+            "sakit.utils.birdeye.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            async with httpx.AsyncClient() as client:
+                response = await limiter.request(
+                    client, "GET", f"{BIRDEYE_API}/defi/price", "/defi/price"
+                )
+
+        assert response.status_code == 200
+        assert 2.0 <= mock_sleep.await_args.args[0] < 2.5
+        metrics = limiter.get_metrics()["endpoints"]["/defi/price"]
+        assert metrics["calls"] == 2
+        assert metrics["rate_limited"] == 1
+        assert metrics["retries"] == 1
+        assert metrics["credits"] == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_returns_429_after_max_retries(self):
+        """Should give up and return the 429 after max_retries."""
+        route = respx.get(f"{BIRDEYE_API}/defi/price").mock(return_value=Response(429))
+        limiter = BirdeyeRateLimiter(max_retries=2)
+        with patch("sakit.utils.birdeye.asyncio.sleep", new_callable=AsyncMock):
+            async with httpx.AsyncClient() as client:
+                response = await limiter.request(
+                    client, "GET", f"{BIRDEYE_API}/defi/price", "/defi/price"
+                )
+
+        assert response.status_code == 429
+        assert route.call_count == 3
+        assert limiter.get_metrics()["totals"]["rate_limited"] == 3
+
+    def test_retry_delay_from_http_date(self):
+        """Should parse HTTP-date Retry-After values."""
+        limiter = BirdeyeRateLimiter(base_delay=0.0)
+        response = Response(
+            429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+        # Date in the past clamps to zero
+        assert limiter._retry_delay(response, 0) == 0.0
+
+    def test_retry_delay_without_header_is_exponential(self):
+        """Should back off exponentially and cap at max_delay."""
+        limiter = BirdeyeRateLimiter(base_delay=1.0, max_delay=3.0)
+        with patch("sakit.utils.birdeye.random.uniform", return_value=0.0):
+            assert limiter._retry_delay(Response(429), 0) == 1.0
+            assert limiter._retry_delay(Response(429), 1) == 2.0
+            assert limiter._retry_delay(Response(429), 5) == 3.0
+
+    def test_reset_metrics(self):
+        """Should clear recorded counters."""
+        limiter = BirdeyeRateLimiter()
+        limiter._endpoint_metrics("/defi/price")["calls"] = 3
+        limiter.reset_metrics()
+        assert limiter.get_metrics()["endpoints"] == {}
+
+
+class TestProject:
+    """Test response projection."""
+
+    def test_no_projection_returns_equal_value(self):
+        """Should keep everything when no fields or limit are given."""
+        data = {"a": 1, "items": [{"b": 2}], "nested": {"c": 3}}
+        assert project(data) == data
+
+    def test_record_keeps_only_fields(self):
+        """Should reduce a record to the requested keys."""
+        data = {"symbol": "SOL", "price": 150, "extensions": {"website": "x"}}
+        assert project(data, frozenset({"symbol", "price"})) == {
+            "symbol": "SOL",
+            "price": 150,
+        }
+
+    def test_fields_applied_to_list_records(self):
+        """Should keep containers and project each list record."""
+        data = {
+            "hasNext": True,
+            "items": [
+                {"txHash": "a", "side": "buy", "from": {"symbol": "SOL"}},
+                {"txHash": "b", "side": "sell", "from": {"symbol": "USDC"}},
+            ],
+        }
+        assert project(data, frozenset({"txHash", "side"})) == {
+            "hasNext": True,
+            "items": [
+                {"txHash": "a", "side": "buy"},
+                {"txHash": "b", "side": "sell"},
+            ],
+        }
+
+    def test_record_keeps_lists(self):
+        """Should keep lists on records so their items can be projected."""
+        data = {"wallet": "w", "totalUsd": 10, "items": [{"symbol": "SOL", "x": 1}]}
+        assert project(data, frozenset({"totalUsd", "symbol"})) == {
+            "totalUsd": 10,
+            "items": [{"symbol": "SOL"}],
+        }
+
+    def test_fields_applied_to_keyed_records(self):
+        """Should project records nested in a dict keyed by address."""
+        data = {"SOL": {"value": 150, "updateUnixTime": 1}, "USDC": {"value": 1}}
+        assert project(data, frozenset({"value"})) == {
+            "SOL": {"value": 150},
+            "USDC": {"value": 1},
+        }
+
+    def test_truncates_lists_with_count(self):
+        """Should truncate long lists and record the original length."""
+        data = {"items": list(range(50)), "total": 50}
+        assert project(data, max_items=3) == {
+            "items": [0, 1, 2],
+            "items_count": 50,
+            "total": 50,
+        }
+
+    def test_short_lists_have_no_count(self):
+        """Should not add a count when nothing was truncated."""
+        assert project({"items": [1, 2]}, max_items=3) == {"items": [1, 2]}
+
+    def test_top_level_list_truncated(self):
+        """Should truncate a top-level list."""
+        assert project([{"a": 1, "b": 2}] * 5, frozenset({"a"}), 2) == [
+            {"a": 1},
+            {"a": 1},
+        ]
+
+
+async def _chunks(body: bytes, size: int):
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+async def _decode(stream: JsonArrayStream, body, size: int = 7) -> list:
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    return [item async for item in stream.items(_chunks(body, size))]
+
+
+class TestJsonArrayStream:
+    """Test incremental decoding of one array from a byte stream."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+    async def test_decodes_items_across_chunk_sizes(self, size):
+        """Should decode the same items regardless of chunk boundaries."""
+        items = [{"a": i, "s": "x,]}[{" * i, "n": [1, {"b": None}]} for i in range(5)]
+        body = {"success": True, "data": {"items": items, "hasNext": True}}
+        stream = JsonArrayStream(("data", "items"))
+        assert await _decode(stream, body, size) == items
+        assert stream.found is True
+        assert stream.key == "items"
+        assert stream.count == 5
+        assert stream.siblings == {"hasNext": True}
+
+    @pytest.mark.asyncio
+    async def test_escaped_strings(self):
+        """Should not be confused by escaped quotes and backslashes."""
+        items = ['a"]b', "c\\", {'k"': 'v\\"'}]
+        stream = JsonArrayStream(("items",))
+        assert await _decode(stream, {"items": items}, 2) == items
+
+    @pytest.mark.asyncio
+    async def test_wildcard_key(self):
+        """Should match any key for a "*" path segment."""
+        stream = JsonArrayStream(("data", "*"))
+        body = {"data": {"solana": [{"txHash": "a"}, {"txHash": "b"}]}}
+        assert await _decode(stream, body) == [{"txHash": "a"}, {"txHash": "b"}]
+        assert stream.key == "solana"
+
+    @pytest.mark.asyncio
+    async def test_skips_other_arrays(self):
+        """Should ignore arrays at other paths."""
+        body = {"meta": {"items": [1, 2]}, "data": {"other": [3], "items": [4]}}
+        stream = JsonArrayStream(("data", "items"))
+        assert await _decode(stream, body) == [4]
+        assert stream.siblings == {"other": [3]}
+
+    @pytest.mark.asyncio
+    async def test_max_items_counts_the_rest(self):
+        """Should yield up to max_items and count the remaining items."""
+        stream = JsonArrayStream(("items",), max_items=2)
+        assert await _decode(stream, {"items": list(range(10)), "total": 10}) == [0, 1]
+        assert stream.count == 10
+        assert stream.siblings == {"total": 10}
+
+    @pytest.mark.asyncio
+    async def test_missing_and_empty_arrays(self):
+        """Should report whether the array was found."""
+        missing = JsonArrayStream(("data", "items"))
+        assert await _decode(missing, {"data": {"hasNext": False}}) == []
+        assert missing.found is False
+        assert missing.siblings == {"hasNext": False}
+
+        empty = JsonArrayStream(("data", "items"))
+        assert await _decode(empty, {"data": {"items": []}}) == []
+        assert empty.found is True
+        assert empty.count == 0
+
+    @pytest.mark.asyncio
+    async def test_buffer_ceiling(self):
+        """Should raise when a single item exceeds the buffer ceiling."""
+        stream = JsonArrayStream(("items",), max_buffer_bytes=64)
+        with pytest.raises(ValueError):
+            await _decode(stream, {"items": ["x" * 500]}, 16)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_limiter_stream_request(self):
+        """Should return an unread streaming response from the limiter."""
+        respx.get(f"{BIRDEYE_API}/defi/txs/token").mock(
+            return_value=Response(200, json={"data": {"items": [1, 2, 3]}})
+        )
+        limiter = BirdeyeRateLimiter()
+        stream = JsonArrayStream(("data", "items"))
+        async with httpx.AsyncClient() as client:
+            response = await limiter.request(
+                client,
+                "GET",
+                f"{BIRDEYE_API}/defi/txs/token",
+                "/defi/txs/token",
+                stream=True,
+            )
+            try:
+                items = [i async for i in stream.items(response.aiter_bytes())]
+            finally:
+                await response.aclose()
+        assert items == [1, 2, 3]
@@ -0,0 +1,204 @@
+"""
+Tests for the multi-RPC transaction broadcaster.
+
+Runs TransactionBroadcaster against stand-in JSON-RPC endpoints that accept
+sends, report signature statuses and block heights.
+"""
+
+import json
+
+import httpx
+import pytest
+import respx
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.transaction import VersionedTransaction
+
+from sakit.utils.broadcast import TransactionBroadcaster
+
+FAST = {"interval": 0.05, "poll_interval": 0.01, "timeout": 1.0}
+
+
+def _signed_tx() -> bytes:
+    payer = Keypair()
+    message = Message.new_with_blockhash([], payer.pubkey(), Hash.new_unique())
+    return bytes(VersionedTransaction(message, [payer]))
+
+
+class StandInRpc:
+    """Minimal JSON-RPC endpoint for broadcaster tests."""
+
+    def __init__(
+        self,
+        url,
+        lands_after=None,
+        err=None,
+        reject=False,
+        block_height=100,
+    ):
+        self.url = url
+        self.lands_after = lands_after
+        self.err = err
+        self.reject = reject
+        self.block_height = block_height
+        self.sends = 0
+        self.polls = 0
+        respx.post(url).mock(side_effect=self.handle)
+
+    def handle(self, request):
+        method = json.loads(request.content)["method"]
+        if method == "sendTransaction":
+            self.sends += 1
+            if self.reject:
+                return httpx.Response(
+                    200, json={"jsonrpc": "2.0", "id": 1, "error": {"code": -32002}}
+                )
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": "s"})
+        if method == "getSignatureStatuses":
+            self.polls += 1
+            entry = None
+            if self.lands_after is not None and self.polls >= self.lands_after:
+                entry = {"confirmationStatus": "confirmed", "err": self.err}
+            return httpx.Response(
+                200,
+                json={"jsonrpc": "2.0", "id": 1, "result": {"value": [entry]}},
+            )
+        if method == "getBlockHeight":
+            return httpx.Response(
+                200, json={"jsonrpc": "2.0", "id": 1, "result": self.block_height}
+            )
+        return httpx.Response(404)
+
+
+class TestTransactionBroadcaster:
+    """Test TransactionBroadcaster."""
+
+    def test_requires_urls(self):
+        """Should reject an empty endpoint list and drop duplicates."""
+        with pytest.raises(ValueError):
+            TransactionBroadcaster([])
+        broadcaster = TransactionBroadcaster(["http://a", "http://a", "", "http://b"])
+        assert broadcaster.rpc_urls == ["http://a", "http://b"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_records_first_landing_endpoint(self):
+        """Should return as soon as one endpoint reports the tx confirmed."""
+        slow = StandInRpc("http://slow")
+        fast = StandInRpc("http://fast", lands_after=2)
+        tx = _signed_tx()
+
+        result = await TransactionBroadcaster([slow.url, fast.url], **FAST).broadcast(
+            tx
+        )
+
+        assert result.success is True
+        assert result.landed_on == "http://fast"
+        assert result.signature == str(
+            VersionedTransaction.from_bytes(tx).signatures[0]
+        )
+        assert result.accepted_by == ["http://slow", "http://fast"]
+        assert slow.sends == fast.sends == 1
+        assert result.to_dict()["landed_on"] == "http://fast"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_rebroadcasts_until_landed(self):
+        """Should resend on every interval until the transaction lands."""
+        rpc = StandInRpc("http://rpc", lands_after=15)
+
+        result = await TransactionBroadcaster(
+            [rpc.url], interval=0.02, poll_interval=0.01, timeout=2.0
+        ).broadcast(_signed_tx())
+
+        assert result.success is True
+        assert result.rounds > 1
+        assert rpc.sends == result.rounds
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_all_endpoints_reject(self):
+        """Should fail immediately when no endpoint accepts the transaction."""
+        a = StandInRpc("http://a", reject=True)
+        StandInRpc("http://b", reject=True)
+
+        result = await TransactionBroadcaster(
+            ["http://a", "http://b"], **FAST
+        ).broadcast(_signed_tx())
+
+        assert result.success is False
+        assert "http://a" in result.error and "http://b" in result.error
+        assert a.polls == 0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_partial_rejection_still_lands(self):
+        """Should keep going while at least one endpoint accepts."""
+        StandInRpc("http://down", reject=True)
+        StandInRpc("http://up", lands_after=1)
+
+        result = await TransactionBroadcaster(
+            ["http://down", "http://up"], **FAST
+        ).broadcast(_signed_tx())
+
+        assert result.success is True
+        assert result.accepted_by == ["http://up"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failed_transaction(self):
+        """Should report an on-chain error as a failure."""
+        StandInRpc("http://rpc", lands_after=1, err={"InstructionError": [0, 1]})
+
+        result = await TransactionBroadcaster(["http://rpc"], **FAST).broadcast(
+            _signed_tx()
+        )
+
+        assert result.success is False
+        assert result.landed_on == "http://rpc"
+        assert "InstructionError" in result.error
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_stops_when_blockhash_expires(self):
+        """Should stop rebroadcasting once the block height passes expiry."""
+        rpc = StandInRpc("http://rpc", block_height=500)
+
+        result = await TransactionBroadcaster(["http://rpc"], **FAST).broadcast(
+            _signed_tx(), last_valid_block_height=400
+        )
+
+        assert result.success is False
+        assert result.error == "Blockhash expired before confirmation"
+        assert rpc.sends == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_times_out(self):
+        """Should give up after the timeout when the tx never lands."""
+        StandInRpc("http://rpc")
+
+        result = await TransactionBroadcaster(
+            ["http://rpc"], interval=0.02, poll_interval=0.01, timeout=0.1
+        ).broadcast(_signed_tx(), last_valid_block_height=1_000)
+
+        assert result.success is False
+        assert result.timed_out is True
+        assert result.error.startswith("Not confirmed")
+        assert result.rounds >= 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_returns_after_first_round_without_confirm(self):
+        """Should not wait for the tx to land when confirmation is skipped."""
+        rpc = StandInRpc("http://rpc")
+
+        result = await TransactionBroadcaster(["http://rpc"], **FAST).broadcast(
+            _signed_tx(), confirm=False
+        )
+
+        assert result.success is True
+        assert result.landed_on is None
+        assert result.rounds == 1
+        assert rpc.polls == 0
@@ -0,0 +1,108 @@
+"""
+Tests for compute unit estimate cache utility.
+
+Tests instruction shape keys, margins, caps and recalibration.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+
+from sakit.utils.compute_units import (
+    CU_MARGIN,
+    MAX_COMPUTE_UNITS,
+    MEMO_PROGRAM_ID,
+    ComputeUnitCache,
+    get_compute_unit_cache,
+    instruction_shape,
+    reset_compute_unit_cache,
+)
+
+
+def _sol_transfer(lamports: int) -> Instruction:
+    return transfer(
+        TransferParams(
+            from_pubkey=Keypair().pubkey(),
+            to_pubkey=Keypair().pubkey(),
+            lamports=lamports,
+        )
+    )
+
+
+def _memo(text: str) -> Instruction:
+    return Instruction(Pubkey.from_string(MEMO_PROGRAM_ID), text.encode(), [])
+
+
+class TestInstructionShape:
+    """Test instruction_shape."""
+
+    def test_ignores_amounts_addresses_and_memo_text(self):
+        """Should give the same key for transfers that differ only in values."""
+        a = [_sol_transfer(1), _memo("hi")]
+        b = [_sol_transfer(10**9), _memo("a much longer memo")]
+        assert instruction_shape(a) == instruction_shape(b)
+
+    def test_distinguishes_instruction_lists(self):
+        """Should give different keys when instructions are added or changed."""
+        base = [_sol_transfer(1)]
+        with_memo = [_sol_transfer(1), _memo("hi")]
+        other = [
+            Instruction(
+                Pubkey.from_string(MEMO_PROGRAM_ID),
+                b"",
+                [AccountMeta(Keypair().pubkey(), True, False)],
+            )
+        ]
+        shapes = {instruction_shape(x) for x in (base, with_memo, other)}
+        assert len(shapes) == 3
+
+
+class TestComputeUnitCache:
+    """Test ComputeUnitCache."""
+
+    @pytest.mark.asyncio
+    async def test_simulates_once_per_shape(self):
+        """Should reuse the simulated units and add the margin."""
+        cache = ComputeUnitCache()
+        simulate = AsyncMock(return_value=300)
+
+        assert await cache.limit([_sol_transfer(1)], simulate) == 300 + CU_MARGIN
+        assert await cache.limit([_sol_transfer(2)], simulate) == 300 + CU_MARGIN
+        simulate.assert_awaited_once()
+
+        await cache.limit([_sol_transfer(1), _memo("x")], simulate)
+        assert simulate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_recalibrates_after_interval(self):
+        """Should simulate again once the entry is due for recalibration."""
+        cache = ComputeUnitCache(recalibrate_interval=10)
+        simulate = AsyncMock(side_effect=[300, 500])
+        with patch("sakit.utils.compute_units.monotonic", return_value=0):
+            await cache.limit([_sol_transfer(1)], simulate)
+        with patch("sakit.utils.compute_units.monotonic", return_value=11):
+            assert await cache.limit([_sol_transfer(1)], simulate) == 500 + CU_MARGIN
+        assert simulate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_caps_and_rejects_missing_units(self):
+        """Should cap the limit and not cache failed simulations."""
+        cache = ComputeUnitCache()
+        assert (
+            await cache.limit([_sol_transfer(1)], AsyncMock(return_value=2_000_000))
+            == MAX_COMPUTE_UNITS
+        )
+        with pytest.raises(ValueError):
+            await cache.limit([_memo("x")], AsyncMock(return_value=None))
+        assert cache.cached(instruction_shape([_memo("x")])) is None
+
+    def test_shared_cache_reset(self):
+        """Should clear the shared cache."""
+        shape = instruction_shape([_sol_transfer(1)])
+        get_compute_unit_cache().store(shape, 100)
+        reset_compute_unit_cache()
+        assert get_compute_unit_cache().cached(shape) is None
@@ -0,0 +1,165 @@
+"""
+Tests for the shared blockhash cache and confirmation tracker.
+
+Tests that concurrent callers share one blockhash fetch and that many
+in-flight signatures are confirmed from a single polling loop.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from solders.hash import Hash
+from solders.signature import Signature
+from solders.transaction_status import TransactionConfirmationStatus
+
+from sakit.utils.confirmation import (
+    BlockhashCache,
+    ConfirmationTracker,
+    get_blockhash_cache,
+    get_confirmation_tracker,
+    reset_confirmation_state,
+)
+
+CONFIRMED = TransactionConfirmationStatus.Confirmed
+PROCESSED = TransactionConfirmationStatus.Processed
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    reset_confirmation_state()
+    yield
+    reset_confirmation_state()
+
+
+class FakeRpc:
+    """Serves blockhashes, statuses and block height from plain attributes."""
+
+    def __init__(self):
+        self.statuses = {}
+        self.block_height = 100
+        self.blockhash_calls = 0
+        self.status_calls = []
+
+    async def get_latest_blockhash(self, commitment=None):
+        self.blockhash_calls += 1
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(
+            value=SimpleNamespace(
+                blockhash=Hash.new_unique(), last_valid_block_height=250
+            )
+        )
+
+    async def get_signature_statuses(self, signatures):
+        self.status_calls.append(list(signatures))
+        return SimpleNamespace(value=[self.statuses.get(s) for s in signatures])
+
+    async def get_block_height(self, commitment=None):
+        return SimpleNamespace(value=self.block_height)
+
+
+def _status(confirmation_status=CONFIRMED, err=None):
+    return SimpleNamespace(confirmation_status=confirmation_status, err=err)
+
+
+class TestBlockhashCache:
+    """Test BlockhashCache."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self):
+        """Should fetch once for many concurrent callers."""
+        rpc = FakeRpc()
+        cache = BlockhashCache(rpc)
+
+        results = await asyncio.gather(*(cache.get() for _ in range(20)))
+
+        assert rpc.blockhash_calls == 1
+        assert len(set(results)) == 1
+        assert results[0][1] == 250
+
+    @pytest.mark.asyncio
+    async def test_refreshes_after_ttl_and_invalidate(self):
+        """Should fetch again once stale or invalidated."""
+        rpc = FakeRpc()
+        cache = BlockhashCache(rpc, ttl=0.0)
+        await cache.get()
+        await cache.get()
+        assert rpc.blockhash_calls == 2
+
+        cache.ttl = 60.0
+        cache.invalidate()
+        await cache.get()
+        await cache.get()
+        assert rpc.blockhash_calls == 3
+
+
+class TestConfirmationTracker:
+    """Test ConfirmationTracker."""
+
+    @pytest.mark.asyncio
+    async def test_confirms_many_signatures_from_one_poll(self):
+        """Should resolve every in-flight signature from a shared poll."""
+        rpc = FakeRpc()
+        tracker = ConfirmationTracker(rpc, poll_interval=0.01)
+        signatures = [Signature.new_unique() for _ in range(10)]
+        for signature in signatures:
+            rpc.statuses[signature] = _status()
+
+        results = await asyncio.gather(
+            *(tracker.wait(s, 250, timeout=1) for s in signatures)
+        )
+
+        assert results == [CONFIRMED] * 10
+        assert len(rpc.status_calls) == 1
+        assert tracker.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_waits_for_processed_and_reports_errors(self):
+        """Should keep polling processed signatures and fail errored ones."""
+        rpc = FakeRpc()
+        tracker = ConfirmationTracker(rpc, poll_interval=0.01)
+        slow, failed = Signature.new_unique(), Signature.new_unique()
+        rpc.statuses[slow] = _status(PROCESSED)
+        rpc.statuses[failed] = _status(err="InstructionError")
+
+        slow_wait = asyncio.ensure_future(tracker.wait(slow, timeout=1))
+        with pytest.raises(RuntimeError, match="InstructionError"):
+            await tracker.wait(failed, timeout=1)
+        assert not slow_wait.done()
+
+        rpc.statuses[slow] = _status()
+        assert await slow_wait == CONFIRMED
+
+    @pytest.mark.asyncio
+    async def test_expires_past_last_valid_block_height(self):
+        """Should fail signatures whose blockhash has expired."""
+        rpc = FakeRpc()
+        rpc.block_height = 300
+        tracker = ConfirmationTracker(rpc, poll_interval=0.01)
+
+        with pytest.raises(RuntimeError, match="expired"):
+            await tracker.wait(Signature.new_unique(), 250, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_timeout_stops_tracking(self):
+        """Should stop tracking a signature whose caller timed out."""
+        rpc = FakeRpc()
+        tracker = ConfirmationTracker(rpc, poll_interval=0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await tracker.wait(Signature.new_unique(), timeout=0.05)
+
+        assert tracker.pending == 0
+        await tracker.stop()
+
+
+class TestRegistry:
+    """Test the per-client registry."""
+
+    def test_shared_per_client(self):
+        """Should return the same cache and tracker for the same client."""
+        rpc, other = FakeRpc(), FakeRpc()
+
+        assert get_blockhash_cache(rpc) is get_blockhash_cache(rpc)
+        assert get_confirmation_tracker(rpc) is get_confirmation_tracker(rpc)
+        assert get_confirmation_tracker(rpc) is not get_confirmation_tracker(other)
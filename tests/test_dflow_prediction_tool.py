@@ -10,6 +10,7 @@ from unittest.mock import patch, AsyncMock, MagicMock
 import time
 
 from sakit.dflow_prediction import DFlowPredictionTool, DFlowPredictionPlugin
+from sakit.utils.jobs import get_job_manager
 from sakit.utils.dflow import (
     calculate_safety_score,
     SafetyResult,
@@ -353,6 +354,7 @@ class TestDFlowPredictionToolSchema:
             "buy",
             "sell",
             "positions",
+            "job_status",
         ]
         assert set(actions) == set(expected_actions)
 
@@ -610,7 +612,7 @@ class TestBuyAction:
                 new_callable=AsyncMock,
                 return_value=low_quality_market,
             ),
-            patch("sakit.dflow_prediction.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
@@ -668,7 +670,7 @@ class TestBuyAction:
                 new_callable=AsyncMock,
                 return_value=order_result,
             ),
-            patch("sakit.dflow_prediction.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
@@ -687,6 +689,63 @@ class TestBuyAction:
             assert result["signature"] == "sig123"
             assert result["execution_mode"] == "sync"
 
+    @pytest.mark.asyncio
+    async def test_buy_in_background(self, prediction_tool, sample_market):
+        """Buy with background=True should return a job id and finish later."""
+        order_result = DFlowPredictionOrderResult(
+            success=True,
+            signature="sig123",
+            execution_mode="async",
+            in_amount="10000000",
+            out_amount="28571428",
+            min_out_amount="28000000",
+            price_impact_pct="0.1",
+        )
+
+        with (
+            patch.object(
+                DFlowPredictionClient,
+                "get_market",
+                new_callable=AsyncMock,
+                return_value=sample_market,
+            ),
+            patch.object(
+                DFlowPredictionClient,
+                "get_prediction_order",
+                new_callable=AsyncMock,
+                return_value={"transaction": "base64tx...", "requestId": "req123"},
+            ),
+            patch.object(
+                DFlowPredictionClient,
+                "execute_prediction_order_blocking",
+                new_callable=AsyncMock,
+                return_value=order_result,
+            ),
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
+        ):
+            mock_keypair = MagicMock()
+            mock_keypair.pubkey.return_value = "UserPubkey123"
+            MockKeypair.from_base58_string.return_value = mock_keypair
+
+            submitted = await prediction_tool.execute(
+                action="buy",
+                market_id="PRES-2028-DEM-HARRIS",
+                side="YES",
+                amount=10,
+                background=True,
+            )
+            assert submitted["status"] == "success"
+            assert submitted["job_status"] == "pending"
+
+            await get_job_manager().wait(submitted["job_id"], timeout=1)
+            result = await prediction_tool.execute(
+                action="job_status", job_id=submitted["job_id"]
+            )
+
+        assert result["status"] == "success"
+        assert result["job_status"] == "succeeded"
+        assert result["result"]["signature"] == "sig123"
+
     @pytest.mark.asyncio
     async def test_buy_handles_order_failure(self, prediction_tool, sample_market):
         """Buy should handle order execution failure."""
@@ -726,7 +785,7 @@ class TestBuyAction:
                 new_callable=AsyncMock,
                 return_value=order_result,
             ),
-            patch("sakit.dflow_prediction.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
@@ -815,7 +874,7 @@ class TestSellAction:
                 new_callable=AsyncMock,
                 return_value=order_result,
             ),
-            patch("sakit.dflow_prediction.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
@@ -863,7 +922,7 @@ class TestPositionsAction:
                 }
             }
         )
-        with patch("sakit.dflow_prediction.Keypair") as MockKeypair:
+        with patch("sakit.utils.keyring.Keypair") as MockKeypair:
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
             MockKeypair.from_base58_string.return_value = mock_keypair
@@ -905,7 +964,7 @@ class TestPositionsAction:
                     "hint": "Each position represents outcome tokens.",
                 },
             ),
-            patch("sakit.dflow_prediction.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
@@ -933,7 +992,7 @@ class TestPositionsAction:
                     "hint": "No prediction market positions found.",
                 },
             ),
-            patch("sakit.dflow_prediction.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
@@ -1707,7 +1766,7 @@ class TestSellActionExtra:
                 new_callable=AsyncMock,
                 return_value=sample_market_no_mints,
             ),
-            patch("sakit.dflow_prediction.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
@@ -1761,7 +1820,7 @@ class TestSellActionExtra:
                 new_callable=AsyncMock,
                 return_value=order_result,
             ),
-            patch("sakit.dflow_prediction.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
@@ -1799,7 +1858,7 @@ class TestBuyActionExtra:
                 new_callable=AsyncMock,
                 return_value=sample_market_no_mints,
             ),
-            patch("sakit.dflow_prediction.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
@@ -1863,7 +1922,7 @@ class TestBuyActionExtra:
                 new_callable=AsyncMock,
                 return_value=order_result,
             ),
-            patch("sakit.dflow_prediction.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserPubkey123"
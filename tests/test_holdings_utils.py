@@ -0,0 +1,147 @@
+"""
+Tests for shared holdings cache utility.
+
+Tests TTL caching, coalescing of concurrent reads, and invalidation after
+transactions.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sakit.utils.holdings import (
+    HoldingsCache,
+    get_holdings_cache,
+    invalidate_holdings,
+    reset_holdings_cache,
+)
+
+
+def _ultra(delay: float = 0.0):
+    calls = {"n": 0}
+
+    async def holdings(wallet):
+        calls["n"] += 1
+        await asyncio.sleep(delay)
+        return {"wallet": wallet, "version": calls["n"]}
+
+    ultra = MagicMock()
+    ultra.get_holdings = AsyncMock(side_effect=holdings)
+    ultra.get_native_holdings = AsyncMock(return_value={"amount": "1"})
+    return ultra
+
+
+class TestHoldingsCache:
+    """Test HoldingsCache."""
+
+    @pytest.mark.asyncio
+    async def test_serves_fresh_entries(self):
+        """Should return cached holdings with their age within the TTL."""
+        cache = HoldingsCache(ttl=60)
+        ultra = _ultra()
+        first, age = await cache.get(ultra, "w1")
+        second, cached_age = await cache.get(ultra, "w1")
+        assert first == second
+        assert age == 0.0
+        assert cached_age >= 0.0
+        assert ultra.get_holdings.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_native_and_full_cached_separately(self):
+        """Should key native-only reads separately from full holdings."""
+        cache = HoldingsCache(ttl=60)
+        ultra = _ultra()
+        await cache.get(ultra, "w1")
+        native, _ = await cache.get(ultra, "w1", native_only=True)
+        assert native == {"amount": "1"}
+        ultra.get_native_holdings.assert_awaited_once_with("w1")
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_and_override(self):
+        """Should refetch after the TTL and when the TTL is disabled."""
+        cache = HoldingsCache(ttl=0.01)
+        ultra = _ultra()
+        await cache.get(ultra, "w1")
+        await asyncio.sleep(0.02)
+        await cache.get(ultra, "w1")
+        await cache.get(ultra, "w1", ttl=0)
+        assert ultra.get_holdings.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_coalesce(self):
+        """Should share one request between concurrent readers."""
+        cache = HoldingsCache(ttl=60)
+        ultra = _ultra(delay=0.05)
+        results = await asyncio.gather(*(cache.get(ultra, "w1") for _ in range(5)))
+        assert ultra.get_holdings.await_count == 1
+        assert all(holdings["version"] == 1 for holdings, _ in results)
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_fetch_is_not_cached(self):
+        """Should not store a response fetched before an invalidation."""
+        cache = HoldingsCache(ttl=60)
+        ultra = _ultra(delay=0.05)
+        pending = asyncio.ensure_future(cache.get(ultra, "w1"))
+        await asyncio.sleep(0.01)
+        cache.invalidate("w1")
+        stale, _ = await pending
+        fresh, _ = await cache.get(ultra, "w1")
+        assert stale["version"] == 1
+        assert fresh["version"] == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_return_copies(self):
+        """Should not let callers mutate the cached response."""
+        cache = HoldingsCache(ttl=60)
+        ultra = _ultra()
+        first, _ = await cache.get(ultra, "w1")
+        first["version"] = 99
+        second, _ = await cache.get(ultra, "w1")
+        assert second["version"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bounded_and_prunes_expired(self):
+        """Should evict the oldest entry and drop expired ones on insert."""
+        cache = HoldingsCache(ttl=60, max_entries=2)
+        ultra = _ultra()
+        for wallet in ("w1", "w2", "w3"):
+            await cache.get(ultra, wallet)
+        assert set(cache._entries) == {("w2", False), ("w3", False)}
+
+        cache.ttl = 0.01
+        await asyncio.sleep(0.02)
+        await cache.get(ultra, "w4")
+        assert set(cache._entries) == {("w4", False)}
+
+        cache.invalidate("w4")
+        assert cache._generations == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_errors_propagate(self):
+        """Should raise fetch errors and cache nothing."""
+        cache = HoldingsCache(ttl=60)
+        ultra = MagicMock()
+        ultra.get_holdings = AsyncMock(side_effect=[Exception("down"), {"ok": 1}])
+        with pytest.raises(Exception, match="down"):
+            await cache.get(ultra, "w1")
+        holdings, _ = await cache.get(ultra, "w1")
+        assert holdings == {"ok": 1}
+
+
+class TestSharedCache:
+    """Test module-level helpers."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_holdings(self):
+        """Should invalidate every given wallet and skip empty values."""
+        reset_holdings_cache()
+        cache = get_holdings_cache()
+        ultra = _ultra()
+        await cache.get(ultra, "w1")
+        await cache.get(ultra, "w2")
+        invalidate_holdings("w1", None, "")
+        await cache.get(ultra, "w1")
+        await cache.get(ultra, "w2")
+        assert ultra.get_holdings.await_count == 3
+        reset_holdings_cache()
@@ -0,0 +1,153 @@
+"""
+Tests for the background job manager.
+
+Tests job lifecycle, bounded concurrency, owner checks, and persistence
+of in-flight jobs across restarts.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from sakit.utils.jobs import (
+    JOB_FAILED,
+    JOB_INTERRUPTED,
+    JOB_SUCCEEDED,
+    Job,
+    JobManager,
+    job_submitted,
+)
+
+
+class TestJobManager:
+    """Test JobManager."""
+
+    @pytest.mark.asyncio
+    async def test_runs_job_and_reports_result(self):
+        """Should return a pending job immediately and record its result."""
+        manager = JobManager()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            return {"status": "success", "signature": "sig123"}
+
+        job = manager.submit("test.buy", work, owner="wallet-1")
+        response = job_submitted(job, "buy")
+        assert response["job_id"] == job.id
+        assert response["job_status"] == "pending"
+
+        await manager.wait(job.id, timeout=1)
+        status = manager.status(job.id, owner="wallet-1")
+        assert status["status"] == "success"
+        assert status["job_status"] == JOB_SUCCEEDED
+        assert status["result"]["signature"] == "sig123"
+
+    @pytest.mark.asyncio
+    async def test_error_results_and_exceptions_fail_the_job(self):
+        """Should mark jobs failed on error responses and exceptions."""
+        manager = JobManager()
+
+        async def error_response():
+            return {"status": "error", "message": "Order expired"}
+
+        async def boom():
+            raise RuntimeError("RPC down")
+
+        errored = manager.submit("test.buy", error_response)
+        raised = manager.submit("test.sell", boom)
+        await manager.wait(errored.id, timeout=1)
+        await manager.wait(raised.id, timeout=1)
+
+        assert errored.status == JOB_FAILED
+        assert errored.error == "Order expired"
+        assert raised.status == JOB_FAILED
+        assert raised.error == "RPC down"
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_jobs(self):
+        """Should run at most max_concurrent jobs at once."""
+        manager = JobManager(max_concurrent=2)
+        running = {"now": 0, "max": 0}
+
+        async def work():
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return {"status": "success"}
+
+        jobs = [manager.submit("test.buy", work) for _ in range(6)]
+        for job in jobs:
+            await manager.wait(job.id, timeout=1)
+
+        assert running["max"] == 2
+        assert all(job.status == JOB_SUCCEEDED for job in jobs)
+
+    @pytest.mark.asyncio
+    async def test_keeps_limit_once_jobs_have_run(self):
+        """Should not swap the pool while jobs may still hold it."""
+        manager = JobManager(max_concurrent=2)
+        manager.configure(max_concurrent=3)
+        assert manager.max_concurrent == 3
+
+        async def work():
+            return {"status": "success"}
+
+        job = manager.submit("test.buy", work)
+        await manager.wait(job.id, timeout=1)
+        pool = manager._semaphore
+        manager.configure(max_concurrent=5)
+
+        assert manager.max_concurrent == 3
+        assert manager._semaphore is pool
+
+    def test_status_checks_owner_and_job_id(self):
+        """Should hide other wallets' jobs and require a job id."""
+        manager = JobManager()
+        manager._jobs["abc"] = Job(
+            id="abc", kind="test.buy", owner="wallet-1", status=JOB_SUCCEEDED
+        )
+
+        assert manager.status("abc", owner="wallet-1")["status"] == "success"
+        assert manager.status("abc", owner="wallet-2")["status"] == "error"
+        assert manager.status("missing", owner="wallet-1")["status"] == "error"
+        assert manager.status(None)["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_persists_and_interrupts_in_flight_jobs(self, tmp_path):
+        """Should reload jobs and mark those in flight at shutdown interrupted."""
+        store = tmp_path / "jobs.json"
+        manager = JobManager(store_path=str(store))
+
+        async def quick():
+            return {"status": "success"}
+
+        async def slow():
+            await asyncio.sleep(10)
+
+        done = manager.submit("test.buy", quick, owner="wallet-1")
+        await manager.wait(done.id, timeout=1)
+        in_flight = manager.submit("test.sell", slow, owner="wallet-1")
+        await asyncio.sleep(0)
+
+        # The store records the slow job as running while it is in flight
+        records = {r["id"]: r for r in json.loads(store.read_text())}
+        assert records[in_flight.id]["status"] == "running"
+        await manager.shutdown()
+
+        restarted = JobManager(store_path=str(store))
+        assert restarted.get(done.id, "wallet-1").status == JOB_SUCCEEDED
+        assert restarted.get(in_flight.id, "wallet-1").status == JOB_INTERRUPTED
+
+    def test_interrupts_jobs_left_running_in_store(self, tmp_path):
+        """Should mark jobs a crashed process left running as interrupted."""
+        store = tmp_path / "jobs.json"
+        store.write_text(
+            json.dumps([{"id": "abc", "kind": "test.buy", "status": "running"}])
+        )
+
+        job = JobManager(store_path=str(store)).get("abc")
+
+        assert job.status == JOB_INTERRUPTED
+        assert "may or may not have landed" in job.error
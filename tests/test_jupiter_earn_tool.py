@@ -105,7 +105,7 @@ class TestJupiterEarnToolExecute:
 
     @pytest.mark.asyncio
     async def test_execute_missing_amount(self, earn_tool):
-        with patch("sakit.jupiter_earn.Keypair") as MockKeypair:
+        with patch("sakit.utils.keyring.Keypair") as MockKeypair:
             MockKeypair.from_base58_string.return_value = Keypair()
 
             result = await earn_tool.execute(action="deposit", asset=SOL_MINT)
@@ -115,7 +115,7 @@ class TestJupiterEarnToolExecute:
 
     @pytest.mark.asyncio
     async def test_execute_missing_shares(self, earn_tool):
-        with patch("sakit.jupiter_earn.Keypair") as MockKeypair:
+        with patch("sakit.utils.keyring.Keypair") as MockKeypair:
             MockKeypair.from_base58_string.return_value = Keypair()
 
             result = await earn_tool.execute(action="mint", asset=SOL_MINT)
@@ -127,7 +127,7 @@ class TestJupiterEarnToolExecute:
     async def test_execute_instruction_error(self, earn_tool):
         with (
             patch("sakit.jupiter_earn.JupiterEarn") as MockEarn,
-            patch("sakit.jupiter_earn.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             MockKeypair.from_base58_string.return_value = Keypair()
 
@@ -155,7 +155,7 @@ class TestJupiterEarnToolExecute:
         }
         with (
             patch("sakit.jupiter_earn.JupiterEarn") as MockEarn,
-            patch("sakit.jupiter_earn.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             MockKeypair.from_base58_string.return_value = Keypair()
 
@@ -188,7 +188,7 @@ class TestJupiterEarnToolExecute:
             patch(
                 "sakit.jupiter_earn.get_fresh_blockhash", new_callable=AsyncMock
             ) as mock_blockhash,
-            patch("sakit.jupiter_earn.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             MockKeypair.from_base58_string.return_value = Keypair()
 
@@ -226,7 +226,7 @@ class TestJupiterEarnToolExecute:
                 "sakit.jupiter_earn.send_raw_transaction_with_priority",
                 new_callable=AsyncMock,
             ) as mock_send,
-            patch("sakit.jupiter_earn.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             MockKeypair.from_base58_string.return_value = Keypair()
 
@@ -265,7 +265,7 @@ class TestJupiterEarnToolExecute:
                 "sakit.jupiter_earn.send_raw_transaction_with_priority",
                 new_callable=AsyncMock,
             ) as mock_send,
-            patch("sakit.jupiter_earn.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             MockKeypair.from_base58_string.return_value = Keypair()
 
@@ -291,7 +291,7 @@ class TestJupiterEarnToolExecute:
     @pytest.mark.asyncio
     async def test_positions_defaults_to_configured_wallet(self, earn_tool):
         with (
-            patch("sakit.jupiter_earn.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.jupiter_earn.JupiterEarn") as MockEarn,
         ):
             keypair = Keypair()
@@ -349,7 +349,7 @@ class TestJupiterEarnToolExecute:
 
     @pytest.mark.asyncio
     async def test_earnings_empty_positions_list(self, earn_tool):
-        with patch("sakit.jupiter_earn.Keypair") as MockKeypair:
+        with patch("sakit.utils.keyring.Keypair") as MockKeypair:
             MockKeypair.from_base58_string.return_value = Keypair()
 
             result = await earn_tool.execute(action="earnings", positions=",")
@@ -373,7 +373,7 @@ class TestJupiterEarnToolExecute:
                 "sakit.jupiter_earn.send_raw_transaction_with_priority",
                 new_callable=AsyncMock,
             ) as mock_send,
-            patch("sakit.jupiter_earn.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             MockKeypair.from_base58_string.return_value = Keypair()
 
@@ -411,7 +411,7 @@ class TestJupiterEarnToolExecute:
                 "sakit.jupiter_earn.send_raw_transaction_with_priority",
                 new_callable=AsyncMock,
             ) as mock_send,
-            patch("sakit.jupiter_earn.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
         ):
             MockKeypair.from_base58_string.return_value = Keypair()
 
@@ -436,7 +436,7 @@ class TestJupiterEarnToolExecute:
     @pytest.mark.asyncio
     async def test_earnings_default_user(self, earn_tool):
         with (
-            patch("sakit.jupiter_earn.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.jupiter_earn.JupiterEarn") as MockEarn,
         ):
             keypair = Keypair()
@@ -9,6 +9,15 @@ import pytest
 from unittest.mock import patch, AsyncMock
 
 from sakit.jupiter_holdings import JupiterHoldingsTool, JupiterHoldingsPlugin
+from sakit.utils.holdings import invalidate_holdings, reset_holdings_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_holdings_cache():
+    """Start each test with an empty holdings cache."""
+    reset_holdings_cache()
+    yield
+    reset_holdings_cache()
 
 
 @pytest.fixture
@@ -125,6 +134,47 @@ class TestJupiterHoldingsToolExecute:
             assert result["status"] == "error"
             assert "API Error" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_execute_serves_repeated_reads_from_cache(self, holdings_tool):
+        """Should fetch once until the wallet is invalidated."""
+        with patch("sakit.jupiter_holdings.JupiterUltra") as MockUltra:
+            mock_instance = AsyncMock()
+            mock_instance.get_holdings = AsyncMock(return_value={"tokens": {}})
+            MockUltra.return_value = mock_instance
+
+            first = await holdings_tool.execute(wallet_address="Wallet123")
+            second = await holdings_tool.execute(wallet_address="Wallet123")
+            assert first["holdings_age_seconds"] == 0.0
+            assert second["holdings"] == {"tokens": {}}
+            assert mock_instance.get_holdings.await_count == 1
+
+            invalidate_holdings("Wallet123")
+            await holdings_tool.execute(wallet_address="Wallet123")
+            assert mock_instance.get_holdings.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_cache_disabled(self):
+        """Should always fetch when holdings_cache_ttl is 0."""
+        tool = JupiterHoldingsTool()
+        tool.configure(
+            {
+                "tools": {
+                    "jupiter_holdings": {
+                        "jupiter_api_key": "test-api-key",
+                        "holdings_cache_ttl": 0,
+                    }
+                }
+            }
+        )
+        with patch("sakit.jupiter_holdings.JupiterUltra") as MockUltra:
+            mock_instance = AsyncMock()
+            mock_instance.get_holdings = AsyncMock(return_value={})
+            MockUltra.return_value = mock_instance
+
+            await tool.execute(wallet_address="Wallet123")
+            await tool.execute(wallet_address="Wallet123")
+            assert mock_instance.get_holdings.await_count == 2
+
 
 class TestJupiterHoldingsPlugin:
     """Test plugin class."""
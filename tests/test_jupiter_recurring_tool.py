@@ -39,7 +39,12 @@ class TestJupiterRecurringToolSchema:
         """Should include action in required properties."""
         schema = recurring_tool.get_schema()
         assert "action" in schema["properties"]
-        assert schema["properties"]["action"]["enum"] == ["create", "cancel", "list"]
+        assert schema["properties"]["action"]["enum"] == [
+            "create",
+            "cancel",
+            "list",
+            "job_status",
+        ]
 
     def test_schema_has_dca_properties(self, recurring_tool):
         """Should include DCA order creation properties."""
@@ -135,7 +140,7 @@ class TestJupiterRecurringToolCancelAction:
         )
 
         # Mock Keypair to return a predictable public key
-        with patch("sakit.jupiter_recurring.Keypair") as MockKeypair:
+        with patch("sakit.utils.keyring.Keypair") as MockKeypair:
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserWalletPubkey123"
             MockKeypair.from_base58_string.return_value = mock_keypair
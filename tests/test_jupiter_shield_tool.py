@@ -5,10 +5,21 @@ Tests the JupiterShieldTool which checks token security
 using Jupiter Shield API.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, AsyncMock
 
 from sakit.jupiter_shield import JupiterShieldTool, JupiterShieldPlugin
+from sakit.utils.shield import reset_shield_caches
+
+
+@pytest.fixture(autouse=True)
+def _reset_shield_caches():
+    """Start each test with empty Shield caches."""
+    reset_shield_caches()
+    yield
+    reset_shield_caches()
 
 
 @pytest.fixture
@@ -149,6 +160,31 @@ class TestJupiterShieldToolExecute:
             assert result["status"] == "error"
             assert "API Error" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_execute_caches_and_batches(self, shield_tool):
+        """Should merge concurrent calls and serve repeats from cache."""
+        mock_shield = {"warnings": {"MintA": [{"type": "x", "severity": "info"}]}}
+
+        with patch("sakit.jupiter_shield.JupiterUltra") as MockUltra:
+            mock_instance = AsyncMock()
+            mock_instance.get_shield = AsyncMock(return_value=mock_shield)
+            MockUltra.return_value = mock_instance
+
+            first, second = await asyncio.gather(
+                shield_tool.execute(mints=["MintA"]),
+                shield_tool.execute(mints=["MintA", "MintB"]),
+            )
+            again = await shield_tool.execute(mints=["MintB"])
+
+            mock_instance.get_shield.assert_awaited_once()
+            assert sorted(mock_instance.get_shield.call_args.args[0]) == [
+                "MintA",
+                "MintB",
+            ]
+            assert first["shield"]["MintA"]["has_warnings"] is True
+            assert second["shield"]["MintB"]["has_warnings"] is False
+            assert again["shield"]["MintB"]["has_warnings"] is False
+
 
 class TestJupiterShieldPlugin:
     """Test plugin class."""
@@ -5,10 +5,21 @@ Tests the JupiterTokenSearchTool which searches for tokens
 using Jupiter Ultra API.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, AsyncMock
 
 from sakit.jupiter_token_search import JupiterTokenSearchTool, JupiterTokenSearchPlugin
+from sakit.utils.token_index import get_token_index, reset_token_indexes
+
+
+@pytest.fixture(autouse=True)
+def _reset_token_indexes():
+    """Start each test without shared token indexes."""
+    reset_token_indexes()
+    yield
+    reset_token_indexes()
 
 
 @pytest.fixture
@@ -193,6 +204,182 @@ class TestJupiterTokenSearchToolExecute:
             assert "API Error" in result["message"]
 
 
+class TestJupiterTokenSearchLocalIndex:
+    """Test the optional local token index."""
+
+    @pytest.fixture
+    def indexed_tool(self):
+        tool = JupiterTokenSearchTool()
+        tool.configure(
+            {
+                "tools": {
+                    "jupiter_token_search": {
+                        "jupiter_api_key": "test-api-key",
+                        "local_index": True,
+                    }
+                }
+            }
+        )
+        index = get_token_index("test-api-key")
+        index.build(
+            [{"id": "JupMint", "symbol": "JUP", "name": "Jupiter", "isVerified": True}]
+        )
+        return tool
+
+    @pytest.mark.asyncio
+    async def test_hit_served_locally(self, indexed_tool):
+        """Should answer indexed tokens without a network request."""
+        with patch("sakit.jupiter_token_search.JupiterUltra") as MockUltra:
+            MockUltra.return_value.search_tokens = AsyncMock()
+            result = await indexed_tool.execute(query="jup")
+
+            MockUltra.return_value.search_tokens.assert_not_awaited()
+            assert result["source"] == "local"
+            assert result["data_age_seconds"] >= 0
+            assert result["tokens"][0]["mint"] == "JupMint"
+
+    @pytest.mark.asyncio
+    async def test_prefix_hit_goes_to_network(self, indexed_tool):
+        """Should not let a prefix match hide the network's exact match."""
+        with patch("sakit.jupiter_token_search.JupiterUltra") as MockUltra:
+            MockUltra.return_value.search_tokens = AsyncMock(
+                return_value=[{"id": "JuMint", "symbol": "JU"}]
+            )
+            result = await indexed_tool.execute(query="JU")
+
+            MockUltra.return_value.search_tokens.assert_awaited_once_with("JU")
+            assert result["source"] == "network"
+            assert "data_age_seconds" not in result
+            assert result["tokens"][0]["mint"] == "JuMint"
+
+    @pytest.mark.asyncio
+    async def test_miss_falls_back_to_network(self, indexed_tool):
+        """Should search the network when the index has no match."""
+        with patch("sakit.jupiter_token_search.JupiterUltra") as MockUltra:
+            mock_instance = AsyncMock()
+            mock_instance.search_tokens = AsyncMock(
+                return_value=[{"id": "NewMint", "symbol": "NEW"}]
+            )
+            MockUltra.return_value = mock_instance
+
+            result = await indexed_tool.execute(query="NewMint")
+
+            mock_instance.search_tokens.assert_awaited_once_with("NewMint")
+            assert result["source"] == "network"
+            assert result["tokens"][0]["mint"] == "NewMint"
+
+    @pytest.mark.asyncio
+    async def test_empty_network_result_falls_back_to_fuzzy_index(self, indexed_tool):
+        """Should use the index's fuzzy search when the network finds nothing."""
+        with patch("sakit.jupiter_token_search.JupiterUltra") as MockUltra:
+            MockUltra.return_value.search_tokens = AsyncMock(return_value=[])
+            result = await indexed_tool.execute(query="jupp")
+
+            MockUltra.return_value.search_tokens.assert_awaited_once_with("jupp")
+            assert result["source"] == "local"
+            assert result["tokens"][0]["mint"] == "JupMint"
+
+    @pytest.mark.asyncio
+    async def test_network_failure_falls_back_to_index(self, indexed_tool):
+        """Should answer prefix queries locally when the network search fails."""
+        with patch("sakit.jupiter_token_search.JupiterUltra") as MockUltra:
+            MockUltra.return_value.search_tokens = AsyncMock(
+                side_effect=Exception("API Error")
+            )
+            hit = await indexed_tool.execute(query="Jupi")
+            miss = await indexed_tool.execute(query="zzz")
+
+            assert hit["source"] == "local"
+            assert hit["tokens"][0]["mint"] == "JupMint"
+            assert miss["status"] == "error"
+            assert "API Error" in miss["message"]
+
+    @pytest.mark.asyncio
+    async def test_multi_query_mixes_local_and_network(self, indexed_tool):
+        """Should answer each query from the index or the network."""
+        with patch("sakit.jupiter_token_search.JupiterUltra") as MockUltra:
+            MockUltra.return_value.search_tokens = AsyncMock(
+                return_value=[{"id": "WifMint", "symbol": "WIF"}]
+            )
+            result = await indexed_tool.execute(query="JUP, WIF")
+
+            MockUltra.return_value.search_tokens.assert_awaited_once_with("WIF")
+            assert result["results"]["JUP"]["source"] == "local"
+            assert result["results"]["WIF"]["source"] == "network"
+
+    def test_configure_local_index(self, indexed_tool):
+        """Should read local index settings from config."""
+        assert indexed_tool._local_index is True
+        assert indexed_tool._index_refresh_interval == 3600.0
+
+
+class TestJupiterTokenSearchMultiQuery:
+    """Test comma-separated multi-query fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_splits_and_dedupes_queries(self, search_tool):
+        """Should search each distinct query once and key results by query."""
+
+        async def search(query):
+            return [{"id": f"{query}Mint", "symbol": query}]
+
+        with patch("sakit.jupiter_token_search.JupiterUltra") as MockUltra:
+            mock_instance = AsyncMock()
+            mock_instance.search_tokens = AsyncMock(side_effect=search)
+            MockUltra.return_value = mock_instance
+
+            result = await search_tool.execute(query="SOL, USDC,SOL,,JUP ")
+
+            assert mock_instance.search_tokens.await_count == 3
+            assert list(result["results"]) == ["SOL", "USDC", "JUP"]
+            assert result["results"]["USDC"]["tokens"][0]["mint"] == "USDCMint"
+            assert result["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_with_cap(self, search_tool):
+        """Should overlap searches but keep at most the cap in flight."""
+        search_tool._max_concurrent_searches = 2
+        in_flight = {"now": 0, "max": 0}
+
+        async def search(query):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.02)
+            in_flight["now"] -= 1
+            return []
+
+        with patch("sakit.jupiter_token_search.JupiterUltra") as MockUltra:
+            MockUltra.return_value.search_tokens = AsyncMock(side_effect=search)
+            await search_tool.execute(query="A,B,C,D,E")
+
+        assert in_flight["max"] == 2
+
+    @pytest.mark.asyncio
+    async def test_partial_and_total_failures(self, search_tool):
+        """Should report per-query errors and fail only if every query fails."""
+
+        async def search(query):
+            if query.startswith("BAD"):
+                raise Exception("boom")
+            return []
+
+        with patch("sakit.jupiter_token_search.JupiterUltra") as MockUltra:
+            MockUltra.return_value.search_tokens = AsyncMock(side_effect=search)
+            partial = await search_tool.execute(query="OK,BAD")
+            total = await search_tool.execute(query="BAD1,BAD2")
+
+        assert partial["status"] == "success"
+        assert partial["results"]["BAD"] == {"status": "error", "message": "boom"}
+        assert total["status"] == "error"
+        assert "BAD1: boom" in total["message"]
+
+    @pytest.mark.asyncio
+    async def test_only_separators_is_an_error(self, search_tool):
+        """Should reject queries with no terms."""
+        result = await search_tool.execute(query=" , ,")
+        assert result["status"] == "error"
+
+
 class TestJupiterTokenSearchPlugin:
     """Test plugin class."""
 
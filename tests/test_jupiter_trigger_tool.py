@@ -84,6 +84,7 @@ class TestJupiterTriggerToolSchema:
             "cancel",
             "cancel_all",
             "list",
+            "job_status",
         ]
 
     def test_schema_has_order_properties(self, trigger_tool):
@@ -178,7 +179,7 @@ class TestJupiterTriggerToolCreateAction:
         }
 
         with (
-            patch("sakit.jupiter_trigger.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.jupiter_trigger.JupiterTrigger") as MockTrigger,
             patch.object(
                 trigger_tool,
@@ -216,7 +217,7 @@ class TestJupiterTriggerToolCreateAction:
         mock_result.transaction = None
 
         with (
-            patch("sakit.jupiter_trigger.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.jupiter_trigger.JupiterTrigger") as MockTrigger,
         ):
             mock_keypair = MagicMock()
@@ -246,7 +247,7 @@ class TestJupiterTriggerToolCreateAction:
         mock_result.error = "Insufficient balance"
 
         with (
-            patch("sakit.jupiter_trigger.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.jupiter_trigger.JupiterTrigger") as MockTrigger,
         ):
             mock_keypair = MagicMock()
@@ -284,7 +285,7 @@ class TestJupiterTriggerToolCreateAction:
         }
 
         with (
-            patch("sakit.jupiter_trigger.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.jupiter_trigger.JupiterTrigger") as MockTrigger,
             patch.object(
                 trigger_tool,
@@ -341,7 +342,7 @@ class TestJupiterTriggerToolCancelAction:
         )
 
         # Mock Keypair to return a predictable public key
-        with patch("sakit.jupiter_trigger.Keypair") as MockKeypair:
+        with patch("sakit.utils.keyring.Keypair") as MockKeypair:
             mock_keypair = MagicMock()
             mock_keypair.pubkey.return_value = "UserWalletPubkey123"
             MockKeypair.from_base58_string.return_value = mock_keypair
@@ -0,0 +1,81 @@
+"""
+Tests for the parsed keypair cache.
+
+Tests that configured private keys are parsed once and shared.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from solders.keypair import Keypair
+
+from sakit.utils.keyring import Keyring, get_keyring, load_address, load_keypair
+
+
+class TestKeyring:
+    """Test Keyring."""
+
+    def test_parses_each_key_once(self):
+        """Should parse a key on first load and reuse the entry after."""
+        keypair = Keypair()
+        keyring = Keyring()
+
+        with patch(
+            "sakit.utils.keyring.Keypair.from_base58_string",
+            wraps=Keypair.from_base58_string,
+        ) as parse:
+            first = keyring.load(str(keypair))
+            second = keyring.load(str(keypair))
+
+        parse.assert_called_once()
+        assert first is second
+        assert first.pubkey == keypair.pubkey()
+        assert first.address == str(keypair.pubkey())
+
+    def test_sign_message(self):
+        """Should sign with the parsed keypair."""
+        keypair = Keypair()
+        entry = Keyring().load(str(keypair))
+
+        signature = entry.sign_message(b"hello")
+
+        assert signature == keypair.sign_message(b"hello")
+
+    def test_invalid_key_raises_on_load_only(self):
+        """Should skip bad keys when preloading but raise when used."""
+        keyring = Keyring()
+        keyring.preload("not-a-key", None, "")
+        assert len(keyring) == 0
+
+        with pytest.raises(ValueError):
+            keyring.load("not-a-key")
+
+    def test_no_plaintext_keys_held(self):
+        """Should index entries by digest rather than the key string."""
+        keypair = Keypair()
+        keyring = Keyring()
+        keyring.load(str(keypair))
+
+        assert str(keypair) not in keyring._entries
+
+
+class TestSharedKeyring:
+    """Test the shared keyring helpers."""
+
+    def test_preload_in_configure_is_shared(self):
+        """Should let every tool reuse a key another tool preloaded."""
+        from sakit.solana_transfer import SolanaTransferTool
+
+        keypair = Keypair()
+        tool = SolanaTransferTool()
+        tool.configure(
+            {
+                "tools": {
+                    "solana_transfer": {"rpc_url": "x", "private_key": str(keypair)}
+                }
+            }
+        )
+
+        assert len(get_keyring()) == 1
+        assert load_keypair(str(keypair)) is get_keyring().load(str(keypair)).keypair
+        assert load_address(str(keypair)) == str(keypair.pubkey())
@@ -0,0 +1,165 @@
+"""
+Tests for the durable nonce pool.
+
+Tests nonce account parsing, leasing, consumption tracking and bulk refresh.
+"""
+
+import struct
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+from sakit.utils.nonce import (
+    SYSTEM_PROGRAM_ID,
+    NonceLease,
+    NoncePool,
+    get_nonce_pool,
+    nonce_instructions,
+    parse_nonce_account,
+    reset_nonce_pools,
+)
+
+SYSTEM_PROGRAM = Pubkey.from_string(SYSTEM_PROGRAM_ID)
+
+
+@pytest.fixture(autouse=True)
+def _reset_pools():
+    reset_nonce_pools()
+    yield
+    reset_nonce_pools()
+
+
+def _nonce_data(authority: Pubkey, nonce: Hash, state: int = 1) -> bytes:
+    return struct.pack("<II", 1, state) + bytes(authority) + bytes(nonce) + bytes(8)
+
+
+class FakeRpc:
+    """Serves nonce accounts from a dict of address -> (authority, nonce)."""
+
+    def __init__(self, nonces):
+        self.nonces = nonces
+        self.get_multiple_accounts = AsyncMock(side_effect=self._get)
+
+    async def _get(self, keys):
+        return MagicMock(
+            value=[
+                SimpleNamespace(owner=SYSTEM_PROGRAM, data=_nonce_data(*self.nonces[k]))
+                if k in self.nonces
+                else None
+                for k in keys
+            ]
+        )
+
+
+class TestParseNonceAccount:
+    """Test parse_nonce_account."""
+
+    def test_parses_initialized_account(self):
+        """Should return the authority and nonce."""
+        authority, nonce = Keypair().pubkey(), Hash.new_unique()
+        assert parse_nonce_account(_nonce_data(authority, nonce)) == (authority, nonce)
+
+    def test_rejects_uninitialized_and_short_data(self):
+        """Should return None for anything but an initialized nonce account."""
+        data = _nonce_data(Keypair().pubkey(), Hash.new_unique(), state=0)
+        assert parse_nonce_account(data) is None
+        assert parse_nonce_account(bytes(10)) is None
+
+
+class TestNoncePool:
+    """Test NoncePool."""
+
+    @pytest.mark.asyncio
+    async def test_leases_each_account_once(self):
+        """Should lease distinct accounts and refresh them in one call."""
+        authority = Keypair().pubkey()
+        addresses = [Keypair().pubkey() for _ in range(2)]
+        rpc = FakeRpc({a: (authority, Hash.new_unique()) for a in addresses})
+        pool = NoncePool(authority, [str(a) for a in addresses])
+
+        first = await pool.acquire(rpc)
+        second = await pool.acquire(rpc)
+
+        assert {first.address, second.address} == set(addresses)
+        assert first.nonce == rpc.nonces[first.address][1]
+        assert await pool.acquire(rpc) is None
+        rpc.get_multiple_accounts.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_consumed_lease_is_refreshed(self):
+        """Should re-read a consumed nonce and reuse an unsent one as is."""
+        authority = Keypair().pubkey()
+        address = Keypair().pubkey()
+        rpc = FakeRpc({address: (authority, Hash.new_unique())})
+        pool = NoncePool(authority, [str(address)])
+
+        lease = await pool.acquire(rpc)
+        pool.release(lease, consumed=False)
+        assert (await pool.acquire(rpc)).nonce == lease.nonce
+        assert rpc.get_multiple_accounts.await_count == 1
+
+        pool.release(lease)
+        rpc.nonces[address] = (authority, Hash.new_unique())
+        refreshed = await pool.acquire(rpc)
+        assert refreshed.nonce == rpc.nonces[address][1]
+        assert rpc.get_multiple_accounts.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_consumed_nonce_is_not_leased_again(self):
+        """Should keep a consumed account stale until its nonce advances."""
+        authority = Keypair().pubkey()
+        address = Keypair().pubkey()
+        rpc = FakeRpc({address: (authority, Hash.new_unique())})
+        pool = NoncePool(authority, [str(address)])
+
+        lease = await pool.acquire(rpc)
+        pool.release(lease)
+        # The transaction has not landed yet, so the chain still has the old nonce
+        assert await pool.acquire(rpc) is None
+
+        rpc.nonces[address] = (authority, Hash.new_unique())
+        refreshed = await pool.acquire(rpc)
+        assert refreshed.nonce != lease.nonce
+        assert refreshed.nonce == rpc.nonces[address][1]
+
+    @pytest.mark.asyncio
+    async def test_drops_unusable_accounts(self):
+        """Should drop missing accounts and accounts of another authority."""
+        authority = Keypair().pubkey()
+        missing, foreign = Keypair().pubkey(), Keypair().pubkey()
+        rpc = FakeRpc({foreign: (Keypair().pubkey(), Hash.new_unique())})
+        pool = NoncePool(authority, [str(missing), str(foreign)])
+
+        assert await pool.acquire(rpc) is None
+        assert pool.available == 0
+        pool.add([str(missing)])
+        assert pool.available == 0
+
+    def test_registry_per_authority(self):
+        """Should share one pool per authority and add new accounts to it."""
+        authority = str(Keypair().pubkey())
+        pool = get_nonce_pool(authority, [str(Keypair().pubkey())])
+        assert get_nonce_pool(authority, [str(Keypair().pubkey())]) is pool
+        assert pool.available == 2
+
+
+class TestNonceInstructions:
+    """Test nonce_instructions."""
+
+    def test_prepends_advance_instruction(self):
+        """Should put AdvanceNonceAccount first, signed by the authority."""
+        lease = NonceLease(Keypair().pubkey(), Keypair().pubkey(), Hash.new_unique())
+        ix = MagicMock()
+
+        ixs = nonce_instructions(lease, [ix])
+
+        assert ixs[1] is ix
+        assert ixs[0].program_id == SYSTEM_PROGRAM
+        assert ixs[0].accounts[0].pubkey == lease.address
+        assert ixs[0].accounts[2].pubkey == lease.authority
+        assert ixs[0].accounts[2].is_signer
+        assert nonce_instructions(None, [ix]) == [ix]
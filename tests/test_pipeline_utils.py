@@ -0,0 +1,85 @@
+"""
+Tests for async stage pipeline utility.
+
+Tests dependency ordering, overlap of independent stages, timing, and
+cleanup of unfinished stages.
+"""
+
+import asyncio
+
+import pytest
+
+from sakit.utils.pipeline import StagePipeline
+
+
+async def _sleep_return(value, delay: float = 0.05):
+    await asyncio.sleep(delay)
+    return value
+
+
+class TestStagePipeline:
+    """Test StagePipeline."""
+
+    @pytest.mark.asyncio
+    async def test_dependencies_receive_results(self):
+        """Should pass dependency results to a stage in order."""
+        pipeline = StagePipeline()
+        pipeline.add("a", lambda: _sleep_return(2, 0.01))
+        pipeline.add("b", lambda: 3)
+        pipeline.add("c", lambda a, b: a * 10 + b, "a", "b")
+        assert await pipeline.result("c") == 23
+        await pipeline.aclose()
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self):
+        """Should run independent stages concurrently."""
+        pipeline = StagePipeline()
+        pipeline.add("order", lambda: _sleep_return("order", 0.1))
+        pipeline.add("blockhash", lambda: _sleep_return("hash", 0.1))
+        pipeline.add("tx", lambda o, b: f"{o}:{b}", "order", "blockhash")
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await pipeline.result("tx") == "order:hash"
+        assert loop.time() - start < 0.18
+
+        timings = pipeline.timings()
+        assert set(timings) == {"order", "blockhash", "tx"}
+        assert timings["order"]["duration_ms"] >= 90
+        assert timings["tx"]["start_ms"] >= timings["order"]["duration_ms"]
+        await pipeline.aclose()
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_dependents(self):
+        """Should raise a stage's exception from its dependents."""
+
+        def fail():
+            raise RuntimeError("boom")
+
+        pipeline = StagePipeline()
+        pipeline.add("a", fail)
+        pipeline.add("b", lambda a: a, "a")
+        with pytest.raises(RuntimeError, match="boom"):
+            await pipeline.result("b")
+        assert "a" in pipeline.timings()
+        await pipeline.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_unfinished_stages(self):
+        """Should cancel stages that are still running."""
+        pipeline = StagePipeline()
+        task = pipeline.add("slow", lambda: _sleep_return(1, 10))
+        await pipeline.aclose()
+        assert task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_invalid_stages(self):
+        """Should reject duplicate names and unknown dependencies."""
+        pipeline = StagePipeline()
+        pipeline.add("a", lambda: 1)
+        assert "a" in pipeline
+        with pytest.raises(ValueError):
+            pipeline.add("a", lambda: 1)
+        with pytest.raises(ValueError):
+            pipeline.add("b", lambda x: x, "missing")
+        await pipeline.aclose()
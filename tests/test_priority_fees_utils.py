@@ -0,0 +1,138 @@
+"""
+Tests for the priority fee oracle.
+
+Tests rolling percentiles per writable-account set, strategies and caps,
+fallback to the global fee market, and background sampling.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from sakit.utils.priority_fees import (
+    FEE_SAMPLE_SLOTS,
+    PriorityFeeOracle,
+    get_fee_oracle,
+    reset_fee_oracles,
+)
+
+
+def _samples(fees, start_slot=1):
+    return [
+        {"slot": start_slot + i, "prioritizationFee": fee} for i, fee in enumerate(fees)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _reset_fee_oracles():
+    """Stop shared oracles between tests."""
+    reset_fee_oracles()
+    yield
+    reset_fee_oracles()
+
+
+class TestPriorityFeeOracle:
+    """Test PriorityFeeOracle."""
+
+    @pytest.mark.asyncio
+    async def test_percentiles_and_cap(self):
+        """Should answer each strategy from memory and apply the cap."""
+        oracle = PriorityFeeOracle(fetch=AsyncMock())
+        oracle.record(["A"], _samples(range(1, 101)))
+
+        assert oracle.estimate(["A"], "p50", cap=None) == 50
+        assert oracle.estimate(["A"], "p75", cap=None) == 75
+        assert oracle.estimate(["A"], "p90", cap=None) == 90
+        assert oracle.estimate(["A"], "p90", cap=60) == 60
+        oracle.fetch.assert_not_called()
+        oracle.stop()
+
+    @pytest.mark.asyncio
+    async def test_unknown_strategy(self):
+        """Should reject strategies other than p50/p75/p90."""
+        oracle = PriorityFeeOracle(fetch=AsyncMock())
+        with pytest.raises(ValueError):
+            oracle.estimate(["A"], "p99")
+
+    @pytest.mark.asyncio
+    async def test_account_sets_are_independent(self):
+        """Should key fees by the unordered set of writable accounts."""
+        oracle = PriorityFeeOracle(fetch=AsyncMock())
+        oracle.record(["A", "B"], _samples([1000]))
+        oracle.record(["C"], _samples([10]))
+
+        assert oracle.estimate(["B", "A", "A"], cap=None) == 1000
+        assert oracle.estimate(["C"], cap=None) == 10
+        oracle.stop()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_global_fees(self):
+        """Should use the global fee market until an account set has samples."""
+        oracle = PriorityFeeOracle(fetch=AsyncMock())
+        assert oracle.estimate(["A"]) is None
+
+        oracle.record([], _samples([500]))
+        assert oracle.estimate(["A"], cap=None) == 500
+        oracle.stop()
+
+    def test_rolling_window(self):
+        """Should keep only the most recent slots."""
+        oracle = PriorityFeeOracle(fetch=AsyncMock())
+        oracle.record(["A"], _samples([1_000_000] * 10))
+        oracle.record(["A"], _samples([5] * FEE_SAMPLE_SLOTS, start_slot=100))
+
+        assert oracle.estimate(["A"], "p90", cap=None) == 5
+
+    @pytest.mark.asyncio
+    async def test_get_fee_samples_once_when_cold(self):
+        """Should sample on the first query only and serve later ones from memory."""
+        fetch = AsyncMock(return_value=_samples([100, 200, 300, 400]))
+        oracle = PriorityFeeOracle(fetch=fetch)
+
+        assert await oracle.get_fee(["B", "A"], "p75", cap=None) == 300
+        assert await oracle.get_fee(["A", "B"], "p75", cap=None) == 300
+        fetch.assert_awaited_once_with(["A", "B"])
+        oracle.stop()
+
+    @pytest.mark.asyncio
+    async def test_get_fee_fails_open(self):
+        """Should return the default fee when sampling fails."""
+        oracle = PriorityFeeOracle(fetch=AsyncMock(side_effect=Exception("down")))
+
+        assert await oracle.get_fee(["A"], default=42) == 42
+        oracle.stop()
+
+    @pytest.mark.asyncio
+    async def test_background_sampling(self):
+        """Should refresh tracked account sets in the background."""
+        fetch = AsyncMock(return_value=_samples([700]))
+        oracle = PriorityFeeOracle(fetch=fetch, sample_interval=0.01)
+        oracle.record(["A"], _samples([1]))
+
+        assert oracle.estimate(["A"], cap=None) == 1
+        await asyncio.sleep(0.05)
+
+        assert fetch.await_count >= 1
+        assert oracle.estimate(["A"], cap=None) == 700
+        oracle.stop()
+
+    @pytest.mark.asyncio
+    async def test_background_sampling_stops_when_idle(self):
+        """Should stop sampling once no account set has been queried recently."""
+        fetch = AsyncMock(return_value=[])
+        oracle = PriorityFeeOracle(fetch=fetch, sample_interval=0.01, idle_timeout=0)
+        oracle.estimate(["A"])
+        await asyncio.sleep(0.05)
+
+        assert oracle._task.done()
+        fetch.assert_not_awaited()
+
+
+class TestGetFeeOracle:
+    """Test shared oracle registry."""
+
+    def test_shared_per_rpc_url(self):
+        """Should share one oracle per RPC URL."""
+        assert get_fee_oracle("http://a") is get_fee_oracle("http://a")
+        assert get_fee_oracle("http://a") is not get_fee_oracle("http://b")
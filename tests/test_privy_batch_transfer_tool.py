@@ -0,0 +1,135 @@
+"""
+Tests for Privy Batch Transfer Tool.
+
+Tests the PrivyBatchTransferTool which packs many transfers into as few
+transactions as possible, pre-signs them with the fee payer and sends them
+through Privy concurrently.
+"""
+
+import base64
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.transaction import VersionedTransaction
+
+from sakit.privy_batch_transfer import PrivyBatchTransferTool
+from sakit.utils.batch_transfer import SOL_MINT
+
+FEE_PAYER = Keypair()
+WALLET = Keypair().pubkey()
+
+
+def _fake_rpc():
+    """RPC client whose getMultipleAccounts finds nothing."""
+    rpc = MagicMock()
+    rpc.get_multiple_accounts = AsyncMock(
+        side_effect=lambda keys: MagicMock(value=[None] * len(keys))
+    )
+    return rpc
+
+
+@pytest.fixture
+def batch_tool():
+    """Create a configured PrivyBatchTransferTool."""
+    tool = PrivyBatchTransferTool()
+    tool.configure(
+        {
+            "tools": {
+                "privy_batch_transfer": {
+                    "app_id": "test-app-id",
+                    "app_secret": "test-app-secret",
+                    "signing_key": "wallet-auth:test-key",
+                    "rpc_url": "https://api.mainnet-beta.solana.com",
+                    "fee_payer": str(FEE_PAYER),
+                    "fee_percentage": 1.0,
+                }
+            }
+        }
+    )
+    return tool
+
+
+class TestPrivyBatchTransferToolExecute:
+    """Test execute."""
+
+    @pytest.mark.asyncio
+    async def test_missing_wallet_params(self, batch_tool):
+        """Should require wallet_id and wallet_public_key."""
+        result = await batch_tool.execute(
+            wallet_id="", wallet_public_key="", transfers=[]
+        )
+        assert result["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_fee_payer_signs_and_privy_sends(self, batch_tool):
+        """Should fee-payer sign each packed transaction and send it via Privy."""
+        rows = [
+            {"to_address": str(Keypair().pubkey()), "amount": 0.01, "mint": SOL_MINT}
+            for _ in range(5)
+        ]
+        sent = []
+        rpc = _fake_rpc()
+
+        async def fake_sign_and_send(wallet_id, encoded_tx, client, key):
+            tx = VersionedTransaction.from_bytes(base64.b64decode(encoded_tx))
+            sent.append(tx)
+            return {"data": {"hash": f"sig{len(sent)}"}}
+
+        with (
+            patch("sakit.privy_batch_transfer.AsyncPrivyAPI"),
+            patch("sakit.privy_batch_transfer.get_rpc_client", return_value=rpc),
+            patch(
+                "sakit.privy_batch_transfer.get_fresh_blockhash",
+                new=AsyncMock(return_value={"blockhash": str(Hash.new_unique())}),
+            ),
+            patch(
+                "sakit.privy_batch_transfer.privy_sign_and_send",
+                side_effect=fake_sign_and_send,
+            ),
+            patch("sakit.privy_batch_transfer.invalidate_holdings"),
+        ):
+            result = await batch_tool.execute(
+                wallet_id="wallet-1",
+                wallet_public_key=str(WALLET),
+                transfers=rows,
+            )
+
+        assert result["status"] == "success"
+        assert result["transferred"] == 5
+        assert len(sent) == 1
+        tx = sent[0]
+        assert tx.message.account_keys[0] == FEE_PAYER.pubkey()
+        assert tx.verify_with_results()[0] is True
+        # 5 transfers plus one aggregated fee transfer after the compute budget
+        assert len(tx.message.instructions) == 1 + 5 + 1
+        assert result["transactions"][0]["signature"] == "sig1"
+
+    @pytest.mark.asyncio
+    async def test_privy_failure_is_reported_per_row(self, batch_tool):
+        """Should report rows of failed transactions as errors."""
+        rows = [
+            {"to_address": str(Keypair().pubkey()), "amount": 0.01, "mint": SOL_MINT}
+        ]
+        rpc = _fake_rpc()
+        with (
+            patch("sakit.privy_batch_transfer.AsyncPrivyAPI"),
+            patch("sakit.privy_batch_transfer.get_rpc_client", return_value=rpc),
+            patch(
+                "sakit.privy_batch_transfer.get_fresh_blockhash",
+                new=AsyncMock(return_value={"blockhash": str(Hash.new_unique())}),
+            ),
+            patch(
+                "sakit.privy_batch_transfer.privy_sign_and_send",
+                new=AsyncMock(side_effect=Exception("rate limited")),
+            ),
+        ):
+            result = await batch_tool.execute(
+                wallet_id="wallet-1",
+                wallet_public_key=str(WALLET),
+                transfers=rows,
+            )
+
+        assert result["status"] == "error"
+        assert result["errors"][0]["message"] == "rate limited"
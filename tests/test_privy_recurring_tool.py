@@ -158,7 +158,12 @@ class TestPrivyRecurringToolSchema:
         """Should include action in required properties."""
         schema = privy_recurring_tool.get_schema()
         assert "action" in schema["properties"]
-        assert schema["properties"]["action"]["enum"] == ["create", "cancel", "list"]
+        assert schema["properties"]["action"]["enum"] == [
+            "create",
+            "cancel",
+            "list",
+            "job_status",
+        ]
 
     def test_schema_has_dca_properties(self, privy_recurring_tool):
         """Should include DCA order creation properties."""
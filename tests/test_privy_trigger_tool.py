@@ -5,12 +5,15 @@ Tests the PrivyTriggerTool which uses Jupiter Trigger API with
 Privy delegated wallets for transaction signing.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 
 from sakit.privy_trigger import (
     PrivyTriggerTool,
     PrivyTriggerPlugin,
+    PRIVY_SIGN_CONCURRENCY,
     _privy_sign_transaction,
     get_plugin,
 )
@@ -166,6 +169,7 @@ class TestPrivyTriggerToolSchema:
             "cancel",
             "cancel_all",
             "list",
+            "job_status",
         ]
 
     def test_schema_has_order_properties(self, privy_trigger_tool):
@@ -493,10 +497,18 @@ class TestPrivyTriggerToolCancelAction:
                 action="cancel",
                 order_pubkey="UserOwnedOrder123",
             )
+            listed = await privy_trigger_tool.execute(
+                wallet_id="wallet-123",
+                wallet_public_key="UserPublicKey123",
+                action="list",
+            )
 
         assert result["status"] == "success"
         assert result["action"] == "cancel"
         assert result["order_pubkey"] == "UserOwnedOrder123"
+        # The cancel is recorded in the order mirror; list needs no refetch
+        assert listed["order_count"] == 0
+        assert mock_instance.get_orders.await_count == 1
 
 
 class TestPrivyTriggerToolCancelAllAction:
@@ -521,6 +533,24 @@ class TestPrivyTriggerToolCancelAllAction:
         assert result["cancelled_count"] == 0
         assert "no active orders" in result["message"].lower()
 
+    @pytest.mark.asyncio
+    async def test_cancel_all_refetches_orders(self, privy_trigger_tool):
+        """Should list orders fresh rather than from the mirror."""
+        with patch("sakit.privy_trigger.JupiterTrigger") as MockTrigger:
+            mock_instance = MockTrigger.return_value
+            mock_instance.get_orders = AsyncMock(
+                return_value={"success": True, "orders": []}
+            )
+
+            for _ in range(2):
+                await privy_trigger_tool.execute(
+                    wallet_id="wallet-123",
+                    wallet_public_key="UserPublicKey123",
+                    action="cancel_all",
+                )
+
+        assert mock_instance.get_orders.await_count == 2
+
     @pytest.mark.asyncio
     async def test_cancel_all_success(self, privy_trigger_tool):
         """Should successfully cancel all orders."""
@@ -553,6 +583,11 @@ class TestPrivyTriggerToolCancelAllAction:
                 new_callable=AsyncMock,
                 return_value={"success": True, "signature": "sig-123"},
             ),
+            patch(
+                "sakit.privy_trigger.confirm_signatures",
+                new_callable=AsyncMock,
+                return_value=[None, None],
+            ),
         ):
             mock_instance = MockTrigger.return_value
             mock_instance.get_orders = AsyncMock(
@@ -573,6 +608,81 @@ class TestPrivyTriggerToolCancelAllAction:
         assert result["action"] == "cancel_all"
         assert result["cancelled_count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_cancel_all_signs_concurrently_with_one_blockhash(
+        self, privy_trigger_tool
+    ):
+        """Should share one blockhash, bound Privy signing and report failures."""
+        mock_cancel_result = MagicMock()
+        mock_cancel_result.success = True
+        mock_cancel_result.transactions = [f"cancel-tx-{i}" for i in range(10)]
+        mock_cancel_result.request_id = "req-cancel-all"
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_sign(privy_client, wallet_id, tx, signing_key):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return None if tx == "cancel-tx-3" else "dGVzdA=="
+
+        sends = iter(range(10))
+
+        async def fake_send(**kwargs):
+            assert kwargs["skip_confirmation"] is True
+            return {"success": True, "signature": f"sig-{next(sends)}"}
+
+        with (
+            patch("sakit.privy_trigger.JupiterTrigger") as MockTrigger,
+            patch("sakit.privy_trigger._privy_sign_transaction", new=fake_sign),
+            patch(
+                "sakit.privy_trigger.get_fresh_blockhash",
+                new_callable=AsyncMock,
+                return_value={
+                    "blockhash": "FreshBlockhash123",
+                    "lastValidBlockHeight": 12345,
+                },
+            ) as mock_blockhash,
+            patch(
+                "sakit.privy_trigger.replace_blockhash_in_transaction",
+                side_effect=lambda tx, blockhash: tx,
+            ),
+            patch(
+                "sakit.privy_trigger.send_raw_transaction_with_priority", new=fake_send
+            ),
+            patch(
+                "sakit.privy_trigger.confirm_signatures",
+                new_callable=AsyncMock,
+                side_effect=lambda rpc_url, sigs, lvbh: [None] * len(sigs),
+            ) as mock_confirm,
+        ):
+            mock_instance = MockTrigger.return_value
+            mock_instance.get_orders = AsyncMock(
+                return_value={
+                    "success": True,
+                    "orders": [{"order": f"order{i}"} for i in range(10)],
+                }
+            )
+            mock_instance.cancel_orders = AsyncMock(return_value=mock_cancel_result)
+
+            result = await privy_trigger_tool.execute(
+                wallet_id="wallet-123",
+                wallet_public_key="UserPublicKey123",
+                action="cancel_all",
+            )
+
+        assert mock_blockhash.await_count == 1
+        assert 1 < max_in_flight <= PRIVY_SIGN_CONCURRENCY
+        mock_confirm.assert_awaited_once()
+        assert mock_confirm.await_args.args[2] == 12345
+        assert result["status"] == "success"
+        assert len(result["signatures"]) == 9
+        assert result["failed_transactions"] == 1
+        assert "cancelled_count" not in result
+
 
 class TestPrivyTriggerToolListAction:
     """Test list action."""
@@ -151,7 +151,7 @@ class TestPrivyUltraQuoteToolExecute:
         mock_order.gasless = False
 
         with (
-            patch("sakit.privy_ultra_quote.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.privy_ultra_quote.JupiterUltra") as MockUltra,
         ):
             mock_payer_keypair = MagicMock()
@@ -231,7 +231,7 @@ class TestPrivyUltraQuoteToolExecute:
         mock_order.gasless = True
 
         with (
-            patch("sakit.privy_ultra_quote.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.privy_ultra_quote.JupiterUltra") as MockUltra,
         ):
             mock_payer_keypair = MagicMock()
@@ -168,6 +168,23 @@ class TestPrivyUltraToolExecute:
             assert result["status"] == "error"
             assert "transaction" in result["message"].lower()
 
+    @pytest.mark.asyncio
+    async def test_sign_and_execute_closes_only_its_own_pipeline(self, ultra_tool):
+        """Should close a pipeline it created but leave a caller's open."""
+        ultra_tool._rpc_url = None
+        own = MagicMock(aclose=AsyncMock())
+        given = MagicMock(aclose=AsyncMock())
+
+        with patch("sakit.privy_ultra.StagePipeline", return_value=own):
+            first = await ultra_tool._sign_and_execute(MagicMock(), "wallet-123", "tx")
+            second = await ultra_tool._sign_and_execute(
+                MagicMock(), "wallet-123", "tx", pipeline=given
+            )
+
+        assert first["status"] == second["status"] == "error"
+        own.aclose.assert_awaited_once()
+        given.aclose.assert_not_awaited()
+
 
 class TestPrivyUltraPlugin:
     """Test plugin class."""
@@ -293,6 +310,56 @@ class TestPrivyUltraToolExecuteSuccess:
             assert result["signature"] == "sig-456"
             assert result["swap_type"] == "ExactIn"
             assert result["gasless"] is False
+            assert "order" in result["timings"]
+
+    @pytest.mark.asyncio
+    async def test_execute_prefetches_blockhash_with_order(self, configured_ultra_tool):
+        """Should fetch the blockhash concurrently with the order."""
+        import asyncio
+
+        events = []
+
+        async def get_order(**kwargs):
+            events.append("order_start")
+            await asyncio.sleep(0.05)
+            events.append("order_end")
+            order = MagicMock()
+            order.transaction = "mock-transaction-base64"
+            order.price_impact = None
+            return order
+
+        async def get_blockhash(rpc_url):
+            events.append("blockhash_start")
+            return {"blockhash": "hash"}
+
+        async def sign_and_execute(
+            privy_client, wallet_id, transaction_base64, pipeline
+        ):
+            assert await pipeline.result("blockhash") == {"blockhash": "hash"}
+            return {"status": "success", "signature": "sig"}
+
+        with (
+            patch("sakit.privy_ultra.JupiterUltra") as MockUltra,
+            patch("sakit.privy_ultra.get_fresh_blockhash", side_effect=get_blockhash),
+            patch.object(
+                configured_ultra_tool, "_sign_and_execute", side_effect=sign_and_execute
+            ),
+        ):
+            mock_instance = AsyncMock()
+            mock_instance.get_order = AsyncMock(side_effect=get_order)
+            MockUltra.return_value = mock_instance
+
+            result = await configured_ultra_tool.execute(
+                wallet_id="wallet-123",
+                wallet_public_key="WalletPubkey123",
+                input_mint="So11111111111111111111111111111111111111112",
+                output_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+                amount=1000000000,
+            )
+
+        assert result["status"] == "success"
+        assert events.index("blockhash_start") < events.index("order_end")
+        assert set(result["timings"]) >= {"payer", "order", "blockhash", "signing_key"}
 
     @pytest.mark.asyncio
     async def test_execute_sign_and_execute_failure(self, configured_ultra_tool):
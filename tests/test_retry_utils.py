@@ -0,0 +1,133 @@
+"""
+Tests for the shared retry policy.
+
+Tests decorrelated jitter bounds, deadline budgeting, status and exception
+classification, and idempotency-aware retries of HTTP requests.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from sakit.utils.retry import RetryPolicy, request_with_retry
+
+FAST = RetryPolicy(
+    max_attempts=4, base_delay=0.001, max_delay=0.005, deadline=5.0, attempt_timeout=1.0
+)
+
+
+def _client(post):
+    """Patchable httpx.AsyncClient whose post is `post`."""
+    instance = AsyncMock()
+    instance.post = post
+    instance.__aenter__ = AsyncMock(return_value=instance)
+    instance.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=instance)
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy."""
+
+    def test_backoff_stays_within_bounds(self):
+        """Should draw delays between base_delay and max_delay."""
+        policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+        delay = policy.base_delay
+        for _ in range(50):
+            delay = policy.backoff(delay)
+            assert 0.5 <= delay <= 4.0
+
+    def test_classifies_statuses(self):
+        """Should retry gateway errors only when the request is idempotent."""
+        policy = RetryPolicy()
+        assert policy.should_retry_status(504)
+        assert policy.should_retry_status(429)
+        assert not policy.should_retry_status(500)
+        assert not policy.should_retry_status(400)
+        assert not policy.should_retry_status(504, idempotent=False)
+        assert policy.should_retry_status(429, idempotent=False)
+
+    def test_classifies_exceptions(self):
+        """Should retry unsent requests always and ambiguous ones if idempotent."""
+        policy = RetryPolicy()
+        assert policy.should_retry_exception(httpx.ConnectError("refused"))
+        assert policy.should_retry_exception(
+            httpx.ConnectError("refused"), idempotent=False
+        )
+        assert policy.should_retry_exception(httpx.ReadTimeout("slow"))
+        assert not policy.should_retry_exception(
+            httpx.ReadTimeout("slow"), idempotent=False
+        )
+        assert not policy.should_retry_exception(ValueError("bad"))
+
+    @pytest.mark.asyncio
+    async def test_attempts_stop_at_deadline(self):
+        """Should stop yielding once the deadline cannot cover another attempt."""
+        policy = RetryPolicy(
+            max_attempts=100,
+            base_delay=0.02,
+            max_delay=0.02,
+            deadline=0.1,
+            attempt_timeout=1.0,
+        )
+        timeouts = [timeout async for timeout in policy.attempts()]
+
+        assert 1 < len(timeouts) < 100
+        assert all(timeout <= 0.1 for timeout in timeouts)
+
+
+class TestRequestWithRetry:
+    """Test request_with_retry."""
+
+    @pytest.mark.asyncio
+    async def test_retries_gateway_timeout_then_succeeds(self):
+        """Should retry a 504 and return the first non-retryable response."""
+        post = AsyncMock(
+            side_effect=[MagicMock(status_code=504), MagicMock(status_code=200)]
+        )
+        with patch("httpx.AsyncClient", _client(post)):
+            response = await request_with_retry("POST", "https://api/execute", FAST)
+
+        assert response.status_code == 200
+        assert post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_returns_last_response_when_attempts_run_out(self):
+        """Should return the last retryable response after max_attempts."""
+        post = AsyncMock(return_value=MagicMock(status_code=503))
+        with patch("httpx.AsyncClient", _client(post)):
+            response = await request_with_retry("POST", "https://api/execute", FAST)
+
+        assert response.status_code == 503
+        assert post.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_does_not_repeat_non_idempotent_requests(self):
+        """Should not retry an ambiguous failure of a non-idempotent request."""
+        post = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+        with patch("httpx.AsyncClient", _client(post)):
+            with pytest.raises(httpx.ReadTimeout):
+                await request_with_retry(
+                    "POST", "https://api/order", FAST, idempotent=False
+                )
+
+        assert post.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_attempt_timeout_bounds_slow_requests(self):
+        """Should cut a hanging attempt at the policy's attempt timeout."""
+
+        async def hang(url, **kwargs):
+            await asyncio.sleep(10)
+
+        policy = RetryPolicy(
+            max_attempts=2,
+            base_delay=0.001,
+            max_delay=0.001,
+            deadline=0.2,
+            attempt_timeout=0.05,
+        )
+        with patch("httpx.AsyncClient", _client(AsyncMock(side_effect=hang))):
+            with pytest.raises(asyncio.TimeoutError):
+                await request_with_retry("POST", "https://api/execute", policy)
@@ -0,0 +1,245 @@
+"""
+Tests for swap route racing utility.
+
+Tests normalization of Ultra and DFlow orders and the deadline-based race
+between both aggregators.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sakit.utils.dflow import DFlowOrderResponse
+from sakit.utils.routing import (
+    SOL_MINT,
+    dflow_route,
+    race_routes,
+    reset_fee_accounts,
+    ultra_route,
+)
+from sakit.utils.ultra import UltraOrderResponse
+
+USDC = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+REFERRAL = "REFER4ZgmyYx9c6He5XfaTMiGfdLwRnkV4RPp9t9iF3"
+
+
+@pytest.fixture(autouse=True)
+def _reset_fee_accounts():
+    reset_fee_accounts()
+    yield
+    reset_fee_accounts()
+
+
+def _rpc(exists: bool):
+    """Patch the pooled RPC client to report whether the fee account exists."""
+    rpc = MagicMock()
+    rpc.get_account_info = AsyncMock(
+        return_value=MagicMock(value=MagicMock() if exists else None)
+    )
+    return patch("sakit.utils.routing.get_rpc_client", return_value=rpc), rpc
+
+
+def _ultra_order(out_amount: str = "100", gasless: bool = False, **raw):
+    return UltraOrderResponse(
+        request_id="req-1",
+        transaction="ultra-tx",
+        in_amount="1000",
+        out_amount=out_amount,
+        input_mint=USDC,
+        output_mint=SOL_MINT,
+        slippage_bps=50,
+        swap_type="aggregator",
+        price_impact=-0.25,
+        in_usd_value=None,
+        out_usd_value=None,
+        gasless=gasless,
+        raw_response=raw,
+    )
+
+
+def _dflow_order(out_amount: str = "100", fee: int = 0):
+    return DFlowOrderResponse(
+        success=True,
+        transaction="dflow-tx",
+        in_amount="1000",
+        out_amount=out_amount,
+        slippage_bps=30,
+        prioritization_fee_lamports=fee,
+    )
+
+
+def _client(method: str, result=None, delay: float = 0.0, error: Exception = None):
+    async def call(**kwargs):
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return result
+
+    client = MagicMock()
+    setattr(client, method, AsyncMock(side_effect=call))
+    return client
+
+
+class TestRouteNormalization:
+    """Test conversion of aggregator orders to RouteQuote."""
+
+    def test_ultra_fees_subtracted_for_sol_output(self):
+        """Should subtract network fees from SOL output."""
+        order = _ultra_order(
+            "1000000", signatureFeeLamports=5000, prioritizationFeeLamports="1000"
+        )
+        route = ultra_route(order, SOL_MINT)
+        assert route.success is True
+        assert route.network_fee_lamports == 6000
+        assert route.net_out_amount == 994000
+        assert route.price_impact_pct == "-0.25%"
+
+    def test_ultra_gasless_and_token_output(self):
+        """Should ignore fees for gasless orders and non-SOL output."""
+        order = _ultra_order("1000", gasless=True, signatureFeeLamports=5000)
+        assert ultra_route(order, SOL_MINT).net_out_amount == 1000
+        order = _ultra_order("1000", signatureFeeLamports=5000)
+        assert ultra_route(order, USDC).net_out_amount == 1000
+
+    def test_dflow_failure(self):
+        """Should mark failed DFlow orders unsuccessful."""
+        route = dflow_route(DFlowOrderResponse(success=False, error="boom"), USDC)
+        assert route.success is False
+        assert route.error == "boom"
+
+    def test_dflow_success(self):
+        """Should subtract the priority fee from SOL output."""
+        route = dflow_route(_dflow_order("50000", fee=2000), SOL_MINT)
+        assert route.net_out_amount == 48000
+        assert route.transaction == "dflow-tx"
+
+
+class TestRaceRoutes:
+    """Test racing Ultra against DFlow."""
+
+    @pytest.mark.asyncio
+    async def test_picks_higher_net_output(self):
+        """Should choose the route with the larger net output."""
+        ultra = _client("get_order", _ultra_order("100"))
+        dflow = _client("get_order", _dflow_order("120"))
+        decision = await race_routes(USDC, SOL_MINT, 1000, "taker", ultra, dflow)
+        assert decision.best.provider == "dflow"
+        assert set(decision.quotes) == {"ultra", "dflow"}
+        assert decision.summary()["ultra"]["out_amount"] == "100"
+
+    @pytest.mark.asyncio
+    async def test_fees_can_flip_the_winner(self):
+        """Should compare outputs net of network fees."""
+        ultra = _client("get_order", _ultra_order("100000"))
+        dflow = _client("get_order", _dflow_order("100500", fee=1000))
+        decision = await race_routes(USDC, SOL_MINT, 1000, "taker", ultra, dflow)
+        assert decision.best.provider == "ultra"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_other_times_out(self):
+        """Should use the answered route and cancel the slow one."""
+        ultra = _client("get_order", _ultra_order("100"))
+        dflow = _client("get_order", _dflow_order("500"), delay=5)
+        decision = await race_routes(
+            USDC, SOL_MINT, 1000, "taker", ultra, dflow, deadline=0.05
+        )
+        assert decision.best.provider == "ultra"
+        assert decision.timed_out == ["dflow"]
+        assert decision.summary()["dflow"] == {"error": "timed out"}
+
+    @pytest.mark.asyncio
+    async def test_waits_for_first_success_after_deadline(self):
+        """Should wait past the deadline when nothing succeeded yet."""
+        ultra = _client("get_order", error=Exception("Failed to get order: 500"))
+        dflow = _client("get_order", _dflow_order("90"), delay=0.1)
+        decision = await race_routes(
+            USDC, SOL_MINT, 1000, "taker", ultra, dflow, deadline=0.01
+        )
+        assert decision.best.provider == "dflow"
+        assert decision.quotes["ultra"].error == "Failed to get order: 500"
+        assert decision.timed_out == []
+
+    @pytest.mark.asyncio
+    async def test_all_routes_fail(self):
+        """Should return no best route when every aggregator fails."""
+        ultra = _client("get_order", error=Exception("down"))
+        dflow = _client("get_order", DFlowOrderResponse(success=False, error="x"))
+        decision = await race_routes(USDC, SOL_MINT, 1000, "taker", ultra, dflow)
+        assert decision.best is None
+
+    @pytest.mark.asyncio
+    async def test_passes_payer_to_both(self):
+        """Should send the payer as Ultra payer and DFlow sponsor."""
+        ultra = _client("get_order", _ultra_order())
+        dflow = _client("get_order", _dflow_order())
+        await race_routes(
+            USDC, SOL_MINT, 1000, "taker", ultra, dflow, payer="payer", referral_fee=50
+        )
+        ultra_kwargs = ultra.get_order.call_args.kwargs
+        assert ultra_kwargs["payer"] == "payer"
+        assert ultra_kwargs["close_authority"] == "taker"
+        assert ultra_kwargs["referral_fee"] == 50
+        assert dflow.get_order.call_args.kwargs["sponsor"] == "payer"
+
+    @pytest.mark.asyncio
+    async def test_charges_referral_fee_on_dflow(self):
+        """Should send the referral fee to DFlow and compare outputs net of it."""
+        ultra = _client("get_order", _ultra_order("99500"))
+        # Gross 100000 minus a 100 bps fee nets 99000, below Ultra's 99500
+        dflow = _client("get_order", _dflow_order("100000"))
+        patcher, rpc = _rpc(exists=True)
+        with patcher:
+            for _ in range(2):
+                decision = await race_routes(
+                    USDC,
+                    USDC,
+                    1000,
+                    "taker",
+                    ultra,
+                    dflow,
+                    referral_account=REFERRAL,
+                    referral_fee=100,
+                    rpc_url="https://rpc",
+                )
+
+        dflow_kwargs = dflow.get_order.call_args.kwargs
+        assert dflow_kwargs["platform_fee_bps"] == 100
+        assert dflow_kwargs["platform_fee_mode"] == "outputMint"
+        assert dflow_kwargs["fee_account"] not in (None, REFERRAL)
+        assert decision.quotes["dflow"].net_out_amount == 99000
+        assert decision.best.provider == "ultra"
+        # The fee account lookup is cached per mint
+        rpc.get_account_info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_dflow_without_fee_account(self):
+        """Should leave DFlow out when the referral token account is missing."""
+        ultra = _client("get_order", _ultra_order("100"))
+        dflow = _client("get_order", _dflow_order("500"))
+        patcher, _ = _rpc(exists=False)
+        with patcher:
+            decision = await race_routes(
+                USDC,
+                USDC,
+                1000,
+                "taker",
+                ultra,
+                dflow,
+                referral_account=REFERRAL,
+                referral_fee=100,
+                rpc_url="https://rpc",
+            )
+
+        dflow.get_order.assert_not_awaited()
+        assert decision.best.provider == "ultra"
+        assert decision.quotes["dflow"].success is False
+        assert "referral token account" in decision.quotes["dflow"].error
+
+    @pytest.mark.asyncio
+    async def test_single_provider(self):
+        """Should work with only one aggregator and with none."""
+        ultra = _client("get_order", _ultra_order())
+        decision = await race_routes(USDC, SOL_MINT, 1000, "taker", ultra=ultra)
+        assert decision.best.provider == "ultra"
+        assert (await race_routes(USDC, SOL_MINT, 1000, "taker")).best is None
@@ -0,0 +1,132 @@
+"""
+Tests for shared Shield verdict cache utility.
+
+Tests TTL and negative caching, micro-batching of concurrent lookups, and
+the fail-open pre-trade check.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sakit.utils.shield import (
+    ShieldCache,
+    get_shield_cache,
+    pre_trade_check,
+    reset_shield_caches,
+)
+
+CRITICAL = {"type": "freeze_authority", "severity": "critical"}
+INFO = {"type": "new_listing", "severity": "info"}
+
+
+def _ultra(warnings=None, error: Exception = None):
+    ultra = MagicMock()
+    if error:
+        ultra.get_shield = AsyncMock(side_effect=error)
+    else:
+        ultra.get_shield = AsyncMock(return_value={"warnings": warnings or {}})
+    return ultra
+
+
+class TestShieldCache:
+    """Test ShieldCache."""
+
+    @pytest.mark.asyncio
+    async def test_caches_positive_and_negative_verdicts(self):
+        """Should cache mints with and without warnings."""
+        cache = ShieldCache()
+        ultra = _ultra({"A": [CRITICAL]})
+        first = await cache.get_warnings(ultra, ["A", "B"])
+        second = await cache.get_warnings(ultra, ["B", "A"])
+        assert first == {"A": [CRITICAL], "B": []}
+        assert second == first
+        ultra.get_shield.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_negative_ttl_expires_first(self):
+        """Should refetch clean mints after the negative TTL."""
+        cache = ShieldCache(ttl=60, negative_ttl=0.01)
+        ultra = _ultra({"A": [INFO]})
+        await cache.get_warnings(ultra, ["A", "B"])
+        await asyncio.sleep(0.02)
+        assert cache.cached("A") == [INFO]
+        assert cache.cached("B") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self):
+        """Should merge lookups made within the batch window."""
+        cache = ShieldCache(batch_window=0.02)
+        ultra = _ultra({"C": [INFO]})
+        results = await asyncio.gather(
+            cache.get_warnings(ultra, ["A"]),
+            cache.get_warnings(ultra, ["B", "A"]),
+            cache.get_warnings(ultra, ["C"]),
+        )
+        ultra.get_shield.assert_awaited_once()
+        assert sorted(ultra.get_shield.call_args.args[0]) == ["A", "B", "C"]
+        assert results[2] == {"C": [INFO]}
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        """Should split lookups larger than max_batch into several requests."""
+        cache = ShieldCache(batch_window=10, max_batch=2)
+        ultra = _ultra()
+        result = await asyncio.wait_for(
+            cache.get_warnings(ultra, ["A", "B", "C", "D"]), timeout=1
+        )
+        assert set(result) == {"A", "B", "C", "D"}
+        assert ultra.get_shield.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_not_cached(self):
+        """Should raise batch errors to every waiter and cache nothing."""
+        cache = ShieldCache()
+        with pytest.raises(Exception, match="down"):
+            await cache.get_warnings(_ultra(error=Exception("down")), ["A"])
+        assert cache.cached("A") is None
+        assert await cache.get_warnings(_ultra(), ["A"]) == {"A": []}
+
+    @pytest.mark.asyncio
+    async def test_max_entries_evicts_oldest(self):
+        """Should keep at most max_entries verdicts."""
+        cache = ShieldCache(max_entries=2)
+        await cache.get_warnings(_ultra(), ["A", "B", "C"])
+        assert cache.cached("A") is None
+        assert cache.cached("C") == []
+
+
+class TestPreTradeCheck:
+    """Test pre_trade_check."""
+
+    @pytest.mark.asyncio
+    async def test_blocks_configured_severities(self):
+        """Should flag mints with blocking warnings."""
+        ultra = _ultra({"A": [CRITICAL], "B": [INFO]})
+        verdict = await pre_trade_check(ShieldCache(), ultra, ["A", "B"])
+        assert verdict.blocked == ["A"]
+        assert verdict.summary()["blocked"] == ["A"]
+        assert verdict.summary()["B"] == [INFO]
+
+        verdict = await pre_trade_check(
+            ShieldCache(), ultra, ["A", "B"], block_severities=["info"]
+        )
+        assert verdict.blocked == ["B"]
+
+    @pytest.mark.asyncio
+    async def test_fails_open(self):
+        """Should report Shield errors without blocking."""
+        verdict = await pre_trade_check(
+            ShieldCache(), _ultra(error=Exception("timeout")), ["A"]
+        )
+        assert verdict.blocked == []
+        assert verdict.summary() == {"error": "timeout"}
+
+
+def test_shared_cache_per_api_key():
+    """Should share one cache per Jupiter API key."""
+    reset_shield_caches()
+    assert get_shield_cache("k1") is get_shield_cache("k1")
+    assert get_shield_cache("k1") is not get_shield_cache("k2")
+    reset_shield_caches()
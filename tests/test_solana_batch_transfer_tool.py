@@ -0,0 +1,178 @@
+"""
+Tests for Solana Batch Transfer Tool.
+
+Tests the SolanaBatchTransferTool which packs many transfers into as few
+transactions as possible and sends them concurrently.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.transaction import VersionedTransaction
+
+from sakit.solana_batch_transfer import (
+    SolanaBatchTransferPlugin,
+    SolanaBatchTransferTool,
+)
+from sakit.utils.batch_transfer import MAX_BATCH_ROWS, SOL_MINT
+
+KEYPAIR = Keypair()
+
+
+@pytest.fixture
+def batch_tool():
+    """Create a configured SolanaBatchTransferTool."""
+    tool = SolanaBatchTransferTool()
+    tool.configure(
+        {
+            "tools": {
+                "solana_batch_transfer": {
+                    "rpc_url": "https://api.mainnet-beta.solana.com",
+                    "private_key": str(KEYPAIR),
+                    "max_concurrent_sends": 2,
+                }
+            }
+        }
+    )
+    return tool
+
+
+def _rows(n):
+    return [
+        {"to_address": str(Keypair().pubkey()), "amount": 0.001, "mint": SOL_MINT}
+        for _ in range(n)
+    ]
+
+
+class TestSolanaBatchTransferToolSchema:
+    """Test tool schema and configuration."""
+
+    def test_schema_is_strict(self, batch_tool):
+        """Should describe rows with a strict item schema."""
+        schema = batch_tool.get_schema()
+        assert schema["required"] == ["transfers"]
+        items = schema["properties"]["transfers"]["items"]
+        assert items["required"] == ["to_address", "amount", "mint"]
+        assert items["additionalProperties"] is False
+
+    def test_configure(self, batch_tool):
+        """Should store batch settings."""
+        assert batch_tool.name == "solana_batch_transfer"
+        assert batch_tool._max_concurrent_sends == 2
+        assert batch_tool._lookup_table_addresses == []
+
+
+class TestSolanaBatchTransferToolExecute:
+    """Test execute."""
+
+    @pytest.mark.asyncio
+    async def test_missing_config(self):
+        """Should require rpc_url and private_key."""
+        tool = SolanaBatchTransferTool()
+        tool.configure({"tools": {"solana_batch_transfer": {}}})
+        result = await tool.execute(transfers=_rows(1))
+        assert result["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_and_oversized_batches(self, batch_tool):
+        """Should validate the number of rows before touching the network."""
+        assert (await batch_tool.execute(transfers=[]))["status"] == "error"
+        result = await batch_tool.execute(
+            transfers=[{}] * (MAX_BATCH_ROWS + 1),
+        )
+        assert "Too many transfers" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_packs_and_sends_concurrently(self, batch_tool):
+        """Should send fewer transactions than rows, each signed by the wallet."""
+        rows = _rows(30)
+        sent = []
+
+        async def fake_send(rpc_url, tx_bytes, **kwargs):
+            tx = VersionedTransaction.from_bytes(tx_bytes)
+            assert tx.verify_with_results() == [True]
+            sent.append(tx)
+            return {"success": True, "signature": str(tx.signatures[0])}
+
+        with (
+            patch("sakit.solana_batch_transfer.get_rpc_client") as mock_client,
+            patch(
+                "sakit.solana_batch_transfer.get_fresh_blockhash",
+                new=AsyncMock(return_value={"blockhash": str(Hash.new_unique())}),
+            ),
+            patch(
+                "sakit.solana_batch_transfer.send_raw_transaction_with_priority",
+                side_effect=fake_send,
+            ),
+            patch("sakit.solana_batch_transfer.invalidate_holdings") as mock_invalidate,
+        ):
+            mock_client.return_value = MagicMock()
+            result = await batch_tool.execute(transfers=rows)
+
+        assert result["status"] == "success"
+        assert result["transferred"] == 30
+        assert 1 < len(sent) < 30
+        assert len(result["transactions"]) == len(sent)
+        invalidated = mock_invalidate.call_args.args
+        assert invalidated[0] == str(KEYPAIR.pubkey())
+        assert sorted(invalidated[1:]) == sorted(r["to_address"] for r in rows)
+
+    @pytest.mark.asyncio
+    async def test_blockhash_failure(self, batch_tool):
+        """Should return an error when no blockhash is available."""
+        with (
+            patch("sakit.solana_batch_transfer.get_rpc_client"),
+            patch(
+                "sakit.solana_batch_transfer.get_fresh_blockhash",
+                new=AsyncMock(return_value={"error": "RPC error: 503"}),
+            ),
+        ):
+            result = await batch_tool.execute(transfers=_rows(2))
+
+        assert result["status"] == "error"
+        assert "503" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_planning_failure_cancels_blockhash_fetch(self, batch_tool):
+        """Should not leave the blockhash prefetch running when planning fails."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_blockhash(rpc_url):
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with (
+            patch("sakit.solana_batch_transfer.get_rpc_client"),
+            patch(
+                "sakit.solana_batch_transfer.get_fresh_blockhash",
+                side_effect=slow_blockhash,
+            ),
+            patch(
+                "sakit.solana_batch_transfer.plan_batch",
+                new=AsyncMock(side_effect=Exception("RPC error: 429")),
+            ),
+        ):
+            result = await batch_tool.execute(transfers=_rows(2))
+            await asyncio.sleep(0)
+
+        assert result["status"] == "error"
+        assert "429" in result["message"]
+        assert started.is_set() and cancelled.is_set()
+
+
+class TestSolanaBatchTransferPlugin:
+    """Test plugin."""
+
+    def test_plugin(self):
+        """Should expose the batch transfer tool."""
+        plugin = SolanaBatchTransferPlugin()
+        assert plugin.name == "solana_batch_transfer"
+        assert plugin.get_tools() == []
@@ -5,10 +5,17 @@ Tests the SolanaTransferTool which transfers SOL and SPL tokens
 using a Solana keypair.
 """
 
+import struct
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
 
 from sakit.solana_transfer import SolanaTransferTool, SolanaTransferPlugin
+from sakit.utils.nonce import SYSTEM_PROGRAM_ID, get_nonce_pool, reset_nonce_pools
 
 
 @pytest.fixture
@@ -140,7 +147,7 @@ class TestSolanaTransferToolExecute:
         mock_signature.value = "TxSignature123...abc"
 
         with (
-            patch("sakit.solana_transfer.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.solana_transfer.SolanaWalletClient") as MockWallet,
             patch("sakit.solana_transfer.TokenTransferManager") as MockTransfer,
         ):
@@ -166,11 +173,30 @@ class TestSolanaTransferToolExecute:
             assert result["status"] == "success"
             assert result["result"] == "TxSignature123...abc"
 
+    @pytest.mark.asyncio
+    async def test_execute_success_invalidates_holdings(self, transfer_tool):
+        """Should invalidate cached holdings of sender and recipient."""
+        with (
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
+            patch("sakit.solana_transfer.SolanaWalletClient") as MockWallet,
+            patch("sakit.solana_transfer.TokenTransferManager") as MockTransfer,
+            patch("sakit.solana_transfer.invalidate_holdings") as mock_invalidate,
+        ):
+            MockKeypair.from_base58_string.return_value.pubkey.return_value = "Sender"
+            MockWallet.return_value.client.send_transaction = AsyncMock(
+                return_value=MagicMock(value="sig")
+            )
+            MockTransfer.transfer = AsyncMock(return_value=MagicMock())
+
+            await transfer_tool.execute(to_address="Recipient", amount=1.0, mint="mint")
+
+            mock_invalidate.assert_called_once_with("Sender", "Recipient")
+
     @pytest.mark.asyncio
     async def test_execute_transfer_exception(self, transfer_tool):
         """Should return error on transfer exception."""
         with (
-            patch("sakit.solana_transfer.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.solana_transfer.SolanaWalletClient") as MockWalletClient,
             patch("sakit.solana_transfer.TokenTransferManager") as MockTransferManager,
         ):
@@ -191,6 +217,55 @@ class TestSolanaTransferToolExecute:
             assert "Transfer failed" in result["message"]
 
 
+class TestSolanaTransferToolNonce:
+    """Test durable nonce leasing around sends."""
+
+    @pytest.mark.asyncio
+    async def test_rejected_send_leaves_nonce_leasable(self):
+        """Should return the nonce unconsumed when the RPC rejects the send."""
+        reset_nonce_pools()
+        keypair, nonce_account = Keypair(), Keypair().pubkey()
+        nonce = Hash.new_unique()
+        data = struct.pack("<II", 1, 1) + bytes(keypair.pubkey()) + bytes(nonce)
+        account = SimpleNamespace(
+            owner=Pubkey.from_string(SYSTEM_PROGRAM_ID), data=data + bytes(8)
+        )
+
+        tool = SolanaTransferTool()
+        tool.configure(
+            {
+                "tools": {
+                    "solana_transfer": {
+                        "rpc_url": "https://api.mainnet-beta.solana.com",
+                        "private_key": str(keypair),
+                        "nonce_accounts": [str(nonce_account)],
+                    }
+                }
+            }
+        )
+        client = MagicMock()
+        client.get_multiple_accounts = AsyncMock(
+            return_value=MagicMock(value=[account])
+        )
+        client.send_transaction = AsyncMock(
+            side_effect=Exception("Insufficient funds for fee")
+        )
+
+        with (
+            patch("sakit.solana_transfer.SolanaWalletClient") as MockWallet,
+            patch("sakit.solana_transfer.TokenTransferManager") as MockTransfer,
+        ):
+            MockWallet.return_value.client = client
+            MockTransfer.transfer = AsyncMock(return_value=MagicMock())
+            result = await tool.execute(to_address="Recipient", amount=1.0, mint="m")
+
+        assert result["status"] == "error"
+        pool = get_nonce_pool(str(keypair.pubkey()), [])
+        lease = await pool.acquire(client)
+        assert lease.nonce == nonce
+        reset_nonce_pools()
+
+
 class TestSolanaTransferPlugin:
     """Test plugin class."""
 
@@ -134,7 +134,7 @@ class TestSolanaUltraQuoteToolExecute:
         mock_order.gasless = False
 
         with (
-            patch("sakit.solana_ultra_quote.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.solana_ultra_quote.JupiterUltra") as MockUltra,
         ):
             mock_keypair = MagicMock()
@@ -182,7 +182,7 @@ class TestSolanaUltraQuoteToolExecute:
         mock_order.gasless = False
 
         with (
-            patch("sakit.solana_ultra_quote.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.solana_ultra_quote.JupiterUltra") as MockUltra,
         ):
             mock_keypair = MagicMock()
@@ -223,7 +223,7 @@ class TestSolanaUltraQuoteToolExecute:
         mock_order.gasless = True
 
         with (
-            patch("sakit.solana_ultra_quote.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.solana_ultra_quote.JupiterUltra") as MockUltra,
         ):
             mock_keypair = MagicMock()
@@ -260,7 +260,7 @@ class TestSolanaUltraQuoteToolExecute:
     async def test_execute_jupiter_api_error(self, quote_tool):
         """Should handle Jupiter API errors gracefully."""
         with (
-            patch("sakit.solana_ultra_quote.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.solana_ultra_quote.JupiterUltra") as MockUltra,
         ):
             mock_keypair = MagicMock()
@@ -282,6 +282,56 @@ class TestSolanaUltraQuoteToolExecute:
             assert result["status"] == "error"
             assert "API rate limit" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_repeated_quote_uses_cache(self, quote_tool):
+        """Should serve a repeated quote from cache and expose its age."""
+        mock_order = MagicMock()
+        mock_order.price_impact = None
+        mock_order.in_usd_value = None
+        mock_order.out_usd_value = None
+
+        with (
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
+            patch("sakit.solana_ultra_quote.JupiterUltra") as MockUltra,
+        ):
+            mock_keypair = MagicMock()
+            mock_keypair.pubkey.return_value = "TakerPubkey123"
+            MockKeypair.from_base58_string.return_value = mock_keypair
+
+            mock_ultra_instance = AsyncMock()
+            mock_ultra_instance.get_order = AsyncMock(return_value=mock_order)
+            MockUltra.return_value = mock_ultra_instance
+
+            kwargs = dict(
+                input_mint="So11111111111111111111111111111111111111112",
+                output_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+                amount=1000000000,
+            )
+            first = await quote_tool.execute(**kwargs)
+            second = await quote_tool.execute(**kwargs)
+
+            mock_ultra_instance.get_order.assert_awaited_once()
+            assert mock_ultra_instance.get_order.call_args.kwargs["taker"] is None
+            assert first["quote_age_seconds"] == 0.0
+            assert second["status"] == "success"
+            assert second["quote_age_seconds"] >= 0.0
+
+    def test_configure_quote_cache(self):
+        """Should read quote cache settings from config."""
+        tool = SolanaUltraQuoteTool()
+        tool.configure(
+            {
+                "tools": {
+                    "solana_ultra_quote": {
+                        "quote_cache_ttl": 2,
+                        "quote_amount_precision": 4,
+                    }
+                }
+            }
+        )
+        assert tool._quote_cache.ttl == 2
+        assert tool._quote_cache.amount_precision == 4
+
 
 class TestSolanaUltraQuotePlugin:
     """Test plugin functionality."""
@@ -10,6 +10,15 @@ import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 
 from sakit.solana_ultra import SolanaUltraTool, SolanaUltraPlugin
+from sakit.utils.shield import reset_shield_caches
+
+
+@pytest.fixture(autouse=True)
+def _reset_shield_caches():
+    """Start each test with empty Shield caches."""
+    reset_shield_caches()
+    yield
+    reset_shield_caches()
 
 
 @pytest.fixture
@@ -103,6 +112,10 @@ class TestSolanaUltraToolConfigure:
         """Should store RPC URL for direct transaction sending."""
         assert ultra_tool._rpc_url == "https://mainnet.helius-rpc.com/?api-key=test-key"
 
+    def test_broadcast_urls_default_to_empty(self):
+        """Should have no broadcast RPC URLs before configure is called."""
+        assert SolanaUltraTool()._broadcast_rpc_urls == []
+
 
 class TestSolanaUltraToolExecute:
     """Test execute method using RPC-based transaction sending."""
@@ -128,7 +141,7 @@ class TestSolanaUltraToolExecute:
         mock_order.transaction = None
 
         with (
-            patch("sakit.solana_ultra.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.solana_ultra.JupiterUltra") as MockUltra,
         ):
             mock_keypair = MagicMock()
@@ -170,7 +183,7 @@ class TestSolanaUltraToolExecute:
         }
 
         with (
-            patch("sakit.solana_ultra.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.solana_ultra.JupiterUltra") as MockUltra,
             patch.object(
                 ultra_tool,
@@ -216,7 +229,7 @@ class TestSolanaUltraToolExecute:
         }
 
         with (
-            patch("sakit.solana_ultra.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.solana_ultra.JupiterUltra") as MockUltra,
             patch.object(
                 ultra_tool,
@@ -259,7 +272,7 @@ class TestSolanaUltraToolExecute:
         }
 
         with (
-            patch("sakit.solana_ultra.Keypair") as MockKeypair,
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
             patch("sakit.solana_ultra.JupiterUltra") as MockUltra,
             patch.object(
                 ultra_tool,
@@ -288,7 +301,7 @@ class TestSolanaUltraToolExecute:
     @pytest.mark.asyncio
     async def test_execute_exception_handling(self, ultra_tool):
         """Should return error on exception."""
-        with patch("sakit.solana_ultra.Keypair") as MockKeypair:
+        with patch("sakit.utils.keyring.Keypair") as MockKeypair:
             MockKeypair.from_base58_string.side_effect = Exception("Invalid key")
 
             result = await ultra_tool.execute(
@@ -301,6 +314,188 @@ class TestSolanaUltraToolExecute:
             assert "Invalid key" in result["message"]
 
 
+class TestSolanaUltraRouteRacing:
+    """Test optional Ultra vs DFlow route racing."""
+
+    @pytest.mark.asyncio
+    async def test_executes_best_route(self, ultra_tool):
+        """Should race both aggregators and execute the winning transaction."""
+        from sakit.utils.routing import RouteDecision, RouteQuote
+
+        ultra_tool._route_racing = True
+        best = RouteQuote(
+            provider="dflow",
+            success=True,
+            transaction="dflow-tx",
+            in_amount="1000000000",
+            out_amount=51000000,
+            net_out_amount=51000000,
+        )
+        decision = RouteDecision(best=best, quotes={"dflow": best})
+
+        with (
+            patch("sakit.utils.keyring.Keypair") as MockKeypair,
+            patch("sakit.solana_ultra.JupiterUltra"),
+            patch("sakit.solana_ultra.DFlowSwap"),
+            patch(
+                "sakit.solana_ultra.race_routes",
+                new_callable=AsyncMock,
+                return_value=decision,
+            ) as mock_race,
+            patch.object(
+                ultra_tool,
+                "_sign_and_execute",
+                new_callable=AsyncMock,
+                return_value={"status": "success", "signature": "Sig"},
+            ) as mock_exec,
+        ):
+            mock_keypair = MagicMock()
+            mock_keypair.pubkey.return_value = "TakerPubkey123"
+            MockKeypair.from_base58_string.return_value = mock_keypair
+
+            result = await ultra_tool.execute(
+                input_mint="So11111111111111111111111111111111111111112",
+                output_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+                amount=1000000000,
+            )
+
+        assert mock_race.call_args.kwargs["referral_fee"] == 50
+        assert mock_exec.call_args.kwargs["transaction_base64"] == "dflow-tx"
+        assert result["status"] == "success"
+        assert result["route"] == "dflow"
+        assert result["out_amount"] == "51000000"
+
+    @pytest.mark.asyncio
+    async def test_no_route_error(self, ultra_tool):
+        """Should return an error when neither aggregator returned a route."""
+        from sakit.utils.routing import RouteDecision
+
+        ultra_tool._route_racing = True
+        shield_task = MagicMock()
+        with (
+            patch("sakit.utils.keyring.Keypair"),
+            patch("sakit.solana_ultra.JupiterUltra"),
+            patch("sakit.solana_ultra.DFlowSwap"),
+            patch(
+                "sakit.solana_ultra.race_routes",
+                new_callable=AsyncMock,
+                return_value=RouteDecision(best=None),
+            ),
+            patch.object(ultra_tool, "_start_shield_check", return_value=shield_task),
+        ):
+            result = await ultra_tool.execute(
+                input_mint="So11111111111111111111111111111111111111112",
+                output_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+                amount=1000000000,
+            )
+
+        assert result["status"] == "error"
+        assert "No route" in result["message"]
+        shield_task.cancel.assert_called_once()
+
+    def test_configure_route_racing(self):
+        """Should read route racing settings from config."""
+        tool = SolanaUltraTool()
+        tool.configure(
+            {"tools": {"solana_ultra": {"route_racing": True, "route_deadline": 2}}}
+        )
+        assert tool._route_racing is True
+        assert tool._route_deadline == 2.0
+
+
+class TestSolanaUltraShieldCheck:
+    """Test the optional pre-trade Shield check."""
+
+    @staticmethod
+    def _order():
+        order = MagicMock()
+        order.transaction = "base64encodedtransaction"
+        order.price_impact = None
+        return order
+
+    async def _execute(self, ultra_tool, warnings):
+        ultra_tool._shield_check = True
+        with (
+            patch("sakit.utils.keyring.Keypair"),
+            patch("sakit.solana_ultra.JupiterUltra") as MockUltra,
+            patch.object(
+                ultra_tool,
+                "_sign_and_execute",
+                new_callable=AsyncMock,
+                return_value={"status": "success", "signature": "Sig"},
+            ) as mock_exec,
+        ):
+            MockUltra.return_value.get_order = AsyncMock(return_value=self._order())
+            MockUltra.return_value.get_shield = AsyncMock(
+                return_value={"warnings": warnings}
+            )
+            result = await ultra_tool.execute(
+                input_mint="MintIn", output_mint="MintOut", amount=1000
+            )
+            return result, mock_exec, MockUltra.return_value
+
+    @pytest.mark.asyncio
+    async def test_blocks_critical_warnings(self, ultra_tool):
+        """Should not sign when a mint has a blocking warning."""
+        result, mock_exec, _ = await self._execute(
+            ultra_tool, {"MintOut": [{"type": "freeze", "severity": "critical"}]}
+        )
+        assert result["status"] == "error"
+        assert result["shield"]["blocked"] == ["MintOut"]
+        mock_exec.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reports_non_blocking_warnings(self, ultra_tool):
+        """Should swap and report warnings below the blocking severity."""
+        result, mock_exec, ultra = await self._execute(
+            ultra_tool, {"MintIn": [{"type": "new", "severity": "info"}]}
+        )
+        assert result["status"] == "success"
+        assert result["shield"] == {"MintIn": [{"type": "new", "severity": "info"}]}
+        ultra.get_shield.assert_awaited_once()
+        mock_exec.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failure", ["raises", "no_transaction"])
+    async def test_cancels_check_without_order(self, ultra_tool, failure):
+        """Should cancel the Shield check when no order comes back."""
+        ultra_tool._shield_check = True
+        shield_task = MagicMock()
+        order = self._order()
+        order.transaction = None
+        with (
+            patch("sakit.utils.keyring.Keypair"),
+            patch("sakit.solana_ultra.JupiterUltra") as MockUltra,
+            patch.object(ultra_tool, "_start_shield_check", return_value=shield_task),
+        ):
+            MockUltra.return_value.get_order = AsyncMock(
+                side_effect=Exception("API Error") if failure == "raises" else None,
+                return_value=order,
+            )
+            result = await ultra_tool.execute(
+                input_mint="MintIn", output_mint="MintOut", amount=1000
+            )
+
+        assert result["status"] == "error"
+        shield_task.cancel.assert_called_once()
+
+    def test_configure_shield_check(self):
+        """Should read Shield check settings from config."""
+        tool = SolanaUltraTool()
+        tool.configure(
+            {
+                "tools": {
+                    "solana_ultra": {
+                        "shield_check": True,
+                        "shield_block_severities": ["critical", "warning"],
+                    }
+                }
+            }
+        )
+        assert tool._shield_check is True
+        assert tool._shield_block_severities == ["critical", "warning"]
+
+
 class TestSolanaUltraPlugin:
     """Test plugin class."""
 
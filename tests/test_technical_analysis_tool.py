@@ -688,6 +688,32 @@ class TestTechnicalAnalysisToolExecute:
         assert result["error"] == "api_error"
         assert "500" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_execute_http_429_error(self):
+        """Should return rate_limited error for 429 response."""
+        import httpx
+
+        tool = TechnicalAnalysisTool()
+        tool.configure(make_config(api_key="test-key"))
+
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+
+        with patch.object(
+            tool, "_get_ohlcv_data", new_callable=AsyncMock
+        ) as mock_ohlcv:
+            mock_ohlcv.side_effect = httpx.HTTPStatusError(
+                "Too Many Requests", request=MagicMock(), response=mock_response
+            )
+
+            result = await tool.execute(
+                address="So11111111111111111111111111111111111111112",
+                timeframe="4h",
+            )
+
+        assert result["status"] == "error"
+        assert result["error"] == "rate_limited"
+
     @pytest.mark.asyncio
     async def test_execute_generic_exception(self):
         """Should return internal_error for unexpected exceptions."""
@@ -0,0 +1,149 @@
+"""
+Tests for local token search index utility.
+
+Tests exact mint, symbol and prefix lookups, ranking, fuzzy matching, and
+refresh behavior.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from sakit.utils.token_index import (
+    TokenIndex,
+    get_token_index,
+    reset_token_indexes,
+)
+
+SOL = {
+    "id": "So11111111111111111111111111111111111111112",
+    "symbol": "SOL",
+    "name": "Wrapped SOL",
+    "isVerified": True,
+    "liquidity": 900_000_000,
+}
+USDC = {
+    "id": "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+    "symbol": "USDC",
+    "name": "USD Coin",
+    "isVerified": True,
+    "liquidity": 800_000_000,
+}
+JUP = {
+    "id": "JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN",
+    "symbol": "JUP",
+    "name": "Jupiter",
+    "isVerified": True,
+    "liquidity": 50_000_000,
+}
+FAKE_USDC = {
+    "id": "FakeUsdcMint111111111111111111111111111111",
+    "symbol": "USDC",
+    "name": "USD Coin",
+    "isVerified": False,
+    "liquidity": 999_999_999,
+}
+BONK = {
+    "id": "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263",
+    "symbol": "Bonk",
+    "name": "Bonk",
+    "isVerified": True,
+    "liquidity": 20_000_000,
+}
+TOKENS = [FAKE_USDC, JUP, SOL, BONK, USDC]
+
+
+def _index(tokens=TOKENS, **kwargs) -> TokenIndex:
+    index = TokenIndex(fetch=AsyncMock(return_value=tokens), **kwargs)
+    index.build(tokens)
+    return index
+
+
+class TestTokenIndexSearch:
+    """Test TokenIndex.search."""
+
+    def test_exact_mint(self):
+        """Should find a token by mint address."""
+        assert _index().search(JUP["id"]) == [JUP]
+
+    def test_symbol_ranked_by_verification_then_liquidity(self):
+        """Should rank verified tokens above unverified ones."""
+        assert _index().search("usdc") == [USDC, FAKE_USDC]
+
+    def test_prefix_of_symbol_and_name(self):
+        """Should match prefixes of symbols, names and name words."""
+        index = _index()
+        assert index.search("jupi") == [JUP]
+        assert index.search("coin") == [USDC, FAKE_USDC]
+        assert index.search("wrapped s") == [SOL]
+        assert index.search("bon") == [BONK]
+
+    def test_exact_symbol_before_prefix_matches(self):
+        """Should list exact symbol matches first."""
+        sollet = dict(SOL, id="SolXMint", symbol="SOLX", liquidity=10**12)
+        results = _index([SOL, sollet]).search("sol")
+        assert results[0] is SOL
+
+    def test_exact_match_skips_prefix_and_fuzzy(self):
+        """Should match only whole mints and symbols."""
+        index = _index()
+        assert index.match(JUP["id"]) == [JUP]
+        assert index.match("usdc") == [USDC, FAKE_USDC]
+        assert index.match("ju") == []
+        assert index.match("usdd") == []
+
+    def test_fuzzy_symbol_match(self):
+        """Should fall back to close symbol matches for typos."""
+        assert _index().search("usdd") == [USDC, FAKE_USDC]
+
+    def test_miss_and_max_results(self):
+        """Should return nothing on a miss and cap result counts."""
+        assert _index().search("zzzzzz") == []
+        assert _index().search("  ") == []
+        many = [
+            dict(SOL, id=f"Mint{i}", symbol=f"AB{i}", liquidity=i) for i in range(10)
+        ]
+        results = _index(many, max_results=3).search("ab")
+        assert [t["id"] for t in results] == ["Mint9", "Mint8", "Mint7"]
+
+
+class TestTokenIndexRefresh:
+    """Test loading and refreshing the token list."""
+
+    @pytest.mark.asyncio
+    async def test_first_lookup_waits_for_load(self):
+        """Should load the token list on first use."""
+        index = TokenIndex(fetch=AsyncMock(return_value=TOKENS))
+        assert index.stale
+        assert await index.lookup("JUP") == [JUP]
+        assert len(index) == 5
+        index.fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_index_refreshes_in_background(self):
+        """Should serve the old list while refreshing a stale one."""
+        index = _index([SOL], refresh_interval=0)
+        index.fetch = AsyncMock(return_value=[SOL, JUP])
+        assert await index.lookup("JUP") == []
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert index.search("JUP") == [JUP]
+
+    @pytest.mark.asyncio
+    async def test_load_failure_backs_off(self):
+        """Should return no results and not retry immediately after a failure."""
+        index = TokenIndex(fetch=AsyncMock(side_effect=Exception("down")))
+        assert await index.lookup("SOL") == []
+        assert await index.lookup("SOL") == []
+        index.fetch.assert_awaited_once()
+
+
+def test_shared_index_per_api_key():
+    """Should share one index per Jupiter API key."""
+    reset_token_indexes()
+    index = get_token_index("k1", refresh_interval=10)
+    assert get_token_index("k1", refresh_interval=10) is index
+    assert get_token_index("k2") is not index
+    assert index.refresh_interval == 10
+    reset_token_indexes()
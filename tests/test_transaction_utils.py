@@ -0,0 +1,123 @@
+"""
+Tests for byte-level transaction editing.
+
+Checks TransactionEditor against solders for legacy and v0 transactions:
+offsets, in-place blockhash replacement, and signing.
+"""
+
+import base64
+
+import pytest
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message, MessageV0, to_bytes_versioned
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction import VersionedTransaction
+
+from sakit.utils.transaction import TransactionEditor
+from sakit.utils.trigger import replace_blockhash_in_transaction
+
+PROGRAM = Pubkey.from_string("11111111111111111111111111111111")
+
+
+def _unsigned_v0(payer: Keypair, taker: Keypair) -> VersionedTransaction:
+    instruction = Instruction(
+        PROGRAM,
+        bytes([2, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0]),
+        [
+            AccountMeta(taker.pubkey(), True, True),
+            AccountMeta(Keypair().pubkey(), False, True),
+        ],
+    )
+    message = MessageV0.try_compile(payer.pubkey(), [instruction], [], Hash.default())
+    return VersionedTransaction.populate(message, [Signature.default()] * 2)
+
+
+class TestTransactionEditor:
+    """Test TransactionEditor."""
+
+    def test_offsets_match_solders(self):
+        """Should find signer count, keys and blockhash like solders does."""
+        payer, taker = Keypair(), Keypair()
+        tx = _unsigned_v0(payer, taker)
+        editor = TransactionEditor(bytes(tx))
+
+        assert editor.versioned is True
+        assert editor.num_signatures == 2
+        assert editor.num_required_signatures == 2
+        assert editor.num_account_keys == len(tx.message.account_keys)
+        assert editor.blockhash == tx.message.recent_blockhash
+        assert bytes(editor.message) == to_bytes_versioned(tx.message)
+        assert editor.signer(1) == tx.message.account_keys[1]
+
+    def test_set_blockhash_in_place(self):
+        """Should only change the blockhash bytes."""
+        tx = _unsigned_v0(Keypair(), Keypair())
+        data = bytearray(bytes(tx))
+        editor = TransactionEditor(data)
+        new_hash = Hash.new_unique()
+        editor.set_blockhash(str(new_hash))
+
+        assert editor.data is data
+        parsed = VersionedTransaction.from_bytes(bytes(editor))
+        assert parsed.message.recent_blockhash == new_hash
+        assert parsed.message.instructions == tx.message.instructions
+
+    def test_sign_places_signatures_by_signer_index(self):
+        """Should produce signatures that verify against the message."""
+        payer, taker = Keypair(), Keypair()
+        editor = TransactionEditor.from_base64(
+            base64.b64encode(bytes(_unsigned_v0(payer, taker))).decode()
+        )
+        editor.set_blockhash(Hash.new_unique())
+
+        assert editor.sign(payer) == 0
+        assert editor.sign(taker) == 1
+        assert editor.sign(Keypair()) is None
+
+        signed = VersionedTransaction.from_bytes(bytes(editor))
+        assert signed.verify_with_results() == [True, True]
+        assert editor.signature(0) == signed.signatures[0]
+        assert editor.signature(1) == signed.signatures[1]
+
+    def test_legacy_transaction(self):
+        """Should handle legacy (unversioned) messages."""
+        payer = Keypair()
+        instruction = Instruction(PROGRAM, b"", [])
+        message = Message.new_with_blockhash(
+            [instruction], payer.pubkey(), Hash.default()
+        )
+        tx = VersionedTransaction.populate(message, [Signature.default()])
+        editor = TransactionEditor(bytes(tx))
+        new_hash = Hash.new_unique()
+        editor.set_blockhash(new_hash)
+        editor.sign(payer)
+
+        assert editor.versioned is False
+        signed = VersionedTransaction.from_bytes(bytes(editor))
+        assert signed.message.recent_blockhash == new_hash
+        assert signed.verify_with_results() == [True]
+
+    def test_invalid_input(self):
+        """Should reject truncated bytes and bad signature slots."""
+        with pytest.raises(ValueError):
+            TransactionEditor(b"\x01" + b"\x00" * 10)
+        editor = TransactionEditor(bytes(_unsigned_v0(Keypair(), Keypair())))
+        with pytest.raises(IndexError):
+            editor.set_signature(5, bytes(64))
+        with pytest.raises(ValueError):
+            editor.set_signature(0, b"short")
+        with pytest.raises(ValueError):
+            editor.set_blockhash(b"short")
+
+    def test_replace_blockhash_in_transaction(self):
+        """Should keep the base64 helper working on top of the editor."""
+        tx = _unsigned_v0(Keypair(), Keypair())
+        new_hash = Hash.new_unique()
+        result = replace_blockhash_in_transaction(
+            base64.b64encode(bytes(tx)).decode(), str(new_hash)
+        )
+        parsed = VersionedTransaction.from_bytes(base64.b64decode(result))
+        assert parsed.message.recent_blockhash == new_hash
@@ -7,6 +7,16 @@ Tests the TokenTransferManager which handles SOL and SPL token transfers.
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 
+from sakit.utils.compute_units import reset_compute_unit_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_compute_unit_cache():
+    """Clear cached compute unit estimates between tests."""
+    reset_compute_unit_cache()
+    yield
+    reset_compute_unit_cache()
+
 
 class TestTokenTransferManager:
     """Test TokenTransferManager class."""
@@ -521,12 +531,13 @@ class TestTokenTransferManager:
 
     @pytest.mark.asyncio
     async def test_transfer_with_helius_priority_fee(self):
-        """Should add priority fee when using Helius."""
+        """Should add a compute unit price from the fee oracle when using Helius."""
         from sakit.utils.transfer import TokenTransferManager
 
         mock_wallet = MagicMock()
         mock_wallet.pubkey = "SenderPubkey123"
         mock_wallet.keypair = MagicMock()
+        mock_wallet.rpc_url = "https://mainnet.helius-rpc.com"
         mock_wallet.client = AsyncMock()
         mock_wallet.client.get_latest_blockhash = AsyncMock(
             return_value=MagicMock(value=MagicMock(blockhash="blockhash123"))
@@ -534,38 +545,49 @@ class TestTokenTransferManager:
         mock_wallet.client.simulate_transaction = AsyncMock(
             return_value=MagicMock(value=MagicMock(units_consumed=200000))
         )
-        mock_wallet.get_priority_fee_estimate_helius = AsyncMock(return_value=1000)
+        mock_oracle = MagicMock()
+        mock_oracle.get_fee = AsyncMock(return_value=1000)
+        writable = MagicMock(pubkey="RecipientPubkey123", is_writable=True)
+        readonly = MagicMock(pubkey="Program123", is_writable=False)
 
         with (
             patch("sakit.utils.transfer.Pubkey") as MockPubkey,
             patch("sakit.utils.transfer.transfer") as mock_transfer,
             patch("sakit.utils.transfer.Transaction") as MockTx,
             patch("sakit.utils.transfer.Message") as MockMessage,
-            patch("sakit.utils.transfer.based58"),
+            patch(
+                "sakit.utils.transfer.get_fee_oracle", return_value=mock_oracle
+            ) as mock_get_oracle,
+            patch("sakit.utils.transfer.set_compute_unit_limit") as mock_limit,
+            patch("sakit.utils.transfer.set_compute_unit_price") as mock_price,
         ):
             MockPubkey.from_string.return_value = "RecipientPubkey123"
-            mock_transfer.return_value = MagicMock()
-
-            mock_tx_instance = MagicMock()
-            mock_tx_instance.message = MagicMock()
-            mock_tx_instance.message.instructions = []
-            MockTx.return_value = mock_tx_instance
+            mock_transfer.return_value = MagicMock(accounts=[writable, readonly])
+            MockTx.return_value = MagicMock()
             MockMessage.return_value = MagicMock()
 
             sol_mint = "So11111111111111111111111111111111111111112"
 
-            try:
-                await TokenTransferManager.transfer(
-                    wallet=mock_wallet,
-                    to="RecipientPubkey123",
-                    amount=1.0,
-                    mint=sol_mint,
-                    provider="helius",
-                )
-                # Helius priority fee should be called
-                mock_wallet.get_priority_fee_estimate_helius.assert_called()
-            except Exception:
-                pass
+            await TokenTransferManager.transfer(
+                wallet=mock_wallet,
+                to="RecipientPubkey123",
+                amount=1.0,
+                mint=sol_mint,
+                provider="helius",
+                priority_fee_strategy="p90",
+                priority_fee_cap=5000,
+            )
+
+            mock_get_oracle.assert_called_once_with("https://mainnet.helius-rpc.com")
+            mock_oracle.get_fee.assert_awaited_once_with(
+                ["RecipientPubkey123"], "p90", 5000
+            )
+            mock_price.assert_called_once_with(1000)
+            final_ixs = MockMessage.call_args_list[-1].kwargs["instructions"]
+            assert final_ixs[-2:] == [
+                mock_limit.return_value,
+                mock_price.return_value,
+            ]
 
     @pytest.mark.asyncio
     async def test_transfer_token2022(self):
@@ -739,3 +761,83 @@ class TestTokenTransferManager:
         assert (
             await TokenTransferManager._is_valid_ata_owner(mock_wallet, owner_pubkey)
         ) is True
+
+    @pytest.mark.asyncio
+    async def test_transfer_reuses_compute_unit_estimate(self):
+        """Should simulate once per transfer shape, not on every transfer."""
+        from solders.hash import Hash
+        from solders.keypair import Keypair
+        from sakit.utils.transfer import TokenTransferManager
+
+        keypair = Keypair()
+        mock_wallet = MagicMock()
+        mock_wallet.pubkey = keypair.pubkey()
+        mock_wallet.keypair = keypair
+        mock_wallet.fee_payer = None
+        mock_wallet.client = AsyncMock()
+        mock_wallet.client.get_latest_blockhash = AsyncMock(
+            return_value=MagicMock(value=MagicMock(blockhash=Hash.new_unique()))
+        )
+        mock_wallet.client.simulate_transaction = AsyncMock(
+            return_value=MagicMock(value=MagicMock(units_consumed=450))
+        )
+        sol_mint = "So11111111111111111111111111111111111111112"
+
+        for amount in (0.1, 0.2):
+            await TokenTransferManager.transfer(
+                wallet=mock_wallet,
+                to=str(Keypair().pubkey()),
+                amount=amount,
+                mint=sol_mint,
+            )
+        mock_wallet.client.simulate_transaction.assert_awaited_once()
+
+        tx = await TokenTransferManager.transfer(
+            wallet=mock_wallet,
+            to=str(Keypair().pubkey()),
+            amount=0.3,
+            mint=sol_mint,
+            memo="hello",
+        )
+        assert mock_wallet.client.simulate_transaction.await_count == 2
+        assert tx.message.instructions[-1].data[1:5] == (100_450).to_bytes(4, "little")
+
+    @pytest.mark.asyncio
+    async def test_transfer_with_durable_nonce(self):
+        """Should build on the leased nonce and advance it first."""
+        from solders.hash import Hash
+        from solders.keypair import Keypair
+        from solders.pubkey import Pubkey
+        from sakit.utils.nonce import NonceLease
+        from sakit.utils.transfer import TokenTransferManager
+
+        keypair = Keypair()
+        mock_wallet = MagicMock()
+        mock_wallet.pubkey = keypair.pubkey()
+        mock_wallet.keypair = keypair
+        mock_wallet.fee_payer = None
+        mock_wallet.client = AsyncMock()
+        mock_wallet.client.get_latest_blockhash = AsyncMock(
+            return_value=MagicMock(value=MagicMock(blockhash=Hash.new_unique()))
+        )
+        mock_wallet.client.simulate_transaction = AsyncMock(
+            return_value=MagicMock(value=MagicMock(units_consumed=450))
+        )
+        lease = NonceLease(Keypair().pubkey(), keypair.pubkey(), Hash.new_unique())
+
+        tx = await TokenTransferManager.transfer(
+            wallet=mock_wallet,
+            to=str(Keypair().pubkey()),
+            amount=0.1,
+            mint="So11111111111111111111111111111111111111112",
+            nonce=lease,
+        )
+
+        assert tx.message.recent_blockhash == lease.nonce
+        first = tx.message.instructions[0]
+        assert tx.message.account_keys[first.program_id_index] == Pubkey.from_string(
+            "11111111111111111111111111111111"
+        )
+        assert first.data[:4] == (4).to_bytes(4, "little")  # AdvanceNonceAccount
+        # Only the compute unit simulation fetched a blockhash
+        mock_wallet.client.get_latest_blockhash.assert_awaited_once()
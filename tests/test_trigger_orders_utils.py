@@ -0,0 +1,190 @@
+"""
+Tests for the trigger order mirror utility.
+
+Tests concurrent paging, TTL caching, O(1) ownership checks, and local
+updates after our own creates and cancels.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sakit.utils.trigger_orders import (
+    TriggerOrderMirror,
+    created_order,
+    get_trigger_order_mirror,
+    order_key,
+    reset_trigger_order_mirror,
+)
+
+
+def _trigger(total_orders: int = 25, delay: float = 0.0):
+    """Fake JupiterTrigger serving `total_orders` active orders, 10 per page."""
+    orders = [{"orderKey": f"order-{i}"} for i in range(total_orders)]
+    total_pages = max(1, -(-total_orders // 10))
+    in_flight = {"now": 0, "max": 0}
+
+    async def get_orders(user, order_status="active", page=1):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(delay)
+        in_flight["now"] -= 1
+        return {
+            "success": True,
+            "orders": orders[(page - 1) * 10 : page * 10],
+            "page": page,
+            "total_pages": total_pages,
+        }
+
+    trigger = MagicMock()
+    trigger.get_orders = AsyncMock(side_effect=get_orders)
+    trigger.in_flight = in_flight
+    return trigger
+
+
+class TestOrderKey:
+    """Test order_key."""
+
+    def test_reads_any_key_field(self):
+        """Should read orderKey, order or orderPubkey."""
+        assert order_key({"orderKey": "a"}) == "a"
+        assert order_key({"order": "b"}) == "b"
+        assert order_key({"orderPubkey": "c"}) == "c"
+        assert order_key({}) is None
+
+
+class TestTriggerOrderMirror:
+    """Test TriggerOrderMirror."""
+
+    @pytest.mark.asyncio
+    async def test_pages_concurrently_once(self):
+        """Should fetch every page, the rest concurrently, then serve from cache."""
+        mirror = TriggerOrderMirror(ttl=60)
+        trigger = _trigger(total_orders=25, delay=0.01)
+
+        result = await mirror.get_orders(trigger, "w1")
+        again = await mirror.get_orders(trigger, "w1")
+
+        assert result["success"] is True
+        assert result["total"] == 25
+        assert again["orders"] == result["orders"]
+        assert trigger.get_orders.await_count == 3
+        assert trigger.in_flight["max"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_fetch(self):
+        """Should coalesce concurrent reads of the same wallet."""
+        mirror = TriggerOrderMirror(ttl=60)
+        trigger = _trigger(total_orders=5, delay=0.01)
+
+        await asyncio.gather(*(mirror.get_orders(trigger, "w1") for _ in range(5)))
+
+        assert trigger.get_orders.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_has_order_is_a_lookup_when_fresh(self):
+        """Should answer ownership from the mirror without refetching."""
+        mirror = TriggerOrderMirror(ttl=60)
+        trigger = _trigger(total_orders=15)
+        await mirror.get_orders(trigger, "w1")
+        calls = trigger.get_orders.await_count
+
+        assert await mirror.has_order(trigger, "w1", "order-12") is True
+        assert trigger.get_orders.await_count == calls
+
+    @pytest.mark.asyncio
+    async def test_has_order_refetches_once_on_miss(self):
+        """Should confirm a miss with one refetch before reporting it."""
+        mirror = TriggerOrderMirror(ttl=60)
+        trigger = _trigger(total_orders=5)
+        await mirror.get_orders(trigger, "w1")
+
+        assert await mirror.has_order(trigger, "w1", "unknown") is False
+        assert trigger.get_orders.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_has_order_none_on_fetch_error(self):
+        """Should return None when orders cannot be fetched."""
+        mirror = TriggerOrderMirror(ttl=60)
+        trigger = MagicMock()
+        trigger.get_orders = AsyncMock(
+            return_value={"success": False, "error": "boom", "orders": []}
+        )
+
+        assert await mirror.has_order(trigger, "w1", "order-1") is None
+        result = await mirror.get_orders(trigger, "w1")
+        assert result == {"success": False, "error": "boom", "orders": []}
+
+    @pytest.mark.asyncio
+    async def test_truncated_miss_is_unknown(self):
+        """Should not report a miss as False when pages past the bound were skipped."""
+        mirror = TriggerOrderMirror(ttl=60)
+        trigger = _trigger(total_orders=25)
+        with patch("sakit.utils.trigger_orders.MAX_ORDER_PAGES", 2):
+            result = await mirror.get_orders(trigger, "w1")
+            owned = await mirror.has_order(trigger, "w1", "order-24")
+            found = await mirror.has_order(trigger, "w1", "order-3")
+
+        assert result["truncated"] is True
+        assert result["total"] == 20
+        assert owned is None
+        assert found is True
+
+    @pytest.mark.asyncio
+    async def test_records_local_creates_and_cancels(self):
+        """Should apply our own creates and cancels without refetching."""
+        mirror = TriggerOrderMirror(ttl=60)
+        trigger = _trigger(total_orders=3)
+        await mirror.get_orders(trigger, "w1")
+
+        mirror.add("w1", "new", created_order("new", "w1", "A", "B", "1", "2"))
+        mirror.remove("w1", "order-0")
+        result = await mirror.get_orders(trigger, "w1")
+        keys = {order_key(o) for o in result["orders"]}
+        assert keys == {"order-1", "order-2", "new"}
+
+        mirror.remove_all("w1")
+        assert (await mirror.get_orders(trigger, "w1"))["orders"] == []
+        assert trigger.get_orders.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_started_before_update_is_not_stored(self):
+        """Should not let a fetch that raced a local update overwrite it."""
+        mirror = TriggerOrderMirror(ttl=60)
+        trigger = _trigger(total_orders=3, delay=0.02)
+
+        fetch = asyncio.ensure_future(mirror.get_orders(trigger, "w1"))
+        await asyncio.sleep(0.005)
+        mirror.remove_all("w1")
+        await fetch
+
+        assert (await mirror.get_orders(trigger, "w1"))["orders"] == []
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_ttl(self):
+        """Should refetch after invalidation or when the TTL is disabled."""
+        trigger = _trigger(total_orders=3)
+        mirror = TriggerOrderMirror(ttl=60)
+        await mirror.get_orders(trigger, "w1")
+        mirror.invalidate("w1")
+        await mirror.get_orders(trigger, "w1")
+        assert trigger.get_orders.await_count == 2
+
+        uncached = TriggerOrderMirror(ttl=0)
+        await uncached.get_orders(trigger, "w1")
+        await uncached.get_orders(trigger, "w1")
+        assert trigger.get_orders.await_count == 4
+
+
+class TestSharedMirror:
+    """Test the process-wide mirror."""
+
+    @pytest.mark.asyncio
+    async def test_reset(self):
+        """Should drop mirrored orders on reset."""
+        trigger = _trigger(total_orders=3)
+        await get_trigger_order_mirror().get_orders(trigger, "w1")
+        reset_trigger_order_mirror()
+        await get_trigger_order_mirror().get_orders(trigger, "w1")
+        assert trigger.get_orders.await_count == 2
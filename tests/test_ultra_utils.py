@@ -13,6 +13,7 @@ from sakit.utils.ultra import (
     JupiterUltra,
     UltraOrderResponse,
     UltraExecuteResponse,
+    UltraQuoteCache,
     sign_ultra_transaction,
     JUPITER_ULTRA_API,
 )
@@ -180,6 +181,155 @@ class TestJupiterUltraGetOrder:
 
             assert "400" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_get_order_quote_only_omits_taker(self):
+        """Should not send a taker for a quote-only order."""
+        import respx
+
+        with respx.mock:
+            route = respx.get(url__startswith="https://api.jup.ag/ultra/v1/order")
+            route.respond(200, json={"requestId": "req-1", "outAmount": "5"})
+
+            ultra = JupiterUltra(api_key="test-key")
+            order = await ultra.get_order(
+                input_mint="input", output_mint="output", amount=10, taker=None
+            )
+
+            assert "taker" not in route.calls.last.request.url.params
+            assert order.transaction == ""
+            assert order.out_amount == "5"
+
+
+def _order(in_amount: str = "1000", out_amount: str = "500") -> UltraOrderResponse:
+    return UltraOrderResponse(
+        request_id="req-1",
+        transaction="",
+        in_amount=in_amount,
+        out_amount=out_amount,
+        input_mint="input",
+        output_mint="output",
+        slippage_bps=50,
+        swap_type="aggregator",
+        price_impact=-0.1,
+        in_usd_value=10.0,
+        out_usd_value=9.9,
+        gasless=False,
+        raw_response={},
+    )
+
+
+class TestUltraQuoteCache:
+    """Test the short-TTL quote cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_quote_served_from_cache(self):
+        """Should call get_order once and report the entry age."""
+        ultra = MagicMock()
+        ultra.get_order = AsyncMock(return_value=_order())
+        cache = UltraQuoteCache(ttl=60)
+
+        order, age = await cache.get_quote(ultra, "input", "output", 1000, "taker1")
+        assert age == 0.0
+        again, age = await cache.get_quote(ultra, "input", "output", 1000, "taker2")
+
+        assert again is order
+        assert age > 0
+        ultra.get_order.assert_awaited_once()
+        assert ultra.get_order.call_args.kwargs["taker"] is None
+
+    @pytest.mark.asyncio
+    async def test_expired_and_different_params_miss(self):
+        """Should refetch after the TTL and for different fee params."""
+        ultra = MagicMock()
+        ultra.get_order = AsyncMock(return_value=_order())
+        cache = UltraQuoteCache(ttl=60)
+
+        await cache.get_quote(ultra, "input", "output", 1000)
+        await cache.get_quote(ultra, "input", "output", 1000, referral_fee=50)
+        assert ultra.get_order.await_count == 2
+
+        with patch("sakit.utils.ultra.monotonic", return_value=1e12):
+            await cache.get_quote(ultra, "input", "output", 1000)
+        assert ultra.get_order.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self):
+        """Should always fetch when ttl is 0."""
+        ultra = MagicMock()
+        ultra.get_order = AsyncMock(return_value=_order())
+        cache = UltraQuoteCache(ttl=0)
+        await cache.get_quote(ultra, "input", "output", 1000)
+        await cache.get_quote(ultra, "input", "output", 1000)
+        assert ultra.get_order.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_payer_sends_taker_as_close_authority(self):
+        """Should build a full order when an integrator payer is set."""
+        ultra = MagicMock()
+        ultra.get_order = AsyncMock(return_value=_order())
+        cache = UltraQuoteCache()
+        await cache.get_quote(ultra, "input", "output", 1000, "taker1", payer="payer")
+        kwargs = ultra.get_order.call_args.kwargs
+        assert kwargs["taker"] == "taker1"
+        assert kwargs["close_authority"] == "taker1"
+
+    @pytest.mark.asyncio
+    async def test_payer_orders_are_cached_per_taker(self):
+        """Should not serve one taker's payer order to another taker."""
+        ultra = MagicMock()
+        ultra.get_order = AsyncMock(return_value=_order())
+        cache = UltraQuoteCache()
+        await cache.get_quote(ultra, "input", "output", 1000, "taker1", payer="payer")
+        await cache.get_quote(ultra, "input", "output", 1000, "taker1", payer="payer")
+        assert ultra.get_order.await_count == 1
+
+        await cache.get_quote(ultra, "input", "output", 1000, "taker2", payer="payer")
+        assert ultra.get_order.await_count == 2
+        assert ultra.get_order.call_args.kwargs["taker"] == "taker2"
+
+        # Without a payer the taker is not sent, so quotes are shared
+        await cache.get_quote(ultra, "input", "output", 1000, "taker1")
+        await cache.get_quote(ultra, "input", "output", 1000, "taker2")
+        assert ultra.get_order.await_count == 3
+
+    def test_bucket(self):
+        """Should round amounts down to significant digits."""
+        assert UltraQuoteCache().bucket(1234567) == 1234567
+        cache = UltraQuoteCache(amount_precision=3)
+        assert cache.bucket(1234567) == 1230000
+        assert cache.bucket(12) == 12
+
+    @pytest.mark.asyncio
+    async def test_bucketed_amount_is_scaled(self):
+        """Should scale a cached quote to another amount in the same bucket."""
+        ultra = MagicMock()
+        ultra.get_order = AsyncMock(return_value=_order("1000", "500"))
+        cache = UltraQuoteCache(ttl=60, amount_precision=2)
+
+        await cache.get_quote(ultra, "input", "output", 1000)
+        order, _ = await cache.get_quote(ultra, "input", "output", 1002)
+
+        ultra.get_order.assert_awaited_once()
+        assert order.in_amount == "1002"
+        assert order.out_amount == "501"
+        assert order.request_id == ""
+        assert order.in_usd_value == pytest.approx(10.02)
+
+    @pytest.mark.asyncio
+    async def test_evicts_oldest_entry(self):
+        """Should keep at most max_entries quotes."""
+        ultra = MagicMock()
+        ultra.get_order = AsyncMock(return_value=_order())
+        cache = UltraQuoteCache(ttl=60, max_entries=2)
+        for amount in (1, 2, 3):
+            await cache.get_quote(ultra, "input", "output", amount)
+        assert len(cache._entries) == 2
+        await cache.get_quote(ultra, "input", "output", 1)
+        assert ultra.get_order.await_count == 4
+
+        cache.clear()
+        assert cache._entries == {}
+
 
 class TestJupiterUltraExecuteOrder:
     """Test execute_order method."""
@@ -0,0 +1,197 @@
+"""
+Tests for portfolio valuation utility.
+
+Tests holdings parsing, batched and cached multi_price lookups, and
+multi-wallet valuation with Decimal totals.
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import respx
+from httpx import Response
+
+from sakit.utils.birdeye import BIRDEYE_API, reset_rate_limiters
+from sakit.utils.valuation import (
+    SOL_MINT,
+    PortfolioValuer,
+    parse_holdings,
+)
+
+USDC = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+BONK = "DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263"
+MULTI_PRICE = f"{BIRDEYE_API}/defi/multi_price"
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+def _holdings(lamports: str = "0", tokens: dict = None) -> dict:
+    return {"amount": lamports, "uiAmount": 0, "tokens": tokens or {}}
+
+
+def _account(amount: str, decimals: int) -> dict:
+    return {"account": "acc", "amount": amount, "decimals": decimals}
+
+
+def _price_response(request) -> Response:
+    prices = {SOL_MINT: 150.5, USDC: 1, BONK: 0.00002}
+    mints = request.url.params["list_address"].split(",")
+    return Response(
+        200,
+        json={"success": True, "data": {m: {"value": prices.get(m)} for m in mints}},
+    )
+
+
+@pytest.fixture
+def valuer():
+    return PortfolioValuer(jupiter_api_key="jup", birdeye_api_key="bird")
+
+
+class TestParseHoldings:
+    """Test extraction of balances from Ultra holdings."""
+
+    def test_native_and_tokens(self):
+        """Should convert smallest units with Decimal precision."""
+        holdings = _holdings(
+            "1500000000",
+            {USDC: [_account("2500000", 6)], BONK: [_account("100000", 5)]},
+        )
+        assert parse_holdings(holdings) == {
+            SOL_MINT: Decimal("1.5"),
+            USDC: Decimal("2.5"),
+            BONK: Decimal("1"),
+        }
+
+    def test_sums_accounts_and_wsol(self):
+        """Should sum token accounts of one mint, including wSOL with native."""
+        holdings = _holdings(
+            "1000000000",
+            {
+                SOL_MINT: [_account("500000000", 9)],
+                USDC: [_account("1000000", 6), _account("2000000", 6)],
+            },
+        )
+        balances = parse_holdings(holdings)
+        assert balances[SOL_MINT] == Decimal("1.5")
+        assert balances[USDC] == Decimal("3")
+
+    def test_drops_zero_and_invalid(self):
+        """Should skip zero and unparseable balances."""
+        holdings = _holdings(
+            "0", {USDC: [_account("0", 6)], BONK: [{"amount": "x", "decimals": 5}]}
+        )
+        assert parse_holdings(holdings) == {}
+
+
+class TestGetPrices:
+    """Test batched, cached price lookups."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_chunks_unique_mints(self):
+        """Should price each unique mint once in chunks of batch_size."""
+        route = respx.get(MULTI_PRICE).mock(side_effect=_price_response)
+        valuer = PortfolioValuer("jup", "bird", batch_size=2)
+        prices = await valuer.get_prices([SOL_MINT, USDC, SOL_MINT, BONK])
+        assert route.call_count == 2
+        assert prices == {
+            SOL_MINT: Decimal("150.5"),
+            USDC: Decimal("1"),
+            BONK: Decimal("0.00002"),
+        }
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cache_reuses_prices(self, valuer):
+        """Should serve cached prices, including known missing prices."""
+        route = respx.get(MULTI_PRICE).mock(side_effect=_price_response)
+        await valuer.get_prices([SOL_MINT, "unknown"])
+        prices = await valuer.get_prices([SOL_MINT, "unknown"])
+        assert route.call_count == 1
+        assert prices == {SOL_MINT: Decimal("150.5")}
+
+        valuer.clear_cache()
+        await valuer.get_prices([SOL_MINT])
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_zero_ttl_disables_cache(self):
+        """Should refetch every time when price_ttl is 0."""
+        route = respx.get(MULTI_PRICE).mock(side_effect=_price_response)
+        valuer = PortfolioValuer("jup", "bird", price_ttl=0)
+        await valuer.get_prices([USDC])
+        await valuer.get_prices([USDC])
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_failed_batch_is_not_cached(self, valuer):
+        """Should leave mints of a failed batch unpriced and uncached."""
+        route = respx.get(MULTI_PRICE).mock(
+            side_effect=[Response(500, text="boom"), _price_response]
+        )
+        assert await valuer.get_prices([USDC]) == {}
+        route.side_effect = _price_response
+        assert await valuer.get_prices([USDC]) == {USDC: Decimal("1")}
+
+
+class TestValueWallets:
+    """Test multi-wallet valuation."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_values_wallets_with_one_price_pass(self, valuer):
+        """Should combine holdings and prices into exact Decimal totals."""
+        route = respx.get(MULTI_PRICE).mock(side_effect=_price_response)
+        holdings = {
+            "w1": _holdings("2000000000", {USDC: [_account("1100000", 6)]}),
+            "w2": _holdings("0", {USDC: [_account("100000", 6)], "junk": []}),
+            "w3": _holdings("0", {"unknown": [_account("5", 0)]}),
+        }
+        with patch.object(
+            valuer.ultra,
+            "get_holdings",
+            new_callable=AsyncMock,
+            side_effect=lambda wallet: holdings[wallet],
+        ):
+            result = await valuer.value_wallets(["w1", "w2", "w3", "w1"])
+
+        assert route.call_count == 1
+        assert [w.wallet for w in result.wallets] == ["w1", "w2", "w3"]
+        assert result.wallets[0].total_usd == Decimal("302.1")
+        assert result.wallets[1].total_usd == Decimal("0.1")
+        assert result.wallets[2].unpriced == ["unknown"]
+        assert result.total_usd == Decimal("302.2")
+        assert result.unpriced == ["unknown"]
+
+        data = result.to_dict()
+        assert data["total_usd"] == "302.2"
+        assert data["unique_mints"] == 3
+        assert data["wallets"][2]["positions"] == [
+            {"mint": "unknown", "amount": "5", "value_usd": None}
+        ]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_holdings_failure_is_per_wallet(self, valuer):
+        """Should record holdings errors without failing other wallets."""
+        respx.get(MULTI_PRICE).mock(side_effect=_price_response)
+
+        async def get_holdings(wallet):
+            if wallet == "bad":
+                raise Exception("Failed to get holdings: 500 - boom")
+            return _holdings("1000000000")
+
+        with patch.object(valuer.ultra, "get_holdings", side_effect=get_holdings):
+            result = await valuer.value_wallets(["good", "bad"])
+
+        assert result.wallets[0].total_usd == Decimal("150.5")
+        assert result.wallets[1].error == "Failed to get holdings: 500 - boom"
+        assert result.total_usd == Decimal("150.5")
@@ -5,6 +5,8 @@ Tests the SolanaWalletClient which provides wallet operations
 for Solana transactions.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 
@@ -68,37 +70,50 @@ class TestSolanaWalletClientInit:
             assert hasattr(wallet, "fee_payer")
             assert wallet.fee_payer is None
 
+    def test_init_creates_no_client(self):
+        """Should not open an RPC client until one is used."""
+        from sakit.utils.wallet import SolanaWalletClient
+
+        with patch("sakit.utils.wallet.AsyncClient") as MockClient:
+            SolanaWalletClient(rpc_url="https://api.mainnet-beta.solana.com")
+
+            MockClient.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_client_is_pooled(self):
+        """Should share the pooled client for the wallet's RPC URL."""
+        from sakit.utils.wallet import SolanaWalletClient, close_rpc_clients
+
+        with patch("sakit.utils.wallet.AsyncClient") as MockClient:
+            MockClient.side_effect = lambda url: MagicMock(close=AsyncMock())
+            first = SolanaWalletClient(rpc_url="https://rpc-a")
+            second = SolanaWalletClient(rpc_url="https://rpc-a")
+
+            assert first.client is second.client
+            assert MockClient.call_count == 1
+            await close_rpc_clients()
+
 
 class TestSolanaWalletClientSignMessage:
     """Test sign_message method."""
 
     def test_sign_message(self):
         """Should sign message with keypair."""
-        from sakit.utils.wallet import SolanaWalletClient
+        from solders.keypair import Keypair
 
-        mock_keypair = MagicMock()
-        mock_keypair.pubkey.return_value = "TestPubkey123"
-        mock_keypair.secret.return_value = b"\x00" * 32
+        from sakit.utils.wallet import SolanaWalletClient
 
-        with (
-            patch("sakit.utils.wallet.AsyncClient"),
-            patch("nacl.signing.SigningKey") as MockSigningKey,
-        ):
-            mock_signing_key = MagicMock()
-            mock_signed = MagicMock()
-            mock_signed.signature = b"\x01" * 64
-            mock_signing_key.sign.return_value = mock_signed
-            MockSigningKey.return_value = mock_signing_key
+        keypair = Keypair()
 
+        with patch("sakit.utils.wallet.AsyncClient"):
             wallet = SolanaWalletClient(
                 rpc_url="https://api.mainnet-beta.solana.com",
-                keypair=mock_keypair,
+                keypair=keypair,
             )
 
             signature = wallet.sign_message(b"test message")
 
-            # Should return a Signature object
-            assert signature is not None
+            assert signature.verify(keypair.pubkey(), b"test message")
 
 
 class TestSolanaWalletClientGetPriorityFeeEstimate:
@@ -178,3 +193,240 @@ class TestSolanaTransaction:
         )
 
         assert tx.accounts_to_sign == [mock_signer]
+
+
+class TestRpcClientPool:
+    """Test pooled RPC clients."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_url(self):
+        """Should hand out one client per URL on the same loop."""
+        from sakit.utils.wallet import close_rpc_clients, get_rpc_client
+
+        with patch("sakit.utils.wallet.AsyncClient") as MockClient:
+            MockClient.side_effect = lambda url: MagicMock(close=AsyncMock())
+            first = get_rpc_client("https://rpc-a")
+            assert get_rpc_client("https://rpc-a") is first
+            other = get_rpc_client("https://rpc-b")
+            assert other is not first
+            assert MockClient.call_count == 2
+
+            await close_rpc_clients()
+            first.close.assert_awaited_once()
+            other.close.assert_awaited_once()
+            assert get_rpc_client("https://rpc-a") is not first
+            await close_rpc_clients()
+
+    def test_keeps_clients_per_loop(self):
+        """Should not replace another loop's client and drop closed loops' clients."""
+        from sakit.utils import wallet
+
+        async def get():
+            return wallet.get_rpc_client("https://rpc-a")
+
+        with patch("sakit.utils.wallet.AsyncClient") as MockClient:
+            MockClient.side_effect = lambda url: MagicMock(close=AsyncMock())
+            loop_a, loop_b = asyncio.new_event_loop(), asyncio.new_event_loop()
+            try:
+                client_a = loop_a.run_until_complete(get())
+                client_b = loop_b.run_until_complete(get())
+                assert client_a is not client_b
+                assert loop_a.run_until_complete(get()) is client_a
+
+                loop_a.close()
+                loop_b.run_until_complete(wallet.close_rpc_clients())
+                client_b.close.assert_awaited_once()
+                client_a.close.assert_not_called()
+                assert wallet._RPC_CLIENTS == {}
+            finally:
+                loop_a.close()
+                loop_b.close()
+
+
+class TestSolanaWalletClientSendTransaction:
+    """Test SolanaWalletClient.send_transaction."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_share_blockhash_and_confirmation(self):
+        """Should sign locally and confirm many in-flight sends from shared state."""
+        from types import SimpleNamespace
+
+        from solders.hash import Hash
+        from solders.keypair import Keypair
+        from solders.system_program import TransferParams, transfer
+        from solders.transaction import Transaction
+        from solders.transaction_status import TransactionConfirmationStatus
+
+        from sakit.utils.confirmation import reset_confirmation_state
+        from sakit.utils.wallet import SolanaTransaction, SolanaWalletClient
+
+        keypair = Keypair()
+        sent = []
+        rpc = MagicMock()
+        rpc.get_latest_blockhash = AsyncMock(
+            return_value=SimpleNamespace(
+                value=SimpleNamespace(
+                    blockhash=Hash.new_unique(), last_valid_block_height=500
+                )
+            )
+        )
+
+        async def send_raw_transaction(tx_bytes, opts=None):
+            tx = Transaction.from_bytes(tx_bytes)
+            assert tx.verify() is None
+            sent.append(tx.signatures[0])
+            return SimpleNamespace(value=tx.signatures[0])
+
+        rpc.send_raw_transaction = send_raw_transaction
+        rpc.get_signature_statuses = AsyncMock(
+            side_effect=lambda sigs: SimpleNamespace(
+                value=[
+                    SimpleNamespace(
+                        err=None,
+                        confirmation_status=TransactionConfirmationStatus.Confirmed,
+                    )
+                    for _ in sigs
+                ]
+            )
+        )
+        rpc.get_block_height = AsyncMock(return_value=SimpleNamespace(value=100))
+
+        reset_confirmation_state()
+        with (
+            patch("sakit.utils.wallet.AsyncClient"),
+            patch("sakit.utils.wallet.get_rpc_client", return_value=rpc),
+        ):
+            wallet = SolanaWalletClient("https://rpc", keypair)
+            transactions = [
+                SolanaTransaction(
+                    [
+                        transfer(
+                            TransferParams(
+                                from_pubkey=keypair.pubkey(),
+                                to_pubkey=Keypair().pubkey(),
+                                lamports=1000 + i,
+                            )
+                        )
+                    ]
+                )
+                for i in range(5)
+            ]
+            results = await asyncio.gather(
+                *(wallet.send_transaction(tx) for tx in transactions)
+            )
+        reset_confirmation_state()
+
+        assert [r["hash"] for r in results] == [str(s) for s in sent]
+        rpc.get_latest_blockhash.assert_awaited_once()
+        assert rpc.get_signature_statuses.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_sends_are_resigned(self):
+        """Should re-sign a send that would duplicate one already sent."""
+        from types import SimpleNamespace
+
+        from solders.hash import Hash
+        from solders.keypair import Keypair
+        from solders.system_program import TransferParams, transfer
+        from solders.transaction import Transaction
+        from solders.transaction_status import TransactionConfirmationStatus
+
+        from sakit.utils.confirmation import reset_confirmation_state
+        from sakit.utils.wallet import SolanaTransaction, SolanaWalletClient
+
+        keypair = Keypair()
+        sent = []
+        rpc = MagicMock()
+        rpc.get_latest_blockhash = AsyncMock(
+            side_effect=lambda commitment=None: SimpleNamespace(
+                value=SimpleNamespace(
+                    blockhash=Hash.new_unique(), last_valid_block_height=500
+                )
+            )
+        )
+
+        async def send_raw_transaction(tx_bytes, opts=None):
+            tx = Transaction.from_bytes(tx_bytes)
+            sent.append(tx.signatures[0])
+            return SimpleNamespace(value=tx.signatures[0])
+
+        rpc.send_raw_transaction = send_raw_transaction
+        rpc.get_signature_statuses = AsyncMock(
+            side_effect=lambda sigs: SimpleNamespace(
+                value=[
+                    SimpleNamespace(
+                        err=None,
+                        confirmation_status=TransactionConfirmationStatus.Confirmed,
+                    )
+                    for _ in sigs
+                ]
+            )
+        )
+        rpc.get_block_height = AsyncMock(return_value=SimpleNamespace(value=100))
+        payment = SolanaTransaction(
+            [
+                transfer(
+                    TransferParams(
+                        from_pubkey=keypair.pubkey(),
+                        to_pubkey=Keypair().pubkey(),
+                        lamports=1000,
+                    )
+                )
+            ]
+        )
+
+        reset_confirmation_state()
+        with (
+            patch("sakit.utils.wallet.get_rpc_client", return_value=rpc),
+            patch("sakit.utils.wallet.DUPLICATE_RESIGN_DELAY", 0),
+        ):
+            wallet = SolanaWalletClient("https://rpc", keypair)
+            first = await wallet.send_transaction(payment)
+            second = await wallet.send_transaction(payment)
+        reset_confirmation_state()
+
+        assert first["hash"] != second["hash"]
+        assert len(set(sent)) == 2
+        assert rpc.get_latest_blockhash.await_count == 2
+
+
+class TestConfirmSignatures:
+    """Test confirm_signatures."""
+
+    @pytest.mark.asyncio
+    async def test_confirms_batch_in_one_poll(self):
+        """Should confirm all signatures together and report failures per signature."""
+        from types import SimpleNamespace
+
+        from solders.signature import Signature
+        from solders.transaction_status import TransactionConfirmationStatus
+
+        from sakit.utils.confirmation import reset_confirmation_state
+        from sakit.utils.wallet import confirm_signatures
+
+        signatures = [Signature.new_unique() for _ in range(3)]
+        failed = signatures[1]
+        rpc = MagicMock()
+        rpc.get_signature_statuses = AsyncMock(
+            side_effect=lambda sigs: SimpleNamespace(
+                value=[
+                    SimpleNamespace(
+                        err="InstructionError" if s == failed else None,
+                        confirmation_status=TransactionConfirmationStatus.Confirmed,
+                    )
+                    for s in sigs
+                ]
+            )
+        )
+        rpc.get_block_height = AsyncMock(return_value=SimpleNamespace(value=100))
+
+        reset_confirmation_state()
+        with patch("sakit.utils.wallet.get_rpc_client", return_value=rpc):
+            results = await confirm_signatures(
+                "https://rpc", [str(s) for s in signatures], 500
+            )
+        reset_confirmation_state()
+
+        assert results[0] is None and results[2] is None
+        assert "InstructionError" in results[1]
+        assert rpc.get_signature_statuses.await_count == 1